@@ -7,6 +7,34 @@ from agents.state import AgentState
 
 logger = logging.getLogger(__name__)
 
+# 입력 검증 직후 항상 병렬 실행되는 분석 노드
+ANALYSIS_NODES: tuple[str, ...] = (
+    "auscultation_node",
+    "vitals_node",
+    "symptoms_node",
+    "literature_node",
+)
+
+
+def route_after_validation(state: AgentState) -> list[str]:
+    """
+    입력 검증 후 fan-out 대상 결정.
+
+    - 항상: 청진음 / 생체신호 / 증상 / 문헌 검색 노드 (병렬)
+    - emergency(위급 생체신호 또는 사전 위험도 critical): emergency_node 추가
+      → 템플릿 긴급 응답이 먼저 스트리밍되고, 전체 분석은 그대로 진행
+    - routine(모든 규칙 소견 정상): routine_node 단독 → LLM 노드 전부 우회
+    """
+    if state.get("routine"):
+        logger.info("입력 라우팅: 모든 소견 정상 → routine_node")
+        return ["routine_node"]
+
+    targets = list(ANALYSIS_NODES)
+    if state.get("emergency"):
+        logger.info("입력 라우팅: 위급 소견 → emergency_node 병행")
+        targets.append("emergency_node")
+    return targets
+
 
 def route_by_risk(state: AgentState) -> str:
     """
@@ -17,7 +45,7 @@ def route_by_risk(state: AgentState) -> str:
 
     현재는 동일 노드로 라우팅하되, risk_node 결과에 따라
     recommendation_node 내부에서 경고 문구가 달라짐.
-    향후 critical 시 별도 emergency_node 분기 가능.
+    위급 입력의 즉시 응답은 route_after_validation → emergency_node에서 처리.
     """
     risk = state.get("risk_assessment")
     if risk and risk.level in ("high", "critical"):
@@ -1,19 +1,24 @@
 """LangGraph 에이전트 워크플로우 정의 — 그래프 조립 + 컴파일"""
 from __future__ import annotations
 
+import functools
 import logging
 
 from langgraph.graph import END, StateGraph
 
-from agents.edges.risk_router import route_by_risk
+from agents.edges.risk_router import ANALYSIS_NODES, route_after_validation, route_by_risk
 from agents.nodes.auscultation_node import auscultation_node
+from agents.nodes.emergency_node import emergency_node
 from agents.nodes.input_validator import input_validator
+from agents.nodes.literature_node import literature_node
 from agents.nodes.recommendation_node import recommendation_node
 from agents.nodes.risk_node import risk_node
+from agents.nodes.routine_node import routine_node
 from agents.nodes.symptoms_node import symptoms_node
 from agents.nodes.synthesis_node import synthesis_node
 from agents.nodes.vitals_node import vitals_node
 from agents.state import AgentState
+from utils.tracing import traced_node
 
 logger = logging.getLogger(__name__)
 
@@ -23,36 +28,49 @@ def build_graph() -> StateGraph:
     StethoAgent 워크플로우 그래프 생성.
 
     워크플로우:
-        입력 검증 → 병렬(청진음 + 생체신호 + 증상) → 종합 판단 → 위험도 → 응답 생성
+        입력 검증 → 병렬(청진음 + 생체신호 + 증상 + 문헌 검색) → 종합 판단 → 위험도 → 응답 생성
+        입력 검증 → (위급 시) 긴급 응답 → 종료   ※ 분석 경로와 병렬, LLM 호출 없음
+        입력 검증 → (모두 정상 시) 루틴 응답 → 종료   ※ 분석 경로 대신, LLM 호출 없음
 
     Returns:
         컴파일된 StateGraph
     """
     workflow = StateGraph(AgentState)
 
-    # === 노드 등록 ===
-    workflow.add_node("input_validator", input_validator)
-    workflow.add_node("auscultation_node", auscultation_node)
-    workflow.add_node("vitals_node", vitals_node)
-    workflow.add_node("symptoms_node", symptoms_node)
-    workflow.add_node("synthesis_node", synthesis_node)
-    workflow.add_node("risk_node", risk_node)
-    workflow.add_node("recommendation_node", recommendation_node)
+    # === 노드 등록 (모든 노드를 트레이싱 스팬으로 감쌈) ===
+    nodes = {
+        "input_validator": input_validator,
+        "auscultation_node": auscultation_node,
+        "vitals_node": vitals_node,
+        "symptoms_node": symptoms_node,
+        "literature_node": literature_node,
+        "synthesis_node": synthesis_node,
+        "risk_node": risk_node,
+        "recommendation_node": recommendation_node,
+        "emergency_node": emergency_node,
+        "routine_node": routine_node,
+    }
+    for name, node in nodes.items():
+        workflow.add_node(name, traced_node(name, node))
 
     # === 엣지 정의 ===
 
     # 시작점
     workflow.set_entry_point("input_validator")
 
-    # Fan-out: 입력 검증 → 3개 분석 노드 (병렬 실행)
-    workflow.add_edge("input_validator", "auscultation_node")
-    workflow.add_edge("input_validator", "vitals_node")
-    workflow.add_edge("input_validator", "symptoms_node")
+    # Fan-out: 입력 검증 → 3개 분석 노드 + 문헌 검색 (병렬 실행)
+    #          위급 소견이면 긴급 응답 노드도 함께 실행, 모두 정상이면 루틴 응답만 실행
+    workflow.add_conditional_edges(
+        "input_validator",
+        route_after_validation,
+        [*ANALYSIS_NODES, "emergency_node", "routine_node"],
+    )
 
-    # Fan-in: 3개 분석 노드 → 종합 판단 (모두 완료 후 실행)
+    # Fan-in: 3개 분석 노드 + 문헌 검색 → 종합 판단 (모두 완료 후 실행)
     workflow.add_edge("auscultation_node", "synthesis_node")
     workflow.add_edge("vitals_node", "synthesis_node")
     workflow.add_edge("symptoms_node", "synthesis_node")
+    workflow.add_edge("literature_node", "synthesis_node")
 
     # 순차: 종합 판단 → 위험도 평가
     workflow.add_edge("synthesis_node", "risk_node")
@@ -62,13 +80,28 @@ def build_graph() -> StateGraph:
 
     # 종료
     workflow.add_edge("recommendation_node", END)
+    workflow.add_edge("emergency_node", END)
+    workflow.add_edge("routine_node", END)
 
     logger.info("워크플로우 그래프 빌드 완료")
     return workflow
 
 
-# 컴파일된 그래프 (앱에서 import하여 사용)
-graph = build_graph().compile()
+@functools.lru_cache(maxsize=1)
+def get_graph():
+    """
+    컴파일된 그래프 (첫 호출 시 1회 컴파일 후 재사용).
+
+    모듈 import 시점에 컴파일하지 않으므로 앱 기동/스크립트 재실행 비용이 줄어든다.
+    """
+    return build_graph().compile()
+
+
+def __getattr__(name: str):
+    # 하위 호환: `from agents.graph import graph`도 첫 접근 시 컴파일
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -104,7 +137,10 @@ if __name__ == "__main__":
         print()
 
         try:
-            result = graph.invoke(input_state)
+            from utils.tracing import start_trace
+
+            with start_trace():
+                result = get_graph().invoke(input_state)
 
             print("=== 워크플로우 완료 ===\n")
             print(f"--- 청진음 분석 ---\n{result.get('auscultation_analysis', 'N/A')[:200]}\n")
@@ -118,6 +154,9 @@ if __name__ == "__main__":
                 print(f"  레벨: {risk.level}, 점수: {risk.score:.0f}, 즉시조치: {risk.immediate_action_needed}")
                 print(f"  요인: {', '.join(risk.factors)}\n")
 
+            if result.get("emergency_recommendation"):
+                print(f"--- 긴급 응답 ---\n{result['emergency_recommendation']}\n")
+
             print(f"--- 최종 권고 ---\n{result.get('recommendation', 'N/A')[:300]}\n")
 
             lit = result.get("literature_references")
@@ -126,6 +165,12 @@ if __name__ == "__main__":
                 for ref in lit.references[:3]:
                     print(f"  [{ref.source_id}] {ref.title[:80]}")
 
+            timing = result.get("timing")
+            if timing:
+                print(f"\n--- 처리 시간 (trace {timing['trace_id']}) ---")
+                for name, stats in timing["spans"].items():
+                    print(f"  {name}: {stats['count']}회, {stats['total_ms']:.0f}ms")
+
             print("\n테스트 성공!")
         except Exception as e:
             print(f"\n테스트 실패: {e}")
@@ -6,6 +6,7 @@ from pathlib import Path
 
 from agents.state import AgentState
 from models.llm_client import LLMClient
+from utils.deadline import BudgetExceeded, node_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ def auscultation_node(state: AgentState) -> dict:
 
     - 청진음 데이터가 없으면 스킵 메시지 반환
     - 있으면 AST 분류 결과를 LLM으로 해석
+    - 지연 예산 소진 시 분류 결과 요약으로 대체 (degraded_nodes 기록)
     """
     auscultation = state.get("auscultation")
 
@@ -48,12 +50,22 @@ def auscultation_node(state: AgentState) -> dict:
         f"이 청진음 분류 결과를 의학적으로 해석해주세요."
     )
 
+    timeout = node_timeout(state.get("deadline"), "auscultation_node")
     try:
+        if timeout == 0.0:
+            raise BudgetExceeded("남은 지연 예산 부족")
         llm = LLMClient()
         system_prompt = _load_prompt()
-        analysis = llm.generate(user_prompt, system_prompt=system_prompt)
+        analysis = llm.generate(user_prompt, system_prompt=system_prompt, timeout=timeout)
         logger.info("청진음 분석 완료: %d자", len(analysis))
         return {"auscultation_analysis": analysis}
+    except BudgetExceeded as e:
+        logger.warning("청진음 분석 지연 예산 초과 → 분류 결과 요약으로 대체: %s", e)
+        summary = (
+            f"청진음 분류 결과: {auscultation.classification} (신뢰도 {auscultation.confidence:.1%})\n"
+            f"{prob_text}\n(시간 제한으로 AI 해석은 생략되었습니다.)"
+        )
+        return {"auscultation_analysis": summary, "degraded_nodes": ["auscultation_node"]}
     except Exception as e:
         error_msg = f"청진음 분석 중 오류가 발생했습니다: {e}"
         logger.error(error_msg)
@@ -0,0 +1,51 @@
+"""긴급 응답 노드 — 위급 소견 시 LLM 없이 템플릿 권고를 즉시 제공"""
+from __future__ import annotations
+
+import logging
+
+from agents.state import AgentState
+from models.vitals_rules import CRITICAL_LABELS, evaluate_vitals
+from utils.config_loader import get_risk_config
+
+logger = logging.getLogger(__name__)
+
+
+def _format_findings(state: AgentState) -> str:
+    """위급 생체신호 + 사전 위험 요인을 목록 텍스트로 변환"""
+    vitals = state.get("vitals")
+    lines: list[str] = []
+
+    if vitals:
+        findings = state.get("vitals_findings") or evaluate_vitals(vitals)
+        readings = {
+            "heart_rate": f"{vitals.heart_rate}bpm",
+            "systolic": f"{vitals.blood_pressure_sys}mmHg",
+            "diastolic": f"{vitals.blood_pressure_dia}mmHg",
+            "temperature": f"{vitals.body_temperature}°C",
+        }
+        for name in findings.critical:
+            lines.append(f"- {CRITICAL_LABELS[name]} {readings[name]} (위급 범위)")
+
+    pre_risk = state.get("pre_risk_assessment")
+    if pre_risk:
+        lines.append(f"- 사전 위험도: {pre_risk.level} ({pre_risk.score:.0f}점)")
+        lines.extend(f"- {factor}" for factor in pre_risk.factors)
+
+    return "\n".join(lines) if lines else "- 위급 소견"
+
+
+def emergency_node(state: AgentState) -> dict:
+    """
+    긴급 응답 노드.
+
+    input_validator가 emergency로 판정한 경우에만 분석 노드와 병렬로 실행되며,
+    config/risk.yaml 템플릿만 채워 밀리초 단위로 응답한다.
+    전체 분석 결과(recommendation)는 기존 경로에서 이어서 생성된다.
+    """
+    user_mode = state.get("user_mode", "general")
+    templates = get_risk_config()["emergency"]["templates"]
+    template = templates.get(user_mode, templates["general"])
+
+    text = template.format(findings=_format_findings(state)).strip()
+    logger.info("긴급 응답 생성 완료: mode=%s, %d자", user_mode, len(text))
+    return {"emergency_recommendation": text}
@@ -2,13 +2,58 @@
 from __future__ import annotations
 
 import logging
+from typing import Any, Mapping, Optional
 
+from agents.nodes.risk_node import _calculate_risk
 from agents.state import AgentState
+from schemas.auscultation import AuscultationResult
 from schemas.symptoms import SymptomInput
-from schemas.vitals import VitalSigns
+from models.vitals_rules import evaluate_vitals
+from schemas.vitals import VitalSigns, VitalsFindings
+from utils import metrics
+from utils.config_loader import get_risk_config
+from utils.deadline import start_deadline
 
 logger = logging.getLogger(__name__)
 
+# 운영 지표 카운터명 (루틴 경로 비율 = FAST_PATH_METRIC / ANALYSIS_METRIC)
+ANALYSIS_METRIC = "analysis_total"
+FAST_PATH_METRIC = "fast_path_total"
+
+
+def _is_routine(
+    findings: VitalsFindings,
+    auscultation: Optional[AuscultationResult],
+    symptoms: SymptomInput,
+    config: Mapping[str, Any],
+) -> bool:
+    """모든 규칙 소견이 정상인지 판정 (config/risk.yaml fast_path 기준)"""
+    if not config.get("enabled", False):
+        return False
+    # 이상 소견 플래그가 없는 경계 구간(혈압 주의/1기, 이완기 저하, 미열 등)도 LLM 분석 대상
+    bands = (
+        findings.heart_rate_band,
+        findings.systolic_band,
+        findings.diastolic_band,
+        findings.temperature_band,
+    )
+    if findings.flags or findings.critical or any(band != "normal" for band in bands):
+        return False
+
+    if auscultation is None:
+        if config.get("require_auscultation", False):
+            return False
+    elif (
+        auscultation.classification != "Normal"
+        or auscultation.confidence < config.get("min_auscultation_confidence", 1.0)
+    ):
+        return False
+
+    if symptoms.severity not in config.get("allowed_severities", ()):
+        return False
+    red_flags = set(config.get("red_flag_symptoms", ()))
+    return not red_flags.intersection(symptoms.checklist)
+
 
 def input_validator(state: AgentState) -> dict:
     """
@@ -16,6 +61,10 @@ def input_validator(state: AgentState) -> dict:
 
     - VitalSigns / SymptomInput 없으면 디폴트 생성
     - user_mode 없으면 "general"
+    - 생체신호 규칙 평가(vitals_findings)를 1회 계산하여 이후 노드가 공유
+    - 규칙 기반 사전 위험도(종합 판단 키워드 제외) 산정 → 위급 시 emergency 플래그
+    - 모든 규칙 소견 정상이면 routine 플래그 (LLM 노드 우회) + 지표 기록
+    - 요청 마감 시각(deadline) 설정 (호출자가 넘긴 값이 있으면 유지)
     - 중간 분석 필드 초기화
     """
     logger.info("입력 검증 시작")
@@ -24,6 +73,29 @@ def input_validator(state: AgentState) -> dict:
     symptoms = state.get("symptoms") or SymptomInput()
     user_mode = state.get("user_mode", "general")
     auscultation = state.get("auscultation")
+    findings = evaluate_vitals(vitals)
+
+    # 규칙 기반 사전 위험도 (LLM 호출 없음)
+    pre_risk = _calculate_risk({
+        "vitals": vitals,
+        "symptoms": symptoms,
+        "auscultation": auscultation,
+        "vitals_findings": findings,
+    })
+    emergency = bool(findings.critical) or pre_risk.level == "critical"
+    routine = not emergency and _is_routine(
+        findings, auscultation, symptoms, get_risk_config()["fast_path"]
+    )
+
+    metrics.increment(ANALYSIS_METRIC)
+    if routine:
+        metrics.increment(FAST_PATH_METRIC)
+        logger.info("루틴 경로: 모든 규칙 소견 정상 → 템플릿 응답")
+    if emergency:
+        logger.warning(
+            "긴급 경로 활성화: 위급 소견=%s, 사전 위험도=%s(%.0f)",
+            findings.critical, pre_risk.level, pre_risk.score,
+        )
 
     logger.info(
         "입력 검증 완료: vitals=HR%d, symptoms=%d개, mode=%s, audio=%s",
@@ -38,4 +110,9 @@ def input_validator(state: AgentState) -> dict:
         "symptoms": symptoms,
         "user_mode": user_mode,
         "auscultation": auscultation,
+        "vitals_findings": findings,
+        "pre_risk_assessment": pre_risk,
+        "emergency": emergency,
+        "routine": routine,
+        "deadline": state["deadline"] if state.get("deadline") is not None else start_deadline(),
     }
@@ -0,0 +1,54 @@
+"""의학 문헌 검색 노드 — 입력 데이터 기반 PubMed 검색 (분석 노드와 병렬 실행)"""
+from __future__ import annotations
+
+import logging
+
+from agents.state import AgentState
+from models.literature_search import MedicalSearchClient
+from schemas.literature import LiteratureSearchResult
+from utils.deadline import BudgetExceeded, node_timeout, run_with_timeout
+
+logger = logging.getLogger(__name__)
+
+
+def literature_node(state: AgentState) -> dict:
+    """
+    의학 문헌 검색 노드.
+
+    - 청진음 분류 결과 / 증상 / 생체신호만으로 검색 쿼리 생성 (LLM 분석 결과 불필요)
+    - 3개 분석 노드와 같은 단계에서 실행되어 네트워크 지연이 종합 판단 앞에 쌓이지 않음
+    - 검색 실패 시에도 분석은 계속 진행 (실패 결과를 상태에 기록)
+    - 지연 예산 내 벽시계 상한으로 실행 (캐시 적중은 즉시 반환), 초과 시 문헌 없이 진행
+    """
+    logger.info("문헌 검색 시작")
+
+    timeout = node_timeout(state.get("deadline"), "literature_node")
+    try:
+        if timeout == 0.0:
+            raise BudgetExceeded("남은 지연 예산 부족")
+        search_client = MedicalSearchClient(timeout=timeout)
+        result = run_with_timeout(
+            lambda: search_client.search_from_analysis(
+                auscultation=state.get("auscultation"),
+                symptoms=state.get("symptoms"),
+                vitals=state.get("vitals"),
+                vitals_findings=state.get("vitals_findings"),
+            ),
+            timeout,
+        )
+        logger.info("문헌 검색 완료: %d건", result.total_count)
+    except BudgetExceeded as e:
+        logger.warning("문헌 검색 지연 예산 초과 → 문헌 없이 진행: %s", e)
+        result = LiteratureSearchResult(
+            search_successful=False,
+            error_message=f"시간 제한으로 문헌 검색을 생략했습니다: {e}",
+        )
+        return {"literature_references": result, "degraded_nodes": ["literature_node"]}
+    except Exception as e:
+        logger.warning("문헌 검색 실패 (계속 진행): %s", e)
+        result = LiteratureSearchResult(
+            search_successful=False,
+            error_message=f"문헌 검색 중 오류가 발생했습니다: {e}",
+        )
+
+    return {"literature_references": result}
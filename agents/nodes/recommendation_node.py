@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 from agents.state import AgentState
 from models.llm_client import LLMClient
 from models.literature_search import MedicalSearchClient
+from schemas.report import RiskAssessment
+from utils.deadline import BudgetExceeded, node_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +31,20 @@ def _load_prompt(user_mode: str) -> str:
     return "당신은 일반인에게 건강 정보를 전달하는 AI입니다. 쉬운 한국어로 설명하세요."
 
 
+def _fallback_recommendation(risk: Optional[RiskAssessment], risk_warning: str) -> str:
+    """지연 예산 소진 시 위험도 기반 템플릿 권고"""
+    lines = []
+    if risk:
+        lines.append(f"위험도: {risk.level} ({risk.score:.0f}점)")
+        lines.append(f"주요 요인: {', '.join(risk.factors)}")
+    if risk and risk.immediate_action_needed:
+        lines.append("가능한 빨리 의료 전문가의 진료를 받으시기 바랍니다.")
+    else:
+        lines.append("증상이 지속되거나 악화되면 의료기관을 방문하세요.")
+    lines.append("(시간 제한으로 AI 상세 권고는 생략되었습니다.)")
+    return risk_warning + "\n".join(lines)
+
+
 def recommendation_node(state: AgentState) -> dict:
     """
     응답 생성 노드.
@@ -35,6 +52,7 @@ def recommendation_node(state: AgentState) -> dict:
     - user_mode에 따라 프롬프트 선택 (general / professional)
     - 위험도 high/critical 시 즉시 의료 상담 권고 추가
     - 문헌 참조 정보 포함
+    - 지연 예산 소진 시 위험도 기반 템플릿 권고로 대체 (degraded_nodes 기록)
     """
     user_mode = state.get("user_mode", "general")
     synthesis = state.get("synthesis", "")
@@ -76,10 +94,13 @@ def recommendation_node(state: AgentState) -> dict:
         "포함할 내용: 1) 현재 상태 요약 2) 권장 조치 3) 생활 습관 조언 4) 추가 검사 필요 여부"
     )
 
+    timeout = node_timeout(state.get("deadline"), "recommendation_node")
     try:
+        if timeout == 0.0:
+            raise BudgetExceeded("남은 지연 예산 부족")
         llm = LLMClient()
         system_prompt = _load_prompt(user_mode)
-        recommendation = llm.generate(user_prompt, system_prompt=system_prompt)
+        recommendation = llm.generate(user_prompt, system_prompt=system_prompt, timeout=timeout)
 
         # 위험도 경고 추가
         if risk_warning:
@@ -87,6 +108,12 @@ def recommendation_node(state: AgentState) -> dict:
 
         logger.info("응답 생성 완료: %d자", len(recommendation))
         return {"recommendation": recommendation}
+    except BudgetExceeded as e:
+        logger.warning("응답 생성 지연 예산 초과 → 템플릿 권고로 대체: %s", e)
+        return {
+            "recommendation": _fallback_recommendation(risk, risk_warning),
+            "degraded_nodes": ["recommendation_node"],
+        }
     except Exception as e:
         error_msg = f"응답 생성 중 오류가 발생했습니다: {e}"
         logger.error(error_msg)
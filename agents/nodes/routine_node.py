@@ -0,0 +1,59 @@
+"""루틴 응답 노드 — 모든 규칙 소견 정상 시 LLM 없이 템플릿으로 종합/권고 생성"""
+from __future__ import annotations
+
+import logging
+
+from agents.nodes.risk_node import _calculate_risk
+from agents.nodes.vitals_node import _evaluate_vitals
+from agents.state import AgentState
+from schemas.symptoms import SymptomInput
+from schemas.vitals import VitalSigns
+from utils.config_loader import get_risk_config
+
+logger = logging.getLogger(__name__)
+
+
+def routine_node(state: AgentState) -> dict:
+    """
+    루틴 응답 노드.
+
+    input_validator가 routine으로 판정한 경우 분석/종합/권고 LLM 노드를 모두 대신한다.
+    - 생체신호 평가: 규칙 엔진 비교 텍스트 그대로
+    - 청진음/증상/종합/권고: config/risk.yaml fast_path 템플릿 (user_mode별)
+    - 위험도: 입력 검증 시 산정한 규칙 기반 사전 위험도 재사용
+    """
+    user_mode = state.get("user_mode", "general")
+    templates = get_risk_config()["fast_path"]["templates"]
+    vitals = state.get("vitals") or VitalSigns()
+    symptoms = state.get("symptoms") or SymptomInput()
+    auscultation = state.get("auscultation")
+
+    vitals_text = _evaluate_vitals(vitals, state.get("vitals_findings"))
+
+    if auscultation is None:
+        auscultation_text = templates["auscultation"]["none"]
+    else:
+        auscultation_text = templates["auscultation"]["normal"].format(confidence=auscultation.confidence)
+
+    symptom_text = templates["symptoms"].format(
+        symptoms=", ".join(symptoms.checklist) or "없음",
+        duration=symptoms.duration,
+        severity=symptoms.severity,
+    )
+
+    synthesis_templates = templates["synthesis"]
+    synthesis = synthesis_templates.get(user_mode, synthesis_templates["general"]).format(vitals=vitals_text)
+    recommendation_templates = templates["recommendation"]
+    recommendation = recommendation_templates.get(user_mode, recommendation_templates["general"])
+
+    risk = state.get("pre_risk_assessment") or _calculate_risk(state)
+    logger.info("루틴 응답 생성 완료: mode=%s, risk=%s", user_mode, risk.level)
+
+    return {
+        "auscultation_analysis": auscultation_text,
+        "vitals_evaluation": vitals_text,
+        "symptom_analysis": symptom_text,
+        "synthesis": synthesis.strip(),
+        "risk_assessment": risk,
+        "recommendation": recommendation.strip(),
+    }
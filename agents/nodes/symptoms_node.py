@@ -6,6 +6,7 @@ from pathlib import Path
 
 from agents.state import AgentState
 from models.llm_client import LLMClient
+from utils.deadline import BudgetExceeded, node_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +24,7 @@ def symptoms_node(state: AgentState) -> dict:
     증상 분석 노드.
 
     자유텍스트 + 체크리스트 + 기간 + 강도를 종합하여 LLM 분석.
+    지연 예산 소진 시 입력 증상 요약으로 대체 (degraded_nodes 기록).
     """
     symptoms = state.get("symptoms")
     if symptoms is None:
@@ -41,12 +43,22 @@ def symptoms_node(state: AgentState) -> dict:
         f"위 증상들을 종합 분석하고, 의심되는 호흡기/심혈관 관련 소견을 설명해주세요."
     )
 
+    timeout = node_timeout(state.get("deadline"), "symptoms_node")
     try:
+        if timeout == 0.0:
+            raise BudgetExceeded("남은 지연 예산 부족")
         llm = LLMClient()
         system_prompt = _load_prompt()
-        analysis = llm.generate(user_prompt, system_prompt=system_prompt)
+        analysis = llm.generate(user_prompt, system_prompt=system_prompt, timeout=timeout)
         logger.info("증상 분석 완료: %d자", len(analysis))
         return {"symptom_analysis": analysis}
+    except BudgetExceeded as e:
+        logger.warning("증상 분석 지연 예산 초과 → 입력 요약으로 대체: %s", e)
+        summary = (
+            f"보고된 증상: {checklist_str} / 지속 기간 {symptoms.duration} / 강도 {symptoms.severity}\n"
+            f"(시간 제한으로 AI 분석은 생략되었습니다.)"
+        )
+        return {"symptom_analysis": summary, "degraded_nodes": ["symptoms_node"]}
     except Exception as e:
         error_msg = f"증상 분석 중 오류가 발생했습니다: {e}"
         logger.error(error_msg)
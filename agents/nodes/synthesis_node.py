@@ -1,4 +1,4 @@
-"""종합 판단 노드 — 3개 분석 결과 통합 + 의학 문헌 검색"""
+"""종합 판단 노드 — 3개 분석 결과 + 의학 문헌 통합"""
 from __future__ import annotations
 
 import logging
@@ -7,6 +7,7 @@ from pathlib import Path
 from agents.state import AgentState
 from models.llm_client import LLMClient
 from models.literature_search import MedicalSearchClient
+from utils.deadline import BudgetExceeded, node_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +25,9 @@ def synthesis_node(state: AgentState) -> dict:
     종합 판단 노드.
 
     - 청진음 + 생체신호 + 증상 분석 결과를 통합
+    - literature_node가 미리 검색한 문헌을 프롬프트에 포함
     - LLM으로 종합 판단 생성
-    - PubMed 의학 문헌 검색 실행
+    - 지연 예산 소진 시 개별 분석 결과를 이어 붙여 대체 (degraded_nodes 기록)
     """
     aus_analysis = state.get("auscultation_analysis", "분석 없음")
     vitals_eval = state.get("vitals_evaluation", "평가 없음")
@@ -33,21 +35,11 @@ def synthesis_node(state: AgentState) -> dict:
 
     logger.info("종합 판단 시작")
 
-    # 문헌 검색
-    literature_result = None
+    # 문헌 (literature_node에서 병렬 검색 완료)
+    literature_result = state.get("literature_references")
     literature_context = ""
-    try:
-        search_client = MedicalSearchClient()
-        literature_result = search_client.search_from_analysis(
-            auscultation=state.get("auscultation"),
-            symptoms=state.get("symptoms"),
-            vitals=state.get("vitals"),
-        )
+    if literature_result:
         literature_context = MedicalSearchClient.format_references_for_llm(literature_result)
-        if literature_context:
-            logger.info("문헌 검색 완료: %d건", literature_result.total_count)
-    except Exception as e:
-        logger.warning("문헌 검색 실패 (계속 진행): %s", e)
 
     user_prompt = (
         f"=== 청진음 분석 ===\n{aus_analysis}\n\n"
@@ -65,19 +57,23 @@ def synthesis_node(state: AgentState) -> dict:
         "을 정리해주세요."
     )
 
+    timeout = node_timeout(state.get("deadline"), "synthesis_node")
     try:
+        if timeout == 0.0:
+            raise BudgetExceeded("남은 지연 예산 부족")
         llm = LLMClient()
         system_prompt = _load_prompt()
-        synthesis = llm.generate(user_prompt, system_prompt=system_prompt)
+        synthesis = llm.generate(user_prompt, system_prompt=system_prompt, timeout=timeout)
         logger.info("종합 판단 완료: %d자", len(synthesis))
-        return {
-            "synthesis": synthesis,
-            "literature_references": literature_result,
-        }
+        return {"synthesis": synthesis}
+    except BudgetExceeded as e:
+        logger.warning("종합 판단 지연 예산 초과 → 개별 분석 요약으로 대체: %s", e)
+        summary = (
+            f"[청진음]\n{aus_analysis}\n\n[생체신호]\n{vitals_eval}\n\n[증상]\n{symptom_analysis}\n\n"
+            f"(시간 제한으로 AI 종합 판단은 생략되었습니다.)"
+        )
+        return {"synthesis": summary, "degraded_nodes": ["synthesis_node"]}
     except Exception as e:
         error_msg = f"종합 판단 중 오류가 발생했습니다: {e}"
         logger.error(error_msg)
-        return {
-            "synthesis": error_msg,
-            "literature_references": literature_result,
-        }
+        return {"synthesis": error_msg}
@@ -3,10 +3,13 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
+from typing import Optional
 
 from agents.state import AgentState
 from models.llm_client import LLMClient
-from utils.config_loader import get_vitals_reference
+from models.vitals_rules import get_vitals_rules
+from utils.deadline import BudgetExceeded, node_timeout
+from schemas.vitals import VitalSigns, VitalsFindings
 
 logger = logging.getLogger(__name__)
 
@@ -19,46 +22,47 @@ def _load_prompt() -> str:
     return "당신은 생체신호 평가 전문가입니다. 환자의 생체신호를 분석해주세요."
 
 
-def _evaluate_vitals(vitals) -> str:
-    """생체신호를 정상 범위와 비교하여 평가 텍스트 생성"""
-    ref = get_vitals_reference()
-    findings = []
+def _evaluate_vitals(vitals: VitalSigns, findings: Optional[VitalsFindings] = None) -> str:
+    """생체신호 규칙 평가 결과를 정상 범위 비교 텍스트로 변환"""
+    rules = get_vitals_rules()
+    if findings is None:
+        findings = rules.evaluate(vitals)
+    lines = []
 
     # 심박수
-    hr_ref = ref.get("heart_rate", {}).get("normal", {})
-    hr_min, hr_max = hr_ref.get("min", 60), hr_ref.get("max", 100)
-    if vitals.heart_rate < hr_min:
-        findings.append(f"심박수 {vitals.heart_rate}bpm — 서맥 (정상: {hr_min}-{hr_max})")
-    elif vitals.heart_rate > hr_max:
-        findings.append(f"심박수 {vitals.heart_rate}bpm — 빈맥 (정상: {hr_min}-{hr_max})")
+    hr = rules.bands["heart_rate"]
+    hr_range = f"{hr.normal_min:g}-{hr.normal_max:g}"
+    if findings.has("bradycardia"):
+        lines.append(f"심박수 {vitals.heart_rate}bpm — 서맥 (정상: {hr_range})")
+    elif findings.has("tachycardia"):
+        lines.append(f"심박수 {vitals.heart_rate}bpm — 빈맥 (정상: {hr_range})")
     else:
-        findings.append(f"심박수 {vitals.heart_rate}bpm — 정상 범위")
+        lines.append(f"심박수 {vitals.heart_rate}bpm — 정상 범위")
 
     # 혈압
-    sys_ref = ref.get("blood_pressure", {}).get("systolic", {}).get("normal", {})
-    dia_ref = ref.get("blood_pressure", {}).get("diastolic", {}).get("normal", {})
-    sys_max = sys_ref.get("max", 120)
-    dia_max = dia_ref.get("max", 80)
-
+    sys_max = rules.bands["systolic"].normal_max
+    dia_max = rules.bands["diastolic"].normal_max
     bp_str = f"{vitals.blood_pressure_sys}/{vitals.blood_pressure_dia}mmHg"
-    if vitals.blood_pressure_sys > 140 or vitals.blood_pressure_dia > 90:
-        findings.append(f"혈압 {bp_str} — 고혈압 (정상: ~{sys_max}/{dia_max})")
-    elif vitals.blood_pressure_sys < 90:
-        findings.append(f"혈압 {bp_str} — 저혈압")
+    if findings.has("hypertension"):
+        lines.append(f"혈압 {bp_str} — 고혈압 (정상: ~{sys_max:g}/{dia_max:g})")
+    elif findings.has("hypotension"):
+        lines.append(f"혈압 {bp_str} — 저혈압")
     else:
-        findings.append(f"혈압 {bp_str} — 정상 범위")
+        lines.append(f"혈압 {bp_str} — 정상 범위")
 
     # 체온
-    temp_ref = ref.get("body_temperature", {}).get("normal", {})
-    temp_min, temp_max = temp_ref.get("min", 36.1), temp_ref.get("max", 37.2)
-    if vitals.body_temperature > 38.0:
-        findings.append(f"체온 {vitals.body_temperature}°C — 발열 (정상: {temp_min}-{temp_max})")
-    elif vitals.body_temperature < 35.0:
-        findings.append(f"체온 {vitals.body_temperature}°C — 저체온 (정상: {temp_min}-{temp_max})")
+    temp = rules.bands["temperature"]
+    temp_range = f"{temp.normal_min:g}-{temp.normal_max:g}"
+    if findings.has("fever"):
+        lines.append(f"체온 {vitals.body_temperature}°C — 발열 (정상: {temp_range})")
+    elif findings.has("hypothermia"):
+        lines.append(f"체온 {vitals.body_temperature}°C — 저체온 (정상: {temp_range})")
+    elif findings.temperature_band == "low_grade_fever":
+        lines.append(f"체온 {vitals.body_temperature}°C — 미열 (정상: {temp_range})")
     else:
-        findings.append(f"체온 {vitals.body_temperature}°C — 정상 범위")
+        lines.append(f"체온 {vitals.body_temperature}°C — 정상 범위")
 
-    return "\n".join(findings)
+    return "\n".join(lines)
 
 
 def vitals_node(state: AgentState) -> dict:
@@ -66,6 +70,7 @@ def vitals_node(state: AgentState) -> dict:
     생체신호 평가 노드.
 
     정상 범위와 비교한 후 LLM으로 의학적 해석 생성.
+    지연 예산 소진 시 규칙 비교 텍스트로 대체 (degraded_nodes 기록).
     """
     vitals = state.get("vitals")
     if vitals is None:
@@ -75,19 +80,28 @@ def vitals_node(state: AgentState) -> dict:
                 vitals.heart_rate, vitals.blood_pressure_sys,
                 vitals.blood_pressure_dia, vitals.body_temperature)
 
-    eval_text = _evaluate_vitals(vitals)
+    eval_text = _evaluate_vitals(vitals, state.get("vitals_findings"))
 
     user_prompt = (
         f"환자 생체신호 평가:\n{eval_text}\n\n"
         f"위 생체신호를 종합적으로 평가하고, 이상 소견이 있다면 가능한 원인과 주의사항을 설명해주세요."
     )
 
+    timeout = node_timeout(state.get("deadline"), "vitals_node")
     try:
+        if timeout == 0.0:
+            raise BudgetExceeded("남은 지연 예산 부족")
         llm = LLMClient()
         system_prompt = _load_prompt()
-        evaluation = llm.generate(user_prompt, system_prompt=system_prompt)
+        evaluation = llm.generate(user_prompt, system_prompt=system_prompt, timeout=timeout)
         logger.info("생체신호 평가 완료: %d자", len(evaluation))
         return {"vitals_evaluation": evaluation}
+    except BudgetExceeded as e:
+        logger.warning("생체신호 평가 지연 예산 초과 → 규칙 비교 결과로 대체: %s", e)
+        return {
+            "vitals_evaluation": f"{eval_text}\n(시간 제한으로 AI 해석은 생략되었습니다.)",
+            "degraded_nodes": ["vitals_node"],
+        }
     except Exception as e:
         error_msg = f"생체신호 평가 중 오류가 발생했습니다: {e}"
         logger.error(error_msg)
@@ -1,7 +1,8 @@
 """LangGraph 에이전트 상태 정의"""
 from __future__ import annotations
 
-from typing import Literal, Optional
+import operator
+from typing import Annotated, Any, Literal, Optional
 
 from typing_extensions import TypedDict
 
@@ -9,7 +10,12 @@ from schemas.auscultation import AuscultationResult
 from schemas.literature import LiteratureSearchResult
 from schemas.report import RiskAssessment
 from schemas.symptoms import SymptomInput
-from schemas.vitals import VitalSigns
+from schemas.vitals import VitalSigns, VitalsFindings
+
+
+def _latest(_: Any, new: Any) -> Any:
+    """병렬 노드가 같은 키를 쓸 때 마지막 값 유지"""
+    return new
 
 
 class AgentState(TypedDict, total=False):
@@ -26,6 +32,20 @@ class AgentState(TypedDict, total=False):
     auscultation: Optional[AuscultationResult]
     user_mode: Literal["general", "professional"]
 
+    # === 사전 평가 (입력 검증 시 규칙 기반) ===
+    vitals_findings: Optional[VitalsFindings]
+    pre_risk_assessment: Optional[RiskAssessment]
+    emergency: bool
+    routine: bool
+
+    # === 지연 예산 ===
+    deadline: Optional[float]                           # time.monotonic 기준 마감 시각
+    degraded_nodes: Annotated[list[str], operator.add]  # 예산 소진으로 대체 결과를 낸 노드 (병렬 누적)
+
+    # === 트레이싱 (utils.tracing 활성 시) ===
+    trace_id: Annotated[str, _latest]
+    timing: Annotated[dict, _latest]                    # 요청 단위 시간 요약 (노드 완료마다 갱신)
+
     # === 중간 분석 결과 ===
     auscultation_analysis: Optional[str]
     vitals_evaluation: Optional[str]
@@ -36,5 +56,6 @@ class AgentState(TypedDict, total=False):
     risk_assessment: Optional[RiskAssessment]
 
     # === 최종 출력 ===
+    emergency_recommendation: Optional[str]
     recommendation: Optional[str]
     literature_references: Optional[LiteratureSearchResult]
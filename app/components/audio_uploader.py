@@ -4,13 +4,16 @@ from __future__ import annotations
 import logging
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import streamlit as st
 
-from models.ast_classifier import ASTClassifier
 from schemas.auscultation import AuscultationResult
 from utils.config_loader import get_app_config
+from utils.warmup import readiness
+
+if TYPE_CHECKING:
+    from models.ast_classifier import ASTClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +57,9 @@ def render_audio_uploader() -> Optional[AuscultationResult]:
 
         st.audio(uploaded, format="audio/wav")
 
-        with st.spinner("청진음 분석 중..."):
+        ast_status = readiness()["components"].get("ast", {}).get("status")
+        spinner = "청진음 모델 준비를 기다리는 중..." if ast_status in ("pending", "loading") else "청진음 분석 중..."
+        with st.spinner(spinner):
             classifier = _get_classifier()
             result = classifier.classify(tmp_path)
 
@@ -67,7 +72,12 @@ def render_audio_uploader() -> Optional[AuscultationResult]:
         return None
 
 
-@st.cache_resource
 def _get_classifier() -> ASTClassifier:
-    """AST 분류기 캐싱 (모델 로딩 1회)"""
-    return ASTClassifier()
+    """
+    AST 분류기 (프로세스 공유 인스턴스 — 백그라운드 워밍업이 로딩 중이면 완료까지 대기).
+
+    torch/transformers는 워밍업 또는 첫 업로드 시점에 import.
+    """
+    from models.ast_classifier import get_classifier
+
+    return get_classifier()
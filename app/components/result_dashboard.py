@@ -7,18 +7,25 @@ from typing import Optional
 import streamlit as st
 
 from agents.state import AgentState
-from models.literature_search import MedicalSearchClient
 from schemas.auscultation import AuscultationResult
 from schemas.literature import LiteratureSearchResult
 from schemas.report import RiskAssessment
-from utils.visualization import (
-    create_classification_bar_chart,
-    create_risk_indicator,
-    create_vitals_gauges,
-)
+
+# plotly(utils.visualization), httpx(models.literature_search)는 결과 렌더링 시점에 import
+# — 입력 화면만 그리는 스크립트 재실행마다 비용을 치르지 않도록
 
 logger = logging.getLogger(__name__)
 
+# 지연 예산 소진 시 대체 결과를 낸 노드 → 표시명
+_DEGRADED_LABELS: dict[str, str] = {
+    "auscultation_node": "청진음 해석",
+    "vitals_node": "생체신호 해석",
+    "symptoms_node": "증상 분석",
+    "literature_node": "문헌 검색",
+    "synthesis_node": "종합 판단",
+    "recommendation_node": "상세 권고",
+}
+
 
 def render_result_dashboard(result: AgentState) -> None:
     """
@@ -27,6 +34,17 @@ def render_result_dashboard(result: AgentState) -> None:
     Args:
         result: 워크플로우 실행 완료된 AgentState
     """
+    # === 긴급 응답 (위급 소견 시 템플릿) ===
+    emergency_recommendation = result.get("emergency_recommendation")
+    if emergency_recommendation:
+        st.error(emergency_recommendation)
+
+    # === 지연 예산 초과로 간소화된 단계 ===
+    degraded = result.get("degraded_nodes") or []
+    if degraded:
+        labels = ", ".join(_DEGRADED_LABELS.get(node, node) for node in dict.fromkeys(degraded))
+        st.warning(f"⏱️ 시간 제한으로 일부 단계가 간소화되었습니다: {labels}")
+
     # === 위험도 인디케이터 ===
     risk: Optional[RiskAssessment] = result.get("risk_assessment")
     if risk:
@@ -51,9 +69,31 @@ def render_result_dashboard(result: AgentState) -> None:
     if literature and literature.references:
         _render_literature_section(literature)
 
+    # === 처리 시간 (트레이싱 활성 시) ===
+    timing = result.get("timing")
+    if timing:
+        _render_timing_section(timing)
+
+
+def _render_timing_section(timing: dict) -> None:
+    """노드별 처리 시간 요약"""
+    with st.expander(f"처리 시간 {timing['total_ms'] / 1000:.1f}초 (trace {timing['trace_id'][:8]})", expanded=False):
+        rows = sorted(timing["spans"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        st.table([
+            {"단계": name, "횟수": stats["count"], "누적(ms)": f"{stats['total_ms']:.0f}"}
+            for name, stats in rows
+        ])
+        tokens = timing.get("tokens", {})
+        st.caption(
+            f"LLM 토큰: 입력 {tokens.get('input', 0)} / 출력 {tokens.get('output', 0)} · "
+            f"캐시 적중 {timing.get('cache_hits', 0)}건"
+        )
+
 
 def _render_risk_section(risk: RiskAssessment) -> None:
     """위험도 인디케이터 + 요인 표시"""
+    from utils.visualization import create_risk_indicator
+
     col1, col2 = st.columns([1, 1])
     with col1:
         fig = create_risk_indicator(risk.level, risk.score)
@@ -87,6 +127,8 @@ def _render_risk_section(risk: RiskAssessment) -> None:
 
 def _render_detail_tabs(result: AgentState) -> None:
     """청진음/생체신호/증상/종합 탭별 상세 분석"""
+    from utils.visualization import create_classification_bar_chart, create_vitals_gauges
+
     tabs = st.tabs(["생체신호", "증상 분석", "청진음 분석", "종합 판단"])
 
     # 생체신호
@@ -124,6 +166,8 @@ def _render_detail_tabs(result: AgentState) -> None:
 
 def _render_literature_section(literature: LiteratureSearchResult) -> None:
     """참고 문헌 표시"""
+    from models.literature_search import MedicalSearchClient
+
     with st.expander(f"참고 의학 문헌 ({literature.total_count}건)", expanded=False):
         refs = MedicalSearchClient.format_references_for_display(literature)
         for ref in refs:
@@ -13,13 +13,18 @@ import logging
 
 import streamlit as st
 
-from agents.graph import graph
 from agents.state import AgentState
 from app.components.audio_uploader import render_audio_uploader
 from app.components.result_dashboard import render_result_dashboard
 from app.components.symptom_input import render_symptom_input
 from app.components.vitals_input import render_vitals_input
+from agents.nodes.input_validator import ANALYSIS_METRIC, FAST_PATH_METRIC
+from schemas.api import AnalysisRequest, AnalysisResponse
+from service.job_queue import create_job_queue
+from utils import metrics
 from utils.config_loader import get_app_config
+from utils.tracing import start_trace
+from utils.warmup import readiness, start_warmup
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -37,10 +42,14 @@ def main() -> None:
         layout=st_config.get("layout", "wide"),
     )
 
+    # 모델 워밍업 (프로세스당 1회 백그라운드 실행 — 스크립트 재실행 시에는 기존 상태 재사용)
+    start_warmup()
+
     # === 사이드바 ===
     with st.sidebar:
         st.title("🩺 StethoAgent")
         st.caption(config.get("app", {}).get("description", "AI 기반 건강 가이드"))
+        _render_readiness()
 
         st.divider()
 
@@ -61,6 +70,15 @@ def main() -> None:
 
         st.divider()
 
+        # 루틴 경로 비율 (프로세스 누적)
+        total = metrics.get_count(ANALYSIS_METRIC)
+        if total:
+            st.metric(
+                "루틴 경로 비율",
+                f"{metrics.rate(FAST_PATH_METRIC, ANALYSIS_METRIC):.0%}",
+                help=f"누적 분석 {total}건 중 LLM 없이 템플릿으로 처리된 비율",
+            )
+
         # 면책 조항
         disclaimer = config.get("disclaimer", "")
         if disclaimer:
@@ -91,12 +109,31 @@ def main() -> None:
 
     # === 결과 탭 ===
     with tab_result:
+        if "analysis_job_id" in st.session_state:
+            _render_job_status(st.session_state["analysis_job_id"])
         if "analysis_result" in st.session_state:
             render_result_dashboard(st.session_state["analysis_result"])
         else:
             st.info("입력 탭에서 데이터를 입력하고 '분석 실행' 버튼을 눌러주세요.")
 
 
+# 워밍업 구성요소 → 표시명
+_COMPONENT_LABELS = {"ast": "청진음 모델", "llm": "LLM"}
+
+
+def _render_readiness() -> None:
+    """모델 준비 상태 표시 (워밍업 진행 중/실패 시에만)"""
+    state = readiness()
+    if state["ready"]:
+        return
+    for name, info in state["components"].items():
+        label = _COMPONENT_LABELS.get(name, name)
+        if info["status"] == "failed":
+            st.warning(f"{label} 준비 실패 — 첫 사용 시 다시 로딩합니다 ({info['error']})")
+        elif info["status"] in ("pending", "loading"):
+            st.info(f"⏳ {label} 준비 중... (첫 분석이 느릴 수 있습니다)")
+
+
 def _run_analysis(vitals, symptoms, auscultation, user_mode: str) -> None:
     """에이전트 워크플로우 실행"""
     input_state: AgentState = {
@@ -107,10 +144,25 @@ def _run_analysis(vitals, symptoms, auscultation, user_mode: str) -> None:
     if auscultation is not None:
         input_state["auscultation"] = auscultation
 
+    if get_app_config().get("jobs", {}).get("streamlit_submit", False):
+        _submit_job(input_state)
+        return
+
     with st.spinner("AI 분석을 진행하고 있습니다... (1-2분 소요될 수 있습니다)"):
         try:
-            result = graph.invoke(input_state)
+            # 노드 완료 단위 스트리밍: 긴급 응답은 전체 분석을 기다리지 않고 즉시 표시
+            # 그래프(LangGraph/LangChain/httpx)는 첫 분석 시점에 로딩·컴파일 (앱 기동 시간 단축)
+            from agents.graph import get_graph
+
+            result: AgentState = {}
+            with start_trace() as trace:
+                for mode, chunk in get_graph().stream(input_state, stream_mode=["updates", "values"]):
+                    if mode == "values":
+                        result = chunk
+                    elif "emergency_node" in chunk:
+                        st.error(chunk["emergency_node"]["emergency_recommendation"])
             st.session_state["analysis_result"] = result
+            logger.info("분석 소요 시간: trace=%s, %.1f초", trace.trace_id, trace.summary()["total_ms"] / 1000)
             st.success("분석이 완료되었습니다! '결과' 탭에서 확인하세요.")
             logger.info("워크플로우 실행 완료")
         except Exception as e:
@@ -118,5 +170,45 @@ def _run_analysis(vitals, symptoms, auscultation, user_mode: str) -> None:
             logger.error("워크플로우 실행 실패: %s", e)
 
 
+def _submit_job(input_state: AgentState) -> None:
+    """작업 큐에 분석 제출 (워커 프로세스가 처리, 결과 탭에서 조회)"""
+    try:
+        request = AnalysisRequest(**input_state)
+        job_id = create_job_queue().submit(request.model_dump(mode="json"))
+    except Exception as e:
+        st.error(f"분석 작업 제출 중 오류가 발생했습니다: {e}")
+        logger.error("작업 제출 실패: %s", e)
+        return
+    st.session_state["analysis_job_id"] = job_id
+    st.session_state.pop("analysis_result", None)
+    st.success(f"분석 작업이 제출되었습니다 (작업 ID: {job_id[:8]}). '결과' 탭에서 진행 상태를 확인하세요.")
+
+
+def _render_job_status(job_id: str) -> None:
+    """제출한 작업 상태 표시 — 완료되면 결과를 세션에 적재"""
+    record = create_job_queue().get(job_id)
+    if record is None:
+        st.error("작업을 찾을 수 없습니다.")
+        st.session_state.pop("analysis_job_id", None)
+        return
+
+    if record.status == "succeeded":
+        # 대시보드는 입력값(생체신호, 청진음)도 표시하므로 작업 입력과 결과를 합쳐 상태로 복원
+        request = AnalysisRequest.model_validate(record.payload)
+        response = AnalysisResponse.model_validate(record.result)
+        st.session_state["analysis_result"] = {
+            **request.to_state(),
+            **{k: v for k, v in dict(response).items() if v is not None},
+        }
+        st.session_state.pop("analysis_job_id", None)
+    elif record.status == "failed":
+        st.error(f"분석 작업이 실패했습니다 (시도 {record.attempts}회): {record.error}")
+        st.session_state.pop("analysis_job_id", None)
+    else:
+        label = "대기 중" if record.status == "queued" else f"분석 중 (시도 {record.attempts}/{record.max_attempts})"
+        st.info(f"작업 {job_id[:8]}: {label}")
+        st.button("🔄 상태 새로고침")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1 @@
+"""오프라인 부하 테스트 패키지 (Ollama / E-utilities 스텁 서버 + 부하 생성기)"""
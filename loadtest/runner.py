@@ -0,0 +1,337 @@
+"""
+부하 생성기.
+
+그래프(graph.invoke) 또는 HTTP 서비스(/analyze)를 목표 동시성으로 호출해 처리량/지연을 측정한다.
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가 (python loadtest/runner.py 직접 실행 대비)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+import json
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Optional
+
+import numpy as np
+
+from schemas.api import AnalysisRequest
+from schemas.auscultation import AuscultationResult
+from schemas.symptoms import SymptomInput
+from schemas.vitals import VitalSigns
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+# 요청 구성 비율 (routine: LLM 우회, analysis: 전체 분석, emergency: 긴급 응답 + 전체 분석)
+_PROFILE_WEIGHTS = {"routine": 0.2, "analysis": 0.65, "emergency": 0.15}
+
+
+@dataclass
+class RequestSample:
+    """요청 1건의 측정 결과 (시간 단위: ms)"""
+
+    profile: str
+    queue_ms: float
+    latency_ms: float
+    nodes: dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def sample_requests(count: int, seed: int = 0) -> list[tuple[str, AnalysisRequest]]:
+    """결정적 요청 구성 (프로파일 이름, 요청) 목록"""
+    rng = random.Random(seed)
+    profiles = rng.choices(
+        list(_PROFILE_WEIGHTS), weights=list(_PROFILE_WEIGHTS.values()), k=count
+    )
+    requests = []
+    for profile in profiles:
+        if profile == "routine":
+            request = AnalysisRequest(
+                symptoms=SymptomInput(free_text="", checklist=[], severity="경미"),
+                auscultation=AuscultationResult(
+                    file_name="loadtest.wav", classification="Normal", confidence=0.9,
+                    probabilities={"Normal": 0.9, "Crackle": 0.04, "Wheeze": 0.04, "Both": 0.02},
+                ),
+            )
+        elif profile == "emergency":
+            request = AnalysisRequest(
+                vitals=VitalSigns(
+                    heart_rate=165,
+                    blood_pressure_sys=85,
+                    blood_pressure_dia=50,
+                    body_temperature=39.8,
+                ),
+                symptoms=SymptomInput(
+                    checklist=["호흡곤란", "가슴 통증", "객혈(피 섞인 가래)"],
+                    severity="매우 심함",
+                ),
+            )
+        else:
+            classification = rng.choice(["Crackle", "Wheeze", "Both"])
+            request = AnalysisRequest(
+                vitals=VitalSigns(
+                    heart_rate=rng.randint(85, 115),
+                    body_temperature=round(rng.uniform(37.0, 38.5), 1),
+                ),
+                symptoms=SymptomInput(
+                    checklist=rng.sample(["기침", "가래", "호흡곤란", "발열", "피로감"], 3),
+                    severity=rng.choice(["경미", "중간", "심함"]),
+                ),
+                auscultation=AuscultationResult(
+                    file_name="loadtest.wav", classification=classification, confidence=0.7,
+                    probabilities={
+                        "Normal": 0.1, "Crackle": 0.1, "Wheeze": 0.1, "Both": 0.1,
+                        classification: 0.7,
+                    },
+                ),
+            )
+        requests.append((profile, request))
+    return requests
+
+
+def graph_target(request: AnalysisRequest) -> dict[str, float]:
+    """그래프를 프로세스 내에서 직접 실행 → 노드별 소요 시간 (ms)"""
+    from agents.graph import get_graph
+    from utils.tracing import start_trace
+
+    with start_trace(export=False) as trace:
+        get_graph().invoke(request.to_state())
+    nodes: dict[str, float] = {}
+    for span in trace.finished_spans():
+        if span.name.startswith("node."):
+            name = span.name.removeprefix("node.")
+            nodes[name] = nodes.get(name, 0.0) + span.duration_ms
+    return nodes
+
+
+def service_target(
+    url: str, timeout: float = 300.0
+) -> Callable[[AnalysisRequest], dict[str, float]]:
+    """HTTP 서비스 /analyze 호출 → 응답 timing의 노드별 소요 시간 (ms)"""
+    import httpx
+
+    client = httpx.Client(base_url=url, timeout=timeout)
+
+    def call(request: AnalysisRequest) -> dict[str, float]:
+        response = client.post("/analyze", json=request.model_dump(mode="json"))
+        if response.status_code != 200:
+            raise RuntimeError(f"HTTP {response.status_code}: {response.text[:200]}")
+        spans = (response.json().get("timing") or {}).get("spans", {})
+        return {
+            name.removeprefix("node."): stats["total_ms"]
+            for name, stats in spans.items() if name.startswith("node.")
+        }
+
+    return call
+
+
+def run_load(
+    requests: list[tuple[str, AnalysisRequest]],
+    target: Callable[[AnalysisRequest], dict[str, float]],
+    concurrency: int = 4,
+    rate: Optional[float] = None,
+) -> tuple[list[RequestSample], float]:
+    """
+    요청 목록을 concurrency개 워커로 실행.
+
+    Args:
+        rate: 초당 도착 요청 수 (open-loop).
+            None이면 전부 시작 시점에 도착 (closed-loop — 워커가 비는 대로 처리)
+
+    Returns:
+        (요청별 측정 결과, 전체 소요 시간 초).
+        queue_ms는 예정 도착 시각부터 워커가 실행을 시작할 때까지 대기 시간
+    """
+    samples: list[RequestSample] = []
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    def run(profile: str, request: AnalysisRequest, scheduled: float) -> None:
+        begin = time.perf_counter()
+        error = None
+        nodes: dict[str, float] = {}
+        try:
+            nodes = target(request)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logger.warning("요청 실패 (%s): %s", profile, error)
+        end = time.perf_counter()
+        sample = RequestSample(
+            profile, (begin - scheduled) * 1000, (end - begin) * 1000, nodes, error
+        )
+        with lock:
+            samples.append(sample)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="load") as pool:
+        for i, (profile, request) in enumerate(requests):
+            scheduled = start + (i / rate if rate else 0.0)
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(run, profile, request, scheduled)
+    return samples, time.perf_counter() - start
+
+
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {"count": 0}
+    arr = np.asarray(values)
+    return {
+        "count": len(values),
+        "mean": round(float(arr.mean()), 1),
+        "p50": round(float(np.percentile(arr, 50)), 1),
+        "p95": round(float(np.percentile(arr, 95)), 1),
+        "p99": round(float(np.percentile(arr, 99)), 1),
+        "max": round(float(arr.max()), 1),
+    }
+
+
+def summarize(samples: list[RequestSample], wall_seconds: float) -> dict[str, Any]:
+    """
+    측정 결과 요약.
+
+    Returns:
+        requests, errors, throughput_rps(성공 요청 기준), latency_ms / queue_ms(p50/p95/p99),
+        nodes(노드별 p50/p95/p99), profiles(요청 구성별 지연)
+    """
+    ok = [s for s in samples if s.error is None]
+    errors: dict[str, int] = {}
+    for s in samples:
+        if s.error is not None:
+            kind = s.error.split(":", 1)[0]
+            errors[kind] = errors.get(kind, 0) + 1
+
+    node_values: dict[str, list[float]] = {}
+    for s in ok:
+        for name, ms in s.nodes.items():
+            node_values.setdefault(name, []).append(ms)
+    profile_values: dict[str, list[float]] = {}
+    for s in ok:
+        profile_values.setdefault(s.profile, []).append(s.latency_ms)
+
+    return {
+        "requests": len(samples),
+        "succeeded": len(ok),
+        "errors": errors,
+        "wall_seconds": round(wall_seconds, 2),
+        "throughput_rps": round(len(ok) / wall_seconds, 3) if wall_seconds > 0 else 0.0,
+        "latency_ms": _percentiles([s.latency_ms for s in ok]),
+        "queue_ms": _percentiles([s.queue_ms for s in samples]),
+        "nodes": {name: _percentiles(values) for name, values in sorted(node_values.items())},
+        "profiles": {name: _percentiles(values) for name, values in sorted(profile_values.items())},
+    }
+
+
+def format_summary(summary: Mapping[str, Any]) -> str:
+    lines = [
+        f"요청 {summary['requests']}건 "
+        f"(성공 {summary['succeeded']}, 오류 {summary['errors'] or 0}) "
+        f"/ {summary['wall_seconds']}초 → {summary['throughput_rps']} req/s",
+        f"{'구간':24s} {'건수':>5s} {'p50':>9s} {'p95':>9s} {'p99':>9s}",
+    ]
+    rows = [("전체", summary["latency_ms"]), ("대기(queue)", summary["queue_ms"])]
+    rows += [(f"node.{name}", stats) for name, stats in summary["nodes"].items()]
+    for name, stats in rows:
+        if stats.get("count"):
+            lines.append(
+                f"{name:24s} {stats['count']:5d} "
+                f"{stats['p50']:9.1f} {stats['p95']:9.1f} {stats['p99']:9.1f}"
+            )
+    return "\n".join(lines)
+
+
+def start_stubs(config: Mapping[str, Any]):
+    """설정대로 Ollama / E-utilities 스텁 시작 → (ollama, eutils)"""
+    from loadtest.stubs import EutilsStub, OllamaStub
+
+    ollama = OllamaStub(**config.get("ollama_stub", {})).start()
+    eutils = EutilsStub(**config.get("eutils_stub", {})).start()
+    return ollama, eutils
+
+
+if __name__ == "__main__":
+    import argparse
+
+    load_config = get_app_config().get("loadtest", {})
+
+    parser = argparse.ArgumentParser(description="StethoAgent 오프라인 부하 테스트")
+    parser.add_argument(
+        "command", choices=["run", "stubs"],
+        help="run: 스텁 + 부하 실행, stubs: 스텁 서버만 실행 (서비스 프로세스를 따로 띄울 때)",
+    )
+    parser.add_argument(
+        "--target", choices=["graph", "service"], default=None,
+        help="graph: 프로세스 내 invoke, service: /analyze",
+    )
+    parser.add_argument("--url", type=str, default=None, help="서비스 URL (target=service)")
+    parser.add_argument("--requests", type=int, default=None, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 요청 수")
+    parser.add_argument(
+        "--rate", type=float, default=None, help="초당 도착 요청 수 (생략 시 closed-loop)"
+    )
+    parser.add_argument(
+        "--no-stubs", action="store_true", help="스텁 없이 실제 Ollama/PubMed 사용"
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="결과 JSON 경로 (기본: config loadtest.report)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+
+    stubs = () if args.no_stubs else start_stubs(load_config)
+    if stubs:
+        os.environ["STETHO_OLLAMA_BASE_URL"] = stubs[0].base_url
+        os.environ["STETHO_PUBMED_BASE_URL"] = stubs[1].base_url
+        print(f"STETHO_OLLAMA_BASE_URL={stubs[0].base_url}")
+        print(f"STETHO_PUBMED_BASE_URL={stubs[1].base_url}")
+
+    if args.command == "stubs":
+        print("스텁 실행 중 — 위 환경변수로 서비스를 실행하세요 (Ctrl+C 종료)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    target_name = args.target or load_config.get("target", "graph")
+    if target_name == "service":
+        call = service_target(
+            args.url or load_config.get("service_url", "http://localhost:8000")
+        )
+    else:
+        call = graph_target
+
+    planned = sample_requests(
+        args.requests or load_config.get("requests", 40), load_config.get("seed", 0)
+    )
+    rate = args.rate if args.rate is not None else load_config.get("rate")
+    concurrency = args.concurrency or load_config.get("concurrency", 4)
+    results, wall = run_load(planned, call, concurrency, rate)
+    report = summarize(results, wall)
+    if stubs:
+        report["stubs"] = {"ollama": stubs[0].stats(), "eutils": stubs[1].stats()}
+
+    output = Path(args.output or load_config.get("report", "logs/loadtest/report.json"))
+    if not output.is_absolute():
+        output = _PROJECT_ROOT / output
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    print(format_summary(report))
+    print(f"✓ 결과 저장: {output}")
+    for stub in stubs:
+        stub.stop()
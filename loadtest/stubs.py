@@ -0,0 +1,333 @@
+"""
+로컬 스텁 서버 — Ollama 호환 /api/chat, PubMed E-utilities (지연/토큰 속도/장애 주입 설정 가능)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+from models.reference_ranking import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# 스텁 응답 문장 (공백 단위 = 토큰 1개로 스트리밍)
+_STUB_SENTENCE = (
+    "제공된 정보를 종합하면 현재 소견은 경과 관찰이 필요한 수준으로 보입니다. "
+    "증상이 지속되거나 악화되면 의료기관을 방문하여 진료를 받으시기 바랍니다."
+).split()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """경로 → 스텁 서버 메서드 분배 (요청마다 스레드 1개)"""
+
+    server: _HTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s %s", self.address_string(), format % args)
+
+    def _dispatch(self, method: str) -> None:
+        url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.stub.handle(self, method, url.path, parse_qs(url.query), body)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._dispatch("POST")
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address: tuple[str, int], stub: StubServer) -> None:
+        self.stub = stub
+        super().__init__(address, _Handler)
+
+
+class StubServer(ABC):
+    """
+    스텁 서버 공통 (백그라운드 스레드에서 실행, with 문 지원).
+
+    port=0이면 빈 포트를 자동 선택한다. 실제 주소는 start() 이후 base_url.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.failure_rate = failure_rate
+        self._random = random.Random(seed)
+        self._httpd: Optional[_HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.counts: dict[str, int] = {"requests": 0, "failures": 0}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> StubServer:
+        self._httpd = _HTTPServer((self.host, self.port), self)
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+        logger.info("%s 시작: %s", type(self).__name__, self.base_url)
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> StubServer:
+        return self.start()
+
+    def __exit__(self, *_: Any) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counts)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def _should_fail(self) -> bool:
+        """장애 주입 (failure_rate 확률로 True)"""
+        with self._lock:
+            fail = self._random.random() < self.failure_rate
+        if fail:
+            self._count("failures")
+        return fail
+
+    @staticmethod
+    def _send(handler: BaseHTTPRequestHandler, status: int, body: bytes, content_type: str) -> None:
+        handler.send_response(status)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def _json(self, handler: BaseHTTPRequestHandler, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self._send(handler, status, body, "application/json")
+
+    @abstractmethod
+    def handle(
+        self,
+        handler: BaseHTTPRequestHandler,
+        method: str,
+        path: str,
+        query: dict[str, list[str]],
+        body: bytes,
+    ) -> None:
+        """요청 1건 처리 (핸들러 스레드에서 호출, 응답까지 직접 전송)"""
+
+
+class OllamaStub(StubServer):
+    """
+    Ollama 호환 스텁 (/api/chat, /api/generate, /api/tags).
+
+    - 동시 처리 수는 num_parallel로 제한 (실제 OLLAMA_NUM_PARALLEL처럼 초과 요청은 서버에서 대기)
+    - 프롬프트 처리: prompt_eval_delay + 입력 토큰 / prompt_tokens_per_second
+    - 생성: output_tokens개를 tokens_per_second 속도로 스트리밍 (stream=false면 한 번에 응답)
+    - failure_rate 확률로 HTTP 500
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        tokens_per_second: float = 30.0,
+        prompt_tokens_per_second: float = 500.0,
+        prompt_eval_delay: float = 0.0,
+        output_tokens: int = 120,
+        num_parallel: int = 4,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(host, port, failure_rate, seed)
+        self.tokens_per_second = tokens_per_second
+        self.prompt_tokens_per_second = prompt_tokens_per_second
+        self.prompt_eval_delay = prompt_eval_delay
+        self.output_tokens = output_tokens
+        self._slots = threading.BoundedSemaphore(num_parallel)
+
+    def handle(self, handler, method, path, query, body) -> None:
+        self._count("requests")
+        if path == "/api/tags":
+            self._json(handler, {"models": [{"name": "stub", "model": "stub"}]})
+        elif path in ("/api/chat", "/api/generate") and method == "POST":
+            payload = json.loads(body or b"{}")
+            if self._should_fail():
+                self._json(handler, {"error": "stub: 주입된 장애"}, status=500)
+                return
+            with self._slots:
+                self._generate(handler, path, payload)
+        else:
+            self._json(handler, {"error": f"stub: 지원하지 않는 경로 {path}"}, status=404)
+
+    def _generate(
+        self, handler: BaseHTTPRequestHandler, path: str, payload: dict[str, Any]
+    ) -> None:
+        model = payload.get("model", "stub")
+        if path == "/api/generate" and not payload.get("prompt"):
+            # 모델 사전 적재 요청 (프롬프트 없음)
+            self._json(
+                handler, {"model": model, "created_at": _now(), "response": "", "done": True}
+            )
+            return
+
+        prompt = payload.get("prompt") or " ".join(
+            m.get("content", "") for m in payload.get("messages", [])
+        )
+        prompt_tokens = estimate_tokens(prompt)
+        prompt_seconds = self.prompt_eval_delay + prompt_tokens / self.prompt_tokens_per_second
+        time.sleep(prompt_seconds)
+
+        tokens = [_STUB_SENTENCE[i % len(_STUB_SENTENCE)] + " " for i in range(self.output_tokens)]
+        interval = 1.0 / self.tokens_per_second
+        final = {
+            "model": model,
+            "created_at": _now(),
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": prompt_tokens,
+            "prompt_eval_duration": int(prompt_seconds * 1e9),
+            "eval_count": len(tokens),
+            "eval_duration": int(len(tokens) * interval * 1e9),
+        }
+
+        if not payload.get("stream", True):
+            time.sleep(len(tokens) * interval)
+            self._json(handler, {**final, **_content(path, "".join(tokens))})
+            return
+
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/x-ndjson")
+        handler.end_headers()
+        start = time.perf_counter()
+        for i, token in enumerate(tokens):
+            # 누적 시각 기준으로 대기 (토큰마다 sleep 오차가 쌓이지 않게)
+            delay = start + (i + 1) * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            chunk = {"model": model, "created_at": _now(), "done": False, **_content(path, token)}
+            handler.wfile.write((json.dumps(chunk, ensure_ascii=False) + "\n").encode())
+        handler.wfile.write((json.dumps({**final, **_content(path, "")}) + "\n").encode())
+        handler.close_connection = True
+
+
+class EutilsStub(StubServer):
+    """
+    PubMed E-utilities 스텁 (esearch / esummary / epost, JSON 고정 응답).
+
+    PMID는 검색어 해시로 결정적으로 생성하고,
+    모든 요청은 latency_ms(+ 0~jitter_ms) 지연 후 응답한다.
+    failure_rate 확률로 HTTP 503 (Retry-After 없음 → 클라이언트 백오프 재시도 경로).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 300.0,
+        jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(host, port, failure_rate, seed)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._history: dict[str, list[str]] = {}
+
+    def handle(self, handler, method, path, query, body) -> None:
+        self._count("requests")
+        params = {k: v[0] for k, v in query.items()}
+        if method == "POST":
+            params.update({k: v[0] for k, v in parse_qs(body.decode()).items()})
+
+        with self._lock:
+            jitter = self._random.uniform(0, self.jitter_ms)
+        time.sleep((self.latency_ms + jitter) / 1000)
+        if self._should_fail():
+            self._send(handler, 503, b"stub: injected failure", "text/plain")
+            return
+
+        endpoint = path.rsplit("/", 1)[-1]
+        if endpoint == "esearch.fcgi":
+            self._esearch(handler, params)
+        elif endpoint == "esummary.fcgi":
+            self._esummary(handler, params)
+        elif endpoint == "epost.fcgi":
+            self._epost(handler, params)
+        else:
+            self._send(handler, 404, f"stub: unknown endpoint {endpoint}".encode(), "text/plain")
+
+    def _esearch(self, handler: BaseHTTPRequestHandler, params: dict[str, str]) -> None:
+        retmax = int(params.get("retmax", 20))
+        digest = int(hashlib.sha256(params.get("term", "").encode()).hexdigest()[:8], 16)
+        ids = [str(30_000_000 + (digest + i * 7919) % 9_000_000) for i in range(retmax)]
+        self._json(handler, {
+            "esearchresult": {"count": str(len(ids)), "retmax": str(retmax), "idlist": ids},
+        })
+
+    def _esummary(self, handler: BaseHTTPRequestHandler, params: dict[str, str]) -> None:
+        if "WebEnv" in params:
+            with self._lock:
+                ids = self._history.get(params["WebEnv"], [])
+            start = int(params.get("retstart", 0))
+            ids = ids[start:start + int(params.get("retmax", 500))]
+        else:
+            ids = [i for i in params.get("id", "").split(",") if i]
+        result: dict[str, Any] = {"uids": ids}
+        for pmid in ids:
+            result[pmid] = {
+                "uid": pmid,
+                "title": f"Stub article {pmid}: respiratory sounds and clinical assessment",
+                "authors": [{"name": "Stub A"}, {"name": "Stub B"}],
+                "source": "Stub J Respir Med",
+                "pubdate": f"{2019 + int(pmid) % 6} Jan 1",
+                "elocationid": f"doi: 10.0000/stub.{pmid}",
+            }
+        self._json(handler, {"result": result})
+
+    def _epost(self, handler: BaseHTTPRequestHandler, params: dict[str, str]) -> None:
+        web_env = f"STUB_{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self._history[web_env] = [i for i in params.get("id", "").split(",") if i]
+        xml = f"<ePostResult><QueryKey>1</QueryKey><WebEnv>{web_env}</WebEnv></ePostResult>"
+        self._send(handler, 200, xml.encode(), "text/xml")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _content(path: str, text: str) -> dict[str, Any]:
+    """생성 텍스트 → 응답 필드 (/api/chat은 message.content, /api/generate는 response)"""
+    if path == "/api/chat":
+        return {"message": {"role": "assistant", "content": text}}
+    return {"response": text}
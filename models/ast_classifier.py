@@ -1,16 +1,21 @@
 """AST 청진음 분류기 모듈 — HuggingFace AST 모델 기반 4-class 분류"""
 from __future__ import annotations
 
+import contextlib
 import logging
+import threading
 
 import numpy as np
 import torch
 from transformers import ASTFeatureExtractor, ASTForAudioClassification
 
 from models.audio_preprocessor import AudioPreprocessor
+from models.autotune import apply_threads, load_profile
+from models.model_bundle import load_bundle
 from schemas.auscultation import AUSCULTATION_CLASSES, AuscultationResult
 from utils.config_loader import get_ast_config
 from utils.device_utils import get_device
+from utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -38,17 +43,42 @@ class ASTClassifier:
 
         self.device = get_device()
         self.preprocessor = AudioPreprocessor()
+        self.batch_size: int = 1
+        self.precision: str = "float32"
+
+        # 자동 튜닝 프로파일 (python -m models.autotune 로 생성, 없으면 기본값)
+        profile = load_profile(config.get("autotune", {}).get("profile"))
+        if profile:
+            apply_threads(profile)
+            self.device = torch.device(profile["device"])
+            self.batch_size = profile["batch_size"]
+            self.precision = profile["precision"]
+            logger.info(
+                "튜닝 프로파일 적용: %s, 스레드 %d, 배치 %d, %s",
+                self.device, profile["threads"], self.batch_size, self.precision,
+            )
+
+        bundle_config = config.get("bundle", {})
+        bundle_path = bundle_config.get("path")
 
-        logger.info("AST 모델 로딩 중: %s", self.model_name)
+        logger.info("AST 모델 로딩 중: %s", bundle_path or self.model_name)
         try:
-            self.feature_extractor = ASTFeatureExtractor.from_pretrained(
-                self.model_name,
-                cache_dir=cache_dir,
-            )
-            self.model = ASTForAudioClassification.from_pretrained(
-                self.model_name,
-                cache_dir=cache_dir,
-            )
+            if bundle_path:
+                # 오프라인 번들: 체크섬 검증 후 mmap 로딩
+                # (번들이 없거나 손상되면 허브로 폴백하지 않음)
+                self.feature_extractor, self.model = load_bundle(
+                    bundle_path,
+                    checksums=bundle_config.get("verify", "checksum") == "checksum",
+                )
+            else:
+                self.feature_extractor = ASTFeatureExtractor.from_pretrained(
+                    self.model_name,
+                    cache_dir=cache_dir,
+                )
+                self.model = ASTForAudioClassification.from_pretrained(
+                    self.model_name,
+                    cache_dir=cache_dir,
+                )
             self.model.to(self.device)
             self.model.eval()
             logger.info("AST 모델 로딩 완료 (디바이스: %s)", self.device)
@@ -115,6 +145,52 @@ class ASTClassifier:
         # 매핑 실패 시 기본값
         return {"Normal": 0.7, "Crackle": 0.1, "Wheeze": 0.1, "Both": 0.1}
 
+    def _autocast(self) -> contextlib.AbstractContextManager:
+        """bfloat16 프로파일이면 autocast (가중치는 float32 그대로 — mmap/공유 페이지 유지)"""
+        if self.precision == "bfloat16":
+            return torch.autocast(device_type=self.device.type, dtype=torch.bfloat16)
+        return contextlib.nullcontext()
+
+    def _infer_batch(self, waveforms: list[np.ndarray], sr: int) -> np.ndarray:
+        """파형 목록 → fbank 피처 → 모델 로짓 (N x 527), batch_size 단위로 나눠 forward"""
+        logits: list[np.ndarray] = []
+        for start in range(0, len(waveforms), self.batch_size):
+            chunk = waveforms[start:start + self.batch_size]
+            try:
+                with span("ast.fbank", batch=len(chunk)):
+                    inputs = self.feature_extractor(
+                        chunk,
+                        sampling_rate=sr,
+                        return_tensors="pt",
+                    )
+                    inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            except Exception as e:
+                raise RuntimeError(f"피처 추출 실패: {e}") from e
+
+            try:
+                with span("ast.forward", device=str(self.device), batch=len(chunk)), \
+                        torch.no_grad(), self._autocast():
+                    outputs = self.model(**inputs)
+                    logits.append(outputs.logits.float().cpu().numpy())
+            except Exception as e:
+                raise RuntimeError(f"모델 추론 실패: {e}") from e
+        return np.concatenate(logits)
+
+    def _infer(self, waveform: np.ndarray, sr: int) -> np.ndarray:
+        """파형 → fbank 피처 → 모델 로짓 (527차원)"""
+        return self._infer_batch([waveform], sr)[0]
+
+    def warmup(self, seconds: float = 1.0) -> None:
+        """
+        무음 파형으로 더미 추론 1회.
+
+        첫 forward에서 일어나는 지연 초기화(디바이스 커널 컴파일, 메모리 할당)를
+        사용자 요청 전에 끝내 둔다.
+        """
+        sr = self.preprocessor.sample_rate
+        self._infer(np.zeros(int(sr * seconds), dtype=np.float32), sr)
+        logger.info("AST 모델 워밍업 완료 (더미 %.1f초)", seconds)
+
     def classify(self, file_path: str, spectrogram_save_path: str | None = None) -> AuscultationResult:
         """
         오디오 파일 분류 실행.
@@ -133,31 +209,41 @@ class ASTClassifier:
         waveform = result["waveform"]
         sr = result["sample_rate"]
 
-        # 2. 피처 추출
-        try:
-            inputs = self.feature_extractor(
-                waveform,
-                sampling_rate=sr,
-                return_tensors="pt",
-            )
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
-        except Exception as e:
-            raise RuntimeError(f"피처 추출 실패: {e}") from e
-
-        # 3. 추론
-        try:
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits.cpu().numpy()[0]
-        except Exception as e:
-            raise RuntimeError(f"모델 추론 실패: {e}") from e
+        # 2-3. 피처 추출 (fbank) + 추론
+        logits = self._infer(waveform, sr)
 
         # 4. 4-class 매핑
+        return self._to_result(Path(file_path).name, logits, result.get("spectrogram_path"))
+
+    def classify_batch(self, file_paths: list[str]) -> list[AuscultationResult]:
+        """
+        여러 오디오 파일을 batch_size 단위로 묶어 분류 (스펙트로그램 저장 없음).
+
+        Args:
+            file_paths: 오디오 파일 경로 목록
+
+        Returns:
+            입력 순서대로 AuscultationResult 목록
+        """
+        from pathlib import Path
+
+        if not file_paths:
+            return []
+        processed = [self.preprocessor.process(path) for path in file_paths]
+        sr = processed[0]["sample_rate"]
+        logits = self._infer_batch([p["waveform"] for p in processed], sr)
+        return [
+            self._to_result(Path(path).name, row)
+            for path, row in zip(file_paths, logits, strict=True)
+        ]
+
+    def _to_result(
+        self, file_name: str, logits: np.ndarray, spectrogram_path: str | None = None
+    ) -> AuscultationResult:
         probabilities = self._map_to_4class(logits)
         classification = max(probabilities, key=probabilities.get)
         confidence = probabilities[classification]
 
-        file_name = Path(file_path).name
         logger.info("분류 완료: %s → %s (%.2f%%)", file_name, classification, confidence * 100)
 
         return AuscultationResult(
@@ -165,10 +251,29 @@ class ASTClassifier:
             classification=classification,
             confidence=confidence,
             probabilities=probabilities,
-            spectrogram_path=result.get("spectrogram_path"),
+            spectrogram_path=spectrogram_path,
         )
 
 
+_CLASSIFIER: ASTClassifier | None = None
+_CLASSIFIER_LOCK = threading.Lock()
+
+
+def get_classifier() -> ASTClassifier:
+    """
+    프로세스 공유 AST 분류기 (최초 호출 시 로딩).
+
+    백그라운드 워밍업과 요청 처리(UI 업로드, 서비스 워커)가 같은 인스턴스를 쓰므로
+    워밍업 중 들어온 요청은 로딩 완료를 기다렸다가 재사용한다.
+    """
+    global _CLASSIFIER
+    if _CLASSIFIER is None:
+        with _CLASSIFIER_LOCK:
+            if _CLASSIFIER is None:
+                _CLASSIFIER = ASTClassifier()
+    return _CLASSIFIER
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -12,6 +12,7 @@ import numpy as np
 import soundfile as sf
 
 from utils.config_loader import get_ast_config
+from utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -59,13 +60,16 @@ class AudioPreprocessor:
             raise FileNotFoundError(f"오디오 파일을 찾을 수 없습니다: {path}")
 
         try:
-            # librosa로 로딩 (자동으로 모노 변환 + 리샘플링)
-            waveform, sr = librosa.load(
-                str(path),
-                sr=self.sample_rate,
-                mono=self.mono,
-            )
-            logger.info("오디오 로딩 완료: %s (원본 → %dHz 리샘플링)", path.name, sr)
+            # 디코딩(원본 샘플레이트, 모노 변환)과 리샘플링을 나눠 단계별 시간 기록
+            with span("ast.decode", file=path.name) as s:
+                waveform, orig_sr = librosa.load(str(path), sr=None, mono=self.mono)
+                if s is not None:
+                    s.set(orig_sr=orig_sr, samples=len(waveform))
+            sr = self.sample_rate
+            if orig_sr != sr:
+                with span("ast.resample", orig_sr=orig_sr, target_sr=sr):
+                    waveform = librosa.resample(waveform, orig_sr=orig_sr, target_sr=sr)
+            logger.info("오디오 로딩 완료: %s (%dHz → %dHz 리샘플링)", path.name, orig_sr, sr)
         except Exception as e:
             raise RuntimeError(f"오디오 로딩 실패: {e}") from e
 
@@ -149,7 +153,8 @@ class AudioPreprocessor:
             - spectrogram_path: str | None
         """
         waveform, sr = self.load_audio(file_path)
-        mel_spec_db = self.create_mel_spectrogram(waveform, sr, spectrogram_save_path)
+        with span("ast.spectrogram", save=spectrogram_save_path is not None):
+            mel_spec_db = self.create_mel_spectrogram(waveform, sr, spectrogram_save_path)
 
         duration = len(waveform) / sr
         spec_path = str(spectrogram_save_path) if spectrogram_save_path else None
@@ -0,0 +1,337 @@
+"""AST 추론 자동 튜닝 — 스레드 수/배치 크기/정밀도/디바이스 탐색 후 파레토 최적 프로파일 저장"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from models.ast_classifier import ASTClassifier
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 (상대 프로파일 경로 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+PROFILE_FORMAT_VERSION = 1
+PRECISIONS = ("float32", "bfloat16")
+
+
+@dataclass(frozen=True)
+class TuneResult:
+    """설정 조합 하나의 측정 결과 (지연 단위: ms, 처리량 단위: 클립/초)"""
+
+    device: str
+    threads: int
+    batch_size: int
+    precision: str
+    throughput: float
+    p50_ms: float
+    p95_ms: float
+
+
+def resolve_profile_path(path: str | Path) -> Path:
+    """상대 경로는 프로젝트 루트 기준"""
+    path = Path(path)
+    return path if path.is_absolute() else _PROJECT_ROOT / path
+
+
+def host_fingerprint() -> dict[str, Any]:
+    """프로파일이 측정된 호스트 식별 정보 (다른 머신/torch 버전의 프로파일 적용 방지)"""
+    import torch
+
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "torch_version": torch.__version__,
+        "mps_available": torch.backends.mps.is_available(),
+    }
+
+
+def default_thread_counts(cpu_count: Optional[int] = None) -> list[int]:
+    """1, 2, 4, … (2의 거듭제곱) + 전체 코어 수"""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cpu_count:
+        counts.append(n)
+        n *= 2
+    counts.append(cpu_count)
+    return counts
+
+
+def available_devices() -> list[str]:
+    import torch
+
+    return ["cpu", "mps"] if torch.backends.mps.is_available() else ["cpu"]
+
+
+def synthetic_clips(
+    count: int, seconds: float, sample_rate: int, seed: int = 0
+) -> list[np.ndarray]:
+    """측정용 합성 클립 (저진폭 백색 잡음 — 실제 청진음과 같은 길이/샘플링 레이트)"""
+    rng = np.random.default_rng(seed)
+    return [
+        (rng.standard_normal(int(seconds * sample_rate)) * 0.05).astype(np.float32)
+        for _ in range(count)
+    ]
+
+
+def pareto_front(results: Sequence[TuneResult]) -> list[TuneResult]:
+    """
+    처리량(최대화)과 p95 지연(최소화) 기준 파레토 최적 결과.
+
+    Returns:
+        p95 지연 오름차순 (뒤로 갈수록 처리량이 큼)
+    """
+    front: list[TuneResult] = []
+    for result in sorted(results, key=lambda r: (r.p95_ms, -r.throughput)):
+        if not front or result.throughput > front[-1].throughput:
+            front.append(result)
+    return front
+
+
+def select_result(front: Sequence[TuneResult], max_p95_ms: Optional[float] = None) -> TuneResult:
+    """
+    파레토 전선에서 적용할 설정 선택.
+
+    p95 지연 예산 안에서 처리량이 가장 큰 설정. 예산을 만족하는 설정이 없으면 지연이 가장 짧은 설정.
+    """
+    if not front:
+        raise RuntimeError("자동 튜닝 측정 결과가 없습니다")
+    within = [r for r in front if max_p95_ms is None or r.p95_ms <= max_p95_ms]
+    if not within:
+        logger.warning(
+            "p95 %.0fms 예산을 만족하는 설정이 없어 최소 지연 설정을 선택합니다", max_p95_ms
+        )
+        return front[0]
+    return max(within, key=lambda r: r.throughput)
+
+
+def _measure(
+    classifier: ASTClassifier, clips: list[np.ndarray], sr: int, repeats: int
+) -> list[float]:
+    """배치 1회 추론 지연 목록 (초) — 첫 호출은 워밍업으로 제외"""
+    classifier._infer_batch(clips, sr)
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        classifier._infer_batch(clips, sr)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def autotune(
+    classifier: ASTClassifier,
+    threads: Optional[Sequence[int]] = None,
+    batch_sizes: Sequence[int] = (1, 2, 4, 8),
+    precisions: Sequence[str] = PRECISIONS,
+    devices: Optional[Sequence[str]] = None,
+    clip_seconds: float = 10.0,
+    repeats: int = 5,
+) -> list[TuneResult]:
+    """
+    설정 조합 전체를 현재 머신에서 측정.
+
+    분류기의 디바이스/정밀도/배치 크기와 torch 스레드 수를 바꿔 가며 합성 클립 배치를 추론한다.
+    측정이 끝나면 원래 설정으로 되돌린다.
+
+    Returns:
+        조합별 측정 결과
+    """
+    import torch
+
+    unknown = [p for p in precisions if p not in PRECISIONS]
+    if unknown:
+        raise RuntimeError(f"지원하지 않는 정밀도: {', '.join(unknown)}")
+
+    threads = list(threads or default_thread_counts())
+    devices = list(devices or available_devices())
+    sr = classifier.preprocessor.sample_rate
+    clips = synthetic_clips(max(batch_sizes), clip_seconds, sr)
+    original = (
+        classifier.device, classifier.precision, classifier.batch_size, torch.get_num_threads()
+    )
+
+    results: list[TuneResult] = []
+    try:
+        for device in devices:
+            classifier.device = torch.device(device)
+            classifier.model.to(classifier.device)
+            # MPS는 CPU 스레드 수의 영향이 작아 1개 값만 측정
+            for n_threads in threads if device == "cpu" else threads[-1:]:
+                torch.set_num_threads(n_threads)
+                for precision in precisions:
+                    classifier.precision = precision
+                    for batch_size in batch_sizes:
+                        classifier.batch_size = batch_size
+                        try:
+                            latencies = _measure(classifier, clips[:batch_size], sr, repeats)
+                        except RuntimeError as e:
+                            logger.warning("측정 실패 (%s/%d스레드/%s/배치 %d): %s",
+                                           device, n_threads, precision, batch_size, e)
+                            continue
+                        ms = np.asarray(latencies) * 1000
+                        result = TuneResult(
+                            device=device,
+                            threads=n_threads,
+                            batch_size=batch_size,
+                            precision=precision,
+                            throughput=round(batch_size / float(np.mean(latencies)), 2),
+                            p50_ms=round(float(np.percentile(ms, 50)), 1),
+                            p95_ms=round(float(np.percentile(ms, 95)), 1),
+                        )
+                        logger.info("측정: %s", result)
+                        results.append(result)
+    finally:
+        classifier.device, classifier.precision, classifier.batch_size, n_threads = original
+        classifier.model.to(classifier.device)
+        torch.set_num_threads(n_threads)
+    return results
+
+
+def write_profile(
+    path: str | Path,
+    results: Sequence[TuneResult],
+    max_p95_ms: Optional[float] = None,
+    interop_threads: int = 1,
+) -> dict[str, Any]:
+    """
+    파레토 전선 + 선택된 설정을 프로파일(JSON)로 저장.
+
+    Returns:
+        프로파일
+    """
+    front = pareto_front(results)
+    selected = select_result(front, max_p95_ms)
+    profile = {
+        "format_version": PROFILE_FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": host_fingerprint(),
+        "max_p95_ms": max_p95_ms,
+        "selected": {**asdict(selected), "interop_threads": interop_threads},
+        "pareto": [asdict(r) for r in front],
+        "results": [asdict(r) for r in results],
+    }
+    path = resolve_profile_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    tmp.write_text(json.dumps(profile, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+    logger.info("튜닝 프로파일 저장: %s (선택: %s)", path, selected)
+    return profile
+
+
+def load_profile(path: Optional[str | Path]) -> Optional[dict[str, Any]]:
+    """
+    튜닝 프로파일 로딩.
+
+    Returns:
+        선택된 설정
+        (프로파일이 없거나, 형식이 다르거나, 다른 호스트에서 측정됐으면 None — 기본값 사용)
+    """
+    if not path:
+        return None
+    path = resolve_profile_path(path)
+    if not path.exists():
+        return None
+    try:
+        profile = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning("튜닝 프로파일을 읽을 수 없어 무시합니다: %s (%s)", path, e)
+        return None
+    if profile.get("format_version") != PROFILE_FORMAT_VERSION:
+        logger.warning("지원하지 않는 튜닝 프로파일 형식이라 무시합니다: %s", path)
+        return None
+    if profile.get("host") != host_fingerprint():
+        logger.warning(
+            "다른 호스트/torch 버전에서 측정된 튜닝 프로파일이라 무시합니다 (다시 튜닝하세요): %s",
+            path,
+        )
+        return None
+    return profile["selected"]
+
+
+def apply_threads(selected: Mapping[str, Any]) -> None:
+    """
+    프로파일의 torch 스레드 수 적용.
+
+    inter-op 스레드 수는 프로세스에서 병렬 작업이 시작되기 전에만 바꿀 수 있어
+    실패하면 경고만 남긴다.
+    """
+    import torch
+
+    if selected.get("threads"):
+        torch.set_num_threads(int(selected["threads"]))
+    interop = selected.get("interop_threads")
+    if interop and interop != torch.get_num_interop_threads():
+        try:
+            torch.set_num_interop_threads(int(interop))
+        except RuntimeError as e:
+            logger.warning("inter-op 스레드 수를 바꿀 수 없습니다 (이미 병렬 작업 시작): %s", e)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from utils.config_loader import get_ast_config
+
+    tune_config = get_ast_config().get("autotune", {})
+
+    parser = argparse.ArgumentParser(description="AST 추론 자동 튜닝 (스레드/배치/정밀도/디바이스)")
+    parser.add_argument(
+        "--output", type=str, default=None, help="프로파일 경로 (기본: config autotune.profile)"
+    )
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=None,
+        help="측정할 스레드 수 (기본: 1,2,4…코어 수)",
+    )
+    parser.add_argument(
+        "--batch-sizes", type=int, nargs="+", default=None, help="측정할 배치 크기"
+    )
+    parser.add_argument("--repeats", type=int, default=None, help="조합별 반복 횟수")
+    parser.add_argument("--max-p95-ms", type=float, default=None, help="p95 지연 예산 (ms)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+
+    from models.ast_classifier import ASTClassifier
+
+    # 기존 프로파일이 적용돼 있어도 측정 중에는 조합별 설정으로 덮어씀
+    classifier = ASTClassifier()
+    tuned = autotune(
+        classifier,
+        threads=args.threads or tune_config.get("threads"),
+        batch_sizes=args.batch_sizes or tune_config.get("batch_sizes", [1, 2, 4, 8]),
+        precisions=tune_config.get("precisions", list(PRECISIONS)),
+        clip_seconds=tune_config.get("clip_seconds", 10.0),
+        repeats=args.repeats or tune_config.get("repeats", 5),
+    )
+    max_p95_ms = args.max_p95_ms if args.max_p95_ms is not None else tune_config.get("max_p95_ms")
+    saved = write_profile(
+        args.output or tune_config.get("profile") or "artifacts/ast_profile.json",
+        tuned,
+        max_p95_ms=max_p95_ms,
+        interop_threads=tune_config.get("interop_threads", 1),
+    )
+
+    print(
+        f"{'디바이스':6s} {'스레드':>4s} {'배치':>4s} {'정밀도':10s} "
+        f"{'클립/초':>8s} {'p95(ms)':>8s}"
+    )
+    for row in saved["pareto"]:
+        print(
+            f"{row['device']:6s} {row['threads']:4d} {row['batch_size']:4d} "
+            f"{row['precision']:10s} {row['throughput']:8.2f} {row['p95_ms']:8.1f}"
+        )
+    print(f"✓ 선택: {saved['selected']}")
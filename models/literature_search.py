@@ -3,16 +3,31 @@ from __future__ import annotations
 
 import abc
 import logging
+import math
 import os
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Optional, Union
+from xml.etree import ElementTree
 
 import httpx
 
+from models.reference_ranking import (
+    cap_by_token_budget,
+    deduplicate_references,
+    format_reference_line,
+    rerank_references,
+)
+from models.vitals_rules import evaluate_vitals
 from schemas.auscultation import AuscultationResult
-from schemas.literature import LiteratureSearchResult, MedicalReference
+from schemas.literature import CanonicalQuery, LiteratureSearchResult, MedicalReference
 from schemas.symptoms import SymptomInput
-from schemas.vitals import VitalSigns
-from utils.config_loader import get_literature_config, get_vitals_reference
+from schemas.vitals import VitalSigns, VitalsFindings
+from utils.config_loader import get_literature_config
+from utils.rate_limiter import SingleFlight, TokenBucket, backoff_delay, parse_retry_after
+from utils.replay import interaction
+from utils.tracing import annotate, span
 
 logger = logging.getLogger(__name__)
 
@@ -54,11 +69,59 @@ class BaseMedicalSearchProvider(abc.ABC):
         """
         ...
 
+    def search_batch(
+        self,
+        queries: list[str],
+        max_results: int,
+        timeout: int,
+    ) -> dict[str, list[MedicalReference]]:
+        """
+        여러 쿼리 일괄 검색. 기본 구현은 쿼리별 search() 순차 호출이며,
+        소스가 일괄 조회 API를 제공하면 재정의하여 왕복 횟수를 줄인다.
+
+        Args:
+            queries: 검색 쿼리 목록 (중복 허용)
+            max_results: 쿼리당 최대 결과 수
+            timeout: 요청 타임아웃 (초)
+
+        Returns:
+            쿼리 → MedicalReference 리스트 딕셔너리
+
+        Raises:
+            RuntimeError: 검색 실패 시
+        """
+        return {query: self.search(query, max_results, timeout) for query in dict.fromkeys(queries)}
+
 
 # ---------------------------------------------------------------------------
 # PubMed 프로바이더
 # ---------------------------------------------------------------------------
 
+# NCBI rate limit은 API 키(또는 IP) 단위이므로 프로세스 전체에서 버킷을 공유
+_NCBI_LIMITERS: dict[float, TokenBucket] = {}
+_NCBI_LIMITERS_LOCK = threading.Lock()
+
+# 동일 검색 동시 요청 병합 (여러 분석이 같은 쿼리를 동시에 요청하는 경우)
+_PUBMED_INFLIGHT = SingleFlight()
+
+# 재시도해도 결과가 바뀌지 않는 상태 코드 (429 제외 4xx)
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def get_ncbi_limiter(rate: float) -> TokenBucket:
+    """
+    요청률별 프로세스 공유 토큰 버킷 반환.
+
+    용량 1 (버스트 없음): 용량이 rate이면 유휴 후 rate건이 한꺼번에 나가고 같은 1초 안에
+    보충분까지 나가 NCBI 한도(초당 요청 수)를 넘는다.
+    """
+    with _NCBI_LIMITERS_LOCK:
+        limiter = _NCBI_LIMITERS.get(rate)
+        if limiter is None:
+            limiter = TokenBucket(rate=rate, capacity=1)
+            _NCBI_LIMITERS[rate] = limiter
+        return limiter
+
 
 class PubMedProvider(BaseMedicalSearchProvider):
     """
@@ -66,6 +129,10 @@ class PubMedProvider(BaseMedicalSearchProvider):
 
     - ESearch (PMID 검색) + ESummary (메타데이터 조회) 2단계 파이프라인
     - NCBI_API_KEY 환경변수 지원 (선택, 없으면 기본 rate limit)
+    - 프로세스 공유 토큰 버킷으로 NCBI 허용 요청률 준수 (키 없음 3 req/s, 키 있음 10 req/s)
+    - 실패 시 지수 백오프 + jitter 재시도 (Retry-After 헤더 우선)
+    - 동일 쿼리 동시 요청은 하나의 요청으로 병합
+    - 일괄 검색 시 PMID 합집합을 EPost/WebEnv 기반 ESummary로 한 번에 조회
     """
 
     @property
@@ -75,35 +142,123 @@ class PubMedProvider(BaseMedicalSearchProvider):
     def __init__(self) -> None:
         config = get_literature_config()
         pubmed_config = config.get("pubmed", {})
-        self.base_url: str = pubmed_config.get("base_url", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils")
+        # STETHO_PUBMED_BASE_URL: 설정 파일 수정 없이 다른 서버로 전환 (부하 테스트 스텁 등)
+        self.base_url: str = os.environ.get("STETHO_PUBMED_BASE_URL") or pubmed_config.get(
+            "base_url", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils",
+        )
         self.min_year: int = pubmed_config.get("min_year", 2019)
         self.language: str = pubmed_config.get("language", "english")
         self.sort: str = pubmed_config.get("sort", "relevance")
         self.url_template: str = pubmed_config.get("url_template", "https://pubmed.ncbi.nlm.nih.gov/{id}/")
         self._api_key: Optional[str] = os.environ.get("NCBI_API_KEY")
-        logger.info("PubMedProvider 초기화: base_url=%s, min_year=%d", self.base_url, self.min_year)
 
-    def _make_request(self, url: str, params: dict, timeout: int, max_retries: int = 2) -> dict:
-        """HTTP GET 요청 + 재시도 처리"""
+        rate_config = pubmed_config.get("rate_limit", {})
+        if self._api_key:
+            self.requests_per_second: float = rate_config.get("requests_per_second_with_key", 10)
+        else:
+            self.requests_per_second = rate_config.get("requests_per_second", 3)
+        self._limiter = get_ncbi_limiter(self.requests_per_second)
+
+        common = config.get("common", {})
+        self.backoff_base: float = common.get("backoff_base", 0.5)
+        self.backoff_max: float = common.get("backoff_max", 8.0)
+
+        batch_config = pubmed_config.get("batch", {})
+        self.esummary_id_limit: int = batch_config.get("esummary_id_limit", 200)
+        self.esummary_page_size: int = batch_config.get("esummary_page_size", 500)
+        logger.info(
+            "PubMedProvider 초기화: base_url=%s, min_year=%d, rate=%.0f req/s",
+            self.base_url, self.min_year, self.requests_per_second,
+        )
+
+    def _send(
+        self,
+        url: str,
+        params: dict,
+        timeout: int,
+        max_retries: int = 2,
+        method: str = "GET",
+    ) -> httpx.Response:
+        """HTTP 요청 + rate limit + 백오프 재시도 처리"""
+        # 녹화/재생 키는 엔드포인트 + 파라미터 (base_url, api_key 제외 — 스텁/실서버 녹화 공용)
+        key = {"method": method, "endpoint": url.rsplit("/", 1)[-1], "params": dict(params)}
         if self._api_key:
             params["api_key"] = self._api_key
+        return interaction(
+            "http",
+            key,
+            lambda: self._send_with_retry(url, params, timeout, max_retries, method),
+            encode=lambda r: {
+                "status": r.status_code,
+                "content_type": r.headers.get("Content-Type", ""),
+                "text": r.text,
+            },
+            decode=lambda d: httpx.Response(
+                d["status"],
+                text=d["text"],
+                headers={"Content-Type": d["content_type"]},
+                request=httpx.Request(method, url),
+            ),
+        )
 
+    def _send_with_retry(
+        self, url: str, params: dict, timeout: int, max_retries: int, method: str
+    ) -> httpx.Response:
+        endpoint = url.rsplit("/", 1)[-1]
         last_error = None
         for attempt in range(1, max_retries + 1):
+            self._limiter.acquire()
+            retry_after = None
             try:
-                response = httpx.get(url, params=params, timeout=timeout)
-                response.raise_for_status()
-                return response.json()
+                with span(
+                    "pubmed.request", endpoint=endpoint, method=method, attempt=attempt
+                ) as s:
+                    if method == "POST":
+                        # 수백 개 ID 목록은 URL 길이 제한을 넘을 수 있어 POST 본문으로 전송
+                        response = httpx.post(url, data=params, timeout=timeout)
+                    else:
+                        response = httpx.get(url, params=params, timeout=timeout)
+                    if s is not None:
+                        s.set(status=response.status_code)
+                    response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError as e:
+                last_error = e
+                status = e.response.status_code
+                logger.warning(
+                    "PubMed 요청 실패 (시도 %d/%d): HTTP %d", attempt, max_retries, status
+                )
+                if status not in _RETRYABLE_STATUS:
+                    break
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
             except Exception as e:
                 last_error = e
                 logger.warning("PubMed 요청 실패 (시도 %d/%d): %s", attempt, max_retries, e)
 
+            if attempt < max_retries:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after)
+                logger.info("PubMed 재시도 대기: %.2f초", delay)
+                time.sleep(delay)
+
         raise RuntimeError(f"PubMed API 요청이 {max_retries}회 모두 실패했습니다: {last_error}")
 
+    def _make_request(
+        self,
+        url: str,
+        params: dict,
+        timeout: int,
+        max_retries: int = 2,
+        method: str = "GET",
+    ) -> dict:
+        """JSON 응답 요청"""
+        return self._send(url, params, timeout, max_retries, method).json()
+
     def search(self, query: str, max_results: int = 5, timeout: int = 15) -> list[MedicalReference]:
         """
         PubMed 검색 실행: ESearch → ESummary 2단계.
 
+        동일 조건의 검색이 이미 진행 중이면 그 결과를 공유한다.
+
         Args:
             query: 영문 검색 쿼리
             max_results: 최대 결과 수
@@ -112,26 +267,18 @@ class PubMedProvider(BaseMedicalSearchProvider):
         Returns:
             MedicalReference 리스트
         """
-        # 1단계: ESearch — PMID 목록 조회
-        esearch_params = {
-            "db": "pubmed",
-            "term": query,
-            "retmode": "json",
-            "retmax": max_results,
-            "sort": self.sort,
-            "mindate": str(self.min_year),
-            "datetype": "pdat",
-        }
-        esearch_data = self._make_request(f"{self.base_url}/esearch.fcgi", esearch_params, timeout)
-
-        id_list = esearch_data.get("esearchresult", {}).get("idlist", [])
+        key = (self.base_url, query, max_results, self.sort, self.min_year)
+        references = _PUBMED_INFLIGHT.do(key, lambda: self._search(query, max_results, timeout))
+        # 병합된 호출끼리 리스트를 공유하지 않도록 복사본 반환
+        return list(references)
+
+    def _search(self, query: str, max_results: int, timeout: int) -> list[MedicalReference]:
+        """ESearch → ESummary 실제 실행 (병합 없이)"""
+        id_list = self._esearch(query, max_results, timeout)
         if not id_list:
             logger.info("PubMed 검색 결과 없음: query='%s'", query)
             return []
 
-        logger.info("PubMed ESearch: %d건 PMID 조회 완료", len(id_list))
-
-        # 2단계: ESummary — 논문 메타데이터 조회
         esummary_params = {
             "db": "pubmed",
             "id": ",".join(id_list),
@@ -139,7 +286,104 @@ class PubMedProvider(BaseMedicalSearchProvider):
         }
         esummary_data = self._make_request(f"{self.base_url}/esummary.fcgi", esummary_params, timeout)
 
-        result_data = esummary_data.get("result", {})
+        references = self._build_references(id_list, esummary_data.get("result", {}))
+        logger.info("PubMed ESummary: %d건 메타데이터 조회 완료", len(references))
+        return references
+
+    def search_batch(
+        self,
+        queries: list[str],
+        max_results: int = 5,
+        timeout: int = 15,
+    ) -> dict[str, list[MedicalReference]]:
+        """
+        PubMed 일괄 검색: 쿼리별 ESearch → PMID 합집합 → 최소 횟수 ESummary → 쿼리별 분배.
+
+        - 합집합이 `esummary_id_limit` 이하: ESummary 1회 (POST id 목록)
+        - 초과: EPost 1회로 History Server에 등록 후 WebEnv로 페이지 단위 ESummary
+
+        N개 쿼리의 왕복 횟수가 2N회에서 약 N+1회로 줄어든다.
+
+        Args:
+            queries: 영문 검색 쿼리 목록 (중복 허용)
+            max_results: 쿼리당 최대 결과 수
+            timeout: 요청 타임아웃 (초)
+
+        Returns:
+            쿼리 → MedicalReference 리스트 딕셔너리 (각 쿼리의 검색 순위 유지)
+        """
+        id_lists = {
+            query: self._esearch(query, max_results, timeout)
+            for query in dict.fromkeys(queries)
+        }
+        union = list(dict.fromkeys(pmid for ids in id_lists.values() for pmid in ids))
+        summaries = self._fetch_summaries(union, timeout) if union else {}
+
+        results = {
+            query: self._build_references(ids, summaries)
+            for query, ids in id_lists.items()
+        }
+        logger.info(
+            "PubMed 일괄 검색: 쿼리 %d건, 고유 PMID %d건",
+            len(id_lists), len(union),
+        )
+        return results
+
+    def _esearch(self, query: str, max_results: int, timeout: int) -> list[str]:
+        """ESearch — PMID 목록 조회"""
+        esearch_params = {
+            "db": "pubmed",
+            "term": query,
+            "retmode": "json",
+            "retmax": max_results,
+            "sort": self.sort,
+            "mindate": str(self.min_year),
+            "datetype": "pdat",
+        }
+        esearch_data = self._make_request(f"{self.base_url}/esearch.fcgi", esearch_params, timeout)
+        id_list = esearch_data.get("esearchresult", {}).get("idlist", [])
+        if id_list:
+            logger.info("PubMed ESearch: %d건 PMID 조회 완료", len(id_list))
+        return id_list
+
+    def _fetch_summaries(self, pmids: list[str], timeout: int) -> dict:
+        """PMID 목록의 ESummary 결과를 최소 요청 수로 조회 (PMID → article 딕셔너리)"""
+        if len(pmids) <= self.esummary_id_limit:
+            params = {"db": "pubmed", "id": ",".join(pmids), "retmode": "json"}
+            data = self._make_request(
+                f"{self.base_url}/esummary.fcgi", params, timeout, method="POST"
+            )
+            return data.get("result", {})
+
+        # EPost로 History Server에 등록 (응답은 XML만 지원)
+        epost_response = self._send(
+            f"{self.base_url}/epost.fcgi",
+            {"db": "pubmed", "id": ",".join(pmids)},
+            timeout,
+            method="POST",
+        )
+        root = ElementTree.fromstring(epost_response.text)
+        web_env = root.findtext("WebEnv")
+        query_key = root.findtext("QueryKey")
+        if not web_env or not query_key:
+            raise RuntimeError("PubMed EPost 응답에 WebEnv/QueryKey가 없습니다")
+
+        summaries: dict = {}
+        for retstart in range(0, len(pmids), self.esummary_page_size):
+            params = {
+                "db": "pubmed",
+                "WebEnv": web_env,
+                "query_key": query_key,
+                "retstart": retstart,
+                "retmax": self.esummary_page_size,
+                "retmode": "json",
+            }
+            data = self._make_request(f"{self.base_url}/esummary.fcgi", params, timeout)
+            summaries.update(data.get("result", {}))
+        return summaries
+
+    def _build_references(self, id_list: list[str], result_data: dict) -> list[MedicalReference]:
+        """ESummary 결과 → 검색 순위 순서의 MedicalReference 리스트"""
         references: list[MedicalReference] = []
 
         for i, pmid in enumerate(id_list):
@@ -172,11 +416,11 @@ class PubMedProvider(BaseMedicalSearchProvider):
                 journal=article.get("source", ""),
                 year=year,
                 doi=doi,
+                pmid=pmid,
                 url=self.url_template.format(id=pmid),
                 relevance_score=relevance,
             ))
 
-        logger.info("PubMed ESummary: %d건 메타데이터 조회 완료", len(references))
         return references
 
 
@@ -190,6 +434,188 @@ PROVIDER_REGISTRY: dict[str, type[BaseMedicalSearchProvider]] = {
 }
 
 
+# ---------------------------------------------------------------------------
+# 서킷 브레이커
+# ---------------------------------------------------------------------------
+
+
+class CircuitBreaker:
+    """
+    프로바이더 단위 서킷 브레이커 (closed → open → half-open).
+
+    - closed: 정상 호출. 최근 `window_size`회 중 실패율이 임계값 이상이면 open
+    - open: `cooldown_seconds` 동안 호출 없이 즉시 실패 처리
+    - half-open: 쿨다운 후 시험 호출 허용. 성공하면 closed, 실패하면 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int = 10,
+        minimum_calls: int = 4,
+        failure_rate_threshold: float = 0.5,
+        cooldown_seconds: float = 60.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.name = name
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (쿨다운 경과 시 half-open으로 전환)"""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown_seconds:
+            self._state = self.HALF_OPEN
+            self._half_open_calls = 0
+            logger.info("서킷 브레이커 half-open: %s (시험 호출 허용)", self.name)
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        logger.warning(
+            "서킷 브레이커 open: %s (%.0f초간 호출 차단)", self.name, self.cooldown_seconds
+        )
+
+    def allow_request(self) -> bool:
+        """호출 허용 여부 (half-open에서는 시험 호출 수만큼 허용)"""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            return False
+
+    def remaining_cooldown(self) -> float:
+        """open 상태 해제까지 남은 시간 (초)"""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self.cooldown_seconds - (time.monotonic() - self._opened_at))
+
+    def record_success(self) -> None:
+        """호출 성공 기록"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._state = self.CLOSED
+                self._outcomes.clear()
+                logger.info("서킷 브레이커 closed: %s (시험 호출 성공)", self.name)
+                return
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """호출 실패 기록"""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                self._open()
+                return
+            if self._state == self.OPEN:
+                return
+            self._outcomes.append(False)
+            if len(self._outcomes) >= self.minimum_calls:
+                failure_rate = self._outcomes.count(False) / len(self._outcomes)
+                if failure_rate >= self.failure_rate_threshold:
+                    self._open()
+
+
+# 프로바이더 인스턴스는 분석마다 새로 생성되므로 브레이커는 소스 이름 단위로 프로세스 공유
+_CIRCUIT_BREAKERS: dict[str, CircuitBreaker] = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(source_name: str) -> CircuitBreaker:
+    """소스별 서킷 브레이커 반환 (없으면 config 기반 생성)"""
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(source_name)
+        if breaker is None:
+            cb_config = get_literature_config().get("circuit_breaker", {})
+            breaker = CircuitBreaker(
+                name=source_name,
+                window_size=cb_config.get("window_size", 10),
+                minimum_calls=cb_config.get("minimum_calls", 4),
+                failure_rate_threshold=cb_config.get("failure_rate_threshold", 0.5),
+                cooldown_seconds=cb_config.get("cooldown_seconds", 60),
+                half_open_max_calls=cb_config.get("half_open_max_calls", 1),
+            )
+            _CIRCUIT_BREAKERS[source_name] = breaker
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """모든 서킷 브레이커 초기화 (테스트/설정 변경 시)"""
+    with _CIRCUIT_BREAKERS_LOCK:
+        _CIRCUIT_BREAKERS.clear()
+
+
+# ---------------------------------------------------------------------------
+# 검색 결과 캐시
+# ---------------------------------------------------------------------------
+
+
+class _SearchResultCache:
+    """
+    정규화 쿼리 키 기반 검색 결과 캐시 (프로세스 공유, TTL + LRU).
+
+    MedicalSearchClient는 분석마다 새로 생성되므로 캐시는 모듈 수준에 둔다.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple, tuple[float, LiteratureSearchResult]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, ttl: float) -> Optional[LiteratureSearchResult]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: tuple, result: LiteratureSearchResult, max_entries: int) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SEARCH_CACHE = _SearchResultCache()
+
+
+def clear_search_cache() -> None:
+    """검색 결과 캐시 초기화 (테스트/설정 변경 시)"""
+    _SEARCH_CACHE.clear()
+
+
 # ---------------------------------------------------------------------------
 # 통합 검색 클라이언트
 # ---------------------------------------------------------------------------
@@ -200,18 +626,31 @@ class MedicalSearchClient:
     의학 문헌 통합 검색 클라이언트.
 
     - config/literature.yaml의 active_sources 기반으로 프로바이더 활성화
-    - 여러 소스 결과를 통합하여 LiteratureSearchResult로 반환
+    - 여러 소스 결과를 중복 제거 + BM25 재순위화 + 토큰 예산 절단하여 LiteratureSearchResult로 반환
+    - 소스별 서킷 브레이커로 장애 소스는 즉시 건너뜀 (error_message에 기록)
     - 분석 결과(청진음, 증상, 생체신호)를 검색 쿼리로 변환
     - LLM 프롬프트 및 UI 표시용 포맷팅 제공
     """
 
-    def __init__(self) -> None:
+    def __init__(self, timeout: Optional[float] = None) -> None:
+        """
+        Args:
+            timeout: 요청 타임아웃 상한 (초). config 값보다 짧을 때만 적용 (지연 예산)
+        """
         config = get_literature_config()
         self._config = config
         common = config.get("common", {})
         self.max_results: int = common.get("max_results_per_source", 5)
-        self.timeout: int = common.get("timeout", 15)
+        self.timeout: float = common.get("timeout", 15)
+        if timeout is not None:
+            self.timeout = min(self.timeout, timeout)
         self.max_retries: int = common.get("max_retries", 2)
+        self.cache_ttl: float = common.get("cache_ttl_seconds", 3600)
+        self.cache_max_entries: int = common.get("cache_max_entries", 256)
+        ranking = config.get("ranking", {})
+        self.bm25_weight: float = ranking.get("bm25_weight", 0.7)
+        self.max_reference_tokens: Optional[int] = ranking.get("max_reference_tokens")
+        self.max_references: Optional[int] = ranking.get("max_references")
 
         # 활성 소스에 해당하는 프로바이더 인스턴스 생성
         active_sources = config.get("active_sources", ["pubmed"])
@@ -234,22 +673,26 @@ class MedicalSearchClient:
             [p.source_name for p in self._providers],
         )
 
-    def build_search_query(
+    def build_canonical_query(
         self,
         auscultation: Optional[AuscultationResult] = None,
         symptoms: Optional[SymptomInput] = None,
         vitals: Optional[VitalSigns] = None,
-    ) -> str:
+        vitals_findings: Optional[VitalsFindings] = None,
+    ) -> CanonicalQuery:
         """
-        분석 결과를 PubMed 영문 검색 쿼리로 변환.
+        분석 결과를 정규화된 검색 쿼리로 변환.
+
+        체크리스트 선택 순서와 무관하게 같은 임상 정보는 같은 쿼리(같은 캐시 키)가 된다.
 
         Args:
             auscultation: 청진음 분류 결과
             symptoms: 증상 입력
             vitals: 생체신호
+            vitals_findings: 생체신호 규칙 평가 결과 (None이면 vitals로 계산)
 
         Returns:
-            영문 검색 쿼리 문자열
+            CanonicalQuery
         """
         terms: list[str] = []
 
@@ -260,98 +703,222 @@ class MedicalSearchClient:
             if mapped:
                 terms.append(mapped)
 
-        # 2. 증상 → 검색어 (최대 3개)
+        # 2. 증상 → 검색어 (최대 3개, 선택 순서가 아닌 매핑 정의 순서 기준)
         if symptoms and symptoms.checklist:
             sym_mapping = self._query_mapping.get("symptoms", {})
-            count = 0
-            for symptom in symptoms.checklist:
-                mapped = sym_mapping.get(symptom, "")
-                if mapped and count < 3:
-                    terms.append(mapped)
-                    count += 1
-
-        # 3. 생체신호 이상 → 검색어
-        if vitals:
+            selected = set(symptoms.checklist)
+            mapped_symptoms = [
+                mapped for symptom, mapped in sym_mapping.items()
+                if symptom in selected and mapped
+            ]
+            terms.extend(mapped_symptoms[:3])
+
+        # 3. 생체신호 이상 → 검색어 (규칙 엔진의 이상 소견 기준)
+        if vitals_findings is None and vitals is not None:
+            vitals_findings = evaluate_vitals(vitals)
+        if vitals_findings:
             vitals_mapping = self._query_mapping.get("vitals", {})
-            vitals_ref = get_vitals_reference()
-            hr_ref = vitals_ref.get("heart_rate", {}).get("normal", {})
-            bp_ref = vitals_ref.get("blood_pressure", {}).get("systolic", {}).get("normal", {})
-            temp_ref = vitals_ref.get("body_temperature", {})
-
-            if vitals.heart_rate > hr_ref.get("max", 100):
-                terms.append(vitals_mapping.get("tachycardia", "tachycardia"))
-            elif vitals.heart_rate < hr_ref.get("min", 60):
-                terms.append(vitals_mapping.get("bradycardia", "bradycardia"))
-
-            if vitals.blood_pressure_sys > 140:
-                terms.append(vitals_mapping.get("hypertension", "hypertension"))
-            elif vitals.blood_pressure_sys < 90:
-                terms.append(vitals_mapping.get("hypotension", "hypotension"))
-
-            if vitals.body_temperature > temp_ref.get("low_grade_fever", {}).get("min", 37.5):
-                terms.append(vitals_mapping.get("fever", "fever"))
-            elif vitals.body_temperature < temp_ref.get("hypothermia", {}).get("max", 35.0):
-                terms.append(vitals_mapping.get("hypothermia", "hypothermia"))
+            for flag in vitals_findings.flags:
+                terms.append(vitals_mapping.get(flag, flag))
 
         # 기본 컨텍스트 추가
         if not terms:
             terms = ["lung auscultation respiratory diagnosis"]
 
-        query = " ".join(terms)
-        logger.info("검색 쿼리 생성: '%s'", query)
-        return query
+        canonical = CanonicalQuery.from_terms(terms)
+        logger.info("검색 쿼리 생성: '%s' (key=%s)", canonical.text, canonical.key)
+        return canonical
+
+    def build_search_query(
+        self,
+        auscultation: Optional[AuscultationResult] = None,
+        symptoms: Optional[SymptomInput] = None,
+        vitals: Optional[VitalSigns] = None,
+    ) -> str:
+        """
+        분석 결과를 PubMed 영문 검색 쿼리로 변환.
+
+        Args:
+            auscultation: 청진음 분류 결과
+            symptoms: 증상 입력
+            vitals: 생체신호
+
+        Returns:
+            영문 검색 쿼리 문자열 (정규화된 쿼리의 text)
+        """
+        return self.build_canonical_query(auscultation, symptoms, vitals).text
+
+    def _cache_key(self, canonical: CanonicalQuery, max_results: int) -> tuple:
+        """캐시 키: 정규화 쿼리 + 결과 수 + 활성 소스"""
+        return (canonical.key, max_results, tuple(p.source_name for p in self._providers))
 
     def search(
         self,
-        query: str,
+        query: Union[str, CanonicalQuery],
         max_results: Optional[int] = None,
     ) -> LiteratureSearchResult:
         """
         모든 활성 소스에서 통합 검색 실행.
 
+        정규화 쿼리 키 기준으로 결과를 캐시하며, 모든 소스가 성공한 결과만 저장한다.
+
         Args:
-            query: 영문 검색 쿼리
+            query: 영문 검색 쿼리 (문자열이면 정규화 후 사용) 또는 CanonicalQuery
             max_results: 소스당 최대 결과 수 (None이면 config 기본값)
 
         Returns:
             LiteratureSearchResult (모든 소스 통합 결과)
         """
+        canonical = query if isinstance(query, CanonicalQuery) else CanonicalQuery.from_text(query)
+        return self.search_many([canonical], max_results)[0]
+
+    def search_many(
+        self,
+        queries: list[CanonicalQuery],
+        max_results: Optional[int] = None,
+    ) -> list[LiteratureSearchResult]:
+        """
+        여러 정규화 쿼리 일괄 검색 (배치 재처리, 대기열 분석 등).
+
+        캐시에 없는 고유 쿼리만 모아 프로바이더의 search_batch()로 한 번에 조회하므로
+        PubMed는 쿼리별 ESearch + 공통 ESummary로 왕복 횟수가 줄어든다.
+
+        Args:
+            queries: 정규화 쿼리 목록 (중복 허용)
+            max_results: 소스당 최대 결과 수 (None이면 config 기본값)
+
+        Returns:
+            입력 순서와 같은 LiteratureSearchResult 리스트
+        """
         max_results = max_results or self.max_results
-        all_references: list[MedicalReference] = []
+
+        results: dict[str, LiteratureSearchResult] = {}
+        pending: dict[str, CanonicalQuery] = {}
+        for canonical in queries:
+            if canonical.key in results or canonical.key in pending:
+                continue
+            cached = _SEARCH_CACHE.get(self._cache_key(canonical, max_results), self.cache_ttl)
+            if cached is not None:
+                logger.info("문헌 검색 캐시 적중: key=%s", canonical.key)
+                results[canonical.key] = cached
+            else:
+                pending[canonical.key] = canonical
+
+        annotate(cache_hit=bool(results) and not pending, cached_queries=len(results))
+        if pending:
+            with span("literature.search", queries=len(pending), sources=len(self._providers)):
+                results.update(self._search_pending(pending, max_results))
+
+        # 호출자별 결과 수정이 캐시/다른 호출자에 번지지 않도록 복사본 반환
+        return [results[canonical.key].model_copy(deep=True) for canonical in queries]
+
+    def _search_pending(
+        self,
+        pending: dict[str, CanonicalQuery],
+        max_results: int,
+    ) -> dict[str, LiteratureSearchResult]:
+        """캐시에 없는 쿼리를 모든 활성 소스에서 검색 후 캐시에 저장"""
+        texts = [canonical.text for canonical in pending.values()]
+        references: dict[str, list[MedicalReference]] = {key: [] for key in pending}
         sources_used: list[str] = []
         errors: list[str] = []
 
         for provider in self._providers:
+            breaker = get_circuit_breaker(provider.source_name)
+            if not breaker.allow_request():
+                # 쿨다운이 끝났는데 차단됨 = half-open 시험 호출 슬롯이 모두 사용 중
+                cooldown = breaker.remaining_cooldown()
+                if cooldown > 0:
+                    retry = f"약 {math.ceil(cooldown)}초 후 재시도"
+                else:
+                    retry = "시험 호출 진행 중"
+                error_msg = (
+                    f"{provider.source_name} 검색 생략: 반복 실패로 일시 차단됨 ({retry})"
+                )
+                errors.append(error_msg)
+                logger.warning(error_msg)
+                continue
+
             try:
-                refs = provider.search(query, max_results, self.timeout)
-                all_references.extend(refs)
-                sources_used.append(provider.source_name)
-                logger.info("%s: %d건 검색 완료", provider.source_name, len(refs))
+                if len(texts) == 1:
+                    batch = {texts[0]: provider.search(texts[0], max_results, self.timeout)}
+                else:
+                    batch = provider.search_batch(texts, max_results, self.timeout)
             except Exception as e:
+                breaker.record_failure()
                 error_msg = f"{provider.source_name} 검색 실패: {e}"
                 errors.append(error_msg)
                 logger.warning(error_msg)
+                continue
 
-        # 관련성 점수 기준 정렬
-        all_references.sort(key=lambda r: r.relevance_score, reverse=True)
+            breaker.record_success()
+            sources_used.append(provider.source_name)
+            for key, canonical in pending.items():
+                references[key].extend(batch.get(canonical.text, []))
+            logger.info(
+                "%s: %d건 검색 완료 (쿼리 %d건)",
+                provider.source_name, sum(len(batch.get(t, [])) for t in texts), len(texts),
+            )
 
         search_successful = len(sources_used) > 0
         error_message = "; ".join(errors) if errors else None
 
-        return LiteratureSearchResult(
-            query=query,
-            total_count=len(all_references),
-            references=all_references,
-            sources_used=sources_used,
-            search_successful=search_successful,
-            error_message=error_message,
-        )
+        results: dict[str, LiteratureSearchResult] = {}
+        for key, canonical in pending.items():
+            # 소스 간 중복 제거 → 쿼리 대비 로컬 재순위화 → 프롬프트 토큰 예산 절단
+            merged = deduplicate_references(references[key])
+            ranked = rerank_references(canonical.text, merged, self.bm25_weight)
+            refs = cap_by_token_budget(ranked, self.max_reference_tokens, self.max_references)
+            result = LiteratureSearchResult(
+                query=canonical.text,
+                query_key=canonical.key,
+                total_count=len(merged),
+                references=refs,
+                sources_used=list(sources_used),
+                search_successful=search_successful,
+                error_message=error_message,
+            )
+            if search_successful and not errors:
+                _SEARCH_CACHE.put(
+                    self._cache_key(canonical, max_results),
+                    result.model_copy(deep=True),
+                    self.cache_max_entries,
+                )
+            results[key] = result
+        return results
+
+    def prefetch(
+        self,
+        queries: list[CanonicalQuery],
+        max_results: Optional[int] = None,
+    ) -> int:
+        """
+        정규화 쿼리 목록을 일괄 검색하여 캐시 채우기 (중복/캐시된 키 제외).
+
+        Args:
+            queries: 미리 검색할 정규화 쿼리 목록
+            max_results: 소스당 최대 결과 수 (None이면 config 기본값)
+
+        Returns:
+            새로 검색한 쿼리 수 (이미 캐시된 쿼리 제외)
+        """
+        max_results = max_results or self.max_results
+        unique = {q.key: q for q in queries}
+        missing = [
+            canonical for canonical in unique.values()
+            if _SEARCH_CACHE.get(self._cache_key(canonical, max_results), self.cache_ttl) is None
+        ]
+        if missing:
+            self.search_many(missing, max_results)
+        logger.info("문헌 검색 사전 캐싱: %d/%d건 신규 검색", len(missing), len(unique))
+        return len(missing)
 
     def search_from_analysis(
         self,
         auscultation: Optional[AuscultationResult] = None,
         symptoms: Optional[SymptomInput] = None,
         vitals: Optional[VitalSigns] = None,
+        vitals_findings: Optional[VitalsFindings] = None,
     ) -> LiteratureSearchResult:
         """
         분석 결과 기반 자동 검색 (쿼리 빌드 + 검색 통합).
@@ -360,12 +927,13 @@ class MedicalSearchClient:
             auscultation: 청진음 분류 결과
             symptoms: 증상 입력
             vitals: 생체신호
+            vitals_findings: 생체신호 규칙 평가 결과 (None이면 vitals로 계산)
 
         Returns:
             LiteratureSearchResult
         """
-        query = self.build_search_query(auscultation, symptoms, vitals)
-        return self.search(query)
+        canonical = self.build_canonical_query(auscultation, symptoms, vitals, vitals_findings)
+        return self.search(canonical)
 
     @staticmethod
     def format_references_for_llm(result: LiteratureSearchResult) -> str:
@@ -383,12 +951,7 @@ class MedicalSearchClient:
 
         lines = ["[참고 의학 문헌]"]
         for i, ref in enumerate(result.references, 1):
-            first_author = ref.authors[0] if ref.authors else "Unknown"
-            et_al = " et al." if len(ref.authors) > 1 else ""
-            lines.append(
-                f"[{i}] {ref.title}. {first_author}{et_al}. "
-                f"{ref.journal}, {ref.year}. ({ref.source.upper()}: {ref.source_id})"
-            )
+            lines.append(format_reference_line(i, ref))
         return "\n".join(lines)
 
     @staticmethod
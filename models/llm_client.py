@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import logging
-from typing import Generator
-
-import httpx
-from langchain_ollama import ChatOllama
-from langchain_core.messages import HumanMessage, SystemMessage
+import os
+import time
+from typing import TYPE_CHECKING, Generator, Optional
 
 from utils.config_loader import get_llm_config
+from utils.deadline import BudgetExceeded, run_with_timeout
+from utils.replay import interaction
+from utils.tracing import span
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_ollama import ChatOllama
 
 logger = logging.getLogger(__name__)
 
@@ -28,20 +33,42 @@ class LLMClient:
         ollama_config = config.get("ollama", {})
 
         self.model: str = ollama_config.get("model", "qwen3:8b")
-        self.base_url: str = ollama_config.get("base_url", "http://localhost:11434")
+        # STETHO_OLLAMA_BASE_URL: 설정 파일 수정 없이 다른 서버로 전환 (부하 테스트 스텁 등)
+        self.base_url: str = os.environ.get("STETHO_OLLAMA_BASE_URL") or ollama_config.get(
+            "base_url", "http://localhost:11434",
+        )
         self.temperature: float = ollama_config.get("temperature", 0.7)
         self.top_p: float = ollama_config.get("top_p", 0.9)
         self.timeout: int = ollama_config.get("timeout", 120)
         self.max_retries: int = ollama_config.get("max_retries", 3)
+        self.keep_alive: str = ollama_config.get("keep_alive", "30m")
+
+        self._llm = self._build_llm(self.timeout)
+        logger.info("LLMClient 초기화: model=%s, base_url=%s", self.model, self.base_url)
+
+    def _build_llm(self, timeout: float) -> ChatOllama:
+        """HTTP 타임아웃을 지정한 ChatOllama 생성 (langchain은 첫 클라이언트 생성 시 import)"""
+        from langchain_ollama import ChatOllama
 
-        self._llm = ChatOllama(
+        return ChatOllama(
             model=self.model,
             base_url=self.base_url,
             temperature=self.temperature,
             top_p=self.top_p,
             num_predict=-1,
+            keep_alive=self.keep_alive,
+            client_kwargs={"timeout": timeout},
         )
-        logger.info("LLMClient 초기화: model=%s, base_url=%s", self.model, self.base_url)
+
+    @staticmethod
+    def _messages(prompt: str, system_prompt: str | None) -> list[BaseMessage]:
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        messages: list[BaseMessage] = []
+        if system_prompt:
+            messages.append(SystemMessage(content=system_prompt))
+        messages.append(HumanMessage(content=prompt))
+        return messages
 
     def is_available(self) -> bool:
         """
@@ -50,6 +77,8 @@ class LLMClient:
         Returns:
             연결 가능 여부
         """
+        import httpx
+
         try:
             response = httpx.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
@@ -57,10 +86,34 @@ class LLMClient:
             logger.warning("Ollama 서버에 연결할 수 없습니다: %s", self.base_url)
             return False
 
+    def preload(self, timeout: Optional[float] = None) -> None:
+        """
+        모델을 Ollama 메모리에 미리 적재 (프롬프트 없는 /api/generate 요청).
+
+        keep_alive 동안 언로드되지 않으므로 첫 분석이 모델 로딩 시간을 기다리지 않는다.
+
+        Raises:
+            RuntimeError: 서버 연결 실패 또는 오류 응답 시
+        """
+        import httpx
+
+        try:
+            with span("llm.preload", model=self.model):
+                response = httpx.post(
+                    f"{self.base_url}/api/generate",
+                    json={"model": self.model, "keep_alive": self.keep_alive},
+                    timeout=timeout or self.timeout,
+                )
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"LLM 모델 사전 적재 실패 ({self.model}): {e}") from e
+        logger.info("LLM 모델 사전 적재 완료: %s (keep_alive=%s)", self.model, self.keep_alive)
+
     def generate(
         self,
         prompt: str,
         system_prompt: str | None = None,
+        timeout: Optional[float] = None,
     ) -> str:
         """
         비스트리밍 텍스트 생성.
@@ -68,30 +121,66 @@ class LLMClient:
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트 (선택)
+            timeout: 재시도 포함 전체 시간 예산 (초). None이면 시도당 config timeout만 적용
 
         Returns:
             생성된 텍스트
 
         Raises:
+            BudgetExceeded: timeout 안에 응답을 받지 못했을 때
             RuntimeError: LLM 호출 실패 시
         """
-        messages = []
-        if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
-        messages.append(HumanMessage(content=prompt))
+        # 녹화/재생 세션이 있으면 프롬프트 단위로 기록·대체 (utils.replay)
+        return interaction(
+            "llm",
+            {"model": self.model, "system_prompt": system_prompt or "", "prompt": prompt},
+            lambda: self._generate(prompt, system_prompt, timeout),
+        )
+
+    def _generate(self, prompt: str, system_prompt: str | None, timeout: Optional[float]) -> str:
+        """generate 본체 (재시도 + 시간 예산)"""
+        messages = self._messages(prompt, system_prompt)
 
+        deadline = None if timeout is None else time.monotonic() + timeout
         last_error = None
         for attempt in range(1, self.max_retries + 1):
+            llm = self._llm
+            left = None
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise BudgetExceeded(
+                        f"LLM 호출 시간 예산 {timeout:.1f}초 소진 "
+                        f"(시도 {attempt - 1}회): {last_error}"
+                    )
+                if left < self.timeout:
+                    llm = self._build_llm(left)
             try:
                 logger.info("LLM 생성 요청 (시도 %d/%d)", attempt, self.max_retries)
-                response = self._llm.invoke(messages)
-                result = response.content
+                with span("llm.generate", model=self.model, attempt=attempt) as s:
+                    # ChatOllama는 내부적으로 스트리밍하므로 HTTP 타임아웃은 읽기 1회에만 적용됨
+                    # → 호출 전체에 벽시계 상한
+                    response = run_with_timeout(lambda: llm.invoke(messages), left)
+                    result = response.content
+                    if s is not None:
+                        usage = getattr(response, "usage_metadata", None) or {}
+                        s.set(
+                            input_tokens=usage.get("input_tokens", 0),
+                            output_tokens=usage.get("output_tokens", 0),
+                            chars=len(result),
+                        )
                 logger.info("LLM 응답 수신: %d자", len(result))
                 return result
+            except BudgetExceeded as e:
+                raise BudgetExceeded(
+                    f"LLM 호출 시간 예산 {timeout:.1f}초 소진 (시도 {attempt}회): {e}"
+                ) from e
             except Exception as e:
                 last_error = e
                 logger.warning("LLM 호출 실패 (시도 %d/%d): %s", attempt, self.max_retries, e)
 
+        if deadline is not None and time.monotonic() >= deadline:
+            raise BudgetExceeded(f"LLM 호출 시간 예산 {timeout:.1f}초 소진: {last_error}")
         raise RuntimeError(f"LLM 호출이 {self.max_retries}회 모두 실패했습니다: {last_error}")
 
     def stream(
@@ -109,15 +198,17 @@ class LLMClient:
         Yields:
             텍스트 청크
         """
-        messages = []
-        if system_prompt:
-            messages.append(SystemMessage(content=system_prompt))
-        messages.append(HumanMessage(content=prompt))
+        messages = self._messages(prompt, system_prompt)
 
         try:
-            for chunk in self._llm.stream(messages):
-                if chunk.content:
-                    yield chunk.content
+            with span("llm.stream", model=self.model) as s:
+                chars = 0
+                for chunk in self._llm.stream(messages):
+                    if chunk.content:
+                        chars += len(chunk.content)
+                        yield chunk.content
+                if s is not None:
+                    s.set(chars=chars)
         except Exception as e:
             logger.error("LLM 스트리밍 실패: %s", e)
             raise RuntimeError(f"LLM 스트리밍 호출 실패: {e}") from e
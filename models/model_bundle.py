@@ -0,0 +1,268 @@
+"""AST 모델 오프라인 번들 — safetensors 스냅샷 + 매니페스트(체크섬) 생성/검증, mmap 로딩"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import struct
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import torch
+    from transformers import ASTFeatureExtractor, ASTForAudioClassification
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 (상대 번들 경로 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+MANIFEST_NAME = "manifest.json"
+WEIGHTS_NAME = "model.safetensors"
+BUNDLE_FORMAT_VERSION = 1
+
+# 체크섬 계산 단위 (대용량 가중치 파일을 메모리에 올리지 않고 해시)
+_HASH_CHUNK = 8 * 1024 * 1024
+
+# safetensors dtype 코드 → torch dtype 이름
+_SAFETENSORS_DTYPES = {
+    "F64": "float64", "F32": "float32", "F16": "float16", "BF16": "bfloat16",
+    "I64": "int64", "I32": "int32", "I16": "int16", "I8": "int8", "U8": "uint8", "BOOL": "bool",
+}
+
+
+class BundleError(RuntimeError):
+    """번들 누락/손상/버전 불일치"""
+
+
+def resolve_bundle_dir(path: str | Path) -> Path:
+    """상대 경로는 프로젝트 루트 기준"""
+    path = Path(path)
+    return path if path.is_absolute() else _PROJECT_ROOT / path
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_bundle(
+    output_dir: str | Path,
+    model_name: str,
+    cache_dir: Optional[str] = None,
+    revision: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    허브(또는 HF 캐시)의 모델을 오프라인 번들로 스냅샷.
+
+    가중치는 현재 transformers 버전의 state_dict 키 그대로 단일 safetensors 파일로 저장하여
+    로더가 변환 없이 mmap 텐서를 바로 연결할 수 있게 한다. 임시 디렉토리에 만든 뒤 교체하므로
+    실패해도 기존 번들은 유지된다.
+
+    Returns:
+        매니페스트
+    """
+    import torch
+    import transformers
+    from safetensors.torch import save_file
+    from transformers import ASTFeatureExtractor, ASTForAudioClassification
+
+    output_dir = resolve_bundle_dir(output_dir)
+    staging = output_dir.with_name(f"{output_dir.name}.partial")
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir(parents=True)
+
+    logger.info("번들 생성: %s → %s", model_name, output_dir)
+    extractor = ASTFeatureExtractor.from_pretrained(
+        model_name, cache_dir=cache_dir, revision=revision
+    )
+    model = ASTForAudioClassification.from_pretrained(
+        model_name, cache_dir=cache_dir, revision=revision
+    )
+
+    state = {name: tensor.detach().contiguous() for name, tensor in model.state_dict().items()}
+    save_file(state, str(staging / WEIGHTS_NAME), metadata={"format": "pt"})
+    model.config.save_pretrained(staging)
+    extractor.save_pretrained(staging)
+
+    files = {
+        path.name: {"sha256": _sha256(path), "bytes": path.stat().st_size}
+        for path in sorted(staging.iterdir())
+    }
+    manifest = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "model_name": model_name,
+        "revision": revision,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "transformers_version": transformers.__version__,
+        "torch_version": torch.__version__,
+        "weights": WEIGHTS_NAME,
+        "files": files,
+    }
+    (staging / MANIFEST_NAME).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    shutil.rmtree(output_dir, ignore_errors=True)
+    staging.rename(output_dir)
+    logger.info(
+        "번들 생성 완료: 파일 %d개, %.1fMB",
+        len(files), sum(f["bytes"] for f in files.values()) / 1e6,
+    )
+    return manifest
+
+
+def verify_bundle(bundle_dir: str | Path, checksums: bool = True) -> dict[str, Any]:
+    """
+    번들 무결성 검증.
+
+    Args:
+        checksums: False면 파일 존재/크기만 확인 (빠른 검증)
+
+    Returns:
+        매니페스트
+
+    Raises:
+        BundleError: 매니페스트 누락, 파일 누락/크기·체크섬 불일치, 미지원 형식
+    """
+    bundle_dir = resolve_bundle_dir(bundle_dir)
+    manifest_path = bundle_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        raise BundleError(
+            f"모델 번들이 없습니다: {bundle_dir} (python -m models.model_bundle build 로 생성)"
+        )
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("format_version") != BUNDLE_FORMAT_VERSION:
+        raise BundleError(f"지원하지 않는 번들 형식: {manifest.get('format_version')}")
+
+    for name, expected in manifest["files"].items():
+        path = bundle_dir / name
+        if not path.exists():
+            raise BundleError(f"번들 파일 누락: {name}")
+        if path.stat().st_size != expected["bytes"]:
+            raise BundleError(f"번들 파일 크기 불일치: {name}")
+        if checksums and _sha256(path) != expected["sha256"]:
+            raise BundleError(f"번들 파일 체크섬 불일치: {name}")
+    return manifest
+
+
+def mmap_safetensors(path: str | Path) -> dict[str, torch.Tensor]:
+    """
+    safetensors 파일을 메모리 매핑하여 텐서 딕셔너리로 반환 (복사 없음).
+
+    파일 전체를 torch 파일 스토리지(MAP_PRIVATE)로 매핑하고 각 텐서를 그 뷰로 만든다.
+    페이지는 접근 시점에 로딩되고, 같은 파일을 여는 워커 프로세스들은 OS 페이지 캐시를 공유한다.
+    """
+    import torch
+
+    path = Path(path)
+    with open(path, "rb") as f:
+        header_len = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_len))
+    header.pop("__metadata__", None)
+
+    storage = torch.UntypedStorage.from_file(str(path), False, path.stat().st_size)
+    raw = torch.empty(0, dtype=torch.uint8).set_(storage)
+    base = 8 + header_len
+
+    tensors: dict[str, torch.Tensor] = {}
+    for name, info in header.items():
+        if info["dtype"] not in _SAFETENSORS_DTYPES:
+            raise BundleError(f"지원하지 않는 텐서 dtype: {name} ({info['dtype']})")
+        dtype = getattr(torch, _SAFETENSORS_DTYPES[info["dtype"]])
+        start, end = (base + offset for offset in info["data_offsets"])
+        chunk = raw[start:end]
+        if start % dtype.itemsize:
+            # 정렬되지 않은 텐서는 뷰를 만들 수 없어 복사 (safetensors 저장 규칙상 드묾)
+            chunk = chunk.clone()
+        tensors[name] = chunk.view(dtype).reshape(info["shape"])
+    return tensors
+
+
+def load_bundle(
+    bundle_dir: str | Path,
+    checksums: bool = True,
+) -> tuple[ASTFeatureExtractor, ASTForAudioClassification]:
+    """
+    오프라인 번들에서 피처 추출기 + 모델 로딩 (네트워크 접근 없음).
+
+    모델은 meta 디바이스에서 구조만 만든 뒤 mmap 텐서를 그대로 연결한다 (assign=True).
+
+    Raises:
+        BundleError: 번들 누락/손상, 또는 현재 transformers와 가중치 키가 맞지 않을 때
+    """
+    # 이 프로세스의 이후 HF 호출도 허브에 접근하지 않도록 오프라인 강제
+    os.environ["HF_HUB_OFFLINE"] = "1"
+    os.environ["TRANSFORMERS_OFFLINE"] = "1"
+
+    import torch
+    from transformers import ASTConfig, ASTFeatureExtractor, ASTForAudioClassification
+
+    bundle_dir = resolve_bundle_dir(bundle_dir)
+    manifest = verify_bundle(bundle_dir, checksums=checksums)
+
+    extractor = ASTFeatureExtractor.from_pretrained(bundle_dir, local_files_only=True)
+    config = ASTConfig.from_pretrained(bundle_dir, local_files_only=True)
+    with torch.device("meta"):
+        model = ASTForAudioClassification(config)
+
+    state = mmap_safetensors(bundle_dir / manifest["weights"])
+    try:
+        model.load_state_dict(state, strict=True, assign=True)
+    except RuntimeError as e:
+        raise BundleError(
+            f"번들 가중치가 현재 모델 구조와 맞지 않습니다 (번들 transformers "
+            f"{manifest.get('transformers_version')}) — 번들을 다시 생성하세요: {e}"
+        ) from e
+    if any(t.is_meta for t in (*model.parameters(), *model.buffers())):
+        raise BundleError("번들에 없는 텐서가 있습니다 — 번들을 다시 생성하세요")
+
+    logger.info("번들 로딩 완료 (mmap): %s", bundle_dir)
+    return extractor, model
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from utils.config_loader import get_ast_config
+
+    model_config = get_ast_config().get("model", {})
+    bundle_config = get_ast_config().get("bundle", {})
+
+    parser = argparse.ArgumentParser(description="AST 모델 오프라인 번들 생성/검증")
+    parser.add_argument(
+        "command", choices=["build", "verify"],
+        help="build: 허브에서 스냅샷, verify: 체크섬 검증",
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="번들 디렉토리 (기본: config bundle.path)"
+    )
+    parser.add_argument("--model", type=str, default=None, help="모델명 (기본: config model.name)")
+    parser.add_argument("--revision", type=str, default=None, help="허브 리비전 (커밋 해시 권장)")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+    target = args.output or bundle_config.get("path") or "artifacts/ast"
+
+    if args.command == "build":
+        result = build_bundle(
+            target,
+            args.model or model_config.get("name", "MIT/ast-finetuned-audioset-10-10-0.4593"),
+            cache_dir=model_config.get("cache_dir"),
+            revision=args.revision,
+        )
+        print(f"✓ 번들 생성: {resolve_bundle_dir(target)}")
+    else:
+        start = time.perf_counter()
+        result = verify_bundle(target)
+        print(f"✓ 번들 검증 통과 ({time.perf_counter() - start:.2f}초)")
+    for name, info in result["files"].items():
+        print(f"  {name}: {info['bytes'] / 1e6:.1f}MB sha256={info['sha256'][:12]}…")
@@ -0,0 +1,204 @@
+"""참고 문헌 병합 모듈 — 소스 간 중복 제거, 로컬 BM25 재순위화, 토큰 예산 절단"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+
+from schemas.literature import MedicalReference
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """소문자 영숫자 토큰 분리"""
+    return _TOKEN.findall(text.lower())
+
+
+def normalize_title(title: str) -> str:
+    """제목 정규화 (대소문자/구두점/공백 차이 무시)"""
+    return " ".join(tokenize(title))
+
+
+def _dedup_keys(ref: MedicalReference) -> list[tuple[str, str]]:
+    """중복 판정 해시 키 목록 (DOI, PMID, 정규화 제목)"""
+    keys: list[tuple[str, str]] = []
+    if ref.doi:
+        keys.append(("doi", ref.doi.strip().lower()))
+    if ref.pmid:
+        keys.append(("pmid", ref.pmid))
+    title = normalize_title(ref.title)
+    if title:
+        keys.append(("title", title))
+    return keys
+
+
+def _merge(kept: MedicalReference, dup: MedicalReference) -> MedicalReference:
+    """중복 문헌 병합 — 점수가 높은 쪽 기준, 비어있는 식별자/초록은 보완"""
+    primary, other = (kept, dup) if kept.relevance_score >= dup.relevance_score else (dup, kept)
+    updates = {}
+    for field in ("doi", "pmid", "abstract", "journal", "year"):
+        if not getattr(primary, field) and getattr(other, field):
+            updates[field] = getattr(other, field)
+    if not primary.authors and other.authors:
+        updates["authors"] = other.authors
+    return primary.model_copy(update=updates) if updates else primary
+
+
+def deduplicate_references(references: Iterable[MedicalReference]) -> list[MedicalReference]:
+    """
+    여러 소스 결과에서 같은 문헌 제거.
+
+    DOI / PMID / 정규화 제목 중 하나라도 같으면 같은 문헌으로 보고 병합한다.
+
+    Args:
+        references: 소스별 결과를 이어붙인 문헌 목록
+
+    Returns:
+        처음 등장 순서를 유지한 중복 제거 목록
+    """
+    merged: list[MedicalReference] = []
+    index: dict[tuple[str, str], int] = {}
+
+    for ref in references:
+        keys = _dedup_keys(ref)
+        slot = next((index[k] for k in keys if k in index), None)
+        if slot is None:
+            slot = len(merged)
+            merged.append(ref)
+        else:
+            merged[slot] = _merge(merged[slot], ref)
+        for key in _dedup_keys(merged[slot]) + keys:
+            index.setdefault(key, slot)
+
+    return merged
+
+
+def bm25_scores(
+    query: str,
+    documents: list[str],
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> np.ndarray:
+    """
+    BM25 점수 계산 (문서-용어 행렬 기반 벡터 연산).
+
+    Args:
+        query: 검색 쿼리
+        documents: 문서 텍스트 목록
+        k1: 용어 빈도 포화 계수
+        b: 문서 길이 정규화 계수
+
+    Returns:
+        문서별 BM25 점수 배열 (len(documents),)
+    """
+    query_terms = list(dict.fromkeys(tokenize(query)))
+    if not documents or not query_terms:
+        return np.zeros(len(documents))
+
+    vocab = {term: j for j, term in enumerate(query_terms)}
+    tf = np.zeros((len(documents), len(vocab)))
+    doc_len = np.zeros(len(documents))
+    for i, doc in enumerate(documents):
+        tokens = tokenize(doc)
+        doc_len[i] = len(tokens)
+        for token in tokens:
+            j = vocab.get(token)
+            if j is not None:
+                tf[i, j] += 1
+
+    n_docs = len(documents)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+    avg_len = doc_len.mean() or 1.0
+    norm = k1 * (1 - b + b * doc_len / avg_len)
+    return ((tf * (k1 + 1)) / (tf + norm[:, None]) * idf).sum(axis=1)
+
+
+def rerank_references(
+    query: str,
+    references: list[MedicalReference],
+    bm25_weight: float = 0.7,
+) -> list[MedicalReference]:
+    """
+    쿼리 대비 제목+초록 BM25 점수로 재순위화.
+
+    최종 relevance_score = bm25_weight * (최고점 대비 BM25) + (1 - bm25_weight) * 소스 순위 점수
+
+    Args:
+        query: 검색 쿼리 (CanonicalQuery.text)
+        references: 중복 제거된 문헌 목록
+        bm25_weight: BM25 점수 반영 비율 (0-1)
+
+    Returns:
+        relevance_score 내림차순 문헌 목록
+    """
+    if not references:
+        return []
+
+    scores = bm25_scores(query, [f"{r.title} {r.abstract}" for r in references])
+    top = scores.max()
+    lexical = scores / top if top > 0 else scores
+    source_rank = np.array([r.relevance_score for r in references])
+    combined = np.clip(bm25_weight * lexical + (1 - bm25_weight) * source_rank, 0.0, 1.0)
+
+    ranked = [
+        ref.model_copy(update={"relevance_score": round(float(score), 4)})
+        for ref, score in zip(references, combined, strict=True)
+    ]
+    # 동점은 원래 순서 유지 (stable sort)
+    ranked.sort(key=lambda r: r.relevance_score, reverse=True)
+    return ranked
+
+
+def format_reference_line(index: int, ref: MedicalReference) -> str:
+    """LLM 프롬프트용 참고 문헌 한 줄 포맷"""
+    first_author = ref.authors[0] if ref.authors else "Unknown"
+    et_al = " et al." if len(ref.authors) > 1 else ""
+    return (
+        f"[{index}] {ref.title}. {first_author}{et_al}. "
+        f"{ref.journal}, {ref.year}. ({ref.source.upper()}: {ref.source_id})"
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사 (영문 기준 약 4자 = 1토큰)"""
+    return max(1, (len(text) + 3) // 4)
+
+
+def cap_by_token_budget(
+    references: list[MedicalReference],
+    max_tokens: Optional[int],
+    max_references: Optional[int] = None,
+) -> list[MedicalReference]:
+    """
+    LLM 프롬프트에 들어갈 문헌을 토큰 예산 이내로 절단 (순위 순서 유지).
+
+    Args:
+        references: 재순위화된 문헌 목록
+        max_tokens: 참고 문헌 블록 최대 토큰 수 (None이면 제한 없음)
+        max_references: 최대 문헌 수 (None이면 제한 없음)
+
+    Returns:
+        예산 내 상위 문헌 목록 (첫 문헌은 예산과 무관하게 포함)
+    """
+    kept: list[MedicalReference] = []
+    used = 0
+    for i, ref in enumerate(references, 1):
+        if max_references is not None and len(kept) >= max_references:
+            break
+        cost = estimate_tokens(format_reference_line(i, ref))
+        if max_tokens is not None and kept and used + cost > max_tokens:
+            break
+        kept.append(ref)
+        used += cost
+
+    if len(kept) < len(references):
+        logger.info(
+            "참고 문헌 토큰 예산 절단: %d → %d건 (약 %d토큰)", len(references), len(kept), used
+        )
+    return kept
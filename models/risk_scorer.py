@@ -0,0 +1,411 @@
+"""위험도 배치 산정 모듈 — 열 단위 배열로 규칙 기반 위험도 점수/레벨을 벡터 연산"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Mapping, Optional
+
+import numpy as np
+
+from models.vitals_rules import VitalsRuleEngine, get_vitals_rules
+from schemas.auscultation import AUSCULTATION_CLASSES
+from schemas.symptoms import SEVERITY_OPTIONS
+from utils.config_loader import get_config_snapshot
+from utils.keyword_automaton import KeywordAutomaton, KeywordMatch
+
+logger = logging.getLogger(__name__)
+
+# 규칙 기반 점수 (risk_node._calculate_risk와 공유)
+VITAL_FLAG_POINTS = 15.0                # 생체신호 이상 소견 1개당
+ABNORMAL_AUSCULTATION_POINTS = 20.0     # 비정상 청진음 (Crackle/Wheeze/Both)
+SEVERE_SYMPTOM_POINTS = 15.0            # 증상 강도 심함/매우 심함
+SEVERE_LEVELS: tuple[str, ...] = ("심함", "매우 심함")
+MAX_SCORE = 100.0
+
+# 레벨 경계: 점수가 경계 이상이면 다음 레벨
+LEVEL_THRESHOLDS: tuple[float, ...] = (25.0, 50.0, 75.0)
+RISK_LEVELS: tuple[str, ...] = ("low", "moderate", "high", "critical")
+IMMEDIATE_ACTION_LEVELS: tuple[str, ...] = ("high", "critical")
+
+# 배치 입력 열 이름
+VITAL_COLUMNS: tuple[str, ...] = (
+    "heart_rate", "blood_pressure_sys", "blood_pressure_dia", "body_temperature",
+)
+PROBABILITY_COLUMNS: tuple[str, ...] = tuple(f"prob_{c.lower()}" for c in AUSCULTATION_CLASSES)
+
+_SEVERE_CODES = np.array([SEVERITY_OPTIONS.index(level) for level in SEVERE_LEVELS])
+
+
+def risk_level(score: float) -> str:
+    """점수 → 위험도 레벨"""
+    return RISK_LEVELS[int(np.searchsorted(LEVEL_THRESHOLDS, score, side="right"))]
+
+
+@dataclass(frozen=True)
+class RiskScores:
+    """배치 위험도 산정 결과 (레코드 n개)"""
+
+    score: np.ndarray               # (n,) float
+    level: np.ndarray               # (n,) str
+    immediate_action: np.ndarray    # (n,) bool
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+
+class RiskScorer:
+    """
+    규칙 기반 위험도 배치 산정기.
+
+    - 생체신호 이상 소견 / 청진음 분류 / 증상 강도 점수를 열 배열 단위로 계산
+    - 종합 판단 텍스트 키워드 점수는 LLM 출력이 필요하므로 제외
+      (그 외 규칙은 risk_node._calculate_risk와 동일)
+    """
+
+    def __init__(self, rules: Optional[VitalsRuleEngine] = None) -> None:
+        self.rules = rules or get_vitals_rules()
+
+    def score(
+        self,
+        heart_rate: np.ndarray,
+        blood_pressure_sys: np.ndarray,
+        blood_pressure_dia: np.ndarray,
+        body_temperature: np.ndarray,
+        class_probabilities: Optional[np.ndarray] = None,
+        severity: Optional[np.ndarray] = None,
+    ) -> RiskScores:
+        """
+        열 배열 위험도 산정.
+
+        Args:
+            heart_rate: 심박수 (n,)
+            blood_pressure_sys: 수축기 혈압 (n,)
+            blood_pressure_dia: 이완기 혈압 (n,)
+            body_temperature: 체온 (n,)
+            class_probabilities: 청진음 클래스 확률 (n, 4), AUSCULTATION_CLASSES 순서.
+                행이 전부 NaN이면 청진음 없음
+            severity: 증상 강도 코드 (n,), SEVERITY_OPTIONS 인덱스. 음수는 증상 없음
+
+        Returns:
+            RiskScores
+        """
+        vitals = np.column_stack(
+            [heart_rate, blood_pressure_sys, blood_pressure_dia, body_temperature]
+        )
+        findings = self.rules.evaluate_batch(vitals)
+        n = len(vitals)
+
+        flag_count = np.sum(list(findings.flags.values()), axis=0) if n else np.zeros(0)
+        score = flag_count * VITAL_FLAG_POINTS
+
+        if class_probabilities is not None:
+            probs = np.asarray(class_probabilities, dtype=float).reshape(
+                n, len(AUSCULTATION_CLASSES)
+            )
+            present = ~np.all(np.isnan(probs), axis=1)
+            # 분류 = 최대 확률 클래스 (동률이면 앞 클래스, ASTClassifier와 동일)
+            predicted = np.argmax(np.nan_to_num(probs, nan=-np.inf), axis=1)
+            abnormal = present & (predicted != AUSCULTATION_CLASSES.index("Normal"))
+            score = score + abnormal * ABNORMAL_AUSCULTATION_POINTS
+
+        if severity is not None:
+            severe = np.isin(np.asarray(severity), _SEVERE_CODES)
+            score = score + severe * SEVERE_SYMPTOM_POINTS
+
+        score = np.minimum(score.astype(float), MAX_SCORE)
+        level_idx = np.searchsorted(LEVEL_THRESHOLDS, score, side="right")
+        level = np.asarray(RISK_LEVELS)[level_idx]
+        immediate = np.isin(level, IMMEDIATE_ACTION_LEVELS)
+        return RiskScores(score=score, level=level, immediate_action=immediate)
+
+    def score_frame(self, frame):
+        """
+        DataFrame 위험도 산정.
+
+        필수 열: heart_rate, blood_pressure_sys, blood_pressure_dia, body_temperature
+        선택 열: prob_normal/prob_crackle/prob_wheeze/prob_both 또는 classification,
+                 severity (텍스트 "심함" 등 또는 SEVERITY_OPTIONS 인덱스)
+
+        Args:
+            frame: pandas DataFrame
+
+        Returns:
+            risk_score, risk_level, immediate_action 열이 추가된 DataFrame
+        """
+        missing = [c for c in VITAL_COLUMNS if c not in frame.columns]
+        if missing:
+            raise RuntimeError(f"필수 열 누락: {', '.join(missing)}")
+
+        probs = None
+        if all(c in frame.columns for c in PROBABILITY_COLUMNS):
+            probs = frame[list(PROBABILITY_COLUMNS)].to_numpy(dtype=float)
+        elif "classification" in frame.columns:
+            # 분류 레이블만 있으면 해당 클래스 확률 1.0으로 변환
+            labels = frame["classification"].to_numpy(dtype=object)
+            probs = np.full((len(frame), len(AUSCULTATION_CLASSES)), np.nan)
+            for i, cls in enumerate(AUSCULTATION_CLASSES):
+                hit = labels == cls
+                probs[hit] = 0.0
+                probs[hit, i] = 1.0
+
+        severity = None
+        if "severity" in frame.columns:
+            from pandas.api.types import is_numeric_dtype
+
+            column = frame["severity"]
+            if is_numeric_dtype(column):
+                severity = column.fillna(-1).to_numpy(dtype=int)
+            else:
+                codes = {level: i for i, level in enumerate(SEVERITY_OPTIONS)}
+                severity = column.map(codes).fillna(-1).to_numpy(dtype=int)
+
+        result = self.score(
+            *(frame[c].to_numpy(dtype=float) for c in VITAL_COLUMNS),
+            class_probabilities=probs,
+            severity=severity,
+        )
+        return frame.assign(
+            risk_score=result.score,
+            risk_level=result.level,
+            immediate_action=result.immediate_action,
+        )
+
+
+@dataclass(frozen=True)
+class KeywordScore:
+    """종합 판단 텍스트 키워드 점수"""
+
+    points: float
+    matched: tuple[str, ...]                # 매칭된 서로 다른 키워드 (첫 등장 순서)
+    group_points: Mapping[str, float]       # 그룹별 점수 (상한 적용 후)
+
+
+class SynthesisKeywordScorer:
+    """
+    종합 판단 텍스트 위험 키워드 점수기.
+
+    config/risk.yaml의 그룹별 가중치 키워드를 하나의 Aho–Corasick 오토마톤으로 컴파일하여
+    텍스트를 한 번만 훑는다. stream()은 LLM 스트리밍 출력을 청크 단위로 받아
+    종합 판단이 끝나기 전에도 누적 점수를 계산한다.
+    """
+
+    def __init__(self, config: Mapping) -> None:
+        groups = config.get("synthesis_keywords", {})
+        self.max_points: dict[str, float] = {}
+        entries: list[tuple[str, str, float]] = []
+        for group, spec in groups.items():
+            self.max_points[group] = float(spec.get("max_points", float("inf")))
+            for keyword, weight in spec.get("terms", {}).items():
+                entries.append((group, str(keyword), float(weight)))
+        self._entries = entries
+        self.automaton = KeywordAutomaton(keyword for _, keyword, _ in entries)
+
+    def _score(self, matches: list[KeywordMatch]) -> KeywordScore:
+        group_points = {group: 0.0 for group in self.max_points}
+        seen: set[int] = set()
+        for match in matches:
+            if match.index in seen:
+                continue
+            seen.add(match.index)
+            group, _, weight = self._entries[match.index]
+            group_points[group] += weight
+        capped = {g: min(p, self.max_points[g]) for g, p in group_points.items()}
+        matched = tuple(dict.fromkeys(m.keyword for m in matches))
+        return KeywordScore(points=sum(capped.values()), matched=matched, group_points=capped)
+
+    def score(self, text: str) -> KeywordScore:
+        """전체 텍스트 점수"""
+        return self._score(self.automaton.find_all(text))
+
+    def stream(self) -> SynthesisKeywordStream:
+        """스트리밍 점수기 생성 (요청마다 새로 생성)"""
+        return SynthesisKeywordStream(self)
+
+
+class SynthesisKeywordStream:
+    """LLM 스트리밍 출력용 누적 키워드 점수기"""
+
+    def __init__(self, scorer: SynthesisKeywordScorer) -> None:
+        self._scorer = scorer
+        self._stream = scorer.automaton.stream()
+
+    def feed(self, chunk: str) -> KeywordScore:
+        """
+        청크 입력 (토큰 경계에 걸친 키워드도 매칭).
+
+        Returns:
+            지금까지 입력된 텍스트 기준 누적 점수
+        """
+        self._stream.feed(chunk)
+        return self._scorer._score(self._stream.matches)
+
+
+_KEYWORD_SCORER: Optional[tuple[object, SynthesisKeywordScorer]] = None
+_KEYWORD_SCORER_LOCK = threading.Lock()
+
+
+def get_synthesis_keyword_scorer() -> SynthesisKeywordScorer:
+    """공유 키워드 점수기 조회 (config/risk.yaml 스냅샷당 1회 컴파일)"""
+    global _KEYWORD_SCORER
+    snapshot = get_config_snapshot("risk")
+    cached = _KEYWORD_SCORER
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    with _KEYWORD_SCORER_LOCK:
+        if _KEYWORD_SCORER is None or _KEYWORD_SCORER[0] is not snapshot:
+            _KEYWORD_SCORER = (snapshot, SynthesisKeywordScorer(snapshot.data))
+            logger.info(
+                "종합 판단 키워드 오토마톤 컴파일 완료: %d개",
+                len(_KEYWORD_SCORER[1].automaton.keywords),
+            )
+        return _KEYWORD_SCORER[1]
+
+
+def iter_frames(path: Path, chunk_size: int) -> Iterator:
+    """
+    CSV / Parquet 파일을 chunk_size 행 단위 DataFrame으로 스트리밍.
+
+    Raises:
+        RuntimeError: 지원하지 않는 형식이거나 pandas/pyarrow 미설치
+    """
+    try:
+        import pandas as pd
+    except ImportError as e:
+        raise RuntimeError("배치 위험도 산정에는 pandas가 필요합니다: pip install pandas") from e
+
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    elif suffix in (".parquet", ".pq"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise RuntimeError("Parquet 입력에는 pyarrow가 필요합니다: pip install pyarrow") from e
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        raise RuntimeError(f"지원하지 않는 입력 형식입니다 (csv/parquet): {path}")
+
+
+def score_file(
+    input_path: Path,
+    output_path: Path,
+    chunk_size: int = 100_000,
+    scorer: Optional[RiskScorer] = None,
+) -> int:
+    """
+    파일 단위 배치 위험도 산정 (청크 스트리밍, 메모리 사용량은 청크 크기에 비례).
+
+    Args:
+        input_path: 입력 CSV / Parquet
+        output_path: 출력 CSV / Parquet (확장자로 형식 결정)
+        chunk_size: 청크당 행 수
+        scorer: 재사용할 RiskScorer (None이면 생성)
+
+    Returns:
+        처리한 총 행 수
+    """
+    scorer = scorer or RiskScorer()
+    is_parquet = output_path.suffix.lower() in (".parquet", ".pq")
+    writer = None
+    rows = 0
+    start = time.perf_counter()
+
+    try:
+        for i, frame in enumerate(iter_frames(input_path, chunk_size)):
+            scored = scorer.score_frame(frame)
+            if is_parquet:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(scored, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            else:
+                scored.to_csv(output_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+            rows += len(scored)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "배치 위험도 산정 완료: %d행, %.2f초 (%.0f rows/sec)",
+        rows, elapsed, rows / max(elapsed, 1e-9),
+    )
+    return rows
+
+
+def benchmark(rows: int, seed: int = 0, scorer: Optional[RiskScorer] = None) -> float:
+    """
+    합성 데이터로 산정 처리량 측정.
+
+    Args:
+        rows: 레코드 수
+        seed: 난수 시드
+        scorer: 재사용할 RiskScorer (None이면 생성)
+
+    Returns:
+        처리량 (rows/sec)
+    """
+    rng = np.random.default_rng(seed)
+    scorer = scorer or RiskScorer()
+    columns = dict(
+        heart_rate=rng.integers(40, 160, rows).astype(float),
+        blood_pressure_sys=rng.integers(80, 200, rows).astype(float),
+        blood_pressure_dia=rng.integers(50, 120, rows).astype(float),
+        body_temperature=rng.uniform(34.5, 40.5, rows),
+        class_probabilities=rng.dirichlet(np.ones(len(AUSCULTATION_CLASSES)), rows),
+        severity=rng.integers(0, len(SEVERITY_OPTIONS), rows),
+    )
+    start = time.perf_counter()
+    scorer.score(**columns)
+    elapsed = time.perf_counter() - start
+    return rows / max(elapsed, 1e-9)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="배치 위험도 산정 (CSV / Parquet 스트리밍)")
+    parser.add_argument("input", nargs="?", type=Path, help="입력 CSV / Parquet 파일")
+    parser.add_argument(
+        "-o", "--output", type=Path, default=None, help="출력 파일 (기본: <입력>_risk.csv)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="청크당 행 수")
+    parser.add_argument(
+        "--benchmark", type=int, metavar="ROWS", default=None, help="합성 데이터 처리량 측정"
+    )
+    parser.add_argument("--test", action="store_true", help="테스트 모드 실행")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+    if args.test:
+        print("=" * 60)
+        print("RiskScorer 테스트")
+        print("=" * 60)
+        scorer = RiskScorer()
+        result = scorer.score(
+            heart_rate=np.array([75.0, 150.0]),
+            blood_pressure_sys=np.array([120.0, 180.0]),
+            blood_pressure_dia=np.array([80.0, 100.0]),
+            body_temperature=np.array([36.5, 39.5]),
+            class_probabilities=np.array([[0.9, 0.05, 0.03, 0.02], [0.05, 0.9, 0.03, 0.02]]),
+            severity=np.array([0, 3]),
+        )
+        for i in range(len(result)):
+            print(f"✓ 레코드 {i}: score={result.score[i]:.0f}, level={result.level[i]}")
+        print(f"✓ 처리량: {benchmark(100_000, scorer=scorer):,.0f} rows/sec (100,000행)")
+    elif args.benchmark:
+        print(f"처리량: {benchmark(args.benchmark):,.0f} rows/sec ({args.benchmark:,}행)")
+    elif args.input:
+        output = args.output or args.input.with_name(f"{args.input.stem}_risk.csv")
+        total = score_file(args.input, output, args.chunk_size)
+        print(f"✓ {total:,}행 산정 완료 → {output}")
+    else:
+        parser.print_help()
@@ -0,0 +1,299 @@
+"""생체신호 규칙 엔진 — vitals_reference.yaml을 정렬된 임계값 배열로 컴파일하여 벡터 분류"""
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from schemas.vitals import VitalSigns, VitalsFindings
+from utils.config_loader import get_config_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 배치 입력 열 순서
+COLUMNS: tuple[str, ...] = ("heart_rate", "systolic", "diastolic", "temperature")
+
+# 위급 구간 (LLM 분석 전 긴급 응답 대상)
+CRITICAL_BANDS: dict[str, tuple[str, ...]] = {
+    "heart_rate": ("critical_low", "critical_high"),
+    "systolic": ("crisis",),
+    "diastolic": ("crisis",),
+    "temperature": ("critical",),
+}
+
+# 위급 생체신호 → 한국어 표기
+CRITICAL_LABELS: dict[str, str] = {
+    "heart_rate": "심박수",
+    "systolic": "수축기 혈압",
+    "diastolic": "이완기 혈압",
+    "temperature": "체온",
+}
+
+# 이상 소견 → 한국어 표기
+FLAG_LABELS: dict[str, str] = {
+    "tachycardia": "빈맥",
+    "bradycardia": "서맥",
+    "hypertension": "고혈압",
+    "hypotension": "저혈압",
+    "fever": "발열",
+    "hypothermia": "저체온",
+}
+
+
+@dataclass(frozen=True)
+class BandSpec:
+    """
+    한 생체신호의 구간 정의.
+
+    bounds[i]는 labels[i+1] 구간의 시작값(YAML 원래 값), strict[i]가 True면 그 값 "초과"부터
+    다음 구간이다 (예: 정상 max 100 → 100 초과부터 빈맥). 초과 경계는 바로 위 부동소수로 옮긴
+    edges 배열로 컴파일하여 하나의 searchsorted 호출로 포함/미포함 경계를 함께 처리한다.
+    """
+
+    labels: tuple[str, ...]
+    bounds: tuple[float, ...]
+    strict: tuple[bool, ...]
+    normal_min: float
+    normal_max: float
+
+    @property
+    def edges(self) -> np.ndarray:
+        return self._edges
+
+    def __post_init__(self) -> None:
+        edges = np.array([
+            np.nextafter(b, np.inf) if s else b
+            for b, s in zip(self.bounds, self.strict, strict=True)
+        ])
+        object.__setattr__(self, "_edges", edges)
+
+    def classify(self, values: np.ndarray) -> np.ndarray:
+        """값 배열 → 구간 인덱스 배열"""
+        return np.searchsorted(self._edges, values, side="right")
+
+    def index(self, label: str) -> int:
+        return self.labels.index(label)
+
+    def lower_bound(self, label: str) -> float:
+        """구간 시작값 (표시용, YAML 원래 값)"""
+        i = self.index(label)
+        return float("-inf") if i == 0 else self.bounds[i - 1]
+
+
+def _ascending(
+    section: Mapping,
+    bands: Sequence[str],
+    prev_max: float,
+    inclusive: Sequence[str] = (),
+) -> list[tuple[float, bool]]:
+    """
+    정상 구간 위쪽 구간들의 시작 경계 (값, 초과 여부).
+
+    앞 구간의 max와 다음 구간의 min이 같으면 그 값은 앞 구간에 남긴다
+    (예: 정상 max 120 / 주의 min 120 → 120은 정상). inclusive 구간은 예외로 min 값부터 포함한다
+    (위급 구간: 수축기 180 이상 / 이완기 120 이상은 crisis).
+    """
+    bounds = []
+    for band in bands:
+        band_min = float(section[band]["min"])
+        bounds.append((band_min, band_min <= prev_max and band not in inclusive))
+        prev_max = float(section[band].get("max", band_min))
+    return bounds
+
+
+def _spec(labels: tuple[str, ...], bounds: list[tuple[float, bool]], normal: Mapping) -> BandSpec:
+    return BandSpec(
+        labels=labels,
+        bounds=tuple(b for b, _ in bounds),
+        strict=tuple(s for _, s in bounds),
+        normal_min=float(normal["min"]),
+        normal_max=float(normal["max"]),
+    )
+
+
+def compile_bands(ref: Mapping) -> dict[str, BandSpec]:
+    """
+    vitals_reference 설정 → 생체신호별 구간 정의.
+
+    Args:
+        ref: vitals_reference.yaml 내용
+
+    Returns:
+        {"heart_rate" | "systolic" | "diastolic" | "temperature": BandSpec}
+    """
+    # 위급 경계는 임계값 자체를 위급으로 본다 (심박수 40 이하 / 150 이상)
+    hr = ref["heart_rate"]
+    heart_rate = _spec(
+        ("critical_low", "warning_low", "low", "normal", "high", "warning_high", "critical_high"),
+        [
+            (float(hr["critical"]["low"]), True),
+            (float(hr["warning"]["low"]), False),
+            (float(hr["normal"]["min"]), False),
+            (float(hr["normal"]["max"]), True),
+            (float(hr["warning"]["high"]), True),
+            (float(hr["critical"]["high"]), False),
+        ],
+        hr["normal"],
+    )
+
+    sys_ref = ref["blood_pressure"]["systolic"]
+    sys_bands = ("elevated", "high_stage1", "high_stage2", "crisis")
+    systolic = _spec(
+        ("low", "normal") + sys_bands,
+        [(float(sys_ref["normal"]["min"]), False)]
+        + _ascending(sys_ref, sys_bands, float(sys_ref["normal"]["max"]), inclusive=("crisis",)),
+        sys_ref["normal"],
+    )
+
+    # 이완기 elevated는 min 없이 "80 미만" 조건이라 구간에서 제외
+    dia_ref = ref["blood_pressure"]["diastolic"]
+    dia_bands = ("high_stage1", "high_stage2", "crisis")
+    diastolic = _spec(
+        ("low", "normal") + dia_bands,
+        [(float(dia_ref["normal"]["min"]), False)]
+        + _ascending(dia_ref, dia_bands, float(dia_ref["normal"]["max"]), inclusive=("crisis",)),
+        dia_ref["normal"],
+    )
+
+    temp_ref = ref["body_temperature"]
+    temp_bands = ("low_grade_fever", "fever", "high_fever", "critical")
+    temperature = _spec(
+        ("hypothermia", "low", "normal") + temp_bands,
+        [(float(temp_ref["hypothermia"]["max"]), False), (float(temp_ref["normal"]["min"]), False)]
+        + _ascending(temp_ref, temp_bands, float(temp_ref["normal"]["max"])),
+        temp_ref["normal"],
+    )
+
+    specs = {
+        "heart_rate": heart_rate,
+        "systolic": systolic,
+        "diastolic": diastolic,
+        "temperature": temperature,
+    }
+    for name, spec in specs.items():
+        if np.any(np.diff(spec.edges) <= 0):
+            raise RuntimeError(
+                f"생체신호 기준 구간이 오름차순이 아닙니다: {name} {list(spec.bounds)}"
+            )
+    return specs
+
+
+@dataclass(frozen=True)
+class VitalsBatchFindings:
+    """배치 평가 결과 (레코드 n개)"""
+
+    bands: dict[str, np.ndarray]    # 생체신호별 구간 레이블 배열 (n,)
+    flags: dict[str, np.ndarray]    # 이상 소견별 bool 배열 (n,)
+    critical: dict[str, np.ndarray]  # 생체신호별 위급 구간 여부 bool 배열 (n,)
+
+    def __len__(self) -> int:
+        return len(next(iter(self.flags.values())))
+
+    def any_abnormal(self) -> np.ndarray:
+        """레코드별 이상 소견 존재 여부 (n,)"""
+        return np.logical_or.reduce(list(self.flags.values()))
+
+
+class VitalsRuleEngine:
+    """
+    컴파일된 생체신호 규칙.
+
+    - 단건/배치 모두 같은 벡터 경로(np.searchsorted)로 분류
+    - 이상 소견 판정 기준이 여기 한 곳에만 있음 (노드/검색/시각화 공통)
+    """
+
+    def __init__(self, ref: Mapping) -> None:
+        self.bands = compile_bands(ref)
+
+    def evaluate_batch(
+        self, values: Union[np.ndarray, Sequence[VitalSigns]]
+    ) -> VitalsBatchFindings:
+        """
+        여러 레코드 일괄 평가.
+
+        Args:
+            values: (n, 4) 배열 [심박수, 수축기, 이완기, 체온] 또는 VitalSigns 목록 (NaN은 결측)
+
+        Returns:
+            VitalsBatchFindings
+        """
+        if not isinstance(values, np.ndarray):
+            values = np.array(
+                [
+                    [v.heart_rate, v.blood_pressure_sys, v.blood_pressure_dia, v.body_temperature]
+                    for v in values
+                ],
+                dtype=float,
+            ).reshape(-1, len(COLUMNS))
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != len(COLUMNS):
+            raise ValueError(f"입력은 (n, {len(COLUMNS)}) 배열이어야 합니다: {values.shape}")
+
+        # 결측값(NaN)은 정상 구간으로 처리 (해당 항목 이상 소견 없음)
+        idx = {
+            name: np.where(np.isnan(values[:, i]), self.bands[name].index("normal"),
+                           self.bands[name].classify(values[:, i]))
+            for i, name in enumerate(COLUMNS)
+        }
+        hr, sys_, dia, temp = (self.bands[name] for name in COLUMNS)
+
+        hypertension = (
+            (idx["systolic"] >= sys_.index("high_stage2"))
+            | (idx["diastolic"] >= dia.index("high_stage2"))
+        )
+        flags = {
+            "tachycardia": idx["heart_rate"] > hr.index("normal"),
+            "bradycardia": idx["heart_rate"] < hr.index("normal"),
+            "hypertension": hypertension,
+            "hypotension": ~hypertension & (idx["systolic"] < sys_.index("normal")),
+            "fever": idx["temperature"] >= temp.index("fever"),
+            "hypothermia": idx["temperature"] == temp.index("hypothermia"),
+        }
+        bands = {name: np.asarray(self.bands[name].labels)[idx[name]] for name in COLUMNS}
+        critical = {
+            name: np.isin(idx[name], [self.bands[name].index(b) for b in CRITICAL_BANDS[name]])
+            for name in COLUMNS
+        }
+        return VitalsBatchFindings(bands=bands, flags=flags, critical=critical)
+
+    def evaluate(self, vitals: VitalSigns) -> VitalsFindings:
+        """단건 평가 (배치 경로 재사용)"""
+        batch = self.evaluate_batch([vitals])
+        return VitalsFindings(
+            heart_rate_band=str(batch.bands["heart_rate"][0]),
+            systolic_band=str(batch.bands["systolic"][0]),
+            diastolic_band=str(batch.bands["diastolic"][0]),
+            temperature_band=str(batch.bands["temperature"][0]),
+            flags=[flag for flag, mask in batch.flags.items() if mask[0]],
+            critical=[name for name, mask in batch.critical.items() if mask[0]],
+        )
+
+
+_ENGINE: Optional[tuple[object, VitalsRuleEngine]] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def get_vitals_rules() -> VitalsRuleEngine:
+    """
+    공유 규칙 엔진 조회 (설정 스냅샷당 1회 컴파일).
+
+    vitals_reference.yaml이 바뀌어 설정 스냅샷이 교체되면 다음 호출에서 다시 컴파일한다.
+    """
+    global _ENGINE
+    snapshot = get_config_snapshot("vitals_reference")
+    cached = _ENGINE
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    with _ENGINE_LOCK:
+        if _ENGINE is None or _ENGINE[0] is not snapshot:
+            _ENGINE = (snapshot, VitalsRuleEngine(snapshot.data))
+            logger.info("생체신호 규칙 컴파일 완료")
+        return _ENGINE[1]
+
+
+def evaluate_vitals(vitals: VitalSigns) -> VitalsFindings:
+    """생체신호 단건 평가 (편의 함수)"""
+    return get_vitals_rules().evaluate(vitals)
@@ -1,14 +1,16 @@
 """Pydantic 데이터 스키마 패키지"""
 from __future__ import annotations
 
-from schemas.vitals import VitalSigns
+from schemas.vitals import VitalSigns, VitalsFindings
 from schemas.symptoms import SymptomInput, SYMPTOM_OPTIONS, DURATION_OPTIONS, SEVERITY_OPTIONS
 from schemas.auscultation import AuscultationResult, AUSCULTATION_CLASSES
 from schemas.report import RiskAssessment, AnalysisReport
-from schemas.literature import MedicalReference, LiteratureSearchResult
+from schemas.literature import CanonicalQuery, MedicalReference, LiteratureSearchResult
+from schemas.api import AnalysisRequest, AnalysisResponse
 
 __all__ = [
     "VitalSigns",
+    "VitalsFindings",
     "SymptomInput",
     "SYMPTOM_OPTIONS",
     "DURATION_OPTIONS",
@@ -17,6 +19,9 @@ __all__ = [
     "AUSCULTATION_CLASSES",
     "RiskAssessment",
     "AnalysisReport",
+    "CanonicalQuery",
     "MedicalReference",
     "LiteratureSearchResult",
+    "AnalysisRequest",
+    "AnalysisResponse",
 ]
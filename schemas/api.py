@@ -0,0 +1,49 @@
+"""HTTP 추론 서비스 요청/응답 스키마"""
+from __future__ import annotations
+
+from typing import Any, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from schemas.auscultation import AuscultationResult
+from schemas.report import AnalysisReport
+from schemas.symptoms import SymptomInput
+from schemas.vitals import VitalSigns
+
+
+class AnalysisRequest(BaseModel):
+    """/analyze 요청 스키마 (생략한 입력은 스키마 디폴트 적용)"""
+
+    vitals: VitalSigns = Field(default_factory=VitalSigns)
+    symptoms: SymptomInput = Field(default_factory=SymptomInput)
+    auscultation: Optional[AuscultationResult] = Field(
+        default=None,
+        description="/classify 결과 (없으면 생체신호와 증상만으로 분석)",
+    )
+    user_mode: Literal["general", "professional"] = "general"
+
+    def to_state(self) -> dict[str, Any]:
+        """그래프 입력 상태로 변환"""
+        state: dict[str, Any] = {
+            "vitals": self.vitals,
+            "symptoms": self.symptoms,
+            "user_mode": self.user_mode,
+        }
+        if self.auscultation is not None:
+            state["auscultation"] = self.auscultation
+        return state
+
+
+class AnalysisResponse(AnalysisReport):
+    """/analyze 응답 스키마 (분석 리포트 + 실행 메타데이터)"""
+
+    emergency_recommendation: Optional[str] = None
+    degraded_nodes: list[str] = Field(default_factory=list)
+    trace_id: Optional[str] = None
+    timing: Optional[dict[str, Any]] = None
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> AnalysisResponse:
+        """그래프 최종 상태에서 응답 생성 (스키마에 없는 키는 무시)"""
+        fields = {name: state[name] for name in cls.model_fields if state.get(name) is not None}
+        return cls(**fields)
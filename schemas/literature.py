@@ -1,9 +1,13 @@
 """의학 문헌 검색 결과 스키마"""
 from __future__ import annotations
 
-from typing import Optional
+import hashlib
+import re
+from typing import Iterable, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+_WHITESPACE = re.compile(r"\s+")
 
 
 class MedicalReference(BaseModel):
@@ -35,6 +39,14 @@ class MedicalReference(BaseModel):
         default=None,
         description="DOI 식별자",
     )
+    pmid: Optional[str] = Field(
+        default=None,
+        description="PubMed ID (소스 간 중복 판정용, 소스가 PubMed가 아니어도 알면 기록)",
+    )
+    abstract: str = Field(
+        default="",
+        description="초록 (제공하는 소스만, 로컬 재순위화에 사용)",
+    )
     url: str = Field(
         default="",
         description="논문 URL",
@@ -47,6 +59,50 @@ class MedicalReference(BaseModel):
     )
 
 
+class CanonicalQuery(BaseModel):
+    """
+    정규화된 검색 쿼리 (캐시 키 기준).
+
+    검색어 집합을 소문자/공백 정규화 → 중복 제거 → 정렬하여 보관하므로
+    입력 순서가 달라도 같은 임상 정보면 같은 `key`를 가진다.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    terms: tuple[str, ...] = Field(
+        default=(),
+        description="정규화·정렬된 검색어 목록",
+    )
+
+    @staticmethod
+    def normalize_term(term: str) -> str:
+        """검색어 정규화 (소문자 + 연속 공백 축약)"""
+        return _WHITESPACE.sub(" ", term).strip().lower()
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[str]) -> CanonicalQuery:
+        """검색어 목록 → 정규화된 쿼리 (순서 무관)"""
+        normalized = {cls.normalize_term(t) for t in terms}
+        normalized.discard("")
+        return cls(terms=tuple(sorted(normalized)))
+
+    @classmethod
+    def from_text(cls, query: str) -> CanonicalQuery:
+        """자유 입력 쿼리 문자열 → 단일 검색어 쿼리"""
+        return cls.from_terms([query])
+
+    @property
+    def text(self) -> str:
+        """검색 API에 전달할 쿼리 문자열"""
+        return " ".join(self.terms)
+
+    @property
+    def key(self) -> str:
+        """안정적인 해시 키 (프로세스/실행 간 동일)"""
+        digest = hashlib.sha256("\x1f".join(self.terms).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+
 class LiteratureSearchResult(BaseModel):
     """통합 문헌 검색 결과 스키마"""
 
@@ -54,6 +110,10 @@ class LiteratureSearchResult(BaseModel):
         default="",
         description="실행된 검색 쿼리",
     )
+    query_key: Optional[str] = Field(
+        default=None,
+        description="정규화된 쿼리 해시 키 (CanonicalQuery.key)",
+    )
     total_count: int = Field(
         default=0,
         ge=0,
@@ -31,3 +31,43 @@ class VitalSigns(BaseModel):
         le=43.0,
         description="체온 (°C)",
     )
+
+
+class VitalsFindings(BaseModel):
+    """생체신호 규칙 평가 결과 (요청당 1회 계산, 모든 노드가 공유)"""
+
+    heart_rate_band: str = Field(
+        default="normal",
+        description=(
+            "심박수 구간 "
+            "(critical_low, warning_low, low, normal, high, warning_high, critical_high)"
+        ),
+    )
+    systolic_band: str = Field(
+        default="normal",
+        description="수축기 혈압 구간 (low, normal, elevated, high_stage1, high_stage2, crisis)",
+    )
+    diastolic_band: str = Field(
+        default="normal",
+        description="이완기 혈압 구간 (low, normal, high_stage1, high_stage2, crisis)",
+    )
+    temperature_band: str = Field(
+        default="normal",
+        description=(
+            "체온 구간 (hypothermia, low, normal, low_grade_fever, fever, high_fever, critical)"
+        ),
+    )
+    flags: list[str] = Field(
+        default_factory=list,
+        description=(
+            "이상 소견 (tachycardia, bradycardia, hypertension, hypotension, fever, hypothermia)"
+        ),
+    )
+    critical: list[str] = Field(
+        default_factory=list,
+        description="위급 구간에 든 생체신호 (heart_rate, systolic, diastolic, temperature)",
+    )
+
+    def has(self, flag: str) -> bool:
+        """이상 소견 포함 여부"""
+        return flag in self.flags
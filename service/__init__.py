@@ -0,0 +1 @@
+"""HTTP 추론 서비스 패키지 (Streamlit UI와 별도 실행)"""
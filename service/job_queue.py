@@ -0,0 +1,286 @@
+"""비동기 분석 작업 큐 — 작업 ID 기반 제출/조회, 재시도, 가시성 타임아웃 (백엔드 교체 가능)"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 (상대 sqlite_path 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+
+@dataclass(frozen=True)
+class JobRecord:
+    """작업 한 건의 저장 상태"""
+
+    id: str
+    status: str
+    payload: dict[str, Any]
+    result: Optional[dict[str, Any]]
+    error: Optional[str]
+    attempts: int
+    max_attempts: int
+    visible_at: float       # 이 시각(epoch 초) 이후 다시 가져갈 수 있음
+    worker_id: Optional[str]
+    created_at: float
+    updated_at: float
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> dict[str, Any]:
+        """조회 API 응답용 (payload 제외)"""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "error": self.error,
+            "result": self.result,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class BaseJobQueue(ABC):
+    """
+    작업 큐 백엔드 인터페이스.
+
+    - claim(): 가시성 타임아웃 동안 작업을 점유
+      (워커가 죽으면 타임아웃 후 다른 워커가 재점유)
+    - complete()/fail()/extend(): 점유한 워커(worker_id)만 반영 가능
+      (점유를 잃은 워커의 결과는 무시)
+    """
+
+    @classmethod
+    @abstractmethod
+    def from_config(cls, config: Mapping[str, Any]) -> BaseJobQueue:
+        """config/app.yaml jobs 섹션으로 생성"""
+
+    @abstractmethod
+    def submit(self, payload: dict[str, Any], max_attempts: Optional[int] = None) -> str:
+        """작업 제출 → 작업 ID"""
+
+    @abstractmethod
+    def claim(self, worker_id: str, visibility_timeout: float) -> Optional[JobRecord]:
+        """실행 가능한 가장 오래된 작업 점유 (없으면 None)"""
+
+    @abstractmethod
+    def extend(self, job_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        """점유 연장 (하트비트). 점유를 잃었으면 False"""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str, result: dict[str, Any]) -> bool:
+        """성공 결과 저장. 점유를 잃었으면 False"""
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float) -> bool:
+        """실패 기록 — 시도 횟수가 남았으면 retry_delay 후 재시도, 아니면 failed"""
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        """작업 조회"""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """상태별 작업 수"""
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id           TEXT PRIMARY KEY,
+    status       TEXT NOT NULL,
+    payload      TEXT NOT NULL,
+    result       TEXT,
+    error        TEXT,
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    visible_at   REAL NOT NULL,
+    worker_id    TEXT,
+    created_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, visible_at, created_at);
+"""
+
+
+class SQLiteJobQueue(BaseJobQueue):
+    """
+    SQLite(WAL) 백엔드.
+
+    여러 워커 프로세스가 같은 파일을 공유할 수 있다. 점유는 BEGIN IMMEDIATE 트랜잭션 안에서
+    조회+갱신하므로 같은 작업을 두 워커가 동시에 가져가지 않는다.
+    """
+
+    def __init__(self, path: str | Path, default_max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        if not self.path.is_absolute():
+            self.path = _PROJECT_ROOT / self.path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_max_attempts = default_max_attempts
+        self._local = threading.local()
+        self._conn().executescript(_SCHEMA)
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> SQLiteJobQueue:
+        return cls(config.get("sqlite_path", "data/jobs.db"), config.get("max_attempts", 3))
+
+    def _conn(self) -> sqlite3.Connection:
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유 불가)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _record(row: sqlite3.Row) -> JobRecord:
+        return JobRecord(
+            id=row["id"],
+            status=row["status"],
+            payload=json.loads(row["payload"]),
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            visible_at=row["visible_at"],
+            worker_id=row["worker_id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
+    def submit(self, payload: dict[str, Any], max_attempts: Optional[int] = None) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._conn().execute(
+            "INSERT INTO jobs "
+            "(id, status, payload, max_attempts, visible_at, created_at, updated_at) "
+            "VALUES (?, 'queued', ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                json.dumps(payload, ensure_ascii=False),
+                max_attempts or self.default_max_attempts,
+                now, now, now,
+            ),
+        )
+        logger.info("작업 제출: %s", job_id)
+        return job_id
+
+    def claim(self, worker_id: str, visibility_timeout: float) -> Optional[JobRecord]:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 점유 중 타임아웃된 작업 중 시도 횟수를 모두 쓴 것은 실패 처리
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', "
+                "error = '가시성 타임아웃 초과 (워커 응답 없음)', worker_id = NULL, updated_at = ? "
+                "WHERE status = 'running' AND visible_at <= ? AND attempts >= max_attempts",
+                (now, now),
+            )
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE status IN ('queued', 'running') AND visible_at <= ? "
+                "ORDER BY created_at LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker_id = ?, "
+                "visible_at = ?, updated_at = ? WHERE id = ?",
+                (worker_id, now + visibility_timeout, now, row["id"]),
+            )
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+            record = self._record(row)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info(
+            "작업 점유: %s (worker=%s, 시도 %d/%d)",
+            record.id, worker_id, record.attempts, record.max_attempts,
+        )
+        return record
+
+    def _update_owned(self, sql: str, params: tuple, job_id: str, worker_id: str) -> bool:
+        cursor = self._conn().execute(
+            f"{sql} WHERE id = ? AND worker_id = ? AND status = 'running'",
+            (*params, job_id, worker_id),
+        )
+        return cursor.rowcount == 1
+
+    def extend(self, job_id: str, worker_id: str, visibility_timeout: float) -> bool:
+        now = time.time()
+        return self._update_owned(
+            "UPDATE jobs SET visible_at = ?, updated_at = ?",
+            (now + visibility_timeout, now),
+            job_id, worker_id,
+        )
+
+    def complete(self, job_id: str, worker_id: str, result: dict[str, Any]) -> bool:
+        now = time.time()
+        return self._update_owned(
+            "UPDATE jobs SET status = 'succeeded', result = ?, error = NULL, updated_at = ?",
+            (json.dumps(result, ensure_ascii=False), now),
+            job_id, worker_id,
+        )
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry_delay: float) -> bool:
+        now = time.time()
+        return self._update_owned(
+            "UPDATE jobs SET "
+            "status = CASE WHEN attempts < max_attempts THEN 'queued' ELSE 'failed' END, "
+            "error = ?, visible_at = ?, updated_at = ?",
+            (error, now + retry_delay, now),
+            job_id, worker_id,
+        )
+
+    def get(self, job_id: str) -> Optional[JobRecord]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._record(row) if row else None
+
+    def stats(self) -> dict[str, int]:
+        counts = dict.fromkeys(JOB_STATUSES, 0)
+        for row in self._conn().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"):
+            counts[row["status"]] = row["n"]
+        return counts
+
+
+# 백엔드 레지스트리 (새 백엔드는 BaseJobQueue 구현 후 등록)
+QUEUE_BACKENDS: dict[str, type[BaseJobQueue]] = {
+    "sqlite": SQLiteJobQueue,
+}
+
+
+def create_job_queue(config: Optional[Mapping[str, Any]] = None) -> BaseJobQueue:
+    """
+    config/app.yaml jobs 설정으로 큐 생성.
+
+    Raises:
+        RuntimeError: 알 수 없는 백엔드일 때
+    """
+    config = config if config is not None else get_app_config().get("jobs", {})
+    backend = config.get("backend", "sqlite")
+    if backend not in QUEUE_BACKENDS:
+        raise RuntimeError(
+            f"알 수 없는 작업 큐 백엔드: {backend} (지원: {', '.join(QUEUE_BACKENDS)})"
+        )
+    return QUEUE_BACKENDS[backend].from_config(config)
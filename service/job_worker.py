@@ -0,0 +1,171 @@
+"""분석 작업 워커 — 큐에서 작업을 가져와 그래프 실행 후 결과 저장 (워커당 동시 실행 상한)"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가 (python service/job_worker.py 직접 실행 대비)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import logging
+import os
+import socket
+import threading
+import uuid
+from typing import Any, Callable, Mapping, Optional
+
+from schemas.api import AnalysisRequest, AnalysisResponse
+from service.job_queue import BaseJobQueue, JobRecord, create_job_queue
+from utils.config_loader import get_app_config
+from utils.tracing import start_trace
+
+logger = logging.getLogger(__name__)
+
+
+def run_analysis_job(payload: dict[str, Any]) -> dict[str, Any]:
+    """작업 페이로드(AnalysisRequest JSON) → 그래프 실행 → AnalysisResponse JSON"""
+    from agents.graph import get_graph
+
+    request = AnalysisRequest.model_validate(payload)
+    with start_trace():
+        state = get_graph().invoke(request.to_state())
+    return AnalysisResponse.from_state(state).model_dump(mode="json")
+
+
+class JobWorker:
+    """
+    작업 워커.
+
+    - concurrency개 스레드가 각자 claim → 실행 → complete/fail 반복
+    - 실행 중에는 heartbeat_seconds마다 가시성 타임아웃 연장
+      (워커가 죽으면 연장이 멈춰 다른 워커가 재점유)
+    - 여러 프로세스/호스트에서 같은 큐를 공유해 수평 확장
+    """
+
+    def __init__(
+        self,
+        queue: BaseJobQueue,
+        config: Optional[Mapping[str, Any]] = None,
+        handler: Callable[[dict[str, Any]], dict[str, Any]] = run_analysis_job,
+    ) -> None:
+        config = config if config is not None else get_app_config().get("jobs", {})
+        self.queue = queue
+        self.handler = handler
+        self.concurrency: int = config.get("concurrency", 2)
+        self.visibility_timeout: float = config.get("visibility_timeout", 300)
+        self.heartbeat: float = config.get("heartbeat_seconds", 60)
+        self.poll_interval: float = config.get("poll_interval_seconds", 1.0)
+        self.retry_delay: float = config.get("retry_delay_seconds", 10)
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def run_once(self, slot: int = 0) -> Optional[JobRecord]:
+        """
+        작업 1건 처리.
+
+        Returns:
+            처리한 작업 (대기 작업이 없으면 None)
+        """
+        worker_id = f"{self.worker_id}/{slot}"
+        job = self.queue.claim(worker_id, self.visibility_timeout)
+        if job is None:
+            return None
+
+        stop_heartbeat = threading.Event()
+
+        def heartbeat() -> None:
+            while not stop_heartbeat.wait(self.heartbeat):
+                if not self.queue.extend(job.id, worker_id, self.visibility_timeout):
+                    logger.warning("작업 점유 상실: %s (다른 워커가 재점유)", job.id)
+                    return
+
+        beat = threading.Thread(target=heartbeat, name=f"heartbeat-{job.id[:8]}", daemon=True)
+        beat.start()
+        try:
+            result = self.handler(job.payload)
+        except Exception as e:
+            logger.error(
+                "작업 실패: %s (시도 %d/%d): %s", job.id, job.attempts, job.max_attempts, e
+            )
+            self.queue.fail(job.id, worker_id, f"{type(e).__name__}: {e}", self.retry_delay)
+        else:
+            if self.queue.complete(job.id, worker_id, result):
+                logger.info("작업 완료: %s", job.id)
+            else:
+                logger.warning("작업 완료 반영 실패 (점유 상실): %s", job.id)
+        finally:
+            stop_heartbeat.set()
+            beat.join()
+        return self.queue.get(job.id)
+
+    def _loop(self, slot: int) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self.run_once(slot)
+            except Exception as e:
+                logger.error("워커 루프 오류 (계속 진행): %s", e)
+                job = None
+            if job is None:
+                self._stop.wait(self.poll_interval)
+
+    def start(self) -> None:
+        """동시 실행 스레드 시작"""
+        for slot in range(self.concurrency):
+            thread = threading.Thread(
+                target=self._loop, args=(slot,), name=f"job-worker-{slot}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info("작업 워커 시작: %s (동시 실행 %d)", self.worker_id, self.concurrency)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """새 작업 점유 중단 후 실행 중 작업 완료 대기"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        logger.info("작업 워커 종료: %s", self.worker_id)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="StethoAgent 분석 작업 워커")
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="동시 실행 작업 수 (기본: config)"
+    )
+    parser.add_argument("--test", action="store_true", help="디폴트 입력 작업 1건 제출 후 처리")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+    jobs_config = dict(get_app_config().get("jobs", {}))
+    if args.concurrency:
+        jobs_config["concurrency"] = args.concurrency
+
+    job_queue = create_job_queue(jobs_config)
+    worker = JobWorker(job_queue, jobs_config)
+
+    if args.test:
+        print("=" * 60)
+        print("분석 작업 워커 테스트")
+        print("=" * 60)
+        job_id = job_queue.submit(AnalysisRequest().model_dump(mode="json"))
+        print(f"✓ 작업 제출: {job_id}")
+        record = worker.run_once()
+        print(f"✓ 상태: {record.status} (시도 {record.attempts}회)")
+        if record.result:
+            print(f"  권고: {(record.result.get('recommendation') or '')[:200]}")
+        if record.error:
+            print(f"  오류: {record.error}")
+    else:
+        worker.start()
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            print("\n종료 중... (실행 중 작업 완료 대기)")
+            worker.stop()
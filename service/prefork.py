@@ -0,0 +1,208 @@
+"""
+Pre-fork 서비스 런처.
+
+부모에서 AST 모델을 1회 로딩한 뒤 워커 프로세스를 fork한다 (가중치 copy-on-write 공유).
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가 (python service/prefork.py 직접 실행 대비)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from typing import Any, Callable, Mapping, Optional
+
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+# 워커가 이 시간 안에 연속으로 죽으면 재시작을 멈춤 (설정 오류 등으로 무한 fork 방지)
+_MIN_WORKER_LIFETIME = 5.0
+
+
+def worker_threads(workers: int, configured: Optional[int] = None) -> int:
+    """워커당 torch 스레드 수 (미설정 시 CPU 코어를 워커 수로 나눔 — 코어 과다 할당 방지)"""
+    if configured:
+        return configured
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
+def freeze_classifier(classifier: Any, gc_freeze: bool = True) -> None:
+    """
+    fork 전 모델 고정.
+
+    - eval 모드 + requires_grad=False: 추론 중 가중치/grad 버퍼에 쓰지 않아
+      공유 페이지가 복사되지 않음
+    - gc.freeze(): 이미 만들어진 파이썬 객체를 GC 추적에서 제외해
+      자식의 GC가 공유 페이지를 건드리지 않음
+    """
+    classifier.model.eval()
+    for param in classifier.model.parameters():
+        param.requires_grad_(False)
+    if gc_freeze:
+        gc.collect()
+        gc.freeze()
+
+
+def _serve_worker(sock: socket.socket, config: Mapping[str, Any]) -> None:
+    """워커 프로세스: 상속한 모델로 같은 리스닝 소켓에서 ASGI 앱 실행"""
+    import uvicorn
+
+    from service.server import create_app
+    from service.workers import WorkerPools
+
+    # 모델은 부모에서 이미 로딩됨 → AST는 워커 내 스레드로 실행
+    # (별도 프로세스 풀이면 모델을 다시 로딩)
+    pools_config = {**config, "ast": {**config.get("ast", {}), "executor": "thread"}}
+    app = create_app(WorkerPools(pools_config))
+    server = uvicorn.Server(uvicorn.Config(app, log_level="info"))
+    server.run(sockets=[sock])
+
+
+class PreforkServer:
+    """
+    Pre-fork 런처.
+
+    부모 프로세스가 AST 모델을 로딩·고정한 뒤 워커 N개를 fork한다. 워커는 같은 리스닝 소켓을
+    공유하고(커널이 연결 분배), 모델 가중치 페이지는 쓰기 전까지 부모와 공유된다.
+    죽은 워커는 부모가 다시 fork한다 (모델 재로딩 없음).
+    """
+
+    def __init__(
+        self,
+        config: Optional[Mapping[str, Any]] = None,
+        workers: Optional[int] = None,
+        target: Callable[[socket.socket, Mapping[str, Any]], None] = _serve_worker,
+    ) -> None:
+        self.config = config if config is not None else get_app_config().get("service", {})
+        prefork = self.config.get("prefork", {})
+        self.workers: int = workers or prefork.get("workers", 2)
+        self.threads: int = worker_threads(self.workers, prefork.get("threads_per_worker"))
+        self.gc_freeze: bool = prefork.get("gc_freeze", True)
+        self.target = target
+        self.children: dict[int, float] = {}  # pid → 시작 시각
+        self._stopping = False
+
+    def preload(self) -> None:
+        """
+        부모에서 모델 로딩 + 더미 추론 + 고정 (Ollama 모델 사전 적재 포함).
+
+        더미 추론은 단일 스레드로 실행한다. 부모가 OpenMP 워커 스레드를 한 번이라도 띄우면
+        fork된 워커는 첫 병렬 연산에서 멈추고, 자식에서 torch.set_num_threads로도 풀리지 않는다.
+        """
+        import torch
+
+        from models.ast_classifier import get_classifier
+        from utils.warmup import warm_llm
+
+        start = time.perf_counter()
+        classifier = get_classifier()
+        # 튜닝 프로파일이 적용한 스레드 수도 덮어씀 (부모는 워커 감독만 하므로 되돌리지 않음)
+        torch.set_num_threads(1)
+        classifier.warmup(get_app_config().get("warmup", {}).get("ast_dummy_seconds", 1.0))
+        freeze_classifier(classifier, self.gc_freeze)
+        logger.info("부모 프로세스 모델 로딩 완료 (%.1f초)", time.perf_counter() - start)
+        try:
+            warm_llm()
+        except Exception as e:
+            logger.warning("LLM 사전 적재 실패 (첫 분석 시 로딩): %s", e)
+
+    def bind(self, host: str, port: int) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _spawn(self, sock: socket.socket) -> int:
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                import torch
+
+                torch.set_num_threads(self.threads)
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                self.target(sock, self.config)
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 0
+            except BaseException as e:
+                logger.error("워커 종료 (오류): %s", e)
+                code = 1
+            finally:
+                os._exit(code)
+        self.children[pid] = time.monotonic()
+        logger.info("워커 시작: pid=%d (torch 스레드 %d)", pid, self.threads)
+        return pid
+
+    def stop(self, *_: Any) -> None:
+        """모든 워커에 SIGTERM 전달 (supervise 루프는 워커가 모두 종료되면 반환)"""
+        self._stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self, sock: socket.socket) -> None:
+        """워커 fork 후 감독 (비정상 종료한 워커는 재시작)"""
+        for _ in range(self.workers):
+            self._spawn(sock)
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            started = self.children.pop(pid, time.monotonic())
+            code = os.waitstatus_to_exitcode(status)
+            if self._stopping or code == 0:
+                logger.info("워커 종료: pid=%d (코드 %d)", pid, code)
+                continue
+            if time.monotonic() - started < _MIN_WORKER_LIFETIME:
+                logger.error(
+                    "워커가 시작 직후 종료되어 재시작하지 않습니다: pid=%d (코드 %d)", pid, code
+                )
+                continue
+            logger.warning("워커 비정상 종료, 재시작: pid=%d (코드 %d)", pid, code)
+            self._spawn(sock)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="StethoAgent pre-fork 추론 서비스")
+    parser.add_argument("--host", type=str, default=None, help="바인딩 호스트 (기본: config)")
+    parser.add_argument("--port", type=int, default=None, help="포트 (기본: config)")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="워커 프로세스 수 (기본: config prefork.workers)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(process)d %(name)s %(levelname)s: %(message)s",
+    )
+    service_config = get_app_config().get("service", {})
+
+    launcher = PreforkServer(service_config, workers=args.workers)
+    listener = launcher.bind(
+        args.host or service_config.get("host", "0.0.0.0"),
+        args.port or service_config.get("port", 8000),
+    )
+    launcher.preload()
+    signal.signal(signal.SIGTERM, launcher.stop)
+    signal.signal(signal.SIGINT, launcher.stop)
+    launcher.run(listener)
+    logger.info("pre-fork 서비스 종료")
@@ -0,0 +1,326 @@
+"""HTTP 추론 서비스 — /classify, /analyze, /analyze/stream (SSE), /jobs (비동기 작업) ASGI 앱"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가 (python service/server.py 직접 실행 대비)
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+from pydantic import BaseModel, ValidationError
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from schemas.api import AnalysisRequest, AnalysisResponse
+from service.job_queue import BaseJobQueue, create_job_queue
+from service.workers import PoolFull, WorkerPools, classify_file
+from utils.config_loader import get_app_config
+from utils.tracing import start_trace
+from utils.warmup import WARMUP_TASKS, readiness, start_warmup
+
+logger = logging.getLogger(__name__)
+
+# 스트림 종료 표시
+_STREAM_END = object()
+
+
+def _jsonable(value: Any) -> Any:
+    """상태 값(Pydantic 모델 포함)을 JSON 직렬화 가능한 형태로 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    return value
+
+
+def _too_busy(error: PoolFull) -> JSONResponse:
+    retry_after = get_app_config().get("service", {}).get("retry_after_seconds", 5)
+    return JSONResponse(
+        {"detail": str(error)}, status_code=429, headers={"Retry-After": str(retry_after)}
+    )
+
+
+def _run_graph(state: dict[str, Any]) -> dict[str, Any]:
+    """분석 워커에서 실행: 그래프 1회 실행 (요청 단위 트레이스)"""
+    from agents.graph import get_graph
+
+    with start_trace():
+        return get_graph().invoke(state)
+
+
+def _stream_graph(state: dict[str, Any], emit) -> None:
+    """분석 워커에서 실행: 노드 완료마다 emit(event, data), 마지막에 result 이벤트"""
+    from agents.graph import get_graph
+
+    result: dict[str, Any] = {}
+    with start_trace():
+        for mode, chunk in get_graph().stream(state, stream_mode=["updates", "values"]):
+            if mode == "values":
+                result = chunk
+                continue
+            for node, update in chunk.items():
+                emit("node", {"node": node, "update": _jsonable(update)})
+    emit("result", AnalysisResponse.from_state(result).model_dump(mode="json"))
+
+
+def _job_queue(request: Request) -> BaseJobQueue:
+    """작업 큐 (첫 /jobs 요청 시 생성 — 작업 API를 쓰지 않으면 DB 파일을 만들지 않음)"""
+    if request.app.state.job_queue is None:
+        request.app.state.job_queue = create_job_queue()
+    return request.app.state.job_queue
+
+
+def _warmup_tasks(pools: WorkerPools) -> dict[str, Any]:
+    """워밍업 구성요소 — AST는 분류가 실행될 AST 풀 워커 안에서 로딩"""
+    names = get_app_config().get("warmup", {}).get("components", list(WARMUP_TASKS))
+    tasks = {name: WARMUP_TASKS[name] for name in names if name in WARMUP_TASKS}
+    if "ast" in tasks:
+        tasks["ast"] = lambda: pools.warmup().result()
+    return tasks
+
+
+async def _parse_analysis_request(request: Request) -> AnalysisRequest | JSONResponse:
+    try:
+        body = await request.body()
+        return AnalysisRequest.model_validate_json(body or b"{}")
+    except ValidationError as e:
+        return JSONResponse({"detail": json.loads(e.json())}, status_code=422)
+
+
+# === 엔드포인트 ===
+
+
+async def health(request: Request) -> JSONResponse:
+    """상태 확인 (프로세스 생존) + 풀 사용량 + 워밍업 상태"""
+    pools: WorkerPools = request.app.state.pools
+    return JSONResponse({"status": "ok", "pools": pools.stats(), **readiness()})
+
+
+async def ready(request: Request) -> JSONResponse:
+    """준비 상태 확인 — 워밍업이 끝나기 전(또는 실패 시)에는 503 (로드밸런서 readiness probe용)"""
+    state = readiness()
+    return JSONResponse(state, status_code=200 if state["ready"] else 503)
+
+
+async def classify(request: Request) -> Response:
+    """
+    청진음 분류.
+
+    multipart/form-data `audio` 필드의 WAV 파일을 AST 풀에서 분류하여 AuscultationResult 반환.
+    """
+    audio_config = get_app_config().get("audio", {})
+    allowed = tuple(audio_config.get("allowed_extensions", [".wav"]))
+    max_bytes = audio_config.get("max_file_size_mb", 10) * 1024 * 1024
+
+    form = await request.form()
+    upload = form.get("audio")
+    if upload is None or not hasattr(upload, "read"):
+        return JSONResponse({"detail": "audio 파일 필드가 필요합니다"}, status_code=400)
+    if not upload.filename:
+        return JSONResponse({"detail": "audio 파일 이름이 필요합니다"}, status_code=400)
+    if not upload.filename.lower().endswith(allowed):
+        detail = f"지원하지 않는 파일 형식입니다 (허용: {', '.join(allowed)})"
+        return JSONResponse({"detail": detail}, status_code=415)
+    data = await upload.read()
+    if len(data) > max_bytes:
+        detail = f"파일 크기가 {max_bytes // (1024 * 1024)}MB를 초과합니다"
+        return JSONResponse({"detail": detail}, status_code=413)
+
+    with tempfile.NamedTemporaryFile(suffix=Path(upload.filename).suffix, delete=False) as tmp:
+        tmp.write(data)
+        tmp_path = tmp.name
+    try:
+        future = request.app.state.pools.ast.submit(classify_file, tmp_path)
+        result = await asyncio.wrap_future(future)
+    except PoolFull as e:
+        return _too_busy(e)
+    except Exception as e:
+        logger.error("청진음 분류 실패: %s", e)
+        return JSONResponse({"detail": f"청진음 분류 실패: {e}"}, status_code=500)
+    finally:
+        os.unlink(tmp_path)
+
+    result = result.model_copy(update={"file_name": upload.filename})
+    return JSONResponse(result.model_dump(mode="json"))
+
+
+async def analyze(request: Request) -> Response:
+    """전체 그래프 분석 (완료 후 AnalysisResponse 반환)"""
+    parsed = await _parse_analysis_request(request)
+    if isinstance(parsed, JSONResponse):
+        return parsed
+
+    try:
+        future = request.app.state.pools.analysis.submit(_run_graph, parsed.to_state())
+    except PoolFull as e:
+        return _too_busy(e)
+    try:
+        state = await asyncio.wrap_future(future)
+    except Exception as e:
+        logger.error("분석 실패: %s", e)
+        return JSONResponse({"detail": f"분석 실패: {e}"}, status_code=500)
+    return JSONResponse(AnalysisResponse.from_state(state).model_dump(mode="json"))
+
+
+async def analyze_stream(request: Request) -> Response:
+    """
+    전체 그래프 분석 (Server-Sent Events).
+
+    이벤트: `node`(노드 완료마다 {node, update}) → `result`(AnalysisResponse) 또는 `error`.
+    긴급 경로가 활성화되면 emergency_node 이벤트가 전체 분석보다 먼저 도착한다.
+    """
+    parsed = await _parse_analysis_request(request)
+    if isinstance(parsed, JSONResponse):
+        return parsed
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(event: str, data: Any) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, (event, data))
+
+    try:
+        future = request.app.state.pools.analysis.submit(_stream_graph, parsed.to_state(), emit)
+    except PoolFull as e:
+        return _too_busy(e)
+
+    def _finish(done) -> None:
+        error = done.exception()
+        if error is not None:
+            emit("error", {"detail": f"분석 실패: {error}"})
+        loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+    future.add_done_callback(_finish)
+
+    async def events() -> AsyncIterator[str]:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
+
+
+async def submit_job(request: Request) -> Response:
+    """
+    비동기 분석 작업 제출 (202 + job_id).
+
+    작업은 별도 워커 프로세스(service/job_worker.py)가 처리하며, 결과는 GET /jobs/{job_id}로 조회.
+    """
+    parsed = await _parse_analysis_request(request)
+    if isinstance(parsed, JSONResponse):
+        return parsed
+
+    job_queue = _job_queue(request)
+    job_id = await asyncio.to_thread(job_queue.submit, parsed.model_dump(mode="json"))
+    return JSONResponse(
+        {"job_id": job_id, "status": "queued"},
+        status_code=202,
+        headers={"Location": f"/jobs/{job_id}"},
+    )
+
+
+async def get_job(request: Request) -> JSONResponse:
+    """작업 상태/결과 조회 (없으면 404)"""
+    job_queue = _job_queue(request)
+    record = await asyncio.to_thread(job_queue.get, request.path_params["job_id"])
+    if record is None:
+        return JSONResponse({"detail": "작업을 찾을 수 없습니다"}, status_code=404)
+    return JSONResponse(record.to_dict())
+
+
+def create_app(
+    pools: Optional[WorkerPools] = None,
+    job_queue: Optional[BaseJobQueue] = None,
+) -> Starlette:
+    """
+    ASGI 앱 생성.
+
+    Args:
+        pools: 워커 풀 (None이면 config/app.yaml service 설정으로 생성, 테스트에서 주입)
+        job_queue: 작업 큐 (None이면 config/app.yaml jobs 설정으로 생성, 테스트에서 주입)
+    """
+    service_config = get_app_config().get("service", {})
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        app.state.pools = pools or WorkerPools(service_config)
+        app.state.job_queue = job_queue
+        if pools is None and service_config.get("warmup", True):
+            # 첫 요청 지연을 없애기 위해 기동 직후 백그라운드 워밍업
+            # (완료를 기다리지 않음, /ready로 확인)
+            start_warmup(_warmup_tasks(app.state.pools))
+        logger.info("추론 서비스 시작")
+        try:
+            yield
+        finally:
+            app.state.pools.shutdown()
+            logger.info("추론 서비스 종료")
+
+    routes = [
+        Route("/health", health, methods=["GET"]),
+        Route("/ready", ready, methods=["GET"]),
+        Route("/classify", classify, methods=["POST"]),
+        Route("/analyze", analyze, methods=["POST"]),
+        Route("/analyze/stream", analyze_stream, methods=["POST"]),
+        Route("/jobs", submit_job, methods=["POST"]),
+        Route("/jobs/{job_id}", get_job, methods=["GET"]),
+    ]
+    return Starlette(routes=routes, lifespan=lifespan)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="StethoAgent HTTP 추론 서비스")
+    parser.add_argument("--host", type=str, default=None, help="바인딩 호스트 (기본: config)")
+    parser.add_argument("--port", type=int, default=None, help="포트 (기본: config)")
+    parser.add_argument(
+        "--test", action="store_true", help="서버 없이 /health, /analyze 요청 1회 실행"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+    config = get_app_config().get("service", {})
+
+    if args.test:
+        from starlette.testclient import TestClient
+
+        print("=" * 60)
+        print("StethoAgent 추론 서비스 테스트")
+        print("=" * 60)
+        with TestClient(create_app()) as client:
+            print(f"✓ /health: {client.get('/health').json()}")
+            response = client.post("/analyze", json={})
+            print(f"✓ /analyze: HTTP {response.status_code}")
+            body = response.json()
+            print(f"  위험도: {(body.get('risk_assessment') or {}).get('level')}")
+            print(f"  권고: {(body.get('recommendation') or '')[:200]}")
+    else:
+        import uvicorn
+
+        uvicorn.run(
+            create_app(),
+            host=args.host or config.get("host", "0.0.0.0"),
+            port=args.port or config.get("port", 8000),
+        )
@@ -0,0 +1,134 @@
+"""추론 워커 풀 — AST(CPU) / 그래프 분석(I/O) 분리 + 대기열 상한 기반 backpressure"""
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Mapping, Optional
+
+from schemas.auscultation import AuscultationResult
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+
+class PoolFull(RuntimeError):
+    """워커 풀 대기열 초과 (HTTP 429로 변환)"""
+
+
+class BoundedPool:
+    """
+    실행 중 + 대기 작업 수에 상한을 둔 executor 래퍼.
+
+    상한(workers + queue_size)을 넘는 제출은 큐에 쌓지 않고 즉시 PoolFull을 던져
+    호출자가 429로 응답하게 한다 (무한 대기열로 지연이 누적되는 것을 방지).
+    """
+
+    def __init__(self, name: str, executor: Executor, workers: int, queue_size: int) -> None:
+        self.name = name
+        self.capacity = workers + queue_size
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """실행 중 + 대기 작업 수"""
+        return self._pending
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        작업 제출.
+
+        Raises:
+            PoolFull: 상한 초과 시
+        """
+        if not self._slots.acquire(blocking=False):
+            raise PoolFull(f"{self.name} 작업 대기열이 가득 찼습니다 (상한 {self.capacity}건)")
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, _: Optional[Future]) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._slots.release()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# === AST 워커 (프로세스/스레드 공통: 워커마다 모델 1회 로딩 후 상주) ===
+
+
+def _get_classifier():
+    """워커 내 AST 분류기 (프로세스 공유 인스턴스, 최초 호출 시 로딩)"""
+    from models.ast_classifier import get_classifier
+
+    return get_classifier()
+
+
+def warm_classifier() -> bool:
+    """
+    워커 초기화 (모델 로딩 + 더미 추론). 실패해도 서비스는 뜨고 /classify 호출 시 오류 반환.
+    """
+    try:
+        _get_classifier().warmup(get_app_config().get("warmup", {}).get("ast_dummy_seconds", 1.0))
+        return True
+    except Exception as e:
+        logger.warning("AST 모델 사전 로딩 실패: %s", e)
+        return False
+
+
+def classify_file(file_path: str) -> AuscultationResult:
+    """워커에서 실행되는 분류 작업 (프로세스 풀 전달을 위해 모듈 최상위 함수)"""
+    return _get_classifier().classify(file_path)
+
+
+class WorkerPools:
+    """서비스 수명 동안 유지되는 AST / 분석 풀 묶음"""
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
+        ast_config = config.get("ast", {})
+        analysis_config = config.get("analysis", {})
+
+        ast_workers = ast_config.get("workers", 1)
+        if ast_config.get("executor", "process") == "process":
+            ast_executor: Executor = ProcessPoolExecutor(max_workers=ast_workers, initializer=warm_classifier)
+        else:
+            ast_executor = ThreadPoolExecutor(max_workers=ast_workers, thread_name_prefix="ast")
+        self.ast = BoundedPool("AST 추론", ast_executor, ast_workers, ast_config.get("queue_size", 4))
+
+        analysis_workers = analysis_config.get("workers", 4)
+        self.analysis = BoundedPool(
+            "그래프 분석",
+            ThreadPoolExecutor(max_workers=analysis_workers, thread_name_prefix="analysis"),
+            analysis_workers,
+            analysis_config.get("queue_size", 8),
+        )
+        logger.info(
+            "워커 풀 생성: AST=%s×%d (상한 %d), 분석=%d (상한 %d)",
+            ast_config.get("executor", "process"), ast_workers, self.ast.capacity,
+            analysis_workers, self.analysis.capacity,
+        )
+
+    def warmup(self) -> Future:
+        """AST 워커 모델 사전 로딩 요청 (스레드 풀은 공유 모델 1회 로딩)"""
+        return self.ast.submit(warm_classifier)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            "ast": {"pending": self.ast.pending, "capacity": self.ast.capacity},
+            "analysis": {"pending": self.analysis.pending, "capacity": self.analysis.capacity},
+        }
+
+    def shutdown(self) -> None:
+        self.ast.shutdown()
+        self.analysis.shutdown()
@@ -0,0 +1,15 @@
+"""테스트용 합성 오디오 (벤치마크/메모리 테스트 공용)"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def synthetic_lung_sound(duration: float, sr: int, seed: int = 0) -> np.ndarray:
+    """결정적 합성 청진음: 호흡 주기로 변조한 잡음 + 크래클 임펄스 + 400Hz 천명음"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(duration * sr)) / sr
+    breathing = rng.standard_normal(len(t)) * (0.3 + 0.2 * np.sin(2 * np.pi * 0.25 * t))
+    crackles = np.zeros(len(t))
+    crackles[rng.integers(0, len(t), size=int(duration * 5))] = 1.0
+    wheeze = 0.2 * np.sin(2 * np.pi * 400 * t) * (np.sin(2 * np.pi * 0.25 * t) > 0)
+    return (0.3 * (breathing + crackles + wheeze)).astype(np.float32)
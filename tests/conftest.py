@@ -10,6 +10,104 @@ from schemas.report import RiskAssessment, AnalysisReport
 from schemas.literature import MedicalReference, LiteratureSearchResult
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="성능 벤치마크 실행 (tests/test_benchmarks.py — 결과는 config benchmark.report)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """--benchmark 없이는 벤치마크 테스트 제외 (정확성 테스트 실행 시간에 영향 없음)"""
+    if config.getoption("--benchmark"):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if item.get_closest_marker("benchmark") else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(autouse=True)
+def _reset_literature_state():
+    """테스트 간 문헌 검색 캐시 / 서킷 브레이커 격리"""
+    from models.literature_search import clear_search_cache, reset_circuit_breakers
+
+    clear_search_cache()
+    reset_circuit_breakers()
+    yield
+    clear_search_cache()
+    reset_circuit_breakers()
+
+
+@pytest.fixture(scope="session")
+def random_ast_classifier():
+    """
+    허브 다운로드 없이 AST base 구조(527 레이블)를 무작위 초기화한 CPU 분류기.
+
+    벤치마크/메모리 테스트 공용. 호스트의 자동 튜닝 프로파일(artifacts/ast_profile.json)은
+    적용하지 않아 측정값이 머신별 튜닝 결과에 좌우되지 않는다.
+    """
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    from unittest.mock import patch
+
+    from transformers import ASTConfig, ASTFeatureExtractor, ASTForAudioClassification
+
+    from models.ast_classifier import ASTClassifier
+
+    torch.manual_seed(0)
+    labels = {i: f"AudioSet {i}" for i in range(527)}
+    labels.update({0: "Breathing", 1: "Crackle", 2: "Wheeze", 3: "Whistle"})
+    config = ASTConfig(num_labels=527, id2label=labels, label2id={v: k for k, v in labels.items()})
+    model = ASTForAudioClassification(config)
+    extractor = ASTFeatureExtractor()
+    with patch("models.ast_classifier.ASTFeatureExtractor.from_pretrained",
+               return_value=extractor), \
+            patch("models.ast_classifier.ASTForAudioClassification.from_pretrained",
+                  return_value=model), \
+            patch("models.ast_classifier.get_device", return_value=torch.device("cpu")), \
+            patch("models.ast_classifier.load_profile", return_value=None):
+        return ASTClassifier()
+
+
+@pytest.fixture(scope="session")
+def tiny_model_dir(tmp_path_factory):
+    """허브 모델 대신 쓰는 소형 AST 체크포인트 디렉터리 (번들/자동 튜닝 테스트 공용, 읽기 전용)"""
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("transformers")
+    from transformers import ASTConfig, ASTFeatureExtractor, ASTForAudioClassification
+
+    torch.manual_seed(0)
+    config = ASTConfig(
+        hidden_size=32, num_hidden_layers=1, num_attention_heads=2, intermediate_size=64,
+        num_labels=4, id2label={0: "Breathing", 1: "Crackle", 2: "Wheeze", 3: "Music"},
+        label2id={"Breathing": 0, "Crackle": 1, "Wheeze": 2, "Music": 3},
+    )
+    path = tmp_path_factory.mktemp("tiny_ast")
+    ASTForAudioClassification(config).save_pretrained(path)
+    ASTFeatureExtractor().save_pretrained(path)
+    return path
+
+
+@pytest.fixture
+def stub_backends(monkeypatch):
+    """
+    빠른 Ollama / E-utilities 스텁을 띄우고 환경변수로 연결 → (ollama, eutils).
+
+    테스트가 끝나면 스텁을 종료한다 (테스트 중 stop()으로 먼저 끄면 오프라인 재생 확인용).
+    """
+    from loadtest.stubs import EutilsStub, OllamaStub
+
+    with OllamaStub(
+        tokens_per_second=2000, prompt_tokens_per_second=100_000, output_tokens=10
+    ) as ollama, EutilsStub(latency_ms=5) as eutils:
+        monkeypatch.setenv("STETHO_OLLAMA_BASE_URL", ollama.base_url)
+        monkeypatch.setenv("STETHO_PUBMED_BASE_URL", eutils.base_url)
+        yield ollama, eutils
+
+
 @pytest.fixture
 def default_vitals() -> VitalSigns:
     """디폴트 생체신호 픽스처"""
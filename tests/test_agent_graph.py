@@ -22,6 +22,15 @@ class TestGraphBuild:
         compiled = workflow.compile()
         assert compiled is not None
 
+    def test_literature_node_fans_out_with_analysis_nodes(self):
+        """문헌 검색 노드가 입력 검증 직후 분석 노드와 병렬 실행되도록 연결"""
+        from agents.graph import build_graph
+
+        drawable = build_graph().compile().get_graph()
+        edges = {(e.source, e.target) for e in drawable.edges}
+        assert ("input_validator", "literature_node") in edges
+        assert ("literature_node", "synthesis_node") in edges
+
     def test_graph_module_exports(self):
         """모듈 레벨 graph 객체 존재"""
         from agents.graph import graph
@@ -33,7 +42,7 @@ class TestGraphWorkflow:
     """그래프 워크플로우 통합 테스트 (LLM 모킹)"""
 
     @patch("agents.nodes.recommendation_node.LLMClient")
-    @patch("agents.nodes.synthesis_node.MedicalSearchClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
     @patch("agents.nodes.synthesis_node.LLMClient")
     @patch("agents.nodes.symptoms_node.LLMClient")
     @patch("agents.nodes.vitals_node.LLMClient")
@@ -62,7 +71,6 @@ class TestGraphWorkflow:
             total_count=0, references=[], search_successful=True, error_message=None
         )
         mock_search_cls.return_value = mock_search
-        mock_search_cls.format_references_for_llm.return_value = ""
 
         # 그래프 실행
         workflow = build_graph()
@@ -88,7 +96,7 @@ class TestGraphWorkflow:
         assert result.get("recommendation") is not None
 
     @patch("agents.nodes.recommendation_node.LLMClient")
-    @patch("agents.nodes.synthesis_node.MedicalSearchClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
     @patch("agents.nodes.synthesis_node.LLMClient")
     @patch("agents.nodes.symptoms_node.LLMClient")
     @patch("agents.nodes.vitals_node.LLMClient")
@@ -115,7 +123,6 @@ class TestGraphWorkflow:
             total_count=0, references=[], search_successful=True, error_message=None
         )
         mock_search_cls.return_value = mock_search
-        mock_search_cls.format_references_for_llm.return_value = ""
 
         auscultation = AuscultationResult(
             file_name="test.wav",
@@ -143,7 +150,7 @@ class TestGraphWorkflow:
         assert result["risk_assessment"].score >= 20
 
     @patch("agents.nodes.recommendation_node.LLMClient")
-    @patch("agents.nodes.synthesis_node.MedicalSearchClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
     @patch("agents.nodes.synthesis_node.LLMClient")
     @patch("agents.nodes.symptoms_node.LLMClient")
     @patch("agents.nodes.vitals_node.LLMClient")
@@ -170,7 +177,6 @@ class TestGraphWorkflow:
             total_count=0, references=[], search_successful=True, error_message=None
         )
         mock_search_cls.return_value = mock_search
-        mock_search_cls.format_references_for_llm.return_value = ""
 
         workflow = build_graph()
         compiled = workflow.compile()
@@ -185,7 +191,7 @@ class TestGraphWorkflow:
         assert result.get("recommendation") is not None
 
     @patch("agents.nodes.recommendation_node.LLMClient")
-    @patch("agents.nodes.synthesis_node.MedicalSearchClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
     @patch("agents.nodes.synthesis_node.LLMClient")
     @patch("agents.nodes.symptoms_node.LLMClient")
     @patch("agents.nodes.vitals_node.LLMClient")
@@ -216,7 +222,6 @@ class TestGraphWorkflow:
             total_count=0, references=[], search_successful=True, error_message=None
         )
         mock_search_cls.return_value = mock_search
-        mock_search_cls.format_references_for_llm.return_value = ""
 
         workflow = build_graph()
         compiled = workflow.compile()
@@ -233,3 +238,189 @@ class TestGraphWorkflow:
         assert risk.level in ("high", "critical")
         assert risk.immediate_action_needed is True
         assert "중요" in result["recommendation"] or "병원" in result["recommendation"]
+
+    @patch("agents.nodes.recommendation_node.LLMClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    @patch("agents.nodes.synthesis_node.LLMClient")
+    @patch("agents.nodes.symptoms_node.LLMClient")
+    @patch("agents.nodes.vitals_node.LLMClient")
+    @patch("agents.nodes.auscultation_node.LLMClient")
+    def test_emergency_fast_path_streams_first(
+        self,
+        mock_aus_llm,
+        mock_vitals_llm,
+        mock_symptoms_llm,
+        mock_synthesis_llm,
+        mock_search_cls,
+        mock_rec_llm,
+    ):
+        """위급 생체신호 → 긴급 응답이 종합 판단보다 먼저 스트리밍되고 전체 분석도 완료"""
+        from agents.graph import build_graph
+
+        for mock_cls in [mock_aus_llm, mock_vitals_llm, mock_symptoms_llm, mock_synthesis_llm, mock_rec_llm]:
+            mock_instance = MagicMock()
+            mock_instance.generate.return_value = "테스트 분석 결과입니다."
+            mock_cls.return_value = mock_instance
+
+        mock_search = MagicMock()
+        mock_search.search_from_analysis.return_value = MagicMock(
+            total_count=0, references=[], search_successful=True, error_message=None
+        )
+        mock_search_cls.return_value = mock_search
+
+        compiled = build_graph().compile()
+        input_state: AgentState = {
+            "vitals": VitalSigns(heart_rate=160, blood_pressure_sys=190),
+            "symptoms": SymptomInput(),
+            "user_mode": "general",
+        }
+
+        order: list[str] = []
+        result: AgentState = {}
+        for mode, chunk in compiled.stream(input_state, stream_mode=["updates", "values"]):
+            if mode == "values":
+                result = chunk
+            else:
+                order.extend(chunk)
+
+        assert order.index("emergency_node") < order.index("synthesis_node")
+        assert "심박수 160bpm" in result["emergency_recommendation"]
+        assert result["recommendation"]
+        assert result["risk_assessment"] is not None
+
+    @patch("agents.nodes.recommendation_node.LLMClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    @patch("agents.nodes.synthesis_node.LLMClient")
+    @patch("agents.nodes.symptoms_node.LLMClient")
+    @patch("agents.nodes.vitals_node.LLMClient")
+    @patch("agents.nodes.auscultation_node.LLMClient")
+    def test_normal_input_skips_emergency_node(
+        self,
+        mock_aus_llm,
+        mock_vitals_llm,
+        mock_symptoms_llm,
+        mock_synthesis_llm,
+        mock_search_cls,
+        mock_rec_llm,
+    ):
+        """정상 입력 → 긴급 응답 없음"""
+        from agents.graph import build_graph
+
+        for mock_cls in [mock_aus_llm, mock_vitals_llm, mock_symptoms_llm, mock_synthesis_llm, mock_rec_llm]:
+            mock_instance = MagicMock()
+            mock_instance.generate.return_value = "테스트 분석 결과입니다."
+            mock_cls.return_value = mock_instance
+        mock_search_cls.return_value.search_from_analysis.return_value = MagicMock(
+            total_count=0, references=[], search_successful=True, error_message=None
+        )
+
+        result = build_graph().compile().invoke({"vitals": VitalSigns(), "user_mode": "general"})
+
+        assert result.get("emergency") is False
+        assert result.get("emergency_recommendation") is None
+        assert result["recommendation"]
+
+    @patch("agents.nodes.recommendation_node.LLMClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    @patch("agents.nodes.synthesis_node.LLMClient")
+    @patch("agents.nodes.symptoms_node.LLMClient")
+    @patch("agents.nodes.vitals_node.LLMClient")
+    @patch("agents.nodes.auscultation_node.LLMClient")
+    def test_routine_fast_path_skips_llm(
+        self,
+        mock_aus_llm,
+        mock_vitals_llm,
+        mock_symptoms_llm,
+        mock_synthesis_llm,
+        mock_search_cls,
+        mock_rec_llm,
+    ):
+        """모든 소견 정상 → LLM/문헌 검색 호출 없이 템플릿 결과"""
+        from agents.graph import build_graph
+
+        input_state: AgentState = {
+            "vitals": VitalSigns(),
+            "symptoms": SymptomInput(checklist=["기침"]),
+            "user_mode": "general",
+        }
+        result = build_graph().compile().invoke(input_state)
+
+        for mock_cls in [mock_aus_llm, mock_vitals_llm, mock_symptoms_llm, mock_synthesis_llm,
+                         mock_search_cls, mock_rec_llm]:
+            mock_cls.assert_not_called()
+        assert result["routine"] is True
+        assert result["risk_assessment"].level == "low"
+        assert result["synthesis"]
+        assert result["recommendation"]
+        assert result.get("literature_references") is None
+
+    @patch("agents.nodes.recommendation_node.LLMClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    @patch("agents.nodes.synthesis_node.LLMClient")
+    @patch("agents.nodes.symptoms_node.LLMClient")
+    @patch("agents.nodes.vitals_node.LLMClient")
+    @patch("agents.nodes.auscultation_node.LLMClient")
+    def test_expired_deadline_degrades_every_node(
+        self,
+        mock_aus_llm,
+        mock_vitals_llm,
+        mock_symptoms_llm,
+        mock_synthesis_llm,
+        mock_search_cls,
+        mock_rec_llm,
+    ):
+        """마감이 지난 요청 → 호출 없이 대체 결과로 완료, 대체된 노드 목록 기록"""
+        from agents.graph import build_graph
+
+        input_state: AgentState = {
+            "vitals": VitalSigns(),
+            "symptoms": SymptomInput(),
+            "user_mode": "general",
+            "deadline": 0.0,
+        }
+        result = build_graph().compile().invoke(input_state)
+
+        for mock_cls in [mock_aus_llm, mock_vitals_llm, mock_symptoms_llm, mock_synthesis_llm,
+                         mock_search_cls, mock_rec_llm]:
+            mock_cls.assert_not_called()
+        assert sorted(result["degraded_nodes"]) == [
+            "literature_node", "recommendation_node", "symptoms_node", "synthesis_node", "vitals_node",
+        ]
+        assert result["risk_assessment"] is not None
+        assert result["recommendation"]
+
+    @patch("agents.nodes.recommendation_node.LLMClient")
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    @patch("agents.nodes.synthesis_node.LLMClient")
+    @patch("agents.nodes.symptoms_node.LLMClient")
+    @patch("agents.nodes.vitals_node.LLMClient")
+    @patch("agents.nodes.auscultation_node.LLMClient")
+    def test_traced_workflow_attaches_timing(
+        self,
+        mock_aus_llm,
+        mock_vitals_llm,
+        mock_symptoms_llm,
+        mock_synthesis_llm,
+        mock_search_cls,
+        mock_rec_llm,
+    ):
+        """트레이스 안에서 실행 → 병렬 노드 포함 전체 노드 스팬 + 최종 상태에 시간 요약"""
+        from agents.graph import build_graph
+        from utils.tracing import start_trace
+
+        for mock_cls in [mock_aus_llm, mock_vitals_llm, mock_symptoms_llm, mock_synthesis_llm, mock_rec_llm]:
+            mock_cls.return_value.generate.return_value = "테스트 분석 결과입니다."
+        mock_search_cls.return_value.search_from_analysis.return_value = MagicMock(
+            total_count=0, references=[], search_successful=True, error_message=None
+        )
+
+        with start_trace(export=False) as trace:
+            result = build_graph().compile().invoke({"vitals": VitalSigns(), "user_mode": "general"})
+
+        assert result["trace_id"] == trace.trace_id
+        node_spans = {name for name in result["timing"]["spans"] if name.startswith("node.")}
+        assert node_spans == {
+            "node.input_validator", "node.auscultation_node", "node.vitals_node", "node.symptoms_node",
+            "node.literature_node", "node.synthesis_node", "node.risk_node", "node.recommendation_node",
+        }
+        assert len({s.trace_id for s in trace.spans}) == 1
@@ -99,3 +99,11 @@ class TestASTClassifierIntegration:
 
         for cls in AUSCULTATION_CLASSES:
             assert cls in result.probabilities
+
+    def test_워밍업_더미_추론(self):
+        """워밍업은 무음 파형으로 추론 1회 (공유 인스턴스 재사용)"""
+        from models.ast_classifier import get_classifier
+
+        classifier = get_classifier()
+        classifier.warmup(seconds=0.5)
+        assert get_classifier() is classifier
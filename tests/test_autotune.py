@@ -0,0 +1,132 @@
+"""AST 추론 자동 튜닝 테스트 (소형 AST 구성 — 네트워크 없음)"""
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from models.autotune import (  # noqa: E402
+    TuneResult,
+    apply_threads,
+    autotune,
+    default_thread_counts,
+    load_profile,
+    pareto_front,
+    select_result,
+    write_profile,
+)
+
+
+def _result(threads: int, batch_size: int, throughput: float, p95_ms: float) -> TuneResult:
+    return TuneResult("cpu", threads, batch_size, "float32", throughput, p95_ms * 0.8, p95_ms)
+
+
+@pytest.fixture(autouse=True)
+def _restore_threads():
+    threads = torch.get_num_threads()
+    yield
+    torch.set_num_threads(threads)
+
+
+def _classifier(model_dir, profile_path=None):
+    from models.ast_classifier import ASTClassifier
+    from utils.config_loader import get_ast_config
+
+    config = {
+        **get_ast_config(),
+        "model": {"name": str(model_dir), "cache_dir": None},
+        "autotune": {"profile": str(profile_path) if profile_path else None},
+    }
+    with patch("models.ast_classifier.get_ast_config", return_value=config), \
+            patch("models.ast_classifier.get_device", return_value=torch.device("cpu")):
+        return ASTClassifier()
+
+
+class TestPareto:
+    """파레토 전선 / 선택 테스트"""
+
+    def test_지배되는_설정_제외(self):
+        fast = _result(1, 1, throughput=5.0, p95_ms=200)
+        dominated = _result(2, 1, throughput=4.0, p95_ms=250)
+        batched = _result(1, 4, throughput=9.0, p95_ms=450)
+        assert pareto_front([batched, dominated, fast]) == [fast, batched]
+
+    def test_지연_예산_내_최대_처리량(self):
+        front = [_result(1, 1, 5.0, 200), _result(1, 2, 7.0, 300), _result(1, 4, 9.0, 450)]
+        assert select_result(front).batch_size == 4
+        assert select_result(front, max_p95_ms=350).batch_size == 2
+        assert select_result(front, max_p95_ms=100).batch_size == 1
+
+    def test_결과_없음(self):
+        with pytest.raises(RuntimeError, match="측정 결과가 없습니다"):
+            select_result([])
+
+    def test_기본_스레드_후보(self):
+        assert default_thread_counts(1) == [1]
+        assert default_thread_counts(6) == [1, 2, 4, 6]
+        assert default_thread_counts(8) == [1, 2, 4, 8]
+
+
+class TestProfile:
+    """프로파일 저장/로딩 테스트"""
+
+    def test_저장_로딩(self, tmp_path):
+        path = tmp_path / "profile.json"
+        write_profile(path, [_result(1, 1, 5.0, 200), _result(1, 4, 9.0, 450)], max_p95_ms=300)
+
+        selected = load_profile(path)
+        assert selected["batch_size"] == 1
+        assert selected["interop_threads"] == 1
+        assert len(json.loads(path.read_text(encoding="utf-8"))["pareto"]) == 2
+
+    def test_없는_프로파일(self, tmp_path):
+        assert load_profile(None) is None
+        assert load_profile(tmp_path / "missing.json") is None
+
+    def test_다른_호스트_프로파일_무시(self, tmp_path):
+        path = tmp_path / "profile.json"
+        profile = write_profile(path, [_result(1, 1, 5.0, 200)])
+        profile["host"]["cpu_count"] = -1
+        path.write_text(json.dumps(profile), encoding="utf-8")
+        assert load_profile(path) is None
+
+    def test_스레드_적용(self):
+        apply_threads({"threads": 1, "interop_threads": None})
+        assert torch.get_num_threads() == 1
+
+
+class TestAutotune:
+    """소형 모델로 실제 측정 → 프로파일 → 분류기 적용"""
+
+    def test_배치_추론은_단건과_일치(self, tiny_model_dir):
+        classifier = _classifier(tiny_model_dir)
+        classifier.batch_size = 2
+        rng = np.random.default_rng(0)
+        waveforms = [rng.standard_normal(16000).astype(np.float32) * 0.05 for _ in range(3)]
+
+        batched = classifier._infer_batch(waveforms, 16000)
+        single = np.stack([classifier._infer(w, 16000) for w in waveforms])
+        assert batched.shape == (3, 4)
+        np.testing.assert_allclose(batched, single, atol=1e-4)
+
+    def test_측정_후_프로파일_적용(self, tiny_model_dir, tmp_path):
+        classifier = _classifier(tiny_model_dir)
+        results = autotune(
+            classifier, threads=[1], batch_sizes=[1, 2], precisions=["float32", "bfloat16"],
+            devices=["cpu"], clip_seconds=0.5, repeats=2,
+        )
+        assert len(results) == 4
+        assert all(r.throughput > 0 and r.p95_ms >= r.p50_ms for r in results)
+        assert (classifier.batch_size, classifier.precision) == (1, "float32")
+
+        path = tmp_path / "profile.json"
+        selected = write_profile(path, results)["selected"]
+        tuned = _classifier(tiny_model_dir, profile_path=path)
+        assert tuned.batch_size == selected["batch_size"]
+        assert tuned.precision == selected["precision"]
+        assert tuned._infer(np.zeros(8000, dtype=np.float32), 16000).shape == (4,)
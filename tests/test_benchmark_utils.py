@@ -0,0 +1,78 @@
+"""벤치마크 측정/리포트/기준선 비교 테스트"""
+from __future__ import annotations
+
+import json
+
+from utils.benchmark import BenchRecorder, BenchResult, build_report, compare, write_report
+
+
+def _report(calibration_ms: float, **min_ms: float) -> dict:
+    results = [BenchResult(name, {}, 5, value, value, value) for name, value in min_ms.items()]
+    return build_report(results, calibration_ms)
+
+
+class TestRecorder:
+    """반복 측정 테스트"""
+
+    def test_측정_기록(self):
+        calls = []
+        recorder = BenchRecorder(repeats=3, warmup=2)
+        result = recorder.measure("noop", lambda: calls.append(1), duration=5, sr=16000)
+
+        assert len(calls) == 5
+        assert result.key == "noop[duration=5,sr=16000]"
+        assert result.min_ms <= result.median_ms <= result.p95_ms
+        assert recorder.results == [result]
+
+
+class TestCompare:
+    """기준선 비교 테스트"""
+
+    def test_허용치_초과는_회귀(self):
+        comparisons = compare(_report(10, a=20, b=14), _report(10, a=10, b=10), tolerance=0.5)
+        assert {c.key: c.regressed for c in comparisons} == {"a": True, "b": False}
+
+    def test_머신_속도_보정(self):
+        """보정 작업이 2배 느린 머신이면 기준선도 2배로 스케일"""
+        comparisons = compare(_report(20, a=20), _report(10, a=10), tolerance=0.1)
+        assert comparisons[0].ratio == 1.0
+        assert not comparisons[0].regressed
+
+    def test_짧은_측정_잡음_무시(self):
+        comparisons = compare(
+            _report(10, a=0.05), _report(10, a=0.01), tolerance=0.5, min_delta_ms=1.0
+        )
+        assert not comparisons[0].regressed
+
+    def test_한쪽에만_있는_항목_제외(self):
+        assert [c.key for c in compare(_report(10, a=1, new=1), _report(10, a=1, old=1))] == ["a"]
+
+
+class TestWriteReport:
+    """리포트 저장 테스트"""
+
+    def test_기준선_있으면_비교_포함(self, tmp_path):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_report(10, a=10)), encoding="utf-8")
+        config = {
+            "report": str(tmp_path / "report.json"), "baseline": str(baseline), "tolerance": 0.5,
+        }
+
+        report, comparisons = write_report(
+            [BenchResult("a", {}, 5, 30, 30, 30)], config, calibration_ms=10
+        )
+
+        assert comparisons[0].regressed
+        saved = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+        assert saved["baseline"]["comparisons"][0]["key"] == "a"
+        assert saved["results"] == report["results"]
+
+    def test_기준선_없음(self, tmp_path):
+        config = {
+            "report": str(tmp_path / "report.json"), "baseline": str(tmp_path / "missing.json"),
+        }
+        report, comparisons = write_report(
+            [BenchResult("a", {}, 5, 1, 1, 1)], config, calibration_ms=10
+        )
+        assert comparisons == []
+        assert "baseline" not in report
@@ -0,0 +1,133 @@
+"""
+오디오 전처리 / 분류 핫패스 벤치마크 (--benchmark 옵션을 줄 때만 실행).
+
+    python -m pytest tests/test_benchmarks.py --benchmark
+
+결과는 config/app.yaml benchmark.report(JSON)에 저장되고, 커밋된 기준선과 비교해
+허용치를 넘게 느려진 항목이 있으면 마지막 테스트가 실패한다.
+모델 forward는 무작위 초기화한 AST base 구조로 측정한다
+(가중치 값과 무관하게 연산량 동일, 네트워크 불필요).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from models.audio_preprocessor import AudioPreprocessor  # noqa: E402
+from tests._audio import synthetic_lung_sound  # noqa: E402
+from utils.benchmark import BenchRecorder, format_comparisons, write_report  # noqa: E402
+from utils.config_loader import get_app_config  # noqa: E402
+
+pytestmark = pytest.mark.benchmark
+
+DURATIONS = [5, 15, 30]
+SAMPLE_RATES = [4000, 16000, 44100]
+BATCH_SIZES = [1, 2, 4]
+
+
+@pytest.fixture(scope="module")
+def recorder() -> BenchRecorder:
+    return BenchRecorder(repeats=get_app_config().get("benchmark", {}).get("repeats", 5))
+
+
+@pytest.fixture(scope="module")
+def wav_files(tmp_path_factory) -> dict[tuple[int, int], Path]:
+    """(길이, 샘플링 레이트) → 합성 WAV 파일"""
+    root = tmp_path_factory.mktemp("bench_wav")
+    files = {}
+    for duration in DURATIONS:
+        for sr in SAMPLE_RATES:
+            path = root / f"lung_{duration}s_{sr}hz.wav"
+            sf.write(path, synthetic_lung_sound(duration, sr), sr)
+            files[(duration, sr)] = path
+    return files
+
+
+@pytest.fixture(scope="module")
+def preprocessor() -> AudioPreprocessor:
+    return AudioPreprocessor()
+
+
+@pytest.fixture(scope="module")
+def classifier(random_ast_classifier):
+    """허브 다운로드 없이 AST base 구조(527 레이블)를 무작위 초기화한 분류기"""
+    return random_ast_classifier
+
+
+class TestAudioBenchmarks:
+    """AudioPreprocessor 핫패스"""
+
+    @pytest.mark.parametrize("sr", SAMPLE_RATES)
+    @pytest.mark.parametrize("duration", DURATIONS)
+    def test_load_audio(self, recorder, preprocessor, wav_files, duration, sr):
+        recorder.measure("load_audio", lambda: preprocessor.load_audio(wav_files[(duration, sr)]),
+                         duration=duration, sr=sr)
+
+    @pytest.mark.parametrize("save", [False, True])
+    @pytest.mark.parametrize("duration", DURATIONS)
+    def test_mel_spectrogram(self, recorder, preprocessor, tmp_path, duration, save):
+        waveform = synthetic_lung_sound(duration, preprocessor.sample_rate)
+        save_path = tmp_path / "mel.png" if save else None
+        repeats = 3 if save else None
+        recorder.measure(
+            "create_mel_spectrogram",
+            lambda: preprocessor.create_mel_spectrogram(
+                waveform, preprocessor.sample_rate, save_path
+            ),
+            repeats=repeats, duration=duration, save=save,
+        )
+
+
+class TestClassifierBenchmarks:
+    """ASTClassifier 핫패스"""
+
+    @pytest.mark.parametrize("duration", DURATIONS)
+    def test_feature_extraction(self, recorder, classifier, duration):
+        sr = classifier.preprocessor.sample_rate
+        waveform = synthetic_lung_sound(duration, sr)
+        recorder.measure(
+            "feature_extraction",
+            lambda: classifier.feature_extractor(waveform, sampling_rate=sr, return_tensors="pt"),
+            duration=duration,
+        )
+
+    @pytest.mark.parametrize("batch_size", BATCH_SIZES)
+    def test_model_forward(self, recorder, classifier, batch_size):
+        sr = classifier.preprocessor.sample_rate
+        clips = [synthetic_lung_sound(10, sr, seed=i) for i in range(batch_size)]
+        inputs = classifier.feature_extractor(clips, sampling_rate=sr, return_tensors="pt")
+
+        def forward():
+            with torch.no_grad():
+                classifier.model(**inputs)
+
+        recorder.measure("model_forward", forward, repeats=3, batch_size=batch_size)
+
+    def test_map_to_4class(self, recorder, classifier):
+        logits = np.random.default_rng(0).standard_normal(527).astype(np.float32)
+        recorder.measure("map_to_4class", lambda: classifier._map_to_4class(logits), repeats=200)
+
+
+def test_기준선_대비_회귀_없음(recorder):
+    """
+    리포트 저장 + 기준선 비교 (모듈 마지막 테스트).
+
+    모듈 범위 recorder에 앞선 측정 테스트들이 쌓은 결과만 비교하므로 실행 순서에 의존한다.
+    -k 필터로 일부 측정만 선택하면 그 항목만 비교하고(리포트도 그 항목만 저장),
+    이 테스트만 선택하거나 순서가 바뀌어 측정 결과가 없으면 비교 없이 skip한다.
+    전체 비교가 필요하면 필터 없이 모듈 전체를 실행할 것.
+    """
+    if not recorder.results:
+        pytest.skip("측정 결과 없음 (측정 테스트 없이 실행됨 — 모듈 전체를 실행해야 기준선과 비교)")
+    report, comparisons = write_report(recorder.results)
+    if not comparisons:
+        pytest.skip("비교할 기준선 없음 (python -m utils.benchmark promote 로 생성)")
+    print("\n" + format_comparisons(comparisons))
+    regressed = [c.key for c in comparisons if c.regressed]
+    assert not regressed, f"기준선 대비 성능 회귀: {', '.join(regressed)}"
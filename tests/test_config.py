@@ -45,6 +45,13 @@ class TestLoadConfig:
         assert "disclaimer" in config
         assert "symptoms" in config
 
+    def test_risk_설정_로딩(self):
+        """risk.yaml 로딩 확인"""
+        config = load_config("risk")
+        groups = config["synthesis_keywords"]
+        assert groups["high"]["terms"]["응급"] > 0
+        assert "max_points" in groups["moderate"]
+
     def test_존재하지_않는_설정_파일(self):
         """존재하지 않는 설정 파일 로딩 시 FileNotFoundError"""
         with pytest.raises(FileNotFoundError):
@@ -100,3 +107,66 @@ class TestConfigValues:
         """앱 설정에 면책 조항이 포함되어 있는지 확인"""
         config = get_app_config()
         assert "의료 진단이 아닙니다" in config["disclaimer"]
+
+
+class TestConfigCache:
+    """설정 캐시 / mtime 갱신 테스트"""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path, monkeypatch):
+        """임시 config 디렉토리 (테스트 후 캐시 비움)"""
+        import utils.config_loader as config_loader
+
+        monkeypatch.setattr(config_loader, "CONFIG_DIR", tmp_path)
+        config_loader.reload_config()
+        yield tmp_path
+        config_loader.reload_config()
+
+    def test_반복_호출시_재파싱_없음(self, config_dir):
+        """파일이 그대로면 YAML 파싱은 1회"""
+        from unittest.mock import patch
+
+        import utils.config_loader as config_loader
+
+        (config_dir / "sample.yaml").write_text("a: 1\n", encoding="utf-8")
+        with patch.object(config_loader.yaml, "safe_load", wraps=config_loader.yaml.safe_load) as spy:
+            first = load_config("sample")
+            second = load_config("sample")
+        assert spy.call_count == 1
+        assert first is second
+
+    def test_mtime_변경시_갱신(self, config_dir):
+        """파일 수정(mtime 변경) 후 새 값 반영"""
+        import os
+
+        path = config_dir / "sample.yaml"
+        path.write_text("a: 1\n", encoding="utf-8")
+        assert load_config("sample")["a"] == 1
+
+        path.write_text("a: 2\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config("sample")["a"] == 2
+
+    def test_읽기_전용(self, config_dir):
+        """반환된 설정은 수정 불가 (리스트는 튜플)"""
+        (config_dir / "sample.yaml").write_text("a:\n  b: [1, 2]\n", encoding="utf-8")
+        config = load_config("sample")
+        with pytest.raises(TypeError):
+            config["a"]["b"] = 3
+        assert config["a"]["b"] == (1, 2)
+
+    def test_필수_섹션_누락(self, config_dir):
+        """필수 섹션이 없으면 RuntimeError"""
+        (config_dir / "llm.yaml").write_text("other: 1\n", encoding="utf-8")
+        with pytest.raises(RuntimeError, match="ollama"):
+            load_config("llm")
+
+    def test_reload_config_강제_갱신(self, config_dir):
+        """reload_config(name)은 mtime과 무관하게 다시 파싱"""
+        from utils.config_loader import get_config_snapshot, reload_config
+
+        (config_dir / "sample.yaml").write_text("a: 1\n", encoding="utf-8")
+        before = get_config_snapshot("sample")
+        reload_config("sample")
+        assert get_config_snapshot("sample") is not before
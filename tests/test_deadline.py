@@ -0,0 +1,72 @@
+"""지연 예산 유틸리티 테스트"""
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from utils.deadline import BudgetExceeded, node_timeout, remaining, run_with_timeout, start_deadline
+
+
+def _budget(**overrides):
+    config = {
+        "latency_budget": {
+            "enabled": True,
+            "total_seconds": 90,
+            "min_call_seconds": 2,
+            "nodes": {"vitals_node": 30, "literature_node": 10},
+        }
+    }
+    config["latency_budget"].update(overrides)
+    return patch("utils.deadline.get_app_config", return_value=config)
+
+
+class TestDeadline:
+    """마감 시각 / 노드 타임아웃 테스트"""
+
+    def test_config_기본_예산(self):
+        with _budget():
+            deadline = start_deadline()
+        assert 89 < remaining(deadline) <= 90
+
+    def test_예산_비활성(self):
+        with _budget(enabled=False):
+            assert start_deadline() is None
+        assert remaining(None) is None
+        assert node_timeout(None, "vitals_node") is None
+
+    def test_노드_하위_예산(self):
+        deadline = time.monotonic() + 60
+        with _budget():
+            assert node_timeout(deadline, "literature_node") == 10
+            assert 29 < node_timeout(deadline, "vitals_node") <= 30
+            # 하위 예산이 없는 노드는 남은 시간 전체
+            assert 59 < node_timeout(deadline, "unknown_node") <= 60
+
+    def test_남은_시간이_하위_예산보다_짧으면_남은_시간(self):
+        deadline = time.monotonic() + 5
+        with _budget():
+            assert 4 < node_timeout(deadline, "vitals_node") <= 5
+
+    def test_최소_호출_시간_미만이면_생략(self):
+        with _budget():
+            assert node_timeout(time.monotonic() + 1, "vitals_node") == 0.0
+            assert node_timeout(time.monotonic() - 1, "vitals_node") == 0.0
+
+
+class TestRunWithTimeout:
+    """벽시계 상한 실행 테스트"""
+
+    def test_예산_내_완료(self):
+        assert run_with_timeout(lambda: 42, 1.0) == 42
+        assert run_with_timeout(lambda: 7, None) == 7
+
+    def test_예산_초과(self):
+        start = time.monotonic()
+        with pytest.raises(BudgetExceeded):
+            run_with_timeout(lambda: time.sleep(1.0), 0.05)
+        assert time.monotonic() - start < 0.5
+
+    def test_RuntimeError_하위_클래스(self):
+        assert issubclass(BudgetExceeded, RuntimeError)
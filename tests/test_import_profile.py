@@ -0,0 +1,64 @@
+"""import 시간 프로파일 + 기동 시간 예산 회귀 테스트"""
+from __future__ import annotations
+
+import pytest
+
+from utils.import_profile import (
+    ImportProfile,
+    check_startup_budget,
+    parse_importtime,
+    profile_imports,
+)
+
+_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        300 |     torch.nn
+import time:      1000 |       1300 |   torch
+import time:       500 |       1920 | app.main
+"""
+
+
+class TestParseImporttime:
+    """-X importtime 출력 파싱 테스트"""
+
+    def test_파싱(self):
+        entries = parse_importtime(_SAMPLE)
+        assert [e.module for e in entries] == ["_io", "torch.nn", "torch", "app.main"]
+        assert [e.depth for e in entries] == [1, 2, 1, 0]
+        assert entries[2].self_us == 1000
+        assert entries[2].cumulative_us == 1300
+
+    def test_프로파일_요약(self):
+        profile = ImportProfile("app.main", tuple(parse_importtime(_SAMPLE)))
+        assert profile.total_seconds == pytest.approx(0.00192)
+        assert [e.module for e in profile.top(1)] == ["torch"]
+        assert profile.loaded(["torch", "httpx"]) == ["torch"]
+
+    def test_예산_위반(self):
+        profile = ImportProfile("app.main", tuple(parse_importtime(_SAMPLE)))
+        violations = check_startup_budget(profile, {"forbidden": ["torch"], "max_import_seconds": 0.001})
+        assert len(violations) == 2
+        assert "torch" in violations[0]
+        assert check_startup_budget(profile, {"forbidden": ["httpx"], "max_import_seconds": 1.0}) == []
+
+
+class TestStartupBudget:
+    """앱 기동 시 무거운 모듈 지연 로딩 회귀 검사 (새 인터프리터)"""
+
+    def test_앱_import_예산(self):
+        profile = profile_imports("app.main")
+        assert check_startup_budget(profile) == []
+
+    def test_그래프_지연_컴파일(self):
+        """get_graph()는 1회만 컴파일, 기존 `graph` 속성은 같은 객체"""
+        import agents.graph as module
+
+        compiled = module.get_graph()
+        assert module.get_graph() is compiled
+        assert module.graph is compiled
+        assert module.get_graph.cache_info().misses == 1
+
+    def test_import_실패(self):
+        with pytest.raises(RuntimeError, match="import 실패"):
+            profile_imports("no_such_module_xyz")
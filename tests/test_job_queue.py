@@ -0,0 +1,241 @@
+"""비동기 분석 작업 큐 테스트 (SQLite 백엔드, 워커, /jobs 엔드포인트)"""
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from starlette.testclient import TestClient
+
+from service.job_queue import SQLiteJobQueue, create_job_queue
+from service.job_worker import JobWorker
+from service.server import create_app
+from service.workers import WorkerPools
+
+_ROUTINE_REQUEST = {"symptoms": {"checklist": ["기침"], "severity": "경미"}}
+
+
+@pytest.fixture(autouse=True)
+def _no_trace_export():
+    """작업마다 트레이스 파일이 기록되지 않도록 차단"""
+    with patch("utils.tracing.export_trace"):
+        yield
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return SQLiteJobQueue(tmp_path / "jobs.db", default_max_attempts=2)
+
+
+def _worker(queue, handler, **config) -> JobWorker:
+    defaults = {"concurrency": 1, "visibility_timeout": 30, "heartbeat_seconds": 10,
+                "poll_interval_seconds": 0.01, "retry_delay_seconds": 0}
+    return JobWorker(queue, {**defaults, **config}, handler=handler)
+
+
+class TestSQLiteJobQueue:
+    """제출/점유/완료/재시도 테스트"""
+
+    def test_제출_점유_완료(self, queue):
+        job_id = queue.submit({"x": 1})
+        assert queue.get(job_id).status == "queued"
+
+        job = queue.claim("w1", visibility_timeout=30)
+        assert job.id == job_id
+        assert job.payload == {"x": 1}
+        assert job.status == "running"
+        assert job.attempts == 1
+
+        assert queue.complete(job_id, "w1", {"ok": True})
+        record = queue.get(job_id)
+        assert record.status == "succeeded"
+        assert record.result == {"ok": True}
+        assert record.done
+
+    def test_중복_점유_없음(self, queue):
+        queue.submit({})
+        assert queue.claim("w1", 30) is not None
+        assert queue.claim("w2", 30) is None
+
+    def test_동시_점유_시_작업당_한_워커(self, queue):
+        job_ids = {queue.submit({"i": i}) for i in range(20)}
+        claimed: list[str] = []
+        lock = threading.Lock()
+
+        def claim_all(worker_id: str) -> None:
+            while (job := queue.claim(worker_id, 30)) is not None:
+                with lock:
+                    claimed.append(job.id)
+
+        threads = [threading.Thread(target=claim_all, args=(f"w{i}",)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(claimed) == sorted(job_ids)
+
+    def test_실패_후_재시도_후_최종_실패(self, queue):
+        job_id = queue.submit({})
+
+        job = queue.claim("w1", 30)
+        assert queue.fail(job.id, "w1", "오류1", retry_delay=0)
+        assert queue.get(job_id).status == "queued"
+
+        job = queue.claim("w1", 30)
+        assert job.attempts == 2
+        assert queue.fail(job.id, "w1", "오류2", retry_delay=0)
+
+        record = queue.get(job_id)
+        assert record.status == "failed"
+        assert record.error == "오류2"
+        assert queue.claim("w1", 30) is None
+
+    def test_재시도_지연(self, queue):
+        queue.submit({})
+        job = queue.claim("w1", 30)
+        queue.fail(job.id, "w1", "오류", retry_delay=60)
+        assert queue.claim("w1", 30) is None
+
+    def test_가시성_타임아웃_후_재점유(self, queue):
+        job_id = queue.submit({})
+        queue.claim("w1", visibility_timeout=0)
+
+        job = queue.claim("w2", visibility_timeout=30)
+        assert job.id == job_id
+        assert job.attempts == 2
+        # 점유를 잃은 워커의 반영은 무시
+        assert not queue.complete(job_id, "w1", {"stale": True})
+        assert not queue.extend(job_id, "w1", 30)
+        assert queue.complete(job_id, "w2", {"ok": True})
+        assert queue.get(job_id).result == {"ok": True}
+
+    def test_가시성_타임아웃_시도_소진시_실패(self, queue):
+        job_id = queue.submit({}, max_attempts=1)
+        queue.claim("w1", visibility_timeout=0)
+
+        assert queue.claim("w2", 30) is None
+        record = queue.get(job_id)
+        assert record.status == "failed"
+        assert "타임아웃" in record.error
+
+    def test_stats(self, queue):
+        queue.submit({})
+        done = queue.submit({})
+        queue.submit({})
+        # 가장 오래된 작업부터 점유되므로 첫 작업 완료
+        first = queue.claim("w1", 30)
+        queue.complete(first.id, "w1", {})
+        assert queue.get(done).status == "queued"
+        assert queue.stats() == {"queued": 2, "running": 0, "succeeded": 1, "failed": 0}
+
+    def test_알_수_없는_백엔드(self):
+        with pytest.raises(RuntimeError, match="알 수 없는 작업 큐 백엔드"):
+            create_job_queue({"backend": "redis"})
+
+    def test_설정으로_생성(self, tmp_path):
+        queue = create_job_queue({"backend": "sqlite", "sqlite_path": str(tmp_path / "q.db"), "max_attempts": 5})
+        assert isinstance(queue, SQLiteJobQueue)
+        assert queue.claim("w1", 30) is None
+        job_id = queue.submit({})
+        assert queue.get(job_id).max_attempts == 5
+
+
+class TestJobWorker:
+    """워커 처리 테스트"""
+
+    def test_성공(self, queue):
+        job_id = queue.submit({"x": 2})
+        worker = _worker(queue, lambda payload: {"double": payload["x"] * 2})
+
+        record = worker.run_once()
+        assert record.id == job_id
+        assert record.status == "succeeded"
+        assert record.result == {"double": 4}
+        assert worker.run_once() is None
+
+    def test_예외시_재시도_후_실패(self, queue):
+        job_id = queue.submit({})
+
+        def boom(payload):
+            raise ValueError("처리 불가")
+
+        worker = _worker(queue, boom)
+        assert worker.run_once().status == "queued"
+        record = worker.run_once()
+        assert record.status == "failed"
+        assert "ValueError: 처리 불가" in record.error
+        assert queue.get(job_id).attempts == 2
+
+    def test_하트비트로_점유_연장(self, queue):
+        job_id = queue.submit({})
+
+        def slow(payload):
+            time.sleep(0.3)
+            # 하트비트가 없었다면 0.2초 타임아웃이 지나 다른 워커가 재점유했을 것
+            assert queue.claim("other", 30) is None
+            return {}
+
+        worker = _worker(queue, slow, visibility_timeout=0.2, heartbeat_seconds=0.05)
+        assert worker.run_once().status == "succeeded"
+        assert queue.get(job_id).attempts == 1
+
+    def test_스레드_시작_종료(self, queue):
+        job_ids = [queue.submit({"i": i}) for i in range(5)]
+        worker = _worker(queue, lambda payload: payload, concurrency=2)
+        worker.start()
+        try:
+            deadline = time.monotonic() + 10
+            while queue.stats()["succeeded"] < 5 and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            worker.stop(timeout=5)
+        assert [queue.get(j).result for j in job_ids] == [{"i": i} for i in range(5)]
+
+    def test_루틴_입력_그래프_실행(self, queue):
+        """루틴 경로 입력은 LLM 없이 그래프를 끝까지 실행"""
+        job_id = queue.submit(_ROUTINE_REQUEST)
+        worker = JobWorker(queue, {"concurrency": 1})
+
+        record = worker.run_once()
+        assert record.id == job_id
+        assert record.status == "succeeded", record.error
+        assert record.result["recommendation"]
+        assert record.result["risk_assessment"]["level"] == "low"
+
+
+class TestJobEndpoints:
+    """/jobs 엔드포인트 테스트"""
+
+    @pytest.fixture
+    def client(self, queue):
+        pools = WorkerPools({
+            "ast": {"executor": "thread", "workers": 1, "queue_size": 1},
+            "analysis": {"workers": 1, "queue_size": 1},
+        })
+        with TestClient(create_app(pools, job_queue=queue)) as c:
+            yield c
+
+    def test_제출_조회(self, client, queue):
+        response = client.post("/jobs", json=_ROUTINE_REQUEST)
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.headers["location"] == f"/jobs/{job_id}"
+
+        body = client.get(f"/jobs/{job_id}").json()
+        assert body["status"] == "queued"
+        assert body["result"] is None
+
+        JobWorker(queue, {"concurrency": 1}).run_once()
+        body = client.get(f"/jobs/{job_id}").json()
+        assert body["status"] == "succeeded"
+        assert body["result"]["recommendation"]
+
+    def test_입력_검증(self, client, queue):
+        response = client.post("/jobs", json={"user_mode": "unknown"})
+        assert response.status_code == 422
+        assert queue.stats()["queued"] == 0
+
+    def test_없는_작업_404(self, client):
+        assert client.get("/jobs/nope").status_code == 404
@@ -0,0 +1,45 @@
+"""Aho–Corasick 키워드 매칭 테스트"""
+from __future__ import annotations
+
+import pytest
+
+from utils.keyword_automaton import KeywordAutomaton
+
+
+class TestKeywordAutomaton:
+    """KeywordAutomaton 테스트"""
+
+    def test_겹치는_키워드_모두_매칭(self):
+        """접미/중첩 키워드를 한 번에 모두 찾음"""
+        automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+        found = [(m.keyword, m.start) for m in automaton.find_all("ushers")]
+        assert found == [("she", 1), ("he", 2), ("hers", 2)]
+
+    def test_한국어_영어_대소문자_무시(self):
+        """한국어/영어 혼합, 대소문자 무시"""
+        automaton = KeywordAutomaton(["응급", "급성", "Critical"])
+        found = [m.keyword for m in automaton.find_all("CRITICAL 응급성 소견")]
+        assert found == ["critical", "응급", "급성"]
+
+    def test_in_연산과_동일_결과(self):
+        """키워드별 in 검사와 같은 키워드 집합"""
+        keywords = ["주의", "관찰", "검사 필요", "지속", "악화"]
+        text = "증상이 지속되면 검사 필요. 악화 시 재방문"
+        automaton = KeywordAutomaton(keywords)
+        found = {m.keyword for m in automaton.find_all(text)}
+        assert found == {kw for kw in keywords if kw in text}
+
+    def test_스트리밍_경계_걸친_키워드(self):
+        """청크 경계에 걸친 키워드도 매칭, 위치는 전체 기준"""
+        stream = KeywordAutomaton(["폐색전", "emergency"]).stream()
+        assert stream.feed("급성 폐") == []
+        assert [m.keyword for m in stream.feed("색전 의심, emer")] == ["폐색전"]
+        found = stream.feed("gency")
+        assert found[0].keyword == "emergency"
+        assert found[0].start == len("급성 폐색전 의심, ")
+        assert stream.matched_keywords() == ["폐색전", "emergency"]
+
+    def test_빈_키워드_거부(self):
+        """빈 문자열 키워드는 ValueError"""
+        with pytest.raises(ValueError):
+            KeywordAutomaton(["ok", ""])
@@ -270,6 +270,57 @@ class TestBuildSearchQuery:
         assert "tachycardia" in query.lower()
 
 
+class TestCanonicalQuery:
+    """CanonicalQuery 정규화 + 캐시 키 테스트"""
+
+    def test_순서_무관_동일_키(self):
+        """검색어 순서가 달라도 같은 키"""
+        from schemas.literature import CanonicalQuery
+
+        a = CanonicalQuery.from_terms(["cough", "dyspnea", "fever"])
+        b = CanonicalQuery.from_terms(["fever", "cough", "dyspnea"])
+        assert a == b
+        assert a.key == b.key
+        assert a.text == "cough dyspnea fever"
+
+    def test_중복_대소문자_공백_정규화(self):
+        """중복/대소문자/공백 차이 제거"""
+        from schemas.literature import CanonicalQuery
+
+        q = CanonicalQuery.from_terms(["Chest  Pain", "chest pain", " cough ", ""])
+        assert q.terms == ("chest pain", "cough")
+
+    def test_키_안정성(self):
+        """키는 실행 간 동일한 고정 길이 해시"""
+        from schemas.literature import CanonicalQuery
+
+        q = CanonicalQuery.from_terms(["cough"])
+        assert len(q.key) == 16
+        assert q.key == CanonicalQuery.from_text("COUGH").key
+
+    def test_불변(self):
+        """frozen 모델 — 수정 불가"""
+        from schemas.literature import CanonicalQuery
+
+        q = CanonicalQuery.from_terms(["cough"])
+        with pytest.raises(Exception):
+            q.terms = ("fever",)
+
+    def test_체크리스트_순서_무관(self):
+        """체크리스트 선택 순서가 달라도 같은 쿼리 (3개 초과 포함)"""
+        from models.literature_search import MedicalSearchClient
+
+        client = MedicalSearchClient()
+        a = client.build_canonical_query(
+            symptoms=SymptomInput(checklist=["피로감", "기침", "발열", "호흡곤란", "가래"]),
+        )
+        b = client.build_canonical_query(
+            symptoms=SymptomInput(checklist=["가래", "호흡곤란", "기침", "발열", "피로감"]),
+        )
+        assert a.key == b.key
+        assert len(a.terms) == 3
+
+
 # ---------------------------------------------------------------------------
 # 포맷팅 테스트
 # ---------------------------------------------------------------------------
@@ -419,6 +470,113 @@ class TestPubMedProviderMock:
         with pytest.raises(RuntimeError, match="모두 실패"):
             provider.search("test", max_results=5, timeout=5)
 
+    @patch("models.literature_search.httpx.post")
+    @patch("models.literature_search.httpx.get")
+    def test_일괄_검색_ESummary_1회(self, mock_get: MagicMock, mock_post: MagicMock):
+        """쿼리별 ESearch 후 PMID 합집합을 ESummary 1회로 조회하여 분배"""
+        from models.literature_search import PubMedProvider
+
+        def esearch(ids):
+            response = MagicMock()
+            response.json.return_value = {"esearchresult": {"idlist": ids}}
+            return response
+
+        mock_get.side_effect = [
+            esearch(["39876543", "39812345"]), esearch(["39812345"]), esearch([]),
+        ]
+        summary = MagicMock()
+        summary.json.return_value = self.MOCK_ESUMMARY_RESPONSE
+        mock_post.return_value = summary
+
+        provider = PubMedProvider()
+        results = provider.search_batch(
+            ["crackles", "chest", "none", "crackles"], max_results=2, timeout=10
+        )
+
+        assert mock_get.call_count == 3
+        assert mock_post.call_count == 1
+        assert mock_post.call_args.kwargs["data"]["id"] == "39876543,39812345"
+        assert [r.source_id for r in results["crackles"]] == ["39876543", "39812345"]
+        assert [r.source_id for r in results["chest"]] == ["39812345"]
+        assert results["none"] == []
+
+    @patch("models.literature_search.httpx.post")
+    @patch("models.literature_search.httpx.get")
+    def test_일괄_검색_EPost_WebEnv(self, mock_get: MagicMock, mock_post: MagicMock):
+        """PMID 합집합이 한도를 넘으면 EPost + WebEnv 페이지 조회"""
+        from models.literature_search import PubMedProvider
+
+        esearch = MagicMock()
+        esearch.json.return_value = {"esearchresult": {"idlist": ["39876543", "39812345"]}}
+        summary = MagicMock()
+        summary.json.return_value = self.MOCK_ESUMMARY_RESPONSE
+        mock_get.side_effect = [esearch, summary]
+
+        epost = MagicMock()
+        epost.text = "<ePostResult><QueryKey>1</QueryKey><WebEnv>MCID_abc</WebEnv></ePostResult>"
+        mock_post.return_value = epost
+
+        provider = PubMedProvider()
+        provider.esummary_id_limit = 1
+        results = provider.search_batch(["crackles"], max_results=2, timeout=10)
+
+        assert "epost.fcgi" in mock_post.call_args[0][0]
+        summary_params = mock_get.call_args.kwargs["params"]
+        assert summary_params["WebEnv"] == "MCID_abc"
+        assert summary_params["query_key"] == "1"
+        assert len(results["crackles"]) == 2
+
+    @patch("models.literature_search.time.sleep")
+    @patch("models.literature_search.httpx.get")
+    def test_429_retry_after_준수(self, mock_get: MagicMock, mock_sleep: MagicMock):
+        """429 응답 시 Retry-After 만큼 대기 후 재시도"""
+        import httpx
+
+        from models.literature_search import PubMedProvider
+
+        request = httpx.Request("GET", "https://eutils.test/esearch.fcgi")
+        throttled = httpx.Response(429, headers={"Retry-After": "2"}, request=request)
+        ok = MagicMock()
+        ok.json.return_value = {"esearchresult": {"count": "0", "idlist": []}}
+        ok.raise_for_status = MagicMock()
+        mock_get.side_effect = [throttled, ok]
+
+        provider = PubMedProvider()
+        refs = provider.search("retry after", max_results=5, timeout=5)
+
+        assert refs == []
+        assert mock_get.call_count == 2
+        assert any(c.args[0] >= 2.0 for c in mock_sleep.call_args_list)
+
+    @patch("models.literature_search.httpx.get")
+    def test_재시도_불가_상태코드(self, mock_get: MagicMock):
+        """400 응답은 재시도하지 않음"""
+        import httpx
+
+        from models.literature_search import PubMedProvider
+
+        request = httpx.Request("GET", "https://eutils.test/esearch.fcgi")
+        mock_get.return_value = httpx.Response(400, request=request)
+
+        provider = PubMedProvider()
+        with pytest.raises(RuntimeError):
+            provider.search("bad request", max_results=5, timeout=5)
+        assert mock_get.call_count == 1
+
+    def test_api_키_유무별_요청률(self, monkeypatch):
+        """NCBI_API_KEY 유무에 따라 허용 요청률 결정 + 버킷 공유"""
+        from models.literature_search import PubMedProvider
+
+        monkeypatch.delenv("NCBI_API_KEY", raising=False)
+        without_key = PubMedProvider()
+        assert without_key.requests_per_second == 3
+
+        monkeypatch.setenv("NCBI_API_KEY", "test-key")
+        with_key = PubMedProvider()
+        assert with_key.requests_per_second == 10
+
+        assert PubMedProvider()._limiter is with_key._limiter
+
 
 # ---------------------------------------------------------------------------
 # 통합 클라이언트 모킹 테스트
@@ -428,6 +586,14 @@ class TestPubMedProviderMock:
 class TestMedicalSearchClientMock:
     """MedicalSearchClient 통합 테스트 (모킹)"""
 
+    def test_timeout_capped_by_latency_budget(self):
+        """지연 예산 타임아웃은 config 값보다 짧을 때만 적용"""
+        from models.literature_search import MedicalSearchClient
+
+        assert MedicalSearchClient().timeout == 15
+        assert MedicalSearchClient(timeout=4.5).timeout == 4.5
+        assert MedicalSearchClient(timeout=60).timeout == 15
+
     @patch("models.literature_search.httpx.get")
     def test_search_from_analysis(self, mock_get: MagicMock):
         """분석 결과 기반 자동 검색 테스트"""
@@ -471,6 +637,233 @@ class TestMedicalSearchClientMock:
         assert "pubmed" in result.sources_used
 
 
+    def test_정규화_쿼리_캐시_적중(self):
+        """순서만 다른 동일 입력은 캐시에서 반환 (프로바이더 1회 호출)"""
+        from models.literature_search import MedicalSearchClient
+
+        client = MedicalSearchClient()
+        provider = MagicMock()
+        provider.source_name = "pubmed"
+        provider.search.return_value = [MedicalReference(source_id="1", title="Cached")]
+        client._providers = [provider]
+
+        first = client.search_from_analysis(symptoms=SymptomInput(checklist=["기침", "발열"]))
+        second = client.search_from_analysis(symptoms=SymptomInput(checklist=["발열", "기침"]))
+
+        assert provider.search.call_count == 1
+        assert first.query_key == second.query_key
+        assert second.references[0].title == "Cached"
+
+    def test_실패_결과_미캐시(self):
+        """검색 실패 결과는 캐시하지 않음"""
+        from models.literature_search import MedicalSearchClient
+
+        client = MedicalSearchClient()
+        provider = MagicMock()
+        provider.source_name = "pubmed"
+        provider.search.side_effect = RuntimeError("down")
+        client._providers = [provider]
+
+        client.search("cough")
+        client.search("cough")
+        assert provider.search.call_count == 2
+
+    def test_prefetch_중복_제거(self):
+        """prefetch는 고유 키만 일괄 검색하고 이후 검색은 캐시 적중"""
+        from models.literature_search import MedicalSearchClient
+        from schemas.literature import CanonicalQuery
+
+        client = MedicalSearchClient()
+        provider = MagicMock()
+        provider.source_name = "pubmed"
+        provider.search_batch.side_effect = lambda texts, *_: {t: [] for t in texts}
+        client._providers = [provider]
+
+        queries = [
+            CanonicalQuery.from_terms(["cough", "fever"]),
+            CanonicalQuery.from_terms(["fever", "cough"]),
+            CanonicalQuery.from_terms(["wheezing"]),
+        ]
+        assert client.prefetch(queries) == 2
+        assert client.prefetch(queries) == 0
+        client.search(CanonicalQuery.from_terms(["cough", "fever"]))
+
+        provider.search_batch.assert_called_once()
+        assert sorted(provider.search_batch.call_args[0][0]) == ["cough fever", "wheezing"]
+        provider.search.assert_not_called()
+
+    def test_소스_간_중복_제거(self):
+        """여러 소스가 같은 DOI를 반환하면 한 건만 전달"""
+        from models.literature_search import MedicalSearchClient
+
+        client = MedicalSearchClient()
+        pubmed = MagicMock()
+        pubmed.source_name = "pubmed"
+        pubmed.search.return_value = [
+            MedicalReference(
+                source_id="1", title="Wheezing in asthma", doi="10.1/x", relevance_score=1.0
+            ),
+        ]
+        pmc = MagicMock()
+        pmc.source_name = "pmc"
+        pmc.search.return_value = [
+            MedicalReference(
+                source="pmc", source_id="PMC1", title="Wheezing in Asthma", doi="10.1/X",
+                relevance_score=1.0,
+            ),
+            MedicalReference(
+                source="pmc", source_id="PMC2", title="Chest pain", relevance_score=0.5
+            ),
+        ]
+        client._providers = [pubmed, pmc]
+
+        result = client.search("wheezing")
+
+        assert result.total_count == 2
+        assert [r.source_id for r in result.references] == ["1", "PMC2"]
+        assert result.sources_used == ["pubmed", "pmc"]
+
+    def test_search_many_결과_분배(self):
+        """일괄 검색 결과를 입력 순서대로 쿼리별 분배"""
+        from models.literature_search import MedicalSearchClient
+        from schemas.literature import CanonicalQuery
+
+        client = MedicalSearchClient()
+        provider = MagicMock()
+        provider.source_name = "pubmed"
+        provider.search_batch.return_value = {
+            "cough": [MedicalReference(source_id="1", title="Cough", relevance_score=1.0)],
+            "wheezing": [MedicalReference(source_id="2", title="Wheeze", relevance_score=1.0)],
+        }
+        client._providers = [provider]
+
+        results = client.search_many([
+            CanonicalQuery.from_text("wheezing"),
+            CanonicalQuery.from_text("cough"),
+            CanonicalQuery.from_text("wheezing"),
+        ])
+
+        assert [r.references[0].title for r in results] == ["Wheeze", "Cough", "Wheeze"]
+        assert all(r.search_successful for r in results)
+
+
+# ---------------------------------------------------------------------------
+# 서킷 브레이커 테스트
+# ---------------------------------------------------------------------------
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 상태 전이 테스트"""
+
+    def _breaker(self, **kwargs):
+        from models.literature_search import CircuitBreaker
+
+        params = dict(
+            window_size=4, minimum_calls=4, failure_rate_threshold=0.5, cooldown_seconds=60
+        )
+        params.update(kwargs)
+        return CircuitBreaker("test", **params)
+
+    def test_최소_호출_전_closed_유지(self):
+        """최소 호출 수 미만이면 실패해도 closed"""
+        breaker = self._breaker()
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state == "closed"
+        assert breaker.allow_request() is True
+
+    def test_실패율_초과_시_open(self):
+        """실패율 임계값 이상이면 open → 호출 차단"""
+        breaker = self._breaker()
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow_request() is False
+        assert breaker.remaining_cooldown() > 0
+
+    def test_실패율_미만_closed_유지(self):
+        """실패율이 임계값 미만이면 closed"""
+        breaker = self._breaker()
+        for outcome in (True, True, True, False):
+            breaker.record_success() if outcome else breaker.record_failure()
+        assert breaker.state == "closed"
+
+    def test_쿨다운_후_half_open_시험_호출(self):
+        """쿨다운 경과 → half-open, 시험 호출 1회만 허용"""
+        breaker = self._breaker(cooldown_seconds=0)
+        for _ in range(4):
+            breaker.record_failure()
+        assert breaker.state == "half_open"
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+    def test_half_open_성공_시_closed(self):
+        """시험 호출 성공 → closed"""
+        breaker = self._breaker(cooldown_seconds=0)
+        for _ in range(4):
+            breaker.record_failure()
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_half_open_실패_시_재open(self):
+        """시험 호출 실패 → 다시 open"""
+        breaker = self._breaker(cooldown_seconds=0.2)
+        for _ in range(4):
+            breaker.record_failure()
+        import time
+
+        time.sleep(0.25)
+        assert breaker.allow_request() is True
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_클라이언트_open_시_즉시_생략(self):
+        """open 상태 프로바이더는 호출 없이 건너뛰고 error_message에 기록"""
+        from models.literature_search import MedicalSearchClient, get_circuit_breaker
+
+        client = MedicalSearchClient()
+        provider = MagicMock()
+        provider.source_name = "pubmed"
+        provider.search.side_effect = RuntimeError("timeout")
+        client._providers = [provider]
+
+        breaker = get_circuit_breaker("pubmed")
+        for i in range(breaker.minimum_calls):
+            client.search(f"query {i}")
+        assert breaker.state == "open"
+
+        calls_before = provider.search.call_count
+        result = client.search("another query")
+
+        assert provider.search.call_count == calls_before
+        assert result.search_successful is False
+        assert "생략" in result.error_message
+        assert "초 후 재시도" in result.error_message
+
+    def test_시험_호출_진행_중_메시지(self):
+        """half-open 시험 호출 슬롯이 모두 사용 중이면 '0초 후 재시도' 대신 진행 중으로 표시"""
+        from models.literature_search import MedicalSearchClient, get_circuit_breaker
+
+        client = MedicalSearchClient()
+        provider = MagicMock()
+        provider.source_name = "pubmed"
+        provider.search.side_effect = RuntimeError("timeout")
+        client._providers = [provider]
+
+        breaker = get_circuit_breaker("pubmed")
+        for i in range(breaker.minimum_calls):
+            client.search(f"query {i}")
+        breaker.cooldown_seconds = 0
+        assert breaker.allow_request() is True  # 다른 요청이 시험 호출 중
+
+        result = client.search("another query")
+        assert "시험 호출 진행 중" in result.error_message
+        assert "0초" not in result.error_message
+
+
 # ---------------------------------------------------------------------------
 # 프로바이더 레지스트리 테스트
 # ---------------------------------------------------------------------------
@@ -1,6 +1,7 @@
 """LLM 클라이언트 테스트"""
 from __future__ import annotations
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -40,6 +41,45 @@ class TestLLMClientUnit:
         config = get_llm_config()
         assert config["ollama"]["max_retries"] == 3
 
+    def test_HTTP_타임아웃_전달(self):
+        """config timeout이 ChatOllama HTTP 클라이언트에 전달되는지 확인"""
+        from models.llm_client import LLMClient
+
+        client = LLMClient()
+        assert client._llm.client_kwargs == {"timeout": 120}
+
+    def test_시간_예산_소진시_재시도_중단(self):
+        """전체 시간 예산을 넘기면 남은 재시도 없이 BudgetExceeded"""
+        from models.llm_client import LLMClient
+        from utils.deadline import BudgetExceeded
+
+        client = LLMClient()
+        with patch.object(LLMClient, "_build_llm") as mock_build, \
+                patch("models.llm_client.time.monotonic", side_effect=[0.0, 0.0, 10.0, 10.0]):
+            mock_build.return_value.invoke.side_effect = RuntimeError("timed out")
+            with pytest.raises(BudgetExceeded):
+                client.generate("프롬프트", timeout=5)
+
+        # 예산(5초) < config timeout(120초) → 남은 시간으로 HTTP 타임아웃 축소, 1회만 시도
+        mock_build.assert_called_once_with(5.0)
+        assert mock_build.return_value.invoke.call_count == 1
+
+    def test_느린_스트리밍_응답_예산_상한(self, monkeypatch):
+        """토큰이 계속 들어와도(읽기 타임아웃 미발생) 전체 시간 예산에서 BudgetExceeded"""
+        from loadtest.stubs import OllamaStub
+        from models.llm_client import LLMClient
+        from utils.deadline import BudgetExceeded
+
+        # 40토큰 / 초당 10토큰 → 끝까지 받으면 약 4초
+        with OllamaStub(tokens_per_second=10, output_tokens=40) as stub:
+            monkeypatch.setenv("STETHO_OLLAMA_BASE_URL", stub.base_url)
+            client = LLMClient()
+            start = time.perf_counter()
+            with pytest.raises(BudgetExceeded):
+                client.generate("hi", timeout=1.0)
+            elapsed = time.perf_counter() - start
+        assert 0.9 <= elapsed < 1.5
+
 
 @pytest.mark.slow
 class TestLLMClientIntegration:
@@ -0,0 +1,112 @@
+"""부하 테스트 하네스 테스트 (로컬 스텁 서버 — 네트워크/Ollama 불필요)"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from loadtest.runner import RequestSample, run_load, sample_requests, summarize
+from loadtest.stubs import OllamaStub
+
+
+class TestOllamaStub:
+    """Ollama 호환 스텁 테스트"""
+
+    def test_생성(self, stub_backends):
+        ollama, _ = stub_backends
+        from models.llm_client import LLMClient
+
+        client = LLMClient()
+        assert client.base_url == ollama.base_url
+        answer = client.generate("기침이 납니다", system_prompt="의료 도우미")
+        assert answer.startswith("제공된 정보를")
+        assert "".join(client.stream("기침")).strip()
+        assert client.is_available()
+
+    def test_토큰_속도(self, monkeypatch):
+        from models.llm_client import LLMClient
+
+        with OllamaStub(tokens_per_second=100, output_tokens=20) as stub:
+            monkeypatch.setenv("STETHO_OLLAMA_BASE_URL", stub.base_url)
+            start = time.perf_counter()
+            LLMClient().generate("hi")
+            assert time.perf_counter() - start >= 0.2
+
+    def test_장애_주입(self, monkeypatch):
+        from models.llm_client import LLMClient
+
+        with OllamaStub(failure_rate=1.0) as stub:
+            monkeypatch.setenv("STETHO_OLLAMA_BASE_URL", stub.base_url)
+            client = LLMClient()
+            with pytest.raises(RuntimeError, match="모두 실패"):
+                client.generate("hi")
+            assert stub.stats()["failures"] == client.max_retries
+
+
+class TestEutilsStub:
+    """E-utilities 스텁 테스트"""
+
+    def test_검색(self, stub_backends):
+        from models.literature_search import PubMedProvider
+
+        references = PubMedProvider().search("wheezing", max_results=3)
+        assert len(references) == 3
+        assert references[0].title.startswith("Stub article")
+        assert references[0].doi
+
+    def test_일괄_검색_epost_경로(self, stub_backends):
+        from models.literature_search import PubMedProvider
+
+        provider = PubMedProvider()
+        provider.esummary_id_limit = 1
+        results = provider.search_batch(["cough", "fever"], max_results=2)
+        assert {q: len(refs) for q, refs in results.items()} == {"cough": 2, "fever": 2}
+
+
+class TestRunner:
+    """부하 생성 / 요약 테스트"""
+
+    def test_요청_구성_라우팅(self):
+        from agents.nodes.input_validator import input_validator
+
+        requests = dict(sample_requests(60, seed=1))
+        assert set(requests) == {"routine", "analysis", "emergency"}
+        assert input_validator(requests["routine"].to_state())["routine"]
+        assert input_validator(requests["emergency"].to_state())["emergency"]
+        assert not input_validator(requests["analysis"].to_state())["routine"]
+
+    def test_closed_loop_대기_시간(self):
+        def target(request):
+            time.sleep(0.05)
+            return {"node_a": 50.0}
+
+        samples, wall = run_load(sample_requests(4), target, concurrency=1)
+        queue = sorted(s.queue_ms for s in samples)
+        assert queue[-1] >= 140  # 마지막 요청은 앞의 3건이 끝날 때까지 대기
+        assert wall >= 0.2
+
+    def test_요약(self):
+        samples = [
+            RequestSample("analysis", 0.0, 100.0, {"synthesis_node": 60.0}),
+            RequestSample("analysis", 5.0, 300.0, {"synthesis_node": 200.0}),
+            RequestSample(
+                "routine", 1.0, 10.0, {"routine_node": 1.0}, error="RuntimeError: HTTP 429"
+            ),
+        ]
+        summary = summarize(samples, wall_seconds=2.0)
+        assert summary["succeeded"] == 2
+        assert summary["errors"] == {"RuntimeError": 1}
+        assert summary["throughput_rps"] == 1.0
+        assert summary["nodes"]["synthesis_node"]["count"] == 2
+        assert summary["latency_ms"]["p50"] == 200.0
+        assert summary["queue_ms"]["count"] == 3
+
+    def test_그래프_스텁_실행(self, stub_backends):
+        ollama, _ = stub_backends
+        from loadtest.runner import graph_target
+
+        samples, wall = run_load(sample_requests(3, seed=2), graph_target, concurrency=3)
+        summary = summarize(samples, wall)
+        assert summary["succeeded"] == 3, [s.error for s in samples]
+        assert "input_validator" in summary["nodes"]
+        assert ollama.stats()["requests"] > 0
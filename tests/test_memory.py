@@ -0,0 +1,96 @@
+"""
+메모리 예산 테스트 (tracemalloc + RSS 샘플링, config/app.yaml memory.budgets).
+
+단계별 최대 메모리가 예산을 넘으면 실패한다. 첫 호출의 지연 초기화(디코더/모듈 로딩)를 제외하려고
+워밍업 1회 후 측정한다.
+"""
+from __future__ import annotations
+
+import time
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from tests._audio import synthetic_lung_sound
+from utils.config_loader import get_app_config
+from utils.memprofile import (
+    MemoryProfile,
+    StageMemory,
+    check_budgets,
+    current_rss,
+    format_profile,
+    profile_classify,
+    profile_graph,
+    profile_memory,
+)
+from utils.tracing import span
+
+
+def _budgets(name: str) -> dict:
+    return get_app_config()["memory"]["budgets"][name]
+
+
+class TestProfiler:
+    """프로파일러 동작 테스트"""
+
+    def test_rss(self):
+        rss, source = current_rss()
+        assert rss > 10 * 1024 * 1024
+        assert source in ("statm", "psutil", "ru_maxrss")
+
+    def test_단계별_할당(self):
+        with profile_memory("unit", interval_ms=1) as profile:
+            with span("stage.big"):
+                big = np.ones(8 * 1024 * 1024 // 8)  # 8MB
+                time.sleep(0.03)  # 단계 최대값은 샘플링 값 — 샘플 주기보다 오래 유지
+                del big
+            with span("stage.small"):
+                small = bytearray(64 * 1024)
+                del small
+        assert 7.5 <= profile.stages["stage.big"].traced_peak_mb < 12
+        assert profile.stages["stage.small"].traced_peak_mb < 1
+        assert profile.traced_peak_mb >= 7.5
+        assert profile.samples >= 2
+
+    def test_예산_검사(self):
+        profile = MemoryProfile(
+            "classify", traced_peak_mb=10.0, rss_peak_mb=300.0,
+            stages={"ast.fbank": StageMemory(1, 5.0, traced_peak_mb=50.0)},
+        )
+        budgets = {
+            "traced_peak_mb": 20,
+            "rss_peak_mb": 200,
+            "stages": {"ast.fbank": {"traced_peak_mb": 40}, "ast.missing": {}},
+        }
+        violations = check_budgets(profile, budgets)
+        assert len(violations) == 2
+        assert violations[0].startswith("classify rss_peak_mb")
+        assert violations[1].startswith("classify/ast.fbank traced_peak_mb")
+
+
+class TestMemoryBudgets:
+    """분류/그래프 메모리 예산"""
+
+    def test_classify(self, random_ast_classifier, tmp_path):
+        path = tmp_path / "lung_30s.wav"
+        sf.write(path, synthetic_lung_sound(30, 44100), 44100)
+        random_ast_classifier.classify(str(path))  # 워밍업
+
+        profile = profile_classify(random_ast_classifier, path)
+        assert {"ast.decode", "ast.spectrogram", "ast.fbank", "ast.forward"} <= set(profile.stages)
+        assert check_budgets(profile, _budgets("classify")) == [], format_profile(profile)
+
+    def test_graph(self, stub_backends):
+        from loadtest.runner import sample_requests
+
+        request = dict(sample_requests(60, seed=1))["analysis"].model_dump(mode="json")
+        profile_graph(request)  # 워밍업
+        profile = profile_graph(request)
+        assert "node.synthesis_node" in profile.stages
+        assert check_budgets(profile, _budgets("graph")) == [], format_profile(profile)
+
+
+@pytest.mark.parametrize("name", ["classify", "graph"])
+def test_예산_설정(name):
+    assert {"traced_peak_mb", "rss_peak_mb"} <= set(_budgets(name))
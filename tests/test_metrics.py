@@ -0,0 +1,46 @@
+"""운영 지표 카운터 테스트"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from utils import metrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class TestMetrics:
+    """카운터 / 비율 테스트"""
+
+    def test_increment_and_rate(self):
+        metrics.increment("total", 4)
+        metrics.increment("hit")
+        assert metrics.get_count("total") == 4
+        assert metrics.rate("hit", "total") == 0.25
+        assert metrics.snapshot() == {"total": 4, "hit": 1}
+
+    def test_rate_without_denominator(self):
+        assert metrics.rate("hit", "total") == 0.0
+
+    def test_reset_single_counter(self):
+        metrics.increment("a")
+        metrics.increment("b")
+        metrics.reset("a")
+        assert metrics.snapshot() == {"b": 1}
+
+    def test_thread_safe_increment(self):
+        threads = [
+            threading.Thread(target=lambda: [metrics.increment("n") for _ in range(1000)])
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert metrics.get_count("n") == 8000
@@ -0,0 +1,111 @@
+"""AST 오프라인 번들 테스트 (소형 AST 구성으로 생성 — 네트워크 없음)"""
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+
+from models.model_bundle import (  # noqa: E402
+    MANIFEST_NAME,
+    WEIGHTS_NAME,
+    BundleError,
+    build_bundle,
+    load_bundle,
+    mmap_safetensors,
+    verify_bundle,
+)
+
+
+@pytest.fixture(autouse=True)
+def _restore_offline_env(monkeypatch):
+    """load_bundle이 설정하는 오프라인 환경변수를 테스트 후 원복"""
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+    monkeypatch.setenv("TRANSFORMERS_OFFLINE", "1")
+
+
+@pytest.fixture
+def bundle_dir(tmp_path, tiny_model_dir):
+    out = tmp_path / "bundle"
+    build_bundle(out, str(tiny_model_dir))
+    return out
+
+
+class TestBuildVerify:
+    """번들 생성/검증 테스트"""
+
+    def test_매니페스트(self, bundle_dir, tiny_model_dir):
+        manifest = json.loads((bundle_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        assert manifest["model_name"] == str(tiny_model_dir)
+        assert manifest["weights"] == WEIGHTS_NAME
+        assert {WEIGHTS_NAME, "config.json", "preprocessor_config.json"} <= set(manifest["files"])
+        assert all(len(f["sha256"]) == 64 for f in manifest["files"].values())
+        assert not bundle_dir.with_name("bundle.partial").exists()
+
+    def test_검증_통과(self, bundle_dir):
+        assert verify_bundle(bundle_dir)["format_version"] == 1
+
+    def test_번들_없음(self, tmp_path):
+        with pytest.raises(BundleError, match="모델 번들이 없습니다"):
+            verify_bundle(tmp_path / "missing")
+
+    def test_체크섬_불일치(self, bundle_dir):
+        weights = bundle_dir / WEIGHTS_NAME
+        data = bytearray(weights.read_bytes())
+        data[-1] ^= 0xFF
+        weights.write_bytes(bytes(data))
+
+        # 크기만 보는 빠른 검증은 통과, 체크섬 검증은 실패
+        verify_bundle(bundle_dir, checksums=False)
+        with pytest.raises(BundleError, match="체크섬 불일치"):
+            verify_bundle(bundle_dir)
+
+    def test_파일_누락(self, bundle_dir):
+        (bundle_dir / "config.json").unlink()
+        with pytest.raises(BundleError, match="파일 누락"):
+            verify_bundle(bundle_dir)
+
+
+class TestLoadBundle:
+    """mmap 로딩 테스트"""
+
+    def test_mmap_텐서는_파일_스토리지_뷰(self, bundle_dir):
+        tensors = mmap_safetensors(bundle_dir / WEIGHTS_NAME)
+        pointers = {t.untyped_storage().data_ptr() for t in tensors.values()}
+        assert len(pointers) == 1
+
+    def test_로딩_결과_일치(self, bundle_dir, tiny_model_dir):
+        from transformers import ASTForAudioClassification
+
+        extractor, model = load_bundle(bundle_dir)
+        model.eval()
+        reference = ASTForAudioClassification.from_pretrained(tiny_model_dir).eval()
+
+        inputs = extractor(torch.zeros(16000).numpy(), sampling_rate=16000, return_tensors="pt")
+        with torch.no_grad():
+            assert torch.allclose(model(**inputs).logits, reference(**inputs).logits)
+        assert model.config.id2label == reference.config.id2label
+
+    def test_손상된_번들_로딩_거부(self, bundle_dir):
+        weights = bundle_dir / WEIGHTS_NAME
+        weights.write_bytes(b"\x00" * weights.stat().st_size)
+        with pytest.raises(BundleError):
+            load_bundle(bundle_dir)
+
+    def test_분류기_번들_설정(self, bundle_dir):
+        """config bundle.path가 있으면 허브 대신 번들에서 로딩"""
+        from models.ast_classifier import ASTClassifier
+        from utils.config_loader import get_ast_config
+
+        config = {**get_ast_config(), "bundle": {"path": str(bundle_dir), "verify": "size"}}
+        with patch("models.ast_classifier.get_ast_config", return_value=config), \
+                patch("models.ast_classifier.get_device", return_value=torch.device("cpu")), \
+                patch("models.ast_classifier.ASTForAudioClassification.from_pretrained") as hub:
+            classifier = ASTClassifier()
+
+        hub.assert_not_called()
+        assert classifier._crackle_ids == [1]
+        classifier.warmup(seconds=0.1)
@@ -1,6 +1,7 @@
 """에이전트 노드 단위 테스트"""
 from __future__ import annotations
 
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -52,6 +53,103 @@ class TestInputValidator:
         result = input_validator(state)
         assert result["auscultation"] is sample_auscultation
 
+    def test_vitals_findings_computed_once(self):
+        """생체신호 규칙 평가 결과를 상태에 기록 (이후 노드 공유)"""
+        state: AgentState = {"vitals": VitalSigns(heart_rate=120, body_temperature=38.5)}
+        result = input_validator(state)
+        assert result["vitals_findings"].flags == ["tachycardia", "fever"]
+
+    def test_deadline_started_or_preserved(self):
+        """마감 시각 설정, 호출자가 넘긴 값은 유지"""
+        result = input_validator({})
+        assert result["deadline"] > time.monotonic()
+        assert input_validator({"deadline": 123.0})["deadline"] == 123.0
+
+    def test_pre_risk_without_emergency(self):
+        """정상 입력 → 사전 위험도 low, 긴급 경로 비활성"""
+        result = input_validator({})
+        assert result["pre_risk_assessment"].level == "low"
+        assert result["emergency"] is False
+
+    @pytest.mark.parametrize(
+        "vitals",
+        [
+            VitalSigns(heart_rate=160),
+            VitalSigns(blood_pressure_sys=190),
+            VitalSigns(body_temperature=41.5),
+            # 임계값 자체
+            VitalSigns(heart_rate=150),
+            VitalSigns(heart_rate=40),
+            VitalSigns(blood_pressure_sys=180),
+            VitalSigns(blood_pressure_dia=120),
+        ],
+    )
+    def test_critical_vitals_trigger_emergency(self, vitals):
+        """위급 구간 생체신호 → emergency"""
+        result = input_validator({"vitals": vitals})
+        assert result["vitals_findings"].critical
+        assert result["emergency"] is True
+
+    def test_critical_pre_risk_triggers_emergency(self, sample_auscultation):
+        """위급 구간이 없어도 규칙 기반 사전 점수가 critical이면 emergency"""
+        crackle = sample_auscultation.model_copy(update={"classification": "Crackle"})
+        state: AgentState = {
+            "vitals": VitalSigns(heart_rate=120, blood_pressure_sys=150, body_temperature=38.5),
+            "symptoms": SymptomInput(severity="매우 심함"),
+            "auscultation": crackle,
+        }
+        result = input_validator(state)
+        assert result["vitals_findings"].critical == []
+        assert result["pre_risk_assessment"].level == "critical"
+        assert result["emergency"] is True
+
+    def test_all_normal_takes_routine_path(self, sample_auscultation):
+        """정상 생체신호 + 고신뢰 Normal 청진음 + 경미한 증상 → routine, 지표 기록"""
+        from agents.nodes.input_validator import ANALYSIS_METRIC, FAST_PATH_METRIC
+        from utils import metrics
+
+        metrics.reset()
+        state: AgentState = {
+            "symptoms": SymptomInput(checklist=["기침"]),
+            "auscultation": sample_auscultation,
+        }
+        assert input_validator(state)["routine"] is True
+        assert input_validator({})["routine"] is False  # 디폴트 증상에 호흡곤란 포함
+        assert metrics.get_count(ANALYSIS_METRIC) == 2
+        assert metrics.rate(FAST_PATH_METRIC, ANALYSIS_METRIC) == 0.5
+
+    @pytest.mark.parametrize(
+        "state",
+        [
+            {"vitals": VitalSigns(body_temperature=37.5)},
+            {"vitals": VitalSigns(blood_pressure_sys=138, blood_pressure_dia=88)},
+            {"vitals": VitalSigns(blood_pressure_sys=125)},
+            {"vitals": VitalSigns(blood_pressure_dia=55)},
+            {"symptoms": SymptomInput(checklist=["기침"], severity="중간")},
+            {"symptoms": SymptomInput(checklist=["기침", "가슴 통증"])},
+        ],
+    )
+    def test_abnormal_findings_skip_routine_path(self, state):
+        """미열 / 혈압 주의·1기·이완기 저하(플래그 없음) / 증상 강도 / 경고 증상 → 루틴 경로 제외"""
+        state.setdefault("symptoms", SymptomInput(checklist=["기침"]))
+        assert input_validator(state)["routine"] is False
+
+    def test_uncertain_auscultation_skips_routine_path(self, sample_auscultation):
+        """Normal이어도 신뢰도가 기준 미만이면 루틴 경로 제외"""
+        uncertain = sample_auscultation.model_copy(update={"confidence": 0.6})
+        state: AgentState = {"symptoms": SymptomInput(checklist=["기침"]), "auscultation": uncertain}
+        assert input_validator(state)["routine"] is False
+
+    def test_routine_path_disabled_by_config(self):
+        """fast_path.enabled=false → 루틴 경로 비활성"""
+        from utils.config_loader import get_risk_config
+
+        config = dict(get_risk_config())
+        config["fast_path"] = {**config["fast_path"], "enabled": False}
+        with patch("agents.nodes.input_validator.get_risk_config", return_value=config):
+            result = input_validator({"symptoms": SymptomInput(checklist=["기침"])})
+        assert result["routine"] is False
+
 
 # =====================================================================
 # auscultation_node 테스트
@@ -109,6 +207,15 @@ class TestAuscultationNode:
 class TestVitalsNode:
     """생체신호 평가 노드 테스트"""
 
+    def test_evaluate_text_uses_rule_engine(self):
+        """규칙 엔진 구간에 따라 평가 텍스트 생성 (미열 구분)"""
+        from agents.nodes.vitals_node import _evaluate_vitals
+
+        text = _evaluate_vitals(VitalSigns(heart_rate=120, blood_pressure_sys=150, body_temperature=37.5))
+        assert "빈맥 (정상: 60-100)" in text
+        assert "고혈압 (정상: ~120/80)" in text
+        assert "미열" in text
+
     def test_no_vitals_returns_skip(self):
         """생체신호 없으면 스킵"""
         from agents.nodes.vitals_node import vitals_node
@@ -198,6 +305,61 @@ class TestSynthesisNode:
         assert result["synthesis"] == "종합 분석 결과입니다."
 
 
+    @patch("agents.nodes.synthesis_node.LLMClient")
+    def test_synthesis_uses_literature_from_state(self, mock_llm_cls, sample_literature_result):
+        """literature_node가 채운 문헌을 프롬프트에 포함 (직접 검색하지 않음)"""
+        from agents.nodes.synthesis_node import synthesis_node
+
+        mock_llm = MagicMock()
+        mock_llm.generate.return_value = "종합"
+        mock_llm_cls.return_value = mock_llm
+
+        state: AgentState = {"literature_references": sample_literature_result}
+        result = synthesis_node(state)
+
+        prompt = mock_llm.generate.call_args[0][0]
+        assert "[참고 의학 문헌]" in prompt
+        assert "literature_references" not in result
+
+
+# =====================================================================
+# literature_node 테스트
+# =====================================================================
+
+
+class TestLiteratureNode:
+    """문헌 검색 노드 테스트"""
+
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    def test_search_from_inputs(self, mock_search_cls, default_vitals, default_symptoms, sample_literature_result):
+        """입력 데이터로 검색 후 상태에 기록"""
+        from agents.nodes.literature_node import literature_node
+
+        mock_search = MagicMock()
+        mock_search.search_from_analysis.return_value = sample_literature_result
+        mock_search_cls.return_value = mock_search
+
+        state: AgentState = {"vitals": default_vitals, "symptoms": default_symptoms}
+        result = literature_node(state)
+
+        assert result["literature_references"] is sample_literature_result
+        kwargs = mock_search.search_from_analysis.call_args.kwargs
+        assert kwargs["vitals"] is default_vitals
+        assert kwargs["symptoms"] is default_symptoms
+
+    @patch("agents.nodes.literature_node.MedicalSearchClient")
+    def test_search_error_recorded(self, mock_search_cls):
+        """검색 예외 시 실패 결과 반환 (예외 전파 없음)"""
+        from agents.nodes.literature_node import literature_node
+
+        mock_search_cls.side_effect = RuntimeError("네트워크 오류")
+        result = literature_node({})
+
+        lit = result["literature_references"]
+        assert lit.search_successful is False
+        assert "네트워크 오류" in lit.error_message
+
+
 # =====================================================================
 # risk_node 테스트
 # =====================================================================
@@ -206,6 +368,24 @@ class TestSynthesisNode:
 class TestRiskNode:
     """위험도 평가 노드 테스트"""
 
+    def test_synthesis_keywords_factor(self):
+        """종합 판단 키워드 점수와 매칭 키워드를 위험 요인에 기록"""
+        risk = _calculate_risk({"synthesis": "급성 악화 소견으로 응급 진료가 필요합니다."})
+        assert risk.score == 15
+        assert risk.factors == ["종합 판단 키워드: 급성, 악화, 응급"]
+
+    def test_uses_state_vitals_findings(self, default_vitals):
+        """상태의 vitals_findings가 있으면 재평가 없이 사용"""
+        from schemas.vitals import VitalsFindings
+
+        state: AgentState = {
+            "vitals": default_vitals,
+            "vitals_findings": VitalsFindings(flags=["fever"]),
+        }
+        risk = _calculate_risk(state)
+        assert risk.score == 15
+        assert risk.factors == [f"발열 ({default_vitals.body_temperature}°C)"]
+
     def test_normal_inputs_low_risk(self, default_vitals, default_symptoms):
         """정상 입력 → 낮은 위험도"""
         state: AgentState = {
@@ -315,6 +495,150 @@ class TestRecommendationNode:
         assert "중요" in result["recommendation"] or "위험" in result["recommendation"]
 
 
+# =====================================================================
+# 지연 예산 소진 시 대체 결과 테스트
+# =====================================================================
+
+
+class TestLatencyBudgetDegradation:
+    """노드별 지연 예산 소진 → LLM/네트워크 호출 없이 대체 결과 + degraded_nodes 기록"""
+
+    def test_vitals_node_falls_back_to_rules(self, default_vitals):
+        from agents.nodes.vitals_node import vitals_node
+
+        with patch("agents.nodes.vitals_node.LLMClient") as mock_llm:
+            result = vitals_node({"vitals": default_vitals, "deadline": 0.0})
+            mock_llm.assert_not_called()
+        assert "정상 범위" in result["vitals_evaluation"]
+        assert result["degraded_nodes"] == ["vitals_node"]
+
+    def test_auscultation_node_falls_back_to_classification(self, sample_auscultation):
+        from agents.nodes.auscultation_node import auscultation_node
+
+        with patch("agents.nodes.auscultation_node.LLMClient") as mock_llm:
+            result = auscultation_node({"auscultation": sample_auscultation, "deadline": 0.0})
+            mock_llm.assert_not_called()
+        assert "Normal" in result["auscultation_analysis"]
+        assert result["degraded_nodes"] == ["auscultation_node"]
+
+    def test_llm_budget_exceeded_mid_call(self, default_symptoms):
+        """호출 도중 예산 소진(BudgetExceeded) → 대체 결과"""
+        from agents.nodes.symptoms_node import symptoms_node
+        from utils.deadline import BudgetExceeded
+
+        with patch("agents.nodes.symptoms_node.LLMClient") as mock_llm_cls:
+            mock_llm_cls.return_value.generate.side_effect = BudgetExceeded("예산 소진")
+            result = symptoms_node({"symptoms": default_symptoms, "deadline": time.monotonic() + 60})
+            timeout = mock_llm_cls.return_value.generate.call_args.kwargs["timeout"]
+        assert 0 < timeout <= 30
+        assert default_symptoms.duration in result["symptom_analysis"]
+        assert result["degraded_nodes"] == ["symptoms_node"]
+
+    def test_literature_node_skips_search(self):
+        from agents.nodes.literature_node import literature_node
+
+        with patch("agents.nodes.literature_node.MedicalSearchClient") as mock_search_cls:
+            result = literature_node({"deadline": 0.0})
+            mock_search_cls.assert_not_called()
+        assert result["literature_references"].search_successful is False
+        assert result["degraded_nodes"] == ["literature_node"]
+
+    def test_recommendation_node_template(self):
+        from agents.nodes.recommendation_node import recommendation_node
+
+        risk = RiskAssessment(level="high", score=60, factors=["빈맥 (120bpm)"], immediate_action_needed=True)
+        with patch("agents.nodes.recommendation_node.LLMClient") as mock_llm:
+            result = recommendation_node({"risk_assessment": risk, "deadline": 0.0})
+            mock_llm.assert_not_called()
+        assert "빈맥 (120bpm)" in result["recommendation"]
+        assert "중요" in result["recommendation"]
+        assert result["degraded_nodes"] == ["recommendation_node"]
+
+    def test_no_deadline_keeps_existing_behavior(self, default_vitals):
+        """마감이 없으면 타임아웃 없이 LLM 호출"""
+        from agents.nodes.vitals_node import vitals_node
+
+        with patch("agents.nodes.vitals_node.LLMClient") as mock_llm_cls:
+            mock_llm_cls.return_value.generate.return_value = "평가"
+            result = vitals_node({"vitals": default_vitals})
+        assert mock_llm_cls.return_value.generate.call_args.kwargs["timeout"] is None
+        assert "degraded_nodes" not in result
+
+
+# =====================================================================
+# emergency_node 테스트
+# =====================================================================
+
+
+class TestEmergencyNode:
+    """긴급 응답 노드 테스트"""
+
+    def test_template_includes_critical_findings(self):
+        """템플릿에 위급 소견 + 사전 위험도 기입 (LLM 호출 없음)"""
+        from agents.nodes.emergency_node import emergency_node
+
+        state = input_validator({"vitals": VitalSigns(heart_rate=160)})
+        with patch("models.llm_client.LLMClient") as mock_llm:
+            result = emergency_node(state)
+            mock_llm.assert_not_called()
+
+        text = result["emergency_recommendation"]
+        assert "심박수 160bpm" in text
+        assert "119" in text
+
+    def test_professional_template(self):
+        """전문가 모드 템플릿 선택"""
+        from agents.nodes.emergency_node import emergency_node
+
+        state = input_validator({
+            "vitals": VitalSigns(body_temperature=41.5),
+            "user_mode": "professional",
+        })
+        text = emergency_node(state)["emergency_recommendation"]
+        assert "Emergency triage" in text
+        assert "체온 41.5°C" in text
+
+
+# =====================================================================
+# routine_node 테스트
+# =====================================================================
+
+
+class TestRoutineNode:
+    """루틴 응답 노드 테스트"""
+
+    @pytest.mark.parametrize("user_mode", ["general", "professional"])
+    def test_templates_fill_all_outputs(self, user_mode, sample_auscultation):
+        """LLM 호출 없이 분석/종합/위험도/권고 필드를 모두 채움"""
+        from agents.nodes.routine_node import routine_node
+
+        state = input_validator({
+            "symptoms": SymptomInput(checklist=["기침"]),
+            "auscultation": sample_auscultation,
+            "user_mode": user_mode,
+        })
+        with patch("models.llm_client.LLMClient") as mock_llm:
+            result = routine_node({**state})
+            mock_llm.assert_not_called()
+
+        assert "85%" in result["auscultation_analysis"]
+        assert "정상 범위" in result["vitals_evaluation"]
+        assert "기침" in result["symptom_analysis"]
+        assert result["vitals_evaluation"] in result["synthesis"]
+        assert result["risk_assessment"].level == "low"
+        assert result["recommendation"]
+
+    def test_professional_wording(self):
+        """전문가 모드 템플릿 선택"""
+        from agents.nodes.routine_node import routine_node
+
+        state = input_validator({"symptoms": SymptomInput(checklist=[]), "user_mode": "professional"})
+        result = routine_node(state)
+        assert "WNL" in result["synthesis"]
+        assert "Routine screening" in result["recommendation"]
+        assert "없음" in result["symptom_analysis"]
+
+
 # =====================================================================
 # risk_router 테스트
 # =====================================================================
@@ -346,3 +670,22 @@ class TestRiskRouter:
 
         state: AgentState = {}
         assert route_by_risk(state) == "recommendation_node"
+
+    def test_validation_fans_out_to_analysis_nodes(self):
+        """입력 검증 후 분석 노드 4개로 분기"""
+        from agents.edges.risk_router import ANALYSIS_NODES, route_after_validation
+
+        assert route_after_validation({"emergency": False}) == list(ANALYSIS_NODES)
+
+    def test_emergency_adds_emergency_node(self):
+        """위급 입력 → 분석 노드 + emergency_node 병행"""
+        from agents.edges.risk_router import ANALYSIS_NODES, route_after_validation
+
+        targets = route_after_validation({"emergency": True})
+        assert targets == [*ANALYSIS_NODES, "emergency_node"]
+
+    def test_routine_routes_around_llm_nodes(self):
+        """모든 소견 정상 → routine_node 단독"""
+        from agents.edges.risk_router import route_after_validation
+
+        assert route_after_validation({"routine": True}) == ["routine_node"]
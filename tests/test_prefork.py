@@ -0,0 +1,158 @@
+"""Pre-fork 런처 테스트 (실제 fork, 소형 모델 — uvicorn 대신 테스트용 워커 함수)"""
+from __future__ import annotations
+
+import gc
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from service.prefork import PreforkServer, freeze_classifier, worker_threads  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork 미지원 플랫폼")
+
+# 다중 스레드로 설정된 부모에서 preload(워밍업 forward) → fork → 워커 추론.
+# pytest 프로세스는 앞선 테스트가 이미 OpenMP 풀을 띄웠을 수 있어 새 인터프리터에서 실행.
+# OpenMP 풀은 병렬 연산을 실행한 스레드에 묶이므로 실제 런처처럼 메인 스레드에서 fork
+# (멈춘 워커는 30초 후 타이머가 stop으로 종료)
+_WARM_PARENT_SCRIPT = textwrap.dedent("""
+    import os, threading
+    from types import SimpleNamespace
+    from unittest.mock import patch
+
+    import torch
+
+    from service.prefork import PreforkServer
+
+    torch.set_num_threads(4)
+    model = torch.nn.Linear(1024, 1024)
+
+    def forward():
+        with torch.no_grad():
+            model(torch.randn(256, 1024))
+
+    def target(sock, config):
+        forward()
+        os.write(1, b"worker-ok\\n")
+
+    classifier = SimpleNamespace(model=model, warmup=lambda seconds: forward())
+    config = {"prefork": {"threads_per_worker": 2, "gc_freeze": False}}
+    server = PreforkServer(config, workers=2, target=target)
+    with patch("models.ast_classifier.get_classifier", return_value=classifier), \\
+            patch("utils.warmup.warm_llm"):
+        server.preload()
+    watchdog = threading.Timer(30, server.stop)
+    watchdog.start()
+    server.run(None)
+    watchdog.cancel()
+""")
+
+
+def _classifier() -> SimpleNamespace:
+    return SimpleNamespace(model=torch.nn.Linear(64, 4))
+
+
+def _server(target, workers: int = 2, **prefork) -> PreforkServer:
+    config = {"prefork": {"threads_per_worker": 1, "gc_freeze": False, **prefork}}
+    return PreforkServer(config, workers=workers, target=target)
+
+
+def _read_lines(fd: int) -> list[dict]:
+    with os.fdopen(fd, "r") as f:
+        return [json.loads(line) for line in f.read().splitlines()]
+
+
+class TestHelpers:
+    """스레드 수 / 모델 고정 테스트"""
+
+    def test_워커_스레드_수(self, monkeypatch):
+        monkeypatch.setattr(os, "cpu_count", lambda: 8)
+        assert worker_threads(2) == 4
+        assert worker_threads(16) == 1
+        assert worker_threads(2, configured=3) == 3
+
+    def test_모델_고정(self):
+        classifier = _classifier()
+        freeze_classifier(classifier, gc_freeze=False)
+        assert not classifier.model.training
+        assert all(not p.requires_grad for p in classifier.model.parameters())
+
+    def test_gc_freeze(self):
+        try:
+            freeze_classifier(_classifier(), gc_freeze=True)
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+
+class TestPreforkServer:
+    """fork된 워커가 부모 모델을 공유하는지 테스트"""
+
+    def test_워커가_부모_가중치_공유(self):
+        classifier = _classifier()
+        freeze_classifier(classifier, gc_freeze=False)
+        parent_ptr = classifier.model.weight.data_ptr()
+        read_fd, write_fd = os.pipe()
+
+        def target(sock, config):
+            os.close(read_fd)
+            with torch.no_grad():
+                classifier.model(torch.zeros(1, 64))
+            line = {"pid": os.getpid(), "ptr": classifier.model.weight.data_ptr(),
+                    "threads": torch.get_num_threads()}
+            os.write(write_fd, (json.dumps(line) + "\n").encode())
+
+        server = _server(target, workers=2)
+        server.run(sock=None)
+        os.close(write_fd)
+        lines = _read_lines(read_fd)
+
+        assert len({line["pid"] for line in lines}) == 2
+        assert all(line["ptr"] == parent_ptr for line in lines)
+        assert all(line["threads"] == 1 for line in lines)
+        assert server.children == {}
+
+    def test_다중_스레드_부모_워밍업_후_워커_추론(self):
+        # 부모 forward가 OpenMP 워커 스레드를 띄우면 fork된 워커는 첫 병렬 연산에서 멈춤
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-c", _WARM_PARENT_SCRIPT],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, timeout=120,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.splitlines().count("worker-ok") == 2, result.stderr
+        assert time.perf_counter() - start < 30
+
+    def test_시작_직후_실패한_워커는_재시작_안함(self):
+        read_fd, write_fd = os.pipe()
+
+        def target(sock, config):
+            os.write(write_fd, b'{"started": 1}\n')
+            raise RuntimeError("설정 오류")
+
+        _server(target, workers=2).run(sock=None)
+        os.close(write_fd)
+        assert len(_read_lines(read_fd)) == 2
+
+    def test_stop은_워커_종료(self):
+        server = _server(lambda sock, config: time.sleep(60), workers=2)
+        runner = threading.Thread(target=server.run, args=(None,))
+        runner.start()
+        deadline = time.monotonic() + 5
+        while len(server.children) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        server.stop()
+        runner.join(timeout=10)
+        assert not runner.is_alive()
+        assert server.children == {}
@@ -0,0 +1,158 @@
+"""외부 API 호출 제어 유틸리티 테스트"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from utils.rate_limiter import SingleFlight, TokenBucket, backoff_delay, parse_retry_after
+
+
+class TestTokenBucket:
+    """TokenBucket 테스트"""
+
+    def test_버스트_용량까지_즉시_허용(self):
+        """capacity 이내 요청은 대기 없이 통과"""
+        bucket = TokenBucket(rate=5, capacity=5)
+        waits = [bucket.reserve() for _ in range(5)]
+        assert all(w == 0.0 for w in waits)
+
+    def test_초과_요청_대기_시간_증가(self):
+        """용량 초과 요청은 rate 간격으로 대기 시간이 누적"""
+        bucket = TokenBucket(rate=10, capacity=1)
+        assert bucket.reserve() == 0.0
+        second = bucket.reserve()
+        third = bucket.reserve()
+        assert second == pytest.approx(0.1, abs=0.02)
+        assert third == pytest.approx(0.2, abs=0.02)
+
+    def test_허용_요청률_유지(self):
+        """동시 요청에서도 허용 요청률을 넘지 않음"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.monotonic()
+
+        def worker():
+            for _ in range(5):
+                bucket.acquire()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # 20회 요청, 첫 1회는 버스트 → 최소 19/50초 소요
+        assert time.monotonic() - start >= 19 / 50 - 0.02
+
+    def test_잘못된_rate(self):
+        """rate가 0 이하이면 ValueError"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    @pytest.mark.parametrize("rate", [3, 10])
+    def test_NCBI_버킷_1초_구간_한도(self, monkeypatch, rate):
+        """유휴 상태(가득 찬 버킷)에서 몰린 요청도 어떤 1초 구간에서든 rate건 이하로 허용"""
+        import models.literature_search as literature_search
+
+        monkeypatch.setattr(literature_search, "_NCBI_LIMITERS", {})
+        limiter = literature_search.get_ncbi_limiter(rate)
+        grants = []
+        for _ in range(3 * rate):
+            now = time.monotonic()
+            grants.append(now + limiter.reserve())
+
+        # [t, t+1) 구간 — 경계의 부동소수 오차는 제외
+        for start in grants:
+            assert sum(start <= g < start + 1 - 1e-6 for g in grants) <= rate
+
+
+class TestBackoff:
+    """백오프 / Retry-After 테스트"""
+
+    def test_지수_상한(self):
+        """대기 시간은 base * 2^(n-1)과 max_delay 이내"""
+        for attempt in range(1, 6):
+            delay = backoff_delay(attempt, base=0.5, max_delay=4.0)
+            assert 0.0 <= delay <= min(4.0, 0.5 * 2 ** (attempt - 1))
+
+    def test_retry_after_우선(self):
+        """Retry-After가 있으면 그 이상 대기"""
+        delay = backoff_delay(1, base=0.1, max_delay=10.0, retry_after=3.0)
+        assert delay >= 3.0
+
+    def test_retry_after_상한(self):
+        """Retry-After가 max_delay보다 크면 max_delay까지만 대기"""
+        for attempt in range(1, 4):
+            assert backoff_delay(attempt, base=0.1, max_delay=1.0, retry_after=3600.0) == 1.0
+
+    def test_retry_after_초_파싱(self):
+        """숫자 형식 Retry-After"""
+        assert parse_retry_after("2") == 2.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_retry_after_날짜_파싱(self):
+        """HTTP-date 형식 Retry-After (과거 시각은 0)"""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_retry_after_잘못된_값(self):
+        """없거나 파싱 불가하면 None"""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    def test_동시_요청_병합(self):
+        """같은 키 동시 호출은 1회만 실행"""
+        flight = SingleFlight()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_call():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=2)
+            return "result"
+
+        results = []
+
+        def leader():
+            results.append(flight.do("q", slow_call))
+
+        def follower():
+            started.wait(timeout=2)
+            results.append(flight.do("q", lambda: calls.append(1) or "other"))
+
+        t1 = threading.Thread(target=leader)
+        t2 = threading.Thread(target=follower)
+        t1.start()
+        t2.start()
+        started.wait(timeout=2)
+        time.sleep(0.05)
+        release.set()
+        t1.join()
+        t2.join()
+
+        assert len(calls) == 1
+        assert results == ["result", "result"]
+
+    def test_완료_후_재실행(self):
+        """진행 중이 아니면 새로 실행"""
+        flight = SingleFlight()
+        assert flight.do("q", lambda: 1) == 1
+        assert flight.do("q", lambda: 2) == 2
+
+    def test_예외_전파(self):
+        """실행 실패 시 예외 전파 후 키 해제"""
+        flight = SingleFlight()
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            flight.do("q", fail)
+        assert flight.do("q", lambda: "ok") == "ok"
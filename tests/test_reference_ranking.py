@@ -0,0 +1,99 @@
+"""참고 문헌 병합 (중복 제거 / 재순위화 / 토큰 예산) 테스트"""
+from __future__ import annotations
+
+from models.reference_ranking import (
+    bm25_scores,
+    cap_by_token_budget,
+    deduplicate_references,
+    rerank_references,
+)
+from schemas.literature import MedicalReference
+
+
+def _ref(source_id: str, title: str, **kwargs) -> MedicalReference:
+    return MedicalReference(source_id=source_id, title=title, **kwargs)
+
+
+class TestDeduplicate:
+    """소스 간 중복 제거 테스트"""
+
+    def test_doi_중복_병합(self):
+        """같은 DOI는 하나로 병합 (대소문자 무시)"""
+        refs = [
+            _ref(
+                "111", "Crackles in pneumonia",
+                doi="10.1/ABC", source="pubmed", relevance_score=0.9,
+            ),
+            _ref(
+                "PMC9", "Crackles in Pneumonia.",
+                doi="10.1/abc", source="pmc", relevance_score=0.5,
+            ),
+        ]
+        merged = deduplicate_references(refs)
+        assert len(merged) == 1
+        assert merged[0].source == "pubmed"
+
+    def test_pmid_중복과_정보_보완(self):
+        """같은 PMID면 병합하고 빈 초록은 다른 소스 값으로 보완"""
+        refs = [
+            _ref("111", "Wheeze study", pmid="111", relevance_score=0.9),
+            _ref("PMC1", "Wheeze study (full text)", pmid="111", source="pmc",
+                 abstract="wheezing in asthma", relevance_score=0.4),
+        ]
+        merged = deduplicate_references(refs)
+        assert len(merged) == 1
+        assert merged[0].source_id == "111"
+        assert merged[0].abstract == "wheezing in asthma"
+
+    def test_정규화_제목_중복(self):
+        """식별자가 없어도 정규화 제목이 같으면 중복"""
+        refs = [
+            _ref("a", "Lung Sounds: A Review"),
+            _ref("b", "lung sounds - a review"),
+            _ref("c", "Other"),
+        ]
+        assert [r.source_id for r in deduplicate_references(refs)] == ["a", "c"]
+
+
+class TestRerank:
+    """BM25 재순위화 테스트"""
+
+    def test_bm25_쿼리_일치_문서_우선(self):
+        """쿼리 용어가 많이 등장하는 문서가 높은 점수"""
+        scores = bm25_scores(
+            "crackles pneumonia", ["crackles in pneumonia", "heart failure", "pneumonia"]
+        )
+        assert scores[0] > scores[2] > scores[1] == 0
+
+    def test_재순위화_점수_범위와_정렬(self):
+        """어휘 일치가 높으면 소스 순위가 낮아도 상위로 이동"""
+        refs = [
+            _ref("1", "Cardiac output monitoring", relevance_score=1.0),
+            _ref("2", "Pulmonary crackles lung sounds diagnosis", relevance_score=0.6),
+        ]
+        ranked = rerank_references("pulmonary crackles lung sounds diagnosis", refs)
+        assert [r.source_id for r in ranked] == ["2", "1"]
+        assert all(0.0 <= r.relevance_score <= 1.0 for r in ranked)
+
+    def test_빈_목록(self):
+        """빈 입력은 빈 결과"""
+        assert rerank_references("cough", []) == []
+
+
+class TestTokenBudget:
+    """토큰 예산 절단 테스트"""
+
+    def test_예산_초과분_절단(self):
+        """예산을 넘는 하위 문헌은 제외 (순서 유지)"""
+        refs = [_ref(str(i), "x" * 200) for i in range(5)]
+        capped = cap_by_token_budget(refs, max_tokens=150)
+        assert [r.source_id for r in capped] == ["0", "1"]
+
+    def test_첫_문헌은_항상_포함(self):
+        """예산보다 큰 문헌도 최소 1건은 전달"""
+        assert len(cap_by_token_budget([_ref("0", "x" * 1000)], max_tokens=10)) == 1
+
+    def test_최대_문헌_수(self):
+        """max_references 제한"""
+        refs = [_ref(str(i), "t") for i in range(5)]
+        assert len(cap_by_token_budget(refs, max_tokens=None, max_references=3)) == 3
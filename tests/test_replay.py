@@ -0,0 +1,125 @@
+"""그래프 실행 녹화/재생 테스트 (로컬 스텁으로 녹화 → 스텁 종료 후 오프라인 재생)"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from utils.deadline import BudgetExceeded
+from utils.replay import (
+    Interaction,
+    ReplayMiss,
+    append_cases,
+    interaction,
+    read_cases,
+    record_case,
+    recording,
+    replay_case,
+    replaying,
+    request_key,
+)
+
+
+class TestInteraction:
+    """외부 호출 래퍼 테스트"""
+
+    def test_세션_없으면_그대로_호출(self):
+        assert interaction("llm", {"prompt": "a"}, lambda: "실제") == "실제"
+
+    def test_녹화_후_재생(self):
+        with recording() as session:
+            assert interaction("llm", {"prompt": "a"}, lambda: "응답 A") == "응답 A"
+            interaction("llm", {"prompt": "b"}, lambda: "응답 B")
+        assert [i.response for i in session.interactions] == ["응답 A", "응답 B"]
+
+        def fail():
+            raise AssertionError("재생 중 실제 호출")
+
+        with replaying(session.interactions, preserve_latency=False) as replay:
+            # 병렬 노드처럼 순서가 바뀌어도 요청 내용으로 매칭
+            assert interaction("llm", {"prompt": "b"}, fail) == "응답 B"
+            assert interaction("llm", {"prompt": "a"}, fail) == "응답 A"
+        assert replay.unused() == []
+
+    def test_미녹화_호출(self):
+        with replaying([], preserve_latency=False) as session:
+            with pytest.raises(ReplayMiss):
+                interaction("http", {"endpoint": "esearch.fcgi"}, lambda: None)
+        assert session.misses[0]["kind"] == "http"
+
+    def test_예외_재생(self):
+        def timeout():
+            raise BudgetExceeded("예산 소진")
+
+        with recording() as session:
+            with pytest.raises(BudgetExceeded):
+                interaction("llm", {"prompt": "a"}, timeout)
+        assert session.interactions[0].error == {"type": "BudgetExceeded", "message": "예산 소진"}
+
+        with replaying(session.interactions, preserve_latency=False):
+            with pytest.raises(BudgetExceeded, match="예산 소진"):
+                interaction("llm", {"prompt": "a"}, timeout)
+
+    def test_지연_재현(self):
+        key = request_key("llm", {"prompt": "a"})
+        recorded = [Interaction("llm", key, {}, "x", latency_ms=100.0)]
+        with replaying(recorded, preserve_latency=True):
+            start = time.perf_counter()
+            interaction("llm", {"prompt": "a"}, lambda: "실제")
+            assert time.perf_counter() - start >= 0.1
+
+
+def _analysis_request() -> dict:
+    from loadtest.runner import sample_requests
+
+    return dict(sample_requests(60, seed=1))["analysis"].model_dump(mode="json")
+
+
+class TestGraphReplay:
+    """그래프 단위 녹화/재생 테스트"""
+
+    def test_오프라인_재생(self, stub_backends, tmp_path):
+        ollama, eutils = stub_backends
+        case = record_case(_analysis_request(), case_id="case-0")
+        ollama.stop()
+        eutils.stop()
+        assert {i.kind for i in case.interactions} == {"llm", "http"}
+        assert all(i.error is None for i in case.interactions)
+
+        log = append_cases(tmp_path / "cases.jsonl.gz", [case])
+        (loaded,) = read_cases(log)
+
+        # 스텁 종료 후 재생 — 네트워크 호출 없이 같은 출력
+        result = replay_case(loaded, preserve_latency=False)
+        assert result["misses"] == []
+        assert result["changed"] == []
+        assert "input_validator" in result["nodes"]
+
+    def test_같은_질의_연속_녹화(self, stub_backends):
+        # 같은 테스트 안에서는 conftest 초기화가 없으므로, 두 번째 녹화가 검색 캐시를 적중하면
+        # PubMed 호출이 녹화에서 빠져 재생 시 캐시 없이 미녹화가 된다
+        ollama, eutils = stub_backends
+        request_json = _analysis_request()
+        record_case(request_json, case_id="case-0")
+        second = record_case(request_json, case_id="case-1")
+        ollama.stop()
+        eutils.stop()
+        assert any(i.kind == "http" for i in second.interactions)
+
+        result = replay_case(second, preserve_latency=False)
+        assert result["misses"] == []
+        assert result["changed"] == []
+
+    def test_프롬프트_변경_감지(self):
+        from loadtest.runner import sample_requests
+        from utils.replay import ReplayCase
+
+        requests = dict(sample_requests(60, seed=1))
+        # 녹화가 비어 있으면(= 녹화 이후 프롬프트가 바뀐 경우와 같음) LLM 호출이 미녹화로 기록된다
+        empty = ReplayCase("case-x", requests["analysis"].model_dump(mode="json"), {}, 0.0)
+        result = replay_case(empty, preserve_latency=False)
+        assert any(m["kind"] == "llm" for m in result["misses"])
+
+    def test_로그_없음(self, tmp_path):
+        with pytest.raises(RuntimeError, match="녹화 로그가 없습니다"):
+            read_cases(tmp_path / "missing.jsonl.gz")
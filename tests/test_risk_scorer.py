@@ -0,0 +1,168 @@
+"""배치 위험도 산정기 테스트"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from agents.nodes.risk_node import _calculate_risk
+from models.risk_scorer import RiskScorer, benchmark, risk_level, score_file
+from schemas.auscultation import AUSCULTATION_CLASSES, AuscultationResult
+from schemas.symptoms import SEVERITY_OPTIONS, SymptomInput
+from schemas.vitals import VitalSigns
+
+
+class TestRiskScorer:
+    """RiskScorer 테스트"""
+
+    def test_risk_node와_일치(self):
+        """무작위 입력에서 _calculate_risk(키워드 제외)와 점수/레벨 일치"""
+        rng = np.random.default_rng(42)
+        n = 300
+        hr = rng.integers(35, 170, n)
+        sys_ = rng.integers(70, 200, n)
+        dia = rng.integers(40, 130, n)
+        temp = np.round(rng.uniform(34.0, 41.5, n), 1)
+        probs = rng.dirichlet(np.ones(len(AUSCULTATION_CLASSES)), n)
+        has_audio = rng.random(n) < 0.7
+        probs[~has_audio] = np.nan
+        severity = rng.integers(0, len(SEVERITY_OPTIONS), n)
+
+        result = RiskScorer().score(
+            hr, sys_, dia, temp, class_probabilities=probs, severity=severity
+        )
+
+        for i in range(n):
+            auscultation = None
+            if has_audio[i]:
+                probabilities = dict(zip(AUSCULTATION_CLASSES, probs[i].tolist()))
+                auscultation = AuscultationResult(
+                    file_name="x.wav",
+                    classification=max(probabilities, key=probabilities.get),
+                    confidence=float(probs[i].max()),
+                    probabilities=probabilities,
+                )
+            expected = _calculate_risk({
+                "vitals": VitalSigns(
+                    heart_rate=int(hr[i]), blood_pressure_sys=int(sys_[i]),
+                    blood_pressure_dia=int(dia[i]), body_temperature=float(temp[i]),
+                ),
+                "auscultation": auscultation,
+                "symptoms": SymptomInput(severity=SEVERITY_OPTIONS[severity[i]]),
+            })
+            assert result.score[i] == expected.score
+            assert result.level[i] == expected.level
+            assert result.immediate_action[i] == expected.immediate_action_needed
+
+    def test_레벨_경계(self):
+        """경계 점수는 상위 레벨"""
+        assert risk_level(24.9) == "low"
+        assert risk_level(25) == "moderate"
+        assert risk_level(50) == "high"
+        assert risk_level(75) == "critical"
+
+    def test_결측값_무시(self):
+        """생체신호 NaN은 이상 소견 없음, 선택 입력 생략 가능"""
+        result = RiskScorer().score(
+            np.array([np.nan]), np.array([np.nan]), np.array([np.nan]), np.array([39.0]),
+        )
+        assert result.score.tolist() == [15.0]
+
+    def test_score_frame_분류_텍스트_열(self):
+        """classification / severity 텍스트 열 지원"""
+        frame = pd.DataFrame({
+            "heart_rate": [75, 75],
+            "blood_pressure_sys": [120, 120],
+            "blood_pressure_dia": [80, 80],
+            "body_temperature": [36.5, 36.5],
+            "classification": ["Normal", "Wheeze"],
+            "severity": ["경미", "매우 심함"],
+        })
+        scored = RiskScorer().score_frame(frame)
+        assert scored["risk_score"].tolist() == [0.0, 35.0]
+        assert scored["risk_level"].tolist() == ["low", "moderate"]
+
+    def test_필수_열_누락(self):
+        """필수 생체신호 열이 없으면 RuntimeError"""
+        with pytest.raises(RuntimeError):
+            RiskScorer().score_frame(pd.DataFrame({"heart_rate": [75]}))
+
+
+class TestScoreFile:
+    """파일 스트리밍 테스트"""
+
+    @pytest.fixture
+    def sample_frame(self):
+        return pd.DataFrame({
+            "heart_rate": [75, 150, 55, 90, 120],
+            "blood_pressure_sys": [120, 180, 85, 130, 150],
+            "blood_pressure_dia": [80, 100, 60, 85, 95],
+            "body_temperature": [36.5, 39.5, 36.0, 37.0, 38.5],
+            "severity": [0, 3, 1, 2, 0],
+        })
+
+    def test_csv_청크_스트리밍(self, tmp_path, sample_frame):
+        """청크 크기보다 큰 CSV도 전체 행 산정 (헤더 1회)"""
+        src, dst = tmp_path / "in.csv", tmp_path / "out.csv"
+        sample_frame.to_csv(src, index=False)
+
+        assert score_file(src, dst, chunk_size=2) == 5
+        out = pd.read_csv(dst)
+        expected = RiskScorer().score_frame(sample_frame)
+        assert out["risk_score"].tolist() == expected["risk_score"].tolist()
+
+    def test_parquet_입출력(self, tmp_path, sample_frame):
+        """Parquet 입력 → Parquet 출력"""
+        pytest.importorskip("pyarrow")
+        src, dst = tmp_path / "in.parquet", tmp_path / "out.parquet"
+        sample_frame.to_parquet(src, index=False)
+
+        assert score_file(src, dst, chunk_size=3) == 5
+        assert len(pd.read_parquet(dst)) == 5
+
+    def test_지원하지_않는_형식(self, tmp_path):
+        """csv/parquet 외 형식은 RuntimeError"""
+        src = tmp_path / "in.json"
+        src.write_text("{}", encoding="utf-8")
+        with pytest.raises(RuntimeError):
+            score_file(src, tmp_path / "out.csv")
+
+    def test_benchmark_처리량(self):
+        """벤치마크는 양수 처리량 반환"""
+        assert benchmark(1000) > 0
+
+
+class TestSynthesisKeywordScorer:
+    """종합 판단 키워드 점수기 테스트"""
+
+    def test_기본_설정_그룹당_상한(self):
+        """기본 설정: 위험 키워드 여러 개여도 +10, 주의 +5"""
+        from models.risk_scorer import get_synthesis_keyword_scorer
+
+        result = get_synthesis_keyword_scorer().score("급성 폐렴 의심, 응급 처치 후 경과 관찰")
+        assert result.points == 15
+        assert result.group_points == {"high": 10, "moderate": 5}
+        assert result.matched == ("급성", "폐렴", "응급", "관찰")
+
+    def test_가중치_누적(self):
+        """max_points를 올리면 서로 다른 키워드 가중치 누적 (같은 키워드 반복은 1회)"""
+        from models.risk_scorer import SynthesisKeywordScorer
+
+        scorer = SynthesisKeywordScorer({
+            "synthesis_keywords": {
+                "high": {"max_points": 30, "terms": {"응급": 10, "폐렴": 15}},
+            },
+        })
+        assert scorer.score("응급 응급 폐렴").points == 25
+        assert scorer.score("해당 없음").points == 0
+
+    def test_스트리밍_누적_점수(self):
+        """토큰 단위 입력으로 종합 판단 완료 전 점수 추정"""
+        from models.risk_scorer import get_synthesis_keyword_scorer
+
+        stream = get_synthesis_keyword_scorer().stream()
+        assert stream.feed("현재 상태는 ").points == 0
+        assert stream.feed("긴").points == 0
+        assert stream.feed("급합니다").points == 10
+        assert stream.feed(" 주의").points == 15
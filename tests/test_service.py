@@ -0,0 +1,166 @@
+"""HTTP 추론 서비스 테스트 (TestClient, 스레드 풀 + 모킹 분류기)"""
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.testclient import TestClient
+
+from schemas.auscultation import AuscultationResult
+from service.server import create_app
+from service.workers import BoundedPool, PoolFull, WorkerPools
+
+_ROUTINE_REQUEST = {"symptoms": {"checklist": ["기침"], "severity": "경미"}}
+
+
+def _pools(ast_queue: int = 2, analysis_workers: int = 2, analysis_queue: int = 2) -> WorkerPools:
+    return WorkerPools({
+        "ast": {"executor": "thread", "workers": 1, "queue_size": ast_queue},
+        "analysis": {"workers": analysis_workers, "queue_size": analysis_queue},
+    })
+
+
+@pytest.fixture(autouse=True)
+def _no_trace_export():
+    """요청마다 트레이스 파일이 기록되지 않도록 차단"""
+    with patch("utils.tracing.export_trace") as mock_export:
+        yield mock_export
+
+
+@pytest.fixture
+def client():
+    with TestClient(create_app(_pools())) as c:
+        yield c
+
+
+class TestBoundedPool:
+    """대기열 상한 테스트"""
+
+    def test_상한_초과시_PoolFull(self):
+        pool = BoundedPool("테스트", ThreadPoolExecutor(max_workers=1), workers=1, queue_size=1)
+        release = threading.Event()
+        futures = [pool.submit(release.wait), pool.submit(release.wait)]
+        assert pool.pending == 2
+        with pytest.raises(PoolFull):
+            pool.submit(release.wait)
+
+        release.set()
+        for f in futures:
+            f.result(timeout=1)
+        assert pool.pending == 0
+        assert pool.submit(lambda: 1).result(timeout=1) == 1
+        pool.shutdown()
+
+
+class TestEndpoints:
+    """엔드포인트 테스트"""
+
+    def test_health(self, client):
+        body = client.get("/health").json()
+        assert body["status"] == "ok"
+        assert body["pools"]["analysis"] == {"pending": 0, "capacity": 4}
+        assert "ready" in body
+
+    def test_ready(self, client):
+        from utils import warmup
+
+        warmup.reset()
+        try:
+            assert client.get("/ready").status_code == 200
+
+            warmup.start_warmup({"llm": MagicMock(side_effect=RuntimeError("연결 불가"))},
+                                config={"enabled": True}).join(timeout=5)
+            response = client.get("/ready")
+            assert response.status_code == 503
+            assert response.json()["components"]["llm"]["status"] == "failed"
+        finally:
+            warmup.reset()
+
+    def test_AST_워밍업은_풀에서_실행(self):
+        from service.server import _warmup_tasks
+
+        pools = MagicMock()
+        pools.warmup.return_value.result.return_value = True
+        tasks = _warmup_tasks(pools)
+        assert tasks["ast"]() is True
+        pools.warmup.assert_called_once()
+
+    def test_classify(self, client):
+        classifier = MagicMock()
+        classifier.classify.return_value = AuscultationResult(
+            file_name="tmp.wav", classification="Crackle", confidence=0.7,
+            probabilities={"Normal": 0.1, "Crackle": 0.7, "Wheeze": 0.1, "Both": 0.1},
+        )
+        with patch("service.workers._get_classifier", return_value=classifier):
+            response = client.post(
+                "/classify", files={"audio": ("lung.wav", b"RIFF....", "audio/wav")}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["classification"] == "Crackle"
+        assert response.json()["file_name"] == "lung.wav"
+        classifier.classify.assert_called_once()
+
+    def test_classify_입력_검증(self, client):
+        assert client.post("/classify", data={"x": "1"}).status_code == 400
+        mp3 = {"audio": ("a.mp3", b"x", "audio/mpeg")}
+        assert client.post("/classify", files=mp3).status_code == 415
+
+    @pytest.mark.parametrize("filename", ["", None])
+    def test_classify_파일_이름_없음(self, client, filename):
+        """파일 이름 없는 업로드 파트는 500이 아니라 400"""
+        import io
+
+        from starlette.datastructures import FormData, UploadFile
+
+        form = FormData([("audio", UploadFile(io.BytesIO(b"RIFF"), filename=filename))])
+        request_form = AsyncMock(return_value=form)
+        with patch("starlette.requests.Request.form", request_form):
+            response = client.post(
+                "/classify", files={"audio": ("lung.wav", b"RIFF", "audio/wav")}
+            )
+        assert response.status_code == 400
+
+    def test_analyze(self, client, _no_trace_export):
+        """루틴 입력 → LLM 없이 전체 그래프 완료, 시간 요약 포함"""
+        response = client.post("/analyze", json=_ROUTINE_REQUEST)
+        assert response.status_code == 200
+        body = response.json()
+        assert body["risk_assessment"]["level"] == "low"
+        assert body["recommendation"]
+        assert body["trace_id"] == body["timing"]["trace_id"]
+        _no_trace_export.assert_called_once()
+
+    def test_analyze_입력_검증(self, client):
+        response = client.post("/analyze", json={"vitals": {"heart_rate": 999}})
+        assert response.status_code == 422
+
+    def test_analyze_stream(self, client):
+        with client.stream("POST", "/analyze/stream", json=_ROUTINE_REQUEST) as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            text = "".join(response.iter_text())
+
+        events = []
+        for block in text.strip().split("\n\n"):
+            event_line, data_line = block.split("\n")[:2]
+            events.append(
+                (event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: ")))
+            )
+        assert [e for e, _ in events] == ["node", "node", "result"]
+        assert [d["node"] for _, d in events[:2]] == ["input_validator", "routine_node"]
+        assert events[-1][1]["recommendation"]
+
+    def test_대기열_가득_차면_429(self):
+        release = threading.Event()
+        pools = _pools(analysis_workers=1, analysis_queue=0)
+        with TestClient(create_app(pools)) as c:
+            blocker = pools.analysis.submit(release.wait)
+            response = c.post("/analyze", json=_ROUTINE_REQUEST)
+            release.set()
+            blocker.result(timeout=1)
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "5"
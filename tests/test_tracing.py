@@ -0,0 +1,130 @@
+"""요청 트레이싱 유틸리티 테스트"""
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utils.tracing import annotate, current_trace, export_trace, span, start_trace, traced_node
+
+
+class TestSpans:
+    """스팬 기록 테스트"""
+
+    def test_트레이스_없으면_무동작(self):
+        with span("noop") as s:
+            annotate(x=1)
+        assert s is None
+        assert current_trace() is None
+
+    def test_중첩_스팬_부모_연결(self):
+        with start_trace(export=False) as trace:
+            with span("outer") as outer:
+                with span("inner", k="v") as inner:
+                    annotate(cache_hit=True)
+
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert inner.attributes == {"k": "v", "cache_hit": True}
+        assert [s.name for s in trace.spans] == ["inner", "outer"]
+        assert outer.duration_ms >= inner.duration_ms
+
+    def test_예외_기록(self):
+        with start_trace(export=False) as trace:
+            with pytest.raises(ValueError):
+                with span("fail"):
+                    raise ValueError("boom")
+        assert trace.spans[0].attributes["error"] == "ValueError: boom"
+
+    def test_요약_집계(self):
+        with start_trace(trace_id="abc", export=False) as trace:
+            for tokens in (10, 20):
+                with span("llm.generate") as s:
+                    s.set(input_tokens=tokens, output_tokens=1)
+            with span("node.literature_node", cache_hit=True):
+                pass
+
+        summary = trace.summary()
+        assert summary["trace_id"] == "abc"
+        assert summary["spans"]["llm.generate"]["count"] == 2
+        assert summary["tokens"] == {"input": 30, "output": 2}
+        assert summary["cache_hits"] == 1
+        assert summary["total_ms"] >= summary["spans"]["llm.generate"]["total_ms"]
+
+
+class TestExport:
+    """내보내기 테스트"""
+
+    def test_jsonl_chrome(self, tmp_path):
+        with start_trace(export=False) as trace:
+            with span("a", n=1):
+                pass
+
+        trace.to_jsonl(tmp_path / "spans.jsonl")
+        trace.to_jsonl(tmp_path / "spans.jsonl")
+        lines = (tmp_path / "spans.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        record = json.loads(lines[0])
+        assert record["trace_id"] == trace.trace_id
+        assert record["attributes"] == {"n": 1}
+
+        chrome = json.loads(trace.to_chrome(tmp_path / "t.trace.json").read_text(encoding="utf-8"))
+        event = chrome["traceEvents"][0]
+        assert event["ph"] == "X" and event["name"] == "a" and event["dur"] >= 0
+
+    def test_config_기반_내보내기(self, tmp_path):
+        config = {"tracing": {"enabled": True, "export_dir": str(tmp_path), "jsonl": True, "chrome_trace": True}}
+        with patch("utils.tracing.get_app_config", return_value=config):
+            with start_trace() as trace:
+                with span("a"):
+                    pass
+        assert (tmp_path / "spans.jsonl").exists()
+        assert (tmp_path / f"{trace.trace_id}.trace.json").exists()
+
+    def test_비활성시_내보내지_않음(self, tmp_path):
+        config = {"tracing": {"enabled": False, "export_dir": str(tmp_path)}}
+        with patch("utils.tracing.get_app_config", return_value=config):
+            with start_trace(export=False) as trace:
+                with span("a"):
+                    pass
+            assert export_trace(trace) == []
+        assert not list(tmp_path.iterdir())
+
+
+class TestInstrumentation:
+    """노드 래퍼 / 계측 지점 테스트"""
+
+    def test_노드_래퍼(self):
+        node = traced_node("vitals_node", lambda state: {"vitals_evaluation": "ok"})
+        assert node({}) == {"vitals_evaluation": "ok"}
+
+        with start_trace(export=False) as trace:
+            update = node({})
+        assert update["trace_id"] == trace.trace_id
+        assert update["timing"]["spans"]["node.vitals_node"]["count"] == 1
+
+    def test_LLM_토큰_기록(self):
+        from models.llm_client import LLMClient
+
+        client = LLMClient()
+        response = MagicMock(content="응답", usage_metadata={"input_tokens": 12, "output_tokens": 3})
+        client._llm = MagicMock()
+        client._llm.invoke.return_value = response
+
+        with start_trace(export=False) as trace:
+            assert client.generate("질문") == "응답"
+        assert trace.summary()["tokens"] == {"input": 12, "output": 3}
+
+    def test_벽시계_상한_실행도_같은_트레이스(self):
+        from utils.deadline import run_with_timeout
+
+        def work():
+            with span("worker"):
+                return 1
+
+        with start_trace(export=False) as trace:
+            with span("caller") as caller:
+                run_with_timeout(work, 1.0)
+        worker = next(s for s in trace.spans if s.name == "worker")
+        assert worker.parent_id == caller.span_id
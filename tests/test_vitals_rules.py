@@ -0,0 +1,121 @@
+"""생체신호 규칙 엔진 테스트"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from models.vitals_rules import evaluate_vitals, get_vitals_rules
+from schemas.vitals import VitalSigns, VitalsFindings
+
+
+class TestVitalsRuleEngine:
+    """vitals_reference.yaml 기반 구간 분류 테스트"""
+
+    def test_디폴트_정상(self):
+        """디폴트 생체신호는 이상 소견 없음"""
+        findings = evaluate_vitals(VitalSigns())
+        assert isinstance(findings, VitalsFindings)
+        assert findings.flags == []
+        assert findings.heart_rate_band == "normal"
+
+    @pytest.mark.parametrize(
+        ("heart_rate", "band", "flag"),
+        [
+            (39, "critical_low", "bradycardia"),
+            (40, "critical_low", "bradycardia"),
+            (41, "warning_low", "bradycardia"),
+            (59, "low", "bradycardia"),
+            (60, "normal", None),
+            (100, "normal", None),
+            (101, "high", "tachycardia"),
+            (149, "warning_high", "tachycardia"),
+            (150, "critical_high", "tachycardia"),
+            (151, "critical_high", "tachycardia"),
+        ],
+    )
+    def test_심박수_경계(self, heart_rate, band, flag):
+        """정상 max는 포함, 초과부터 빈맥 / 위급 임계값(40, 150)은 위급 구간에 포함"""
+        findings = evaluate_vitals(VitalSigns(heart_rate=heart_rate))
+        assert findings.heart_rate_band == band
+        assert findings.flags == ([flag] if flag else [])
+
+    def test_혈압_구간(self):
+        """수축기 140 이상 또는 이완기 90 이상이면 고혈압, 수축기 90 미만이면 저혈압"""
+        assert evaluate_vitals(VitalSigns(blood_pressure_sys=120)).systolic_band == "normal"
+        assert evaluate_vitals(VitalSigns(blood_pressure_sys=125)).systolic_band == "elevated"
+        assert evaluate_vitals(VitalSigns(blood_pressure_sys=139)).flags == []
+        assert evaluate_vitals(VitalSigns(blood_pressure_sys=140)).has("hypertension")
+        assert evaluate_vitals(VitalSigns(blood_pressure_dia=90)).has("hypertension")
+        assert evaluate_vitals(VitalSigns(blood_pressure_sys=85)).has("hypotension")
+
+    def test_체온_구간(self):
+        """미열은 구간만 기록, 발열 구간부터 이상 소견"""
+        low_grade = evaluate_vitals(VitalSigns(body_temperature=37.5))
+        assert low_grade.temperature_band == "low_grade_fever"
+        assert low_grade.flags == []
+        assert evaluate_vitals(VitalSigns(body_temperature=38.1)).has("fever")
+        assert evaluate_vitals(VitalSigns(body_temperature=34.5)).has("hypothermia")
+
+    def test_배치_평가_단건과_일치(self):
+        """배치 경로 결과가 단건 평가와 동일"""
+        rules = get_vitals_rules()
+        records = [
+            VitalSigns(),
+            VitalSigns(heart_rate=130, body_temperature=39.5),
+            VitalSigns(blood_pressure_sys=85, heart_rate=45),
+        ]
+        batch = rules.evaluate_batch(np.array([
+            [v.heart_rate, v.blood_pressure_sys, v.blood_pressure_dia, v.body_temperature]
+            for v in records
+        ]))
+        assert len(batch) == 3
+        assert batch.any_abnormal().tolist() == [False, True, True]
+        for i, vitals in enumerate(records):
+            single = rules.evaluate(vitals)
+            assert [f for f, mask in batch.flags.items() if mask[i]] == single.flags
+            assert batch.bands["temperature"][i] == single.temperature_band
+
+    def test_위급_구간(self):
+        assert evaluate_vitals(VitalSigns()).critical == []
+        assert evaluate_vitals(VitalSigns(heart_rate=35)).critical == ["heart_rate"]
+        crisis = VitalSigns(blood_pressure_sys=185, blood_pressure_dia=125)
+        assert evaluate_vitals(crisis).critical == ["systolic", "diastolic"]
+        assert evaluate_vitals(VitalSigns(body_temperature=41.2)).critical == ["temperature"]
+
+    @pytest.mark.parametrize(
+        ("vitals", "critical"),
+        [
+            (VitalSigns(heart_rate=150), ["heart_rate"]),
+            (VitalSigns(heart_rate=149), []),
+            (VitalSigns(heart_rate=40), ["heart_rate"]),
+            (VitalSigns(heart_rate=41), []),
+            (VitalSigns(blood_pressure_sys=180), ["systolic"]),
+            (VitalSigns(blood_pressure_sys=179), []),
+            (VitalSigns(blood_pressure_dia=120), ["diastolic"]),
+            (VitalSigns(blood_pressure_dia=119), []),
+        ],
+    )
+    def test_위급_경계값(self, vitals, critical):
+        """위급 임계값 자체는 위급 (심박수 40 이하 / 150 이상, 수축기 180 이상, 이완기 120 이상)"""
+        findings = evaluate_vitals(vitals)
+        assert findings.critical == critical
+        if critical:
+            band = {"heart_rate": findings.heart_rate_band, "systolic": findings.systolic_band,
+                    "diastolic": findings.diastolic_band}[critical[0]]
+            assert band in ("critical_low", "critical_high", "crisis")
+
+    def test_배치_입력_형상_검증(self):
+        """열 개수가 다르면 ValueError"""
+        with pytest.raises(ValueError):
+            get_vitals_rules().evaluate_batch(np.zeros((2, 3)))
+
+    def test_설정_스냅샷당_1회_컴파일(self):
+        """설정이 그대로면 같은 엔진 재사용"""
+        assert get_vitals_rules() is get_vitals_rules()
+
+    def test_표시용_경계값(self):
+        """lower_bound는 YAML 원래 값"""
+        bands = get_vitals_rules().bands
+        assert bands["systolic"].lower_bound("high_stage2") == 140
+        assert bands["heart_rate"].lower_bound("high") == 100
+        assert bands["temperature"].lower_bound("fever") == 38.1
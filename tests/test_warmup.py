@@ -0,0 +1,119 @@
+"""백그라운드 워밍업 + 준비 상태 테스트"""
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from utils import warmup
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    warmup.reset()
+    yield
+    warmup.reset()
+
+
+def _run(tasks, **config):
+    thread = warmup.start_warmup(tasks, config={"enabled": True, **config})
+    if thread is not None:
+        thread.join(timeout=5)
+    return warmup.readiness()
+
+
+class TestStartWarmup:
+    """워밍업 실행/상태 테스트"""
+
+    def test_완료시_ready(self):
+        calls = []
+        state = _run({"ast": lambda: calls.append("ast"), "llm": lambda: calls.append("llm")})
+
+        assert calls == ["ast", "llm"]
+        assert state["ready"] is True
+        assert state["components"]["ast"]["status"] == "ready"
+        assert state["components"]["llm"]["seconds"] is not None
+
+    def test_실패시_not_ready(self):
+        def boom():
+            raise RuntimeError("Ollama 연결 불가")
+
+        state = _run({"ast": lambda: None, "llm": boom})
+
+        assert state["ready"] is False
+        assert state["components"]["ast"]["status"] == "ready"
+        assert state["components"]["llm"]["status"] == "failed"
+        assert "Ollama" in state["components"]["llm"]["error"]
+
+    def test_False_반환은_실패(self):
+        """AST 풀 워밍업(warm_classifier)은 예외 대신 False 반환"""
+        state = _run({"ast": lambda: False})
+        assert state["components"]["ast"]["status"] == "failed"
+
+    def test_진행_중_상태(self):
+        import threading
+
+        release = threading.Event()
+        thread = warmup.start_warmup({"ast": release.wait}, config={"enabled": True})
+        try:
+            state = warmup.readiness()
+            assert state["ready"] is False
+            assert state["components"]["ast"]["status"] in ("pending", "loading")
+        finally:
+            release.set()
+            thread.join(timeout=5)
+        assert warmup.readiness()["ready"] is True
+
+    def test_프로세스당_1회(self):
+        calls = []
+        first = warmup.start_warmup({"ast": lambda: calls.append(1)}, config={"enabled": True})
+        second = warmup.start_warmup({"ast": lambda: calls.append(2)}, config={"enabled": True})
+        first.join(timeout=5)
+
+        assert first is second
+        assert calls == [1]
+
+    def test_비활성시_skipped(self):
+        task = MagicMock()
+        thread = warmup.start_warmup({"ast": task}, config={"enabled": False})
+
+        assert thread is None
+        task.assert_not_called()
+        state = warmup.readiness()
+        assert state["ready"] is True
+        assert state["components"]["ast"]["status"] == "skipped"
+
+    def test_config_구성요소_선택(self):
+        with patch.dict(warmup.WARMUP_TASKS, {"ast": MagicMock(), "llm": MagicMock()}):
+            state = _run(None, components=["llm"])
+            warmup.WARMUP_TASKS["llm"].assert_called_once()
+            warmup.WARMUP_TASKS["ast"].assert_not_called()
+        assert list(state["components"]) == ["llm"]
+
+    def test_알_수_없는_구성요소(self):
+        with pytest.raises(RuntimeError, match="알 수 없는 워밍업 구성요소"):
+            warmup.start_warmup(config={"enabled": True, "components": ["gpu"]})
+
+
+class TestLLMPreload:
+    """Ollama 모델 사전 적재 요청 테스트"""
+
+    def test_keep_alive_요청(self):
+        from models.llm_client import LLMClient
+
+        client = LLMClient()
+        with patch("httpx.post") as mock_post:
+            client.preload()
+
+        url = mock_post.call_args.args[0]
+        assert url.endswith("/api/generate")
+        assert mock_post.call_args.kwargs["json"] == {"model": client.model, "keep_alive": client.keep_alive}
+        assert client._llm.keep_alive == client.keep_alive
+
+    def test_연결_실패시_RuntimeError(self):
+        from models.llm_client import LLMClient
+
+        with patch("httpx.post", side_effect=httpx.ConnectError("refused")):
+            with pytest.raises(RuntimeError, match="사전 적재 실패"):
+                LLMClient().preload()
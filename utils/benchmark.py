@@ -0,0 +1,260 @@
+"""성능 벤치마크 — 반복 측정, JSON 리포트, 커밋된 기준선 대비 회귀 검사"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
+
+import numpy as np
+
+from utils.config_loader import get_app_config
+
+# 프로젝트 루트 (상대 리포트/기준선 경로 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+REPORT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """벤치마크 하나의 측정 결과 (시간 단위: ms)"""
+
+    name: str
+    params: dict[str, Any]
+    repeats: int
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+
+    @property
+    def key(self) -> str:
+        """기준선 매칭 키 (이름 + 파라미터)"""
+        if not self.params:
+            return self.name
+        return f"{self.name}[{','.join(f'{k}={v}' for k, v in sorted(self.params.items()))}]"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """기준선 대비 결과 하나 (ratio: 보정된 기준선 대비 현재 최솟값 배율)"""
+
+    key: str
+    baseline_ms: float
+    current_ms: float
+    ratio: float
+    regressed: bool
+
+
+@dataclass
+class BenchRecorder:
+    """벤치마크 세션 동안 측정 결과 수집"""
+
+    repeats: int = 5
+    warmup: int = 1
+    results: list[BenchResult] = field(default_factory=list)
+
+    def measure(
+        self,
+        name: str,
+        fn: Callable[[], Any],
+        repeats: Optional[int] = None,
+        **params: Any,
+    ) -> BenchResult:
+        """fn을 warmup회 실행 후 repeats회 측정해 기록"""
+        repeats = repeats or self.repeats
+        for _ in range(self.warmup):
+            fn()
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        result = BenchResult(
+            name=name,
+            params=params,
+            repeats=repeats,
+            median_ms=round(statistics.median(samples), 3),
+            p95_ms=round(float(np.percentile(samples, 95)), 3),
+            min_ms=round(min(samples), 3),
+        )
+        self.results.append(result)
+        return result
+
+
+def resolve_path(path: str | Path) -> Path:
+    """상대 경로는 프로젝트 루트 기준"""
+    path = Path(path)
+    return path if path.is_absolute() else _PROJECT_ROOT / path
+
+
+def calibrate(repeats: int = 5) -> float:
+    """
+    머신 속도 보정용 기준 작업 시간 (ms, median).
+
+    고정 크기 행렬곱 + FFT. 기준선과 현재 리포트의 보정값 비율로 기준선 시간을 스케일해
+    다른 머신에서 만든 기준선과도 대략 비교할 수 있게 한다.
+    """
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((256, 256)).astype(np.float32)
+    signal = rng.standard_normal(1 << 16).astype(np.float32)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(10):
+            matrix @ matrix
+            np.fft.rfft(signal)
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def host_info() -> dict[str, Any]:
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def build_report(results: list[BenchResult], calibration_ms: float) -> dict[str, Any]:
+    return {
+        "format_version": REPORT_FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": host_info(),
+        "calibration_ms": calibration_ms,
+        "results": {r.key: asdict(r) for r in results},
+    }
+
+
+def compare(
+    report: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    tolerance: float = 0.25,
+    min_delta_ms: float = 1.0,
+) -> list[Comparison]:
+    """
+    기준선 대비 비교.
+
+    반복 측정의 최솟값(스케줄링/캐시 잡음이 가장 적은 값)끼리 비교한다. 기준선 값을 보정값 비율
+    (현재/기준선)로 스케일한 뒤, 현재 값이 (1 + tolerance)배를 넘고 차이가 min_delta_ms 이상이면
+    회귀로 판정한다 (1ms 미만 측정의 잡음 무시).
+    한쪽에만 있는 항목은 비교하지 않는다.
+    """
+    scale = 1.0
+    if baseline.get("calibration_ms"):
+        scale = report["calibration_ms"] / baseline["calibration_ms"]
+    comparisons = []
+    for key, current in report["results"].items():
+        previous = baseline["results"].get(key)
+        if previous is None:
+            continue
+        expected = previous["min_ms"] * scale
+        ratio = current["min_ms"] / expected if expected > 0 else 1.0
+        comparisons.append(Comparison(
+            key=key,
+            baseline_ms=round(expected, 3),
+            current_ms=current["min_ms"],
+            ratio=round(ratio, 3),
+            regressed=ratio > 1 + tolerance and current["min_ms"] - expected >= min_delta_ms,
+        ))
+    return comparisons
+
+
+def write_report(
+    results: list[BenchResult],
+    config: Optional[Mapping[str, Any]] = None,
+    calibration_ms: Optional[float] = None,
+) -> tuple[dict[str, Any], list[Comparison]]:
+    """
+    리포트(JSON) 저장 + 기준선 비교 결과를 리포트에 포함.
+
+    Args:
+        config: config/app.yaml benchmark 섹션 (테스트에서 주입)
+
+    Returns:
+        (리포트, 비교 결과 — 기준선이 없으면 빈 목록)
+    """
+    config = config if config is not None else get_app_config().get("benchmark", {})
+    report = build_report(results, calibration_ms if calibration_ms is not None else calibrate())
+
+    comparisons: list[Comparison] = []
+    baseline_path = resolve_path(config.get("baseline", "tests/benchmark_baseline.json"))
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        comparisons = compare(
+            report, baseline, config.get("tolerance", 0.25), config.get("min_delta_ms", 1.0)
+        )
+        report["baseline"] = {
+            "path": str(baseline_path),
+            "same_host": baseline.get("host") == report["host"],
+            "comparisons": [asdict(c) for c in comparisons],
+        }
+
+    report_path = resolve_path(config.get("report", "data/benchmark_report.json"))
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return report, comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    lines = [f"{'벤치마크':60s} {'기준선(ms)':>11s} {'현재(ms)':>10s} {'배율':>6s}"]
+    for c in sorted(comparisons, key=lambda c: -c.ratio):
+        mark = " ✗ 회귀" if c.regressed else ""
+        lines.append(f"{c.key:60s} {c.baseline_ms:11.2f} {c.current_ms:10.2f} {c.ratio:6.2f}{mark}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    bench_config = get_app_config().get("benchmark", {})
+
+    parser = argparse.ArgumentParser(description="벤치마크 리포트 비교 / 기준선 갱신")
+    parser.add_argument(
+        "command", choices=["compare", "promote"],
+        help="compare: 리포트를 기준선과 비교, promote: 리포트를 새 기준선으로 복사",
+    )
+    parser.add_argument(
+        "--report", type=str, default=None, help="리포트 경로 (기본: config benchmark.report)"
+    )
+    parser.add_argument(
+        "--baseline", type=str, default=None, help="기준선 경로 (기본: config benchmark.baseline)"
+    )
+    args = parser.parse_args()
+
+    report_file = resolve_path(
+        args.report or bench_config.get("report", "data/benchmark_report.json")
+    )
+    baseline_file = resolve_path(
+        args.baseline or bench_config.get("baseline", "tests/benchmark_baseline.json")
+    )
+    if not report_file.exists():
+        sys.exit(
+            f"리포트가 없습니다: {report_file} "
+            "(python -m pytest tests/test_benchmarks.py --benchmark 로 생성)"
+        )
+
+    if args.command == "promote":
+        current = json.loads(report_file.read_text(encoding="utf-8"))
+        current.pop("baseline", None)
+        baseline_file.write_text(
+            json.dumps(current, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+        print(f"✓ 기준선 갱신: {baseline_file} (항목 {len(current['results'])}개)")
+    else:
+        if not baseline_file.exists():
+            sys.exit(f"기준선이 없습니다: {baseline_file}")
+        result = compare(
+            json.loads(report_file.read_text(encoding="utf-8")),
+            json.loads(baseline_file.read_text(encoding="utf-8")),
+            bench_config.get("tolerance", 0.25),
+            bench_config.get("min_delta_ms", 1.0),
+        )
+        print(format_comparisons(result))
+        sys.exit(1 if any(c.regressed for c in result) else 0)
@@ -1,8 +1,13 @@
-"""YAML 설정 파일 로더 유틸리티"""
+"""YAML 설정 파일 로더 유틸리티 — 프로세스 단위 캐시 + mtime 기반 자동 갱신"""
 from __future__ import annotations
 
 import logging
+import os
+import threading
+from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 import yaml
 
@@ -11,52 +16,166 @@ logger = logging.getLogger(__name__)
 # 프로젝트 루트 기준 config 디렉토리 경로
 CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
 
+# 설정 파일별 필수 최상위 섹션 (로딩 시 검증, 누락되면 캐시하지 않음)
+REQUIRED_SECTIONS: dict[str, tuple[str, ...]] = {
+    "llm": ("ollama",),
+    "ast_model": ("model", "audio"),
+    "vitals_reference": ("heart_rate", "blood_pressure", "body_temperature"),
+    "app": ("app",),
+    "literature": ("active_sources", "common", "pubmed"),
+    "risk": ("synthesis_keywords", "emergency", "fast_path"),
+}
 
-def load_config(name: str) -> dict:
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    파싱·검증된 설정 파일 스냅샷 (불변).
+
+    data는 읽기 전용 매핑(하위 dict → MappingProxyType, list → tuple)이라
+    호출자가 수정해도 캐시가 오염되지 않는다.
     """
-    YAML 설정 파일 로딩.
+
+    name: str
+    path: Path
+    mtime_ns: int
+    data: Mapping[str, Any]
+
+
+def _freeze(value: Any) -> Any:
+    """파싱 결과를 재귀적으로 읽기 전용 구조로 변환"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _validate(name: str, config: Any, path: Path) -> None:
+    """최상위 구조 및 필수 섹션 검증"""
+    if not isinstance(config, dict):
+        raise RuntimeError(f"설정 파일 최상위는 매핑이어야 합니다: {path}")
+    missing = [s for s in REQUIRED_SECTIONS.get(name, ()) if s not in config]
+    if missing:
+        raise RuntimeError(f"설정 파일 필수 섹션 누락: {path.name} ({', '.join(missing)})")
+
+
+_SNAPSHOTS: dict[str, ConfigSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def _watch_enabled() -> bool:
+    """mtime 감시 여부 (STETHO_CONFIG_WATCH=0이면 최초 로딩 후 파일 변경 무시)"""
+    return os.environ.get("STETHO_CONFIG_WATCH", "1") != "0"
+
+
+def _parse(name: str, path: Path, mtime_ns: int) -> ConfigSnapshot:
+    with open(path, encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    _validate(name, config, path)
+    logger.info("설정 파일 로딩 완료: %s", path.name)
+    return ConfigSnapshot(name=name, path=path, mtime_ns=mtime_ns, data=_freeze(config))
+
+
+def get_config_snapshot(name: str, force_reload: bool = False) -> ConfigSnapshot:
+    """
+    캐시된 설정 스냅샷 조회.
+
+    최초 호출 시 파싱하고, 이후에는 파일 mtime이 바뀐 경우에만 다시 파싱하여
+    스냅샷을 통째로 교체한다 (읽는 쪽은 항상 완전한 이전/새 스냅샷 중 하나를 봄).
 
     Args:
-        name: 설정 파일명 (확장자 제외). "llm", "ast_model", "vitals_reference", "app"
+        name: 설정 파일명 (확장자 제외)
+        force_reload: True면 mtime과 무관하게 다시 파싱
 
     Returns:
-        파싱된 설정 딕셔너리
+        ConfigSnapshot
 
     Raises:
         FileNotFoundError: 설정 파일이 존재하지 않을 때
+        RuntimeError: 설정 파일 구조가 잘못되었을 때
     """
+    snapshot = _SNAPSHOTS.get(name)
+    if snapshot is not None and not force_reload and not _watch_enabled():
+        return snapshot
+
     config_path = CONFIG_DIR / f"{name}.yaml"
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}") from None
+
+    if snapshot is not None and not force_reload and snapshot.mtime_ns == mtime_ns:
+        return snapshot
+
+    with _SNAPSHOTS_LOCK:
+        # 대기 중 다른 스레드가 이미 갱신했으면 재사용
+        current = _SNAPSHOTS.get(name)
+        if current is not None and current is not snapshot and current.mtime_ns == mtime_ns:
+            return current
+        fresh = _parse(name, config_path, mtime_ns)
+        if snapshot is not None:
+            logger.info("설정 파일 변경 감지 → 갱신: %s", config_path.name)
+        _SNAPSHOTS[name] = fresh
+        return fresh
+
+
+def load_config(name: str) -> Mapping[str, Any]:
+    """
+    YAML 설정 파일 로딩 (프로세스 단위 캐시).
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
+    Args:
+        name: 설정 파일명 (확장자 제외). "llm", "ast_model", "vitals_reference", "app"
 
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+    Returns:
+        파싱된 설정 (읽기 전용 매핑)
+
+    Raises:
+        FileNotFoundError: 설정 파일이 존재하지 않을 때
+        RuntimeError: 설정 파일 구조가 잘못되었을 때
+    """
+    return get_config_snapshot(name).data
 
-    logger.info("설정 파일 로딩 완료: %s", config_path.name)
-    return config
 
+def reload_config(name: Optional[str] = None) -> None:
+    """
+    설정 캐시 강제 갱신.
 
-def get_llm_config() -> dict:
+    Args:
+        name: 다시 읽을 설정 파일명 (None이면 캐시 전체 비움 → 다음 조회 시 재파싱)
+    """
+    if name is None:
+        with _SNAPSHOTS_LOCK:
+            _SNAPSHOTS.clear()
+        return
+    get_config_snapshot(name, force_reload=True)
+
+
+def get_llm_config() -> Mapping[str, Any]:
     """LLM 설정 로딩 (편의 함수)"""
     return load_config("llm")
 
 
-def get_ast_config() -> dict:
+def get_ast_config() -> Mapping[str, Any]:
     """AST 모델 설정 로딩 (편의 함수)"""
     return load_config("ast_model")
 
 
-def get_vitals_reference() -> dict:
+def get_vitals_reference() -> Mapping[str, Any]:
     """생체신호 정상 범위 기준 로딩 (편의 함수)"""
     return load_config("vitals_reference")
 
 
-def get_app_config() -> dict:
+def get_app_config() -> Mapping[str, Any]:
     """앱 일반 설정 로딩 (편의 함수)"""
     return load_config("app")
 
 
-def get_literature_config() -> dict:
+def get_literature_config() -> Mapping[str, Any]:
     """의학 문헌 검색 설정 로딩 (편의 함수)"""
     return load_config("literature")
+
+
+def get_risk_config() -> Mapping[str, Any]:
+    """위험도 평가 설정 로딩 (편의 함수)"""
+    return load_config("risk")
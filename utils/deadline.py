@@ -0,0 +1,90 @@
+"""요청 단위 지연 예산 유틸리티 — 전체 마감 시각 + 노드별 하위 예산"""
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Mapping, Optional, TypeVar
+
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 벽시계 상한이 필요한 호출(여러 HTTP 왕복 + 재시도)을 실행하는 공유 풀
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="deadline")
+
+
+class BudgetExceeded(RuntimeError):
+    """지연 예산 소진 (호출자는 대체 결과로 진행)"""
+
+
+def _budget_config() -> Mapping[str, Any]:
+    return get_app_config().get("latency_budget", {})
+
+
+def start_deadline(total_seconds: Optional[float] = None) -> Optional[float]:
+    """
+    요청 마감 시각 생성 (time.monotonic 기준 절대값).
+
+    Args:
+        total_seconds: 전체 예산 (None이면 config/app.yaml latency_budget.total_seconds)
+
+    Returns:
+        마감 시각 (예산 비활성 시 None)
+    """
+    config = _budget_config()
+    if total_seconds is None:
+        if not config.get("enabled", False):
+            return None
+        total_seconds = config.get("total_seconds", 90)
+    return time.monotonic() + total_seconds
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """남은 시간 (초, 마감 없으면 None)"""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def node_timeout(deadline: Optional[float], node: str) -> Optional[float]:
+    """
+    노드 호출에 쓸 타임아웃 = min(남은 시간, 노드 하위 예산).
+
+    Returns:
+        타임아웃 (초). 마감 없으면 None, min_call_seconds 미만이면 0.0 (호출 생략 신호)
+    """
+    left = remaining(deadline)
+    if left is None:
+        return None
+    config = _budget_config()
+    budget = config.get("nodes", {}).get(node)
+    timeout = left if budget is None else min(left, float(budget))
+    if timeout < config.get("min_call_seconds", 0):
+        return 0.0
+    return timeout
+
+
+def run_with_timeout(fn: Callable[[], T], timeout: Optional[float]) -> T:
+    """
+    벽시계 상한 실행.
+
+    HTTP 타임아웃이 요청 1회에만 적용되는 호출(여러 왕복, 재시도 대기 포함)에 사용.
+    초과 시 작업은 백그라운드에서 자체 타임아웃으로 끝나도록 두고 즉시 반환한다.
+
+    Raises:
+        BudgetExceeded: timeout 내에 끝나지 않았을 때
+    """
+    if timeout is None:
+        return fn()
+    # 컨텍스트 복사: 호출자의 트레이스/스팬이 작업 스레드에서도 이어지도록
+    future = _EXECUTOR.submit(contextvars.copy_context().run, fn)
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        future.cancel()
+        raise BudgetExceeded(f"지연 예산 {timeout:.1f}초 초과") from None
@@ -0,0 +1,150 @@
+"""import 시간 프로파일링 — `python -X importtime` 출력 파싱 + 기동 시간 예산 검사"""
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+from utils.config_loader import get_app_config
+
+# 프로젝트 루트 (하위 프로세스 작업 디렉토리)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass(frozen=True)
+class ImportEntry:
+    """importtime 한 줄 (시간 단위: 마이크로초)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    """모듈 하나를 새 인터프리터에서 import한 결과"""
+
+    target: str
+    entries: tuple[ImportEntry, ...]
+
+    @property
+    def modules(self) -> set[str]:
+        return {e.module for e in self.entries}
+
+    @property
+    def total_seconds(self) -> float:
+        """대상 모듈의 누적 import 시간"""
+        for entry in self.entries:
+            if entry.module == self.target:
+                return entry.cumulative_us / 1e6
+        return 0.0
+
+    def top(self, n: int = 15) -> list[ImportEntry]:
+        """누적 시간이 큰 대상 모듈의 직속 하위 import"""
+        target_depth = min((e.depth for e in self.entries if e.module == self.target), default=0)
+        children = [e for e in self.entries if e.depth == target_depth + 1]
+        return sorted(children, key=lambda e: e.cumulative_us, reverse=True)[:n]
+
+    def loaded(self, forbidden: list[str]) -> list[str]:
+        """로딩된 금지 모듈 (하위 패키지 포함: "torch"는 "torch.nn"도 해당)"""
+        modules = self.modules
+        return [
+            name for name in forbidden
+            if any(m == name or m.startswith(f"{name}.") for m in modules)
+        ]
+
+
+def parse_importtime(output: str) -> list[ImportEntry]:
+    """
+    `-X importtime` stderr 파싱.
+
+    형식: `import time: <self us> | <cumulative us> | <들여쓰기><모듈명>`
+    (들여쓰기 2칸 = 중첩 한 단계, 헤더 줄은 무시)
+    """
+    entries: list[ImportEntry] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        entries.append(
+            ImportEntry(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return entries
+
+
+def profile_imports(module: str) -> ImportProfile:
+    """
+    새 인터프리터에서 모듈 import 시간 측정.
+
+    Raises:
+        RuntimeError: import 실패 시
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=_PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        last = proc.stderr.strip().splitlines()[-1:] or [""]
+        raise RuntimeError(f"{module} import 실패: {last[0]}")
+    return ImportProfile(target=module, entries=tuple(parse_importtime(proc.stderr)))
+
+
+def check_startup_budget(
+    profile: ImportProfile,
+    config: Optional[Mapping[str, Any]] = None,
+) -> list[str]:
+    """
+    config/app.yaml startup 예산 검사.
+
+    Returns:
+        위반 사항 메시지 목록 (빈 목록이면 통과)
+    """
+    config = config if config is not None else get_app_config().get("startup", {})
+    violations: list[str] = []
+
+    loaded = profile.loaded(list(config.get("forbidden", [])))
+    if loaded:
+        violations.append(f"기동 시 로딩되면 안 되는 모듈: {', '.join(loaded)}")
+
+    max_seconds = config.get("max_import_seconds")
+    if max_seconds is not None and profile.total_seconds > max_seconds:
+        violations.append(f"import 시간 {profile.total_seconds:.2f}초 > 예산 {max_seconds:.2f}초")
+    return violations
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="import 시간 프로파일 + 기동 시간 예산 검사")
+    parser.add_argument("--module", type=str, default=None, help="측정 모듈 (기본: config startup.module)")
+    parser.add_argument("--top", type=int, default=15, help="표시할 하위 import 수")
+    args = parser.parse_args()
+
+    startup = get_app_config().get("startup", {})
+    target = args.module or startup.get("module", "app.main")
+
+    result = profile_imports(target)
+    print(f"{target}: {result.total_seconds:.3f}초 (모듈 {len(result.entries)}개)")
+    for entry in result.top(args.top):
+        print(f"  {entry.cumulative_us / 1000:9.1f}ms  {entry.module}")
+
+    problems = check_startup_budget(result, startup)
+    for problem in problems:
+        print(f"✗ {problem}")
+    if problems:
+        sys.exit(1)
+    print("✓ 기동 시간 예산 통과")
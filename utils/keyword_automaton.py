@@ -0,0 +1,122 @@
+"""다중 키워드 매칭 유틸리티 — Aho–Corasick 오토마톤 (단일 선형 패스, 스트리밍 입력 지원)"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Iterable
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """키워드 매칭 결과"""
+
+    keyword: str
+    index: int      # 오토마톤 생성 시 키워드 순서
+    end: int        # 입력 전체 기준 매칭 끝 위치 (exclusive)
+
+    @property
+    def start(self) -> int:
+        return self.end - len(self.keyword)
+
+
+class KeywordAutomaton:
+    """
+    키워드 집합을 컴파일한 Aho–Corasick 오토마톤.
+
+    - 입력 길이에 선형, 키워드 수와 무관하게 한 번 훑어 모든 (겹치는) 매칭을 찾음
+    - 대소문자 무시 (키워드/입력 모두 소문자 기준)
+    - 상태 전이만 보관하므로 KeywordStream으로 토큰 단위 입력도 경계 걸친 키워드까지 매칭
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self.keywords: tuple[str, ...] = tuple(kw.lower() for kw in keywords)
+        if not all(self.keywords):
+            raise ValueError("빈 키워드는 허용되지 않습니다")
+
+        # 1. 트라이 구성
+        terminal: list[list[int]] = [[]]
+        for idx, keyword in enumerate(self.keywords):
+            state = 0
+            for ch in keyword:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    terminal.append([])
+                state = nxt
+            terminal[state].append(idx)
+
+        # 2. BFS로 실패 링크 + 출력 집합 (실패 링크 따라 접미 키워드 병합)
+        self._out = [tuple(t) for t in terminal]
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def step(self, state: int, ch: str) -> int:
+        """한 글자 전이"""
+        while state and ch not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(ch, 0)
+
+    def outputs(self, state: int) -> tuple[int, ...]:
+        """해당 상태에서 끝나는 키워드 인덱스"""
+        return self._out[state]
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        """텍스트 전체 매칭 (등장 순서)"""
+        stream = KeywordStream(self)
+        return stream.feed(text)
+
+    def stream(self) -> KeywordStream:
+        """스트리밍 매처 생성"""
+        return KeywordStream(self)
+
+
+class KeywordStream:
+    """
+    청크 단위 입력 매처 (LLM 스트리밍 토큰 등).
+
+    오토마톤 상태를 청크 사이에 유지하므로 키워드가 토큰 경계에 걸쳐도 매칭된다.
+    """
+
+    def __init__(self, automaton: KeywordAutomaton) -> None:
+        self._automaton = automaton
+        self._state = 0
+        self._offset = 0
+        self.matches: list[KeywordMatch] = []
+
+    def feed(self, chunk: str) -> list[KeywordMatch]:
+        """
+        청크 입력.
+
+        Returns:
+            이번 청크에서 새로 완성된 매칭
+        """
+        automaton = self._automaton
+        found: list[KeywordMatch] = []
+        state = self._state
+        for i, ch in enumerate(chunk.lower()):
+            state = automaton.step(state, ch)
+            for idx in automaton.outputs(state):
+                found.append(KeywordMatch(automaton.keywords[idx], idx, self._offset + i + 1))
+        self._state = state
+        self._offset += len(chunk)
+        self.matches.extend(found)
+        return found
+
+    def matched_keywords(self) -> list[str]:
+        """지금까지 매칭된 서로 다른 키워드 (첫 등장 순서)"""
+        return list(dict.fromkeys(m.keyword for m in self.matches))
+
@@ -0,0 +1,323 @@
+"""
+메모리 프로파일링.
+
+tracemalloc + RSS 샘플링으로 트레이스 스팬(단계)별 최대 메모리를 측정한다.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional
+
+from utils.config_loader import get_app_config
+from utils.tracing import current_trace, start_trace
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 (상대 리포트 경로 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_MB = 1024 * 1024
+
+
+def current_rss() -> tuple[int, str]:
+    """
+    현재 프로세스 RSS (바이트, 측정 방식).
+
+    Linux는 /proc/self/statm, 그 외는 psutil(설치된 경우)을 쓰고,
+    둘 다 없으면 ru_maxrss(최대값)로 대체한다.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE"), "statm"
+    except OSError:
+        pass
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss, "psutil"
+    except ImportError:
+        # macOS는 바이트, Linux는 KB 단위
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return (maxrss if sys.platform == "darwin" else maxrss * 1024), "ru_maxrss"
+
+
+@dataclass
+class StageMemory:
+    """
+    단계(스팬 이름)별 메모리.
+
+    traced_peak_mb / rss_peak_mb: 단계 시작 시점 대비 단계 실행 중 최대 증가량
+        (여러 번 실행되면 그중 최대)
+    """
+
+    count: int = 0
+    duration_ms: float = 0.0
+    traced_peak_mb: float = 0.0
+    rss_peak_mb: float = 0.0
+
+
+@dataclass
+class MemoryProfile:
+    """
+    프로파일 구간 결과.
+
+    traced_peak_mb: 구간 시작 대비 tracemalloc 최대 증가량 (Python/numpy 할당, 정확값)
+    rss_peak_mb: 구간 시작 대비 RSS 최대 증가량 (torch 등 네이티브 할당 포함, 샘플링 값)
+    """
+
+    name: str
+    duration_ms: float = 0.0
+    traced_peak_mb: float = 0.0
+    rss_peak_mb: float = 0.0
+    rss_start_mb: float = 0.0
+    rss_source: str = ""
+    samples: int = 0
+    stages: dict[str, StageMemory] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _Sampler:
+    """백그라운드 스레드에서 (perf_counter_ns, tracemalloc 현재값, RSS)를 주기적으로 기록"""
+
+    def __init__(self, interval_ms: float) -> None:
+        self.interval = interval_ms / 1000
+        self.samples: list[tuple[int, int, int]] = []
+        self.source = ""
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="memprofile-sampler", daemon=True
+        )
+
+    def sample(self) -> None:
+        rss, self.source = current_rss()
+        self.samples.append((time.perf_counter_ns(), tracemalloc.get_traced_memory()[0], rss))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self) -> None:
+        self.sample()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+
+
+def _stage_peaks(
+    samples: list[tuple[int, int, int]], start_ns: int, end_ns: int
+) -> tuple[int, int]:
+    """[start_ns, end_ns] 구간의 (tracemalloc, RSS) 최대 증가량 — 기준은 구간 직전 샘플"""
+    times = [s[0] for s in samples]
+    first = max(bisect.bisect_right(times, start_ns) - 1, 0)
+    # 구간 안에 샘플이 없을 만큼 짧은 단계는 직후 샘플까지 포함
+    last = min(bisect.bisect_right(times, end_ns), len(samples) - 1)
+    base_traced, base_rss = samples[first][1], samples[first][2]
+    window = samples[first:last + 1]
+    return (
+        max(0, max(s[1] for s in window) - base_traced),
+        max(0, max(s[2] for s in window) - base_rss),
+    )
+
+
+@contextmanager
+def profile_memory(
+    name: str, interval_ms: Optional[float] = None
+) -> Iterator[MemoryProfile]:
+    """
+    구간 메모리 프로파일링. 블록이 끝나면 yield한 MemoryProfile이 채워진다.
+
+    활성 트레이스가 없으면 새로 시작하고(내보내기 없음),
+    블록 안에서 끝난 스팬 이름별로 단계 메모리를 집계한다.
+    전체 tracemalloc 최대값은 정확값이지만 단계별 값은 샘플링 값이라,
+    샘플 주기보다 짧게 유지된 할당은 누락될 수 있다.
+    tracemalloc이 이미 켜져 있으면 최대값만 초기화하고 종료 시 끄지 않는다.
+
+    Args:
+        name: 프로파일 이름 (리포트 키)
+        interval_ms: RSS/tracemalloc 샘플링 주기 (None이면 config memory.sample_interval_ms)
+    """
+    if interval_ms is None:
+        interval_ms = get_app_config().get("memory", {}).get("sample_interval_ms", 2)
+    profile = MemoryProfile(name)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    traced_start = tracemalloc.get_traced_memory()[0]
+    sampler = _Sampler(interval_ms)
+
+    trace = current_trace()
+    with (start_trace(export=False) if trace is None else nullcontext(trace)) as active:
+        span_offset = len(active.spans)
+        start_ns = time.perf_counter_ns()
+        sampler.start()
+        try:
+            yield profile
+        finally:
+            sampler.stop()
+            traced_peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+
+            samples = sampler.samples
+            rss_start = samples[0][2]
+            profile.duration_ms = round((time.perf_counter_ns() - start_ns) / 1e6, 1)
+            profile.traced_peak_mb = round(max(0, traced_peak - traced_start) / _MB, 2)
+            rss_peak = max(s[2] for s in samples)
+            profile.rss_peak_mb = round(max(0, rss_peak - rss_start) / _MB, 2)
+            profile.rss_start_mb = round(rss_start / _MB, 1)
+            profile.rss_source = sampler.source
+            profile.samples = len(samples)
+            for s in active.finished_spans()[span_offset:]:
+                traced, rss = _stage_peaks(samples, s.start_ns, s.end_ns)
+                stage = profile.stages.setdefault(s.name, StageMemory())
+                stage.count += 1
+                stage.duration_ms = round(stage.duration_ms + s.duration_ms, 1)
+                stage.traced_peak_mb = max(stage.traced_peak_mb, round(traced / _MB, 2))
+                stage.rss_peak_mb = max(stage.rss_peak_mb, round(rss / _MB, 2))
+
+
+def profile_classify(
+    classifier: Any, file_path: str | Path, interval_ms: Optional[float] = None
+) -> MemoryProfile:
+    """
+    ASTClassifier.classify 1회 (스펙트로그램 이미지 저장 없음).
+
+    단계: ast.decode/resample/spectrogram/fbank/forward
+    """
+    with profile_memory("classify", interval_ms) as profile:
+        classifier.classify(str(file_path))
+    return profile
+
+
+def profile_graph(
+    request_json: Mapping[str, Any], interval_ms: Optional[float] = None
+) -> MemoryProfile:
+    """그래프 1회 실행 — 단계: node.<이름>, llm.generate, pubmed.request 등"""
+    from agents.graph import get_graph
+    from schemas.api import AnalysisRequest
+
+    state = AnalysisRequest.model_validate(request_json).to_state()
+    graph = get_graph()
+    with profile_memory("graph", interval_ms) as profile:
+        graph.invoke(state)
+    return profile
+
+
+def check_budgets(profile: MemoryProfile, budgets: Mapping[str, Any]) -> list[str]:
+    """
+    예산 초과 항목 목록 (빈 목록이면 통과).
+
+    Args:
+        budgets: {"traced_peak_mb", "rss_peak_mb",
+                  "stages": {스팬 이름: {"traced_peak_mb", "rss_peak_mb"}}}
+            (없는 키는 검사하지 않음)
+    """
+    violations = []
+    checks: list[tuple[str, Any, Mapping[str, Any]]] = [(profile.name, profile, budgets)]
+    for stage_name, stage_budget in (budgets.get("stages") or {}).items():
+        stage = profile.stages.get(stage_name)
+        if stage is not None:
+            checks.append((f"{profile.name}/{stage_name}", stage, stage_budget))
+    for label, measured, budget in checks:
+        for metric in ("traced_peak_mb", "rss_peak_mb"):
+            limit = budget.get(metric)
+            if limit is not None and getattr(measured, metric) > limit:
+                violations.append(
+                    f"{label} {metric}: {getattr(measured, metric):.1f}MB > 예산 {limit:.1f}MB"
+                )
+    return violations
+
+
+def format_profile(profile: MemoryProfile) -> str:
+    lines = [
+        f"[{profile.name}] {profile.duration_ms:.0f}ms, "
+        f"tracemalloc 최대 +{profile.traced_peak_mb:.1f}MB, "
+        f"RSS 최대 +{profile.rss_peak_mb:.1f}MB "
+        f"(시작 {profile.rss_start_mb:.0f}MB, {profile.rss_source}, 샘플 {profile.samples})",
+        f"  {'단계':28s} {'횟수':>4s} {'ms':>9s} {'traced MB':>10s} {'RSS MB':>8s}",
+    ]
+    for name, stage in sorted(profile.stages.items(), key=lambda item: -item[1].rss_peak_mb):
+        lines.append(
+            f"  {name:28s} {stage.count:4d} {stage.duration_ms:9.1f} "
+            f"{stage.traced_peak_mb:10.2f} {stage.rss_peak_mb:8.2f}"
+        )
+    return "\n".join(lines)
+
+
+def write_report(profiles: list[MemoryProfile], path: Optional[str | Path] = None) -> Path:
+    """프로파일 결과 JSON 저장 (None이면 config memory.report)"""
+    default = get_app_config().get("memory", {}).get("report", "data/memory_report.json")
+    path = Path(path or default)
+    if not path.is_absolute():
+        path = _PROJECT_ROOT / path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps({p.name: p.to_dict() for p in profiles}, ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    memory_config = get_app_config().get("memory", {})
+
+    parser = argparse.ArgumentParser(description="단계별 메모리 프로파일링 (tracemalloc + RSS)")
+    parser.add_argument(
+        "--audio", type=str, default=None, help="classify 프로파일용 오디오 파일"
+    )
+    parser.add_argument(
+        "--graph", action="store_true", help="그래프 1회 실행 프로파일 (Ollama/PubMed 필요)"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="config memory.budgets 초과 시 종료 코드 1"
+    )
+    parser.add_argument(
+        "--output", type=str, default=None, help="리포트 JSON 경로 (기본: config memory.report)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+    if not args.audio and not args.graph:
+        parser.error("--audio 또는 --graph 중 하나 이상 지정하세요")
+
+    profiles = []
+    if args.audio:
+        from models.ast_classifier import ASTClassifier
+
+        profiles.append(profile_classify(ASTClassifier(), args.audio))
+    if args.graph:
+        from loadtest.runner import sample_requests
+
+        request = dict(sample_requests(60, seed=1))["analysis"]
+        profiles.append(profile_graph(request.model_dump(mode="json")))
+
+    violations = []
+    for p in profiles:
+        print(format_profile(p))
+        violations += check_budgets(p, memory_config.get("budgets", {}).get(p.name, {}))
+    print(f"리포트: {write_report(profiles, args.output)}")
+    if args.check and violations:
+        print("\n".join(f"✗ {v}" for v in violations))
+        sys.exit(1)
@@ -0,0 +1,42 @@
+"""프로세스 내 운영 지표 유틸리티 — 스레드 안전 카운터 + 비율 조회"""
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+_COUNTERS: dict[str, int] = {}
+_LOCK = threading.Lock()
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """카운터 증가 (없으면 0에서 시작)"""
+    with _LOCK:
+        _COUNTERS[name] = _COUNTERS.get(name, 0) + amount
+
+
+def get_count(name: str) -> int:
+    """카운터 현재 값"""
+    with _LOCK:
+        return _COUNTERS.get(name, 0)
+
+
+def rate(numerator: str, denominator: str) -> float:
+    """두 카운터 비율 (분모 0이면 0.0)"""
+    with _LOCK:
+        total = _COUNTERS.get(denominator, 0)
+        return _COUNTERS.get(numerator, 0) / total if total else 0.0
+
+
+def snapshot() -> dict[str, int]:
+    """전체 카운터 복사본"""
+    with _LOCK:
+        return dict(_COUNTERS)
+
+
+def reset(name: Optional[str] = None) -> None:
+    """카운터 초기화 (None이면 전체)"""
+    with _LOCK:
+        if name is None:
+            _COUNTERS.clear()
+        else:
+            _COUNTERS.pop(name, None)
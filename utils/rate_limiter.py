@@ -0,0 +1,164 @@
+"""외부 API 호출 제어 유틸리티 — 토큰 버킷 rate limiter, 백오프, 요청 병합(single-flight)"""
+from __future__ import annotations
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import Callable, Hashable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 rate limiter.
+
+    - 초당 `rate`개 토큰을 연속적으로 보충, 최대 `capacity`개까지 적립
+    - acquire()는 토큰이 생길 때까지 대기 (대기 순서대로 토큰 예약)
+    - 예약 방식이라 동시 요청이 몰려도 허용 한도에서 일정한 간격으로 처리됨
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        토큰 1개 예약.
+
+        Returns:
+            토큰 사용 가능 시점까지 대기해야 하는 시간 (초, 0이면 즉시)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            # 음수 잔량 = 앞선 예약들이 소진할 토큰 → 그만큼 기다림
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        토큰 1개 획득 (필요 시 대기).
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 파싱.
+
+    Args:
+        value: 헤더 값 (초 단위 숫자 또는 HTTP-date)
+
+    Returns:
+        대기 시간 (초) 또는 None (헤더 없음/파싱 불가)
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    max_delay: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    재시도 대기 시간 계산 (지수 백오프 + full jitter).
+
+    Args:
+        attempt: 실패한 시도 번호 (1부터)
+        base: 기본 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+        retry_after: 서버가 지정한 Retry-After (초). 있으면 하한으로 사용하되 max_delay를 넘지 않음
+            (큰 Retry-After가 그래프 워커 스레드를 시간 예산보다 오래 붙잡지 않도록)
+
+    Returns:
+        대기 시간 (초, 최대 max_delay)
+    """
+    ceiling = min(max_delay, base * (2 ** (attempt - 1)))
+    delay = random.uniform(0, ceiling)
+    if retry_after is not None:
+        delay = min(max(delay, retry_after), max_delay)
+    return delay
+
+
+class SingleFlight:
+    """
+    동일 키 동시 요청 병합기.
+
+    같은 키로 진행 중인 호출이 있으면 새로 실행하지 않고
+    먼저 시작된 호출의 결과(또는 예외)를 함께 받는다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        키 단위로 병합된 호출 실행.
+
+        Args:
+            key: 병합 기준 키
+            fn: 실제 호출 함수
+
+        Returns:
+            fn 실행 결과 (병합된 호출은 동일 객체 공유)
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not leader:
+            logger.debug("진행 중인 동일 요청에 병합: %s", key)
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -0,0 +1,412 @@
+"""
+그래프 실행 녹화/재생.
+
+외부 호출(LLM, PubMed HTTP, 청진음 분류)을 기록해 오프라인에서 결정적으로 재실행한다.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional, TypeVar
+
+from utils.config_loader import get_app_config
+from utils.deadline import BudgetExceeded
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 프로젝트 루트 (상대 로그 경로 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+REPLAY_FORMAT_VERSION = 1
+
+# 요청 미리보기에서 문자열을 자르는 길이 (키는 전체 요청 해시라 매칭에는 영향 없음)
+_PREVIEW_CHARS = 200
+
+# 녹화된 예외 타입 이름 → 재생 시 다시 발생시킬 예외 (그 외는 RuntimeError)
+_REPLAY_ERRORS: dict[str, type[Exception]] = {"BudgetExceeded": BudgetExceeded}
+
+# 응답 비교에서 제외할 필드 (실행마다 달라지는 메타데이터)
+_VOLATILE_FIELDS = {"trace_id", "timing", "timestamp"}
+
+
+class ReplayMiss(RuntimeError):
+    """재생 모드에서 녹화되지 않은 외부 호출 (프롬프트/요청이 녹화 당시와 달라짐)"""
+
+
+@dataclass
+class Interaction:
+    """외부 호출 1건 (latency_ms: 녹화 당시 소요 시간, error: 실패했으면 {type, message})"""
+
+    kind: str
+    key: str
+    request: dict[str, Any]
+    response: Any = None
+    latency_ms: float = 0.0
+    error: Optional[dict[str, str]] = None
+
+
+def request_key(kind: str, request: Mapping[str, Any]) -> str:
+    """요청 내용 해시 (병렬 노드의 호출 순서가 달라도 같은 요청이면 같은 응답으로 매칭)"""
+    payload = json.dumps({"kind": kind, **request}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+
+def _preview(request: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        k: (f"{v[:_PREVIEW_CHARS]}…" if isinstance(v, str) and len(v) > _PREVIEW_CHARS else v)
+        for k, v in request.items()
+    }
+
+
+class ReplaySession:
+    """
+    녹화/재생 세션 (요청 1건 단위).
+
+    - record: 실제 호출 결과와 소요 시간을 interactions에 추가
+    - replay: 같은 키의 녹화 응답을 순서대로 반환 (preserve_latency면 녹화 당시 시간만큼 대기)
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        interactions: Optional[list[Interaction]] = None,
+        preserve_latency: bool = True,
+    ) -> None:
+        if mode not in ("record", "replay"):
+            raise RuntimeError(f"알 수 없는 녹화/재생 모드: {mode}")
+        self.mode = mode
+        self.preserve_latency = preserve_latency
+        self.interactions: list[Interaction] = [] if mode == "record" else list(interactions or [])
+        self.misses: list[dict[str, Any]] = []
+        self._pending: dict[tuple[str, str], deque[Interaction]] = {}
+        for item in self.interactions if mode == "replay" else []:
+            self._pending.setdefault((item.kind, item.key), deque()).append(item)
+        self._lock = threading.Lock()
+
+    def unused(self) -> list[Interaction]:
+        """재생에서 소비되지 않은 녹화 호출 (녹화 당시보다 호출이 줄어든 경우)"""
+        with self._lock:
+            return [item for queue in self._pending.values() for item in queue]
+
+    def _record(self, item: Interaction) -> None:
+        with self._lock:
+            self.interactions.append(item)
+
+    def _take(self, kind: str, key: str, request: Mapping[str, Any]) -> Interaction:
+        with self._lock:
+            queue = self._pending.get((kind, key))
+            if queue:
+                return queue.popleft()
+            self.misses.append({"kind": kind, "key": key, "request": _preview(request)})
+        raise ReplayMiss(f"녹화되지 않은 외부 호출: {kind} ({key})")
+
+
+_CURRENT: ContextVar[Optional[ReplaySession]] = ContextVar("replay_session", default=None)
+
+
+def current_session() -> Optional[ReplaySession]:
+    return _CURRENT.get()
+
+
+@contextmanager
+def recording() -> Iterator[ReplaySession]:
+    """이 블록 안의 외부 호출을 녹화 (LangGraph 병렬 노드 스레드도 contextvars로 같은 세션 공유)"""
+    session = ReplaySession("record")
+    token = _CURRENT.set(session)
+    try:
+        yield session
+    finally:
+        _CURRENT.reset(token)
+
+
+@contextmanager
+def replaying(
+    interactions: list[Interaction], preserve_latency: bool = True
+) -> Iterator[ReplaySession]:
+    """이 블록 안의 외부 호출을 녹화 응답으로 대체 (녹화에 없는 호출은 ReplayMiss)"""
+    session = ReplaySession("replay", interactions, preserve_latency)
+    token = _CURRENT.set(session)
+    try:
+        yield session
+    finally:
+        _CURRENT.reset(token)
+
+
+def interaction(
+    kind: str,
+    request: Mapping[str, Any],
+    call: Callable[[], T],
+    encode: Callable[[T], Any] = lambda value: value,
+    decode: Callable[[Any], T] = lambda value: value,
+) -> T:
+    """
+    외부 호출 지점 래퍼.
+
+    활성 세션이 없으면 call()을 그대로 실행한다.
+    녹화 중이면 결과(encode로 JSON 변환)나 예외를 기록한다.
+    재생 중이면 call()을 실행하지 않고 녹화된 응답(decode로 복원)을 반환하거나
+    녹화된 예외를 다시 발생시킨다.
+
+    Args:
+        kind: 호출 종류 ("llm", "http", "classifier")
+        request: 응답을 결정하는 요청 내용 (키 해시 계산에 사용)
+    """
+    session = _CURRENT.get()
+    if session is None:
+        return call()
+
+    key = request_key(kind, request)
+    if session.mode == "replay":
+        item = session._take(kind, key, request)
+        if session.preserve_latency and item.latency_ms > 0:
+            time.sleep(item.latency_ms / 1000)
+        if item.error is not None:
+            error_type = _REPLAY_ERRORS.get(item.error["type"], RuntimeError)
+            raise error_type(item.error["message"])
+        return decode(item.response)
+
+    start = time.perf_counter()
+    try:
+        result = call()
+    except Exception as e:
+        session._record(Interaction(
+            kind, key, _preview(request), None,
+            round((time.perf_counter() - start) * 1000, 3),
+            {"type": type(e).__name__, "message": str(e)},
+        ))
+        raise
+    session._record(Interaction(
+        kind, key, _preview(request), encode(result),
+        round((time.perf_counter() - start) * 1000, 3),
+    ))
+    return result
+
+
+# ---------------------------------------------------------------------------
+# 케이스 로그 (gzip JSON Lines — 한 줄 = 요청 1건)
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ReplayCase:
+    """
+    녹화된 그래프 실행 1건.
+
+    input: AnalysisRequest JSON, output: 응답 JSON에서 실행 메타데이터 제외
+    """
+
+    case_id: str
+    input: dict[str, Any]
+    output: dict[str, Any]
+    latency_ms: float
+    interactions: list[Interaction] = field(default_factory=list)
+    recorded_at: str = ""
+    format_version: int = REPLAY_FORMAT_VERSION
+
+
+def resolve_log_path(path: Optional[str | Path] = None) -> Path:
+    """상대 경로는 프로젝트 루트 기준 (None이면 config replay.log)"""
+    path = Path(path or get_app_config().get("replay", {}).get("log", "data/replay/cases.jsonl.gz"))
+    return path if path.is_absolute() else _PROJECT_ROOT / path
+
+
+def append_cases(path: str | Path, cases: list[ReplayCase]) -> Path:
+    """케이스 추가 기록 (gzip 멤버를 이어 붙임 — 기존 로그를 다시 쓰지 않음)"""
+    path = resolve_log_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "at", encoding="utf-8") as f:
+        for case in cases:
+            f.write(json.dumps(asdict(case), ensure_ascii=False, separators=(",", ":")) + "\n")
+    return path
+
+
+def read_cases(path: str | Path) -> list[ReplayCase]:
+    path = resolve_log_path(path)
+    if not path.exists():
+        raise RuntimeError(f"녹화 로그가 없습니다: {path} (python -m utils.replay record 로 생성)")
+    cases = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if data.get("format_version") != REPLAY_FORMAT_VERSION:
+                raise RuntimeError(f"지원하지 않는 녹화 로그 형식: {data.get('format_version')}")
+            data["interactions"] = [Interaction(**item) for item in data["interactions"]]
+            cases.append(ReplayCase(**data))
+    return cases
+
+
+def _comparable(output: Mapping[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in output.items() if k not in _VOLATILE_FIELDS}
+
+
+def _reset_process_caches() -> None:
+    """
+    프로세스 전역 문헌 검색 캐시/서킷 브레이커 초기화.
+
+    캐시 적중이나 열린 브레이커로 건너뛴 PubMed 호출은 녹화되지 않는다.
+    케이스마다 빈 상태에서 시작해야 녹화와 재생이 같은 외부 호출을 거친다.
+    """
+    from models.literature_search import clear_search_cache, reset_circuit_breakers
+
+    clear_search_cache()
+    reset_circuit_breakers()
+
+
+def _run_graph(
+    request_json: Mapping[str, Any],
+) -> tuple[dict[str, Any], float, dict[str, float]]:
+    """그래프 1회 실행 → (응답 JSON, 소요 ms, 노드별 ms)"""
+    from agents.graph import get_graph
+    from schemas.api import AnalysisRequest, AnalysisResponse
+    from utils.tracing import start_trace
+
+    request = AnalysisRequest.model_validate(request_json)
+    start = time.perf_counter()
+    with start_trace(export=False) as trace:
+        state = get_graph().invoke(request.to_state())
+    latency_ms = round((time.perf_counter() - start) * 1000, 1)
+    nodes: dict[str, float] = {}
+    for s in trace.finished_spans():
+        if s.name.startswith("node."):
+            name = s.name.removeprefix("node.")
+            nodes[name] = round(nodes.get(name, 0.0) + s.duration_ms, 1)
+    output = AnalysisResponse.from_state(state).model_dump(mode="json")
+    return _comparable(output), latency_ms, nodes
+
+
+def record_case(
+    request_json: Mapping[str, Any], case_id: Optional[str] = None
+) -> ReplayCase:
+    """실제 외부 서비스로 그래프를 실행하며 외부 호출 녹화"""
+    _reset_process_caches()
+    with recording() as session:
+        output, latency_ms, _ = _run_graph(request_json)
+    case = ReplayCase(
+        case_id=case_id or uuid.uuid4().hex[:12],
+        input=dict(request_json),
+        output=output,
+        latency_ms=latency_ms,
+        interactions=session.interactions,
+        recorded_at=time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    )
+    logger.info(
+        "케이스 녹화: %s (외부 호출 %d건, %.0fms)",
+        case.case_id, len(case.interactions), latency_ms,
+    )
+    return case
+
+
+def replay_case(case: ReplayCase, preserve_latency: bool = True) -> dict[str, Any]:
+    """
+    녹화 응답으로 그래프 재실행.
+
+    Returns:
+        case_id, latency_ms(재생 소요), recorded_ms(녹화 당시), nodes(노드별 ms),
+        misses(녹화에 없던 호출), unused(소비되지 않은 녹화 호출 수),
+        changed(녹화 출력과 달라진 필드)
+    """
+    _reset_process_caches()
+    with replaying(case.interactions, preserve_latency) as session:
+        output, latency_ms, nodes = _run_graph(case.input)
+    changed = sorted(
+        k for k in set(output) | set(case.output) if output.get(k) != case.output.get(k)
+    )
+    return {
+        "case_id": case.case_id,
+        "latency_ms": latency_ms,
+        "recorded_ms": case.latency_ms,
+        "nodes": nodes,
+        "misses": session.misses,
+        "unused": len(session.unused()),
+        "changed": changed,
+    }
+
+
+def _main() -> int:
+    """CLI: record / run"""
+    import argparse
+
+    import numpy as np
+
+    replay_config = get_app_config().get("replay", {})
+
+    parser = argparse.ArgumentParser(description="그래프 실행 녹화/재생")
+    sub = parser.add_subparsers(dest="command", required=True)
+    record_parser = sub.add_parser(
+        "record", help="요청 목록(JSONL, 한 줄 = AnalysisRequest)을 실제 서비스로 실행하며 녹화"
+    )
+    record_parser.add_argument("requests", type=str, help="요청 JSONL 파일")
+    record_parser.add_argument(
+        "--log", type=str, default=None, help="녹화 로그 (기본: config replay.log)"
+    )
+    replay_parser = sub.add_parser("run", help="녹화 로그의 모든 케이스를 오프라인 재생")
+    replay_parser.add_argument(
+        "--log", type=str, default=None, help="녹화 로그 (기본: config replay.log)"
+    )
+    replay_parser.add_argument(
+        "--no-latency", action="store_true",
+        help="녹화 당시 지연 없이 즉시 응답 (로직 변경만 측정)",
+    )
+    replay_parser.add_argument("--output", type=str, default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+
+    if args.command == "record":
+        lines = Path(args.requests).read_text(encoding="utf-8").splitlines()
+        recorded = [
+            record_case(json.loads(line), case_id=f"case-{i:04d}")
+            for i, line in enumerate(lines) if line.strip()
+        ]
+        log_path = append_cases(args.log, recorded)
+        size_kb = log_path.stat().st_size / 1024
+        print(f"✓ {len(recorded)}건 녹화: {log_path} ({size_kb:.1f}KB)")
+        return 0
+
+    preserve = not args.no_latency and replay_config.get("preserve_latency", True)
+    results = [replay_case(case, preserve) for case in read_cases(args.log)]
+    latencies = [r["latency_ms"] for r in results]
+    print(
+        f"{'케이스':12s} {'녹화(ms)':>10s} {'재생(ms)':>10s} "
+        f"{'미녹화':>6s} {'미사용':>6s}  변경 필드"
+    )
+    for r in results:
+        print(
+            f"{r['case_id']:12s} {r['recorded_ms']:10.0f} {r['latency_ms']:10.0f} "
+            f"{len(r['misses']):6d} {r['unused']:6d}  {', '.join(r['changed']) or '-'}"
+        )
+    print(
+        f"재생 {len(results)}건: p50 {np.percentile(latencies, 50):.0f}ms, "
+        f"p95 {np.percentile(latencies, 95):.0f}ms"
+    )
+    if args.output:
+        Path(args.output).write_text(
+            json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    return 1 if any(r["misses"] or r["changed"] for r in results) else 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    # python -m 실행 시 이 파일은 __main__으로 따로 로딩되므로,
+    # 훅(LLMClient 등)과 같은 세션 ContextVar를 쓰도록 패키지 모듈 쪽 _main을 호출
+    from utils.replay import _main as main
+
+    sys.exit(main())
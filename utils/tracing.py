@@ -0,0 +1,255 @@
+"""요청 단위 트레이싱 유틸리티 — 중첩 스팬 기록 + JSON Lines / Chrome trace 내보내기"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 (상대 export_dir 기준)
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_CURRENT_TRACE: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("trace", default=None)
+_CURRENT_SPAN: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("span", default=None)
+
+
+@dataclass
+class Span:
+    """구간 기록 (시작/종료는 perf_counter_ns, 표시용 시각은 epoch 기준)"""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    epoch_us: int
+    thread_id: int
+    end_ns: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set(self, **attributes: Any) -> None:
+        """속성 추가 (토큰 수, 캐시 적중, HTTP 상태 등)"""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_us": self.epoch_us,
+            "duration_ms": round(self.duration_ms, 3),
+            "thread_id": self.thread_id,
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """
+    요청 하나의 스팬 모음.
+
+    LangGraph는 노드 실행 시 contextvars를 복사하므로 invoke/stream을 start_trace() 블록 안에서
+    호출하면 병렬 노드 스레드의 스팬도 같은 트레이스에 모인다.
+    """
+
+    def __init__(self, trace_id: Optional[str] = None) -> None:
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.start_ns = time.perf_counter_ns()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def _add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def finished_spans(self) -> list[Span]:
+        with self._lock:
+            return [s for s in self.spans if s.end_ns is not None]
+
+    def summary(self) -> dict[str, Any]:
+        """
+        요청 단위 시간 요약.
+
+        Returns:
+            trace_id, total_ms(트레이스 시작 이후 경과), spans(이름별 count/total_ms),
+            tokens(LLM 입력/출력 토큰 합), cache_hits
+        """
+        by_name: dict[str, dict[str, float]] = {}
+        tokens = {"input": 0, "output": 0}
+        cache_hits = 0
+        for span in self.finished_spans():
+            entry = by_name.setdefault(span.name, {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] = round(entry["total_ms"] + span.duration_ms, 3)
+            tokens["input"] += span.attributes.get("input_tokens", 0) or 0
+            tokens["output"] += span.attributes.get("output_tokens", 0) or 0
+            cache_hits += bool(span.attributes.get("cache_hit"))
+        return {
+            "trace_id": self.trace_id,
+            "total_ms": round((time.perf_counter_ns() - self.start_ns) / 1e6, 3),
+            "spans": by_name,
+            "tokens": tokens,
+            "cache_hits": cache_hits,
+        }
+
+    def to_jsonl(self, path: str | Path) -> Path:
+        """스팬을 JSON Lines로 추가 기록 (한 줄 = 스팬 하나)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            for span in self.finished_spans():
+                f.write(json.dumps(span.to_dict(), ensure_ascii=False) + "\n")
+        return path
+
+    def to_chrome(self, path: str | Path) -> Path:
+        """Chrome trace-event 형식 저장 (chrome://tracing, Perfetto에서 플레임그래프 확인)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        events = [
+            {
+                "name": span.name,
+                "ph": "X",
+                "ts": span.epoch_us,
+                "dur": round(span.duration_ms * 1000, 1),
+                "pid": 1,
+                "tid": span.thread_id,
+                "args": span.attributes,
+            }
+            for span in self.finished_spans()
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "otherData": {"trace_id": self.trace_id}}, f, ensure_ascii=False)
+        return path
+
+
+def current_trace() -> Optional[Trace]:
+    """현재 컨텍스트의 트레이스 (없으면 None)"""
+    return _CURRENT_TRACE.get()
+
+
+@contextmanager
+def start_trace(trace_id: Optional[str] = None, export: bool = True) -> Iterator[Trace]:
+    """
+    요청 트레이스 시작.
+
+    Args:
+        trace_id: 외부에서 받은 추적 ID (None이면 생성)
+        export: 종료 시 config/app.yaml tracing 설정에 따라 파일로 내보낼지 여부
+    """
+    trace = Trace(trace_id)
+    token = _CURRENT_TRACE.set(trace)
+    span_token = _CURRENT_SPAN.set(None)
+    try:
+        yield trace
+    finally:
+        _CURRENT_SPAN.reset(span_token)
+        _CURRENT_TRACE.reset(token)
+        if export:
+            export_trace(trace)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Span]]:
+    """
+    중첩 스팬 기록. 활성 트레이스가 없으면 아무것도 하지 않음 (None 반환).
+
+    Example:
+        with span("llm.generate", model=self.model) as s:
+            ...
+            if s: s.set(output_tokens=n)
+    """
+    trace = _CURRENT_TRACE.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _CURRENT_SPAN.get()
+    current = Span(
+        name=name,
+        trace_id=trace.trace_id,
+        span_id=uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        start_ns=time.perf_counter_ns(),
+        epoch_us=time.time_ns() // 1000,
+        thread_id=threading.get_ident(),
+        attributes=dict(attributes),
+    )
+    token = _CURRENT_SPAN.set(current)
+    try:
+        yield current
+    except Exception as e:
+        current.set(error=f"{type(e).__name__}: {e}")
+        raise
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        _CURRENT_SPAN.reset(token)
+        trace._add(current)
+
+
+def annotate(**attributes: Any) -> None:
+    """현재 스팬에 속성 추가 (활성 스팬 없으면 무시)"""
+    current = _CURRENT_SPAN.get()
+    if current is not None:
+        current.set(**attributes)
+
+
+def traced_node(name: str, fn: Callable[[dict], dict]) -> Callable[[dict], dict]:
+    """
+    그래프 노드 래퍼.
+
+    활성 트레이스가 있으면 "node.<name>" 스팬으로 감싸고, 반환 업데이트에
+    trace_id와 그 시점까지의 시간 요약(timing)을 덧붙인다.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(state: dict) -> dict:
+        trace = _CURRENT_TRACE.get()
+        if trace is None:
+            return fn(state)
+        with span(f"node.{name}"):
+            update = fn(state)
+        return {**update, "trace_id": trace.trace_id, "timing": trace.summary()}
+
+    return wrapper
+
+
+def export_trace(trace: Trace) -> list[Path]:
+    """
+    config/app.yaml tracing 설정에 따라 트레이스 파일 기록.
+
+    - jsonl: <export_dir>/spans.jsonl 에 누적
+    - chrome_trace: <export_dir>/<trace_id>.trace.json 개별 저장
+    """
+    config = get_app_config().get("tracing", {})
+    if not config.get("enabled", False) or not trace.spans:
+        return []
+
+    export_dir = Path(config.get("export_dir", "logs/traces"))
+    if not export_dir.is_absolute():
+        export_dir = _PROJECT_ROOT / export_dir
+
+    written: list[Path] = []
+    try:
+        if config.get("jsonl", True):
+            written.append(trace.to_jsonl(export_dir / "spans.jsonl"))
+        if config.get("chrome_trace", False):
+            written.append(trace.to_chrome(export_dir / f"{trace.trace_id}.trace.json"))
+    except OSError as e:
+        logger.warning("트레이스 내보내기 실패: %s", e)
+    return written
@@ -6,8 +6,8 @@ import logging
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from models.vitals_rules import get_vitals_rules
 from schemas.vitals import VitalSigns
-from utils.config_loader import get_vitals_reference
 
 logger = logging.getLogger(__name__)
 
@@ -22,21 +22,21 @@ def create_vitals_gauges(vitals: VitalSigns) -> go.Figure:
     Returns:
         Plotly Figure 객체
     """
-    ref = get_vitals_reference()
+    bands = get_vitals_rules().bands
 
     # 심박수 범위
-    hr_ref = ref.get("heart_rate", {}).get("normal", {})
-    hr_min = hr_ref.get("min", 60)
-    hr_max = hr_ref.get("max", 100)
+    hr_min = bands["heart_rate"].normal_min
+    hr_max = bands["heart_rate"].normal_max
 
-    # 체온 범위
-    temp_ref = ref.get("body_temperature", {}).get("normal", {})
-    temp_min = temp_ref.get("min", 36.1)
-    temp_max = temp_ref.get("max", 37.2)
+    # 체온 범위 (정상 ~ 발열 사이는 미열 구간)
+    temp_min = bands["temperature"].normal_min
+    temp_max = bands["temperature"].normal_max
+    fever_min = bands["temperature"].lower_bound("fever")
 
-    # 수축기 혈압 범위
-    bp_ref = ref.get("blood_pressure", {}).get("normal", {})
-    sys_max = bp_ref.get("systolic_max", 120)
+    # 수축기 혈압 범위 (정상 ~ 고혈압 2기 사이는 주의 구간)
+    sys_min = bands["systolic"].normal_min
+    sys_max = bands["systolic"].normal_max
+    sys_high = bands["systolic"].lower_bound("high_stage2")
 
     fig = make_subplots(
         rows=1, cols=3,
@@ -73,10 +73,10 @@ def create_vitals_gauges(vitals: VitalSigns) -> go.Figure:
                 axis=dict(range=[60, 250]),
                 bar=dict(color="#43A047"),
                 steps=[
-                    dict(range=[60, 90], color="#FFCDD2"),
-                    dict(range=[90, sys_max], color="#C8E6C9"),
-                    dict(range=[sys_max, 140], color="#FFF9C4"),
-                    dict(range=[140, 250], color="#FFCDD2"),
+                    dict(range=[60, sys_min], color="#FFCDD2"),
+                    dict(range=[sys_min, sys_max], color="#C8E6C9"),
+                    dict(range=[sys_max, sys_high], color="#FFF9C4"),
+                    dict(range=[sys_high, 250], color="#FFCDD2"),
                 ],
             ),
         ),
@@ -95,8 +95,8 @@ def create_vitals_gauges(vitals: VitalSigns) -> go.Figure:
                 steps=[
                     dict(range=[34.0, temp_min], color="#BBDEFB"),
                     dict(range=[temp_min, temp_max], color="#C8E6C9"),
-                    dict(range=[temp_max, 38.0], color="#FFF9C4"),
-                    dict(range=[38.0, 42.0], color="#FFCDD2"),
+                    dict(range=[temp_max, fever_min], color="#FFF9C4"),
+                    dict(range=[fever_min, 42.0], color="#FFCDD2"),
                 ],
             ),
         ),
@@ -0,0 +1,140 @@
+"""모델 워밍업 + 준비 상태(readiness) — 프로세스 시작 시 백그라운드 스레드에서 사전 로딩"""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Mapping, Optional
+
+from utils.config_loader import get_app_config
+
+logger = logging.getLogger(__name__)
+
+# 구성요소 상태: pending → loading → ready | failed  (워밍업 비활성 시 skipped)
+READY_STATUSES = ("ready", "skipped")
+
+_COMPONENTS: dict[str, dict[str, Any]] = {}
+_LOCK = threading.Lock()
+_THREAD: Optional[threading.Thread] = None
+
+
+def warm_ast() -> None:
+    """AST 모델 로딩 + 더미 추론 (UI/서비스 요청과 같은 프로세스 공유 인스턴스)"""
+    from models.ast_classifier import get_classifier
+
+    seconds = get_app_config().get("warmup", {}).get("ast_dummy_seconds", 1.0)
+    get_classifier().warmup(seconds)
+
+
+def warm_llm() -> None:
+    """Ollama 모델 사전 적재 (keep_alive 유지)"""
+    from models.llm_client import LLMClient
+
+    LLMClient().preload()
+
+
+# 구성요소 이름 → 워밍업 함수 (config/app.yaml warmup.components 순서대로 실행)
+WARMUP_TASKS: dict[str, Callable[[], Any]] = {
+    "ast": warm_ast,
+    "llm": warm_llm,
+}
+
+
+def _mark(name: str, status: str, **fields: Any) -> None:
+    with _LOCK:
+        _COMPONENTS[name] = {"status": status, "seconds": None, "error": None, **fields}
+
+
+def _run(tasks: Mapping[str, Callable[[], Any]]) -> None:
+    for name, task in tasks.items():
+        _mark(name, "loading")
+        start = time.perf_counter()
+        try:
+            result = task()
+            if result is False:
+                raise RuntimeError("워밍업 함수가 실패를 반환했습니다")
+        except Exception as e:
+            logger.warning("워밍업 실패: %s (%s)", name, e)
+            _mark(name, "failed", seconds=round(time.perf_counter() - start, 2), error=str(e))
+        else:
+            seconds = round(time.perf_counter() - start, 2)
+            logger.info("워밍업 완료: %s (%.1f초)", name, seconds)
+            _mark(name, "ready", seconds=seconds)
+
+
+def start_warmup(
+    tasks: Optional[Mapping[str, Callable[[], Any]]] = None,
+    config: Optional[Mapping[str, Any]] = None,
+) -> Optional[threading.Thread]:
+    """
+    백그라운드 워밍업 시작 (프로세스당 1회, 이미 시작했으면 기존 스레드 반환).
+
+    Args:
+        tasks: 구성요소 이름 → 워밍업 함수 (None이면 config 구성요소를 WARMUP_TASKS에서 선택)
+        config: config/app.yaml warmup 섹션 (테스트에서 주입)
+
+    Returns:
+        워밍업 스레드 (비활성이면 None — 구성요소는 skipped로 표시되고 첫 사용 시 로딩)
+    """
+    global _THREAD
+    config = config if config is not None else get_app_config().get("warmup", {})
+    with _LOCK:
+        if _THREAD is not None:
+            return _THREAD
+
+        if tasks is None:
+            names = config.get("components", list(WARMUP_TASKS))
+            unknown = [n for n in names if n not in WARMUP_TASKS]
+            if unknown:
+                raise RuntimeError(f"알 수 없는 워밍업 구성요소: {', '.join(unknown)}")
+            tasks = {n: WARMUP_TASKS[n] for n in names}
+
+        if not config.get("enabled", True):
+            for name in tasks:
+                _COMPONENTS[name] = {"status": "skipped", "seconds": None, "error": None}
+            return None
+
+        for name in tasks:
+            _COMPONENTS[name] = {"status": "pending", "seconds": None, "error": None}
+        _THREAD = threading.Thread(target=_run, args=(dict(tasks),), name="warmup", daemon=True)
+        _THREAD.start()
+    logger.info("백그라운드 워밍업 시작: %s", ", ".join(tasks))
+    return _THREAD
+
+
+def readiness() -> dict[str, Any]:
+    """
+    준비 상태 스냅샷.
+
+    Returns:
+        ready(모든 구성요소가 ready/skipped), components(이름별 status/seconds/error)
+    """
+    with _LOCK:
+        components = {name: dict(info) for name, info in _COMPONENTS.items()}
+    return {
+        "ready": all(c["status"] in READY_STATUSES for c in components.values()),
+        "components": components,
+    }
+
+
+def reset() -> None:
+    """상태 초기화 (테스트용 — 실행 중인 워밍업 스레드는 기다리지 않음)"""
+    global _THREAD
+    with _LOCK:
+        _COMPONENTS.clear()
+        _THREAD = None
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="모델 워밍업 실행")
+    parser.add_argument("--test", action="store_true", help="워밍업 실행 후 준비 상태 출력")
+    args = parser.parse_args()
+
+    if args.test:
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(levelname)s: %(message)s")
+        thread = start_warmup(config={**get_app_config().get("warmup", {}), "enabled": True})
+        thread.join()
+        print(json.dumps(readiness(), ensure_ascii=False, indent=2))